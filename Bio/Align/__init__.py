@@ -18,11 +18,14 @@ import copy
 import importlib
 import numbers
 import sys
+import threading
 import types
 import warnings
 from abc import ABC
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from itertools import zip_longest
+from math import log2
 
 try:
     import numpy as np
@@ -3756,6 +3759,37 @@ class PairwiseAlignments(AlignmentsAbstractBaseClass):
         self._index = -1
 
 
+class _SinglePath:
+    """Iterator over the single path found by a restricted alignment (PRIVATE).
+
+    This is used for banded, X-drop, and linear-space alignments.
+
+    It provides the len, next, and reset methods used by PairwiseAlignments
+    for the single optimal path (or None, if no alignment was found).
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._done = path is None
+
+    def __len__(self):
+        if self._path is None:
+            return 0
+        return 1
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._done:
+            raise StopIteration
+        self._done = True
+        return self._path
+
+    def reset(self):
+        self._done = self._path is None
+
+
 class PairwiseAligner(_pairwisealigner.PairwiseAligner):
     """Performs pairwise sequence alignment using dynamic programming.
 
@@ -3899,6 +3933,58 @@ class PairwiseAligner(_pairwisealigner.PairwiseAligner):
     query             0 -A-CG 3
     <BLANKLINE>
 
+    For long, similar sequences, the dynamic programming can be restricted to
+    a band of diagonals by setting band_width. Only cells (i, j) with j - i
+    between min(0, n - m) - band_width and max(0, n - m) + band_width are
+    then considered, where m and n are the lengths of the target and query,
+    so that time and memory scale with the width of the band instead of the
+    product of the sequence lengths. In local mode, setting xdrop instead (or
+    in addition) stops extending the alignment from cells scoring more than
+    xdrop below the best score found so far. In both cases only a single
+    optimal alignment (within these restrictions) is returned:
+
+    >>> aligner = Align.PairwiseAligner(match_score=2, mismatch_score=-1, gap_score=-2)
+    >>> aligner.band_width = 1
+    >>> alignments = aligner.align("GAACTTTAGCA", "GAACTTAGCA")
+    >>> len(alignments)
+    1
+    >>> print(alignments[0])
+    target            0 GAACTTTAGCA 11
+                      0 ||||-|||||| 11
+    query             0 GAAC-TTAGCA 10
+    <BLANKLINE>
+    >>> aligner.band_width = None
+    >>> aligner.mode = "local"
+    >>> aligner.xdrop = 4
+    >>> alignments = aligner.align("TTTTGAACTTTAGCACCCC", "GAACTTAGCA")
+    >>> print(alignments[0])
+    target            4 GAACTTTAGCA 15
+                      0 ||||-|||||| 11
+    query             0 GAAC-TTAGCA 10
+    <BLANKLINE>
+
+    Finding all optimal global alignments requires memory proportional to the
+    product of the sequence lengths. By setting linear_space to True, a single
+    optimal global alignment is found instead using the divide-and-conquer
+    algorithm by Myers and Miller, which needs memory proportional to the sum
+    of the sequence lengths only, at the cost of recalculating parts of the
+    dynamic programming matrix. The score is the same as without linear_space:
+
+    >>> aligner = Align.PairwiseAligner(match_score=2, mismatch_score=-1)
+    >>> aligner.open_gap_score = -3
+    >>> aligner.extend_gap_score = -1
+    >>> aligner.linear_space = True
+    >>> alignments = aligner.align("GAACTTTAGCA", "GAACTAGCA")
+    >>> len(alignments)
+    1
+    >>> print(alignments[0])
+    target            0 GAACTTTAGCA 11
+                      0 ||||--||||| 11
+    query             0 GAAC--TAGCA  9
+    <BLANKLINE>
+    >>> alignments.score == aligner.score("GAACTTTAGCA", "GAACTAGCA")
+    True
+
     """
 
     def __init__(self, scoring=None, **kwargs):
@@ -3958,6 +4044,10 @@ class PairwiseAligner(_pairwisealigner.PairwiseAligner):
         if isinstance(seqB, (Seq, MutableSeq, SeqRecord)):
             sB = bytes(sB)
         score, paths = super().align(sA, sB, strand)
+        if self.band_width is not None or self.xdrop is not None or self.linear_space:
+            # Banded, X-drop, and linear-space alignments return a single
+            # optimal path
+            paths = _SinglePath(paths)
         alignments = PairwiseAlignments(seqA, seqB, score, paths)
         return alignments
 
@@ -3971,6 +4061,84 @@ class PairwiseAligner(_pairwisealigner.PairwiseAligner):
             seqB = bytes(seqB)
         return super().score(seqA, seqB, strand)
 
+    def score_many(self, query, targets, strand="+", threads=None):
+        """Return the alignment scores of a query against many target sequences.
+
+        This returns a NumPy array with the same scores as
+        ``[aligner.score(target, query, strand) for target in targets]``, but
+        calculated in one call to the C code, which does not hold the GIL
+        while calculating the scores. The optional threads argument gives the
+        number of threads used to calculate the scores in parallel. This has
+        no effect if gap score functions are used, as these are Python code.
+
+        >>> from Bio import Align
+        >>> aligner = Align.PairwiseAligner(mode="local", open_gap_score=-2)
+        >>> aligner.score_many("GAACT", ["GAACT", "GAT", "TTTGAACTTT"])
+        array([5., 2., 5.])
+        """
+        if strand == "-":
+            query = reverse_complement(query)
+        if isinstance(query, (Seq, MutableSeq, SeqRecord)):
+            query = bytes(query)
+        targets = [
+            bytes(seq) if isinstance(seq, (Seq, MutableSeq, SeqRecord)) else seq
+            for seq in targets
+        ]
+        scores = np.empty((1, len(targets)))
+        self._score_many(targets, [query], strand, scores, threads)
+        return scores[0]
+
+    def score_matrix(self, seqs, strand="+", threads=None):
+        """Return the alignment scores of all pairs of sequences as a matrix.
+
+        Element [i, j] of the returned NumPy array is the score of sequence i
+        as the target against sequence j as the query, as given by
+        ``aligner.score(seqs[i], seqs[j], strand)``. The optional threads
+        argument is as for the score_many method.
+
+        >>> from Bio import Align
+        >>> aligner = Align.PairwiseAligner(mismatch_score=-1, gap_score=-1)
+        >>> print(aligner.score_matrix(["GAACT", "GAT", "GACT"]))
+        [[5. 1. 3.]
+         [1. 3. 2.]
+         [3. 2. 4.]]
+        """
+        if strand == "-":
+            queries = [reverse_complement(seq) for seq in seqs]
+        else:
+            queries = list(seqs)
+        targets = [
+            bytes(seq) if isinstance(seq, (Seq, MutableSeq, SeqRecord)) else seq
+            for seq in seqs
+        ]
+        queries = [
+            bytes(seq) if isinstance(seq, (Seq, MutableSeq, SeqRecord)) else seq
+            for seq in queries
+        ]
+        scores = np.empty((len(queries), len(targets)))
+        self._score_many(targets, queries, strand, scores, threads)
+        return scores.transpose().copy()
+
+    def _score_many(self, targets, queries, strand, scores, threads):
+        """Calculate the score of targets[j] against queries[i] (PRIVATE)."""
+        score_many = _pairwisealigner.PairwiseAligner.score_many
+        if threads is None or threads == 1:
+            for query, row in zip(queries, scores):
+                score_many(self, targets, query, strand, row)
+            return
+        if not isinstance(threads, int) or threads < 1:
+            raise ValueError(f"threads should be a positive integer, not {threads!r}")
+        # Split the work into a few tasks per thread, to balance the load
+        size = max(-(-len(targets) * len(queries) // (4 * threads)), 1)
+        tasks = [
+            (targets[start : start + size], query, strand, row[start : start + size])
+            for query, row in zip(queries, scores)
+            for start in range(0, len(targets), size)
+        ]
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            for task in [executor.submit(score_many, self, *task) for task in tasks]:
+                task.result()
+
     def __getstate__(self):
         state = {
             "wildcard": self.wildcard,
@@ -3987,6 +4155,9 @@ class PairwiseAligner(_pairwisealigner.PairwiseAligner):
             "query_right_open_gap_score": self.query_right_open_gap_score,
             "query_right_extend_gap_score": self.query_right_extend_gap_score,
             "mode": self.mode,
+            "band_width": self.band_width,
+            "xdrop": self.xdrop,
+            "linear_space": self.linear_space,
         }
         if self.substitution_matrix is None:
             state["match_score"] = self.match_score
@@ -4012,6 +4183,9 @@ class PairwiseAligner(_pairwisealigner.PairwiseAligner):
         self.query_right_open_gap_score = state["query_right_open_gap_score"]
         self.query_right_extend_gap_score = state["query_right_extend_gap_score"]
         self.mode = state["mode"]
+        self.band_width = state.get("band_width")
+        self.xdrop = state.get("xdrop")
+        self.linear_space = state.get("linear_space", False)
         substitution_matrix = state.get("substitution_matrix")
         if substitution_matrix is None:
             self.match_score = state["match_score"]
@@ -4020,6 +4194,493 @@ class PairwiseAligner(_pairwisealigner.PairwiseAligner):
             self.substitution_matrix = substitution_matrix
 
 
+class AnchoredAligner:
+    """Maps query sequences to long target sequences using seeds and extension.
+
+    Finding the local alignment of a query sequence to a target sequence with
+    a PairwiseAligner takes time proportional to the product of the sequence
+    lengths, which is too slow for mapping many reads to a reference sequence
+    of several kilobases or megabases. The AnchoredAligner instead indexes
+    the minimizers of the target sequences once; these are the k-mers (of
+    either strand) with the lowest hash value among each window of w
+    consecutive k-mers. For each query, the minimizers it shares with the
+    targets are used as seeds, which are chained as in minimap2 (Li,
+    Bioinformatics 34: 3094-3100 (2018)). Each chain is then extended into a
+    local alignment by a PairwiseAligner, restricted to a band around the
+    diagonals of the chain.
+
+    Arguments:
+     - targets         - The target sequence (plain string, Seq, MutableSeq,
+                         or SeqRecord), or a list of target sequences.
+     - k               - The k-mer length (at most 31; default 15).
+     - w               - The number of consecutive k-mers from which a
+                         minimizer is chosen (default 10).
+     - aligner         - A PairwiseAligner defining the scores used to extend
+                         the chains. The aligner is copied and used in local
+                         mode. By default, a match scores 2, a mismatch -4,
+                         and a gap of length n scores -6 - 2 * (n - 1).
+     - band_width      - The number of diagonals allowed on each side of the
+                         chain during its extension (default 50).
+     - max_occurrences - Minimizers occurring more often than this in the
+                         targets are not used as seeds (default 200).
+     - max_gap         - The maximum distance between consecutive seeds in
+                         a chain (default 5000).
+     - min_chain_score - The minimum score of a chain to be extended into
+                         an alignment (default 40).
+
+    The alignments of a query are returned as Alignment objects, sorted by
+    score, with the aligned target sequence as the first sequence and the
+    query as the second. Alignments to the reverse strand have decreasing
+    query coordinates. The mapq and flag attributes of each alignment are set
+    as used by the SAM format, with all but the best alignment marked as
+    secondary (if they overlap a better alignment on the query for at least
+    half their length) or supplementary (otherwise), and the mapping quality
+    calculated from the score of the best secondary alignment, so that the
+    alignments can be written directly using Bio.Align.write:
+
+    >>> from Bio import Align
+    >>> from Bio.Seq import Seq
+    >>> from Bio.SeqRecord import SeqRecord
+    >>> target = SeqRecord(
+    ...     Seq(
+    ...         "GTCAGGATCCTTAGCTAGGCATTACGGATCGATTCGACTAGCTTAACGGCTATCCGATGCAT"
+    ...         "ATCGGCTAGCATCGACTACGTTAGGCTACGGATTCGACGTAGCTTAGCCGATACGTAGCTAA"
+    ...     ),
+    ...     id="plasmid",
+    ... )
+    >>> aligner = Align.AnchoredAligner(target, k=11, w=5, min_chain_score=20)
+    >>> read = SeqRecord(
+    ...     Seq("CATTACGGATCGATTCGACTAGCTTAACGGCTAACCGATGCATATCGG"), id="read"
+    ... )
+    >>> alignments = aligner.align(read)
+    >>> len(alignments)
+    1
+    >>> alignment = alignments[0]
+    >>> print(alignment)
+    plasmid          19 CATTACGGATCGATTCGACTAGCTTAACGGCTATCCGATGCATATCGG 67
+                      0 |||||||||||||||||||||||||||||||||.|||||||||||||| 48
+    read              0 CATTACGGATCGATTCGACTAGCTTAACGGCTAACCGATGCATATCGG 48
+    <BLANKLINE>
+    >>> print(format(alignment, "sam"), end="")  # doctest: +NORMALIZE_WHITESPACE
+    read	0	plasmid	20	60	48M	*	0	0	CATTACGGATCGATTCGACTAGCTTAACGGCTAACCGATGCATATCGG	*	AS:i:90
+
+    Use the map method to align many queries, for example the reads in a
+    FASTQ file, and write all alignments to a SAM file including a header.
+    """
+
+    # the number of preceding seeds considered when chaining seeds
+    _max_predecessors = 50
+    # the number of minimizer windows processed at a time
+    _block_size = 1048576
+    # two-bit encoding of nucleotides; other letters are encoded as 4
+    _codes = np.full(256, 4, np.uint8)
+    _codes[np.frombuffer(b"ACGTUacgtu", np.uint8)] = [0, 1, 2, 3, 3, 0, 1, 2, 3, 3]
+
+    def __init__(
+        self,
+        targets,
+        k=15,
+        w=10,
+        aligner=None,
+        band_width=50,
+        max_occurrences=200,
+        max_gap=5000,
+        min_chain_score=40,
+    ):
+        """Initialize the aligner and index the minimizers of the targets."""
+        if not 0 < k < 32:
+            raise ValueError("k should be between 1 and 31")
+        if w < 1:
+            raise ValueError("w should be a positive integer")
+        if isinstance(targets, (str, Seq, MutableSeq, SeqRecord)):
+            targets = [targets]
+        else:
+            targets = list(targets)
+        if aligner is None:
+            aligner = PairwiseAligner(
+                match_score=2,
+                mismatch_score=-4,
+                open_gap_score=-6,
+                extend_gap_score=-2,
+            )
+        else:
+            aligner = copy.deepcopy(aligner)
+        aligner.mode = "local"
+        aligner.linear_space = False
+        self.targets = targets
+        self.aligner = aligner
+        self.band_width = band_width
+        self.max_occurrences = max_occurrences
+        self.max_gap = max_gap
+        self.min_chain_score = min_chain_score
+        self._k = k
+        self._w = w
+        self._sequences = [self._get_sequence(target) for target in targets]
+        positions = []
+        hashes = []
+        orientations = []
+        target_ids = []
+        for index, sequence in enumerate(self._sequences):
+            p, h, o = self._minimizers(sequence)
+            positions.append(p)
+            hashes.append(h)
+            orientations.append(o)
+            target_ids.append(np.full(len(p), index, np.int32))
+        hashes = np.concatenate(hashes)
+        order = np.argsort(hashes, kind="stable")
+        self._keys, starts = np.unique(hashes[order], return_index=True)
+        self._offsets = np.append(starts, len(order))
+        self._positions = np.concatenate(positions)[order]
+        self._orientations = np.concatenate(orientations)[order]
+        self._target_ids = np.concatenate(target_ids)[order]
+        # copies of the aligner used by each thread to extend the chains
+        self._local = threading.local()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    @property
+    def k(self):
+        """The k-mer length used for the index (read only)."""
+        return self._k
+
+    @property
+    def w(self):
+        """The window size used to select minimizers (read only)."""
+        return self._w
+
+    @staticmethod
+    def _get_sequence(sequence):
+        """Return the sequence as an upper case string (PRIVATE)."""
+        if isinstance(sequence, SeqRecord):
+            sequence = sequence.seq
+        return str(sequence).upper()
+
+    def _hash_kmers(self, values, start, size):
+        """Return the hashes of size k-mers from start, and their orientation (PRIVATE).
+
+        The hash is calculated from the canonical k-mer (the lowest of the
+        k-mer and its reverse complement, encoded with two bits per letter).
+        Also returned are boolean arrays indicating if the canonical k-mer is
+        the reverse complement, and if the k-mer is its own reverse complement.
+        """
+        forward = np.zeros(size, np.uint64)
+        reverse = np.zeros(size, np.uint64)
+        for i in range(self._k):
+            letters = values[start + i : start + i + size].astype(np.uint64)
+            forward = (forward << np.uint64(2)) | letters
+            reverse |= (np.uint64(3) - letters) << np.uint64(2 * i)
+        hashes = (np.minimum(forward, reverse) + np.uint64(1)) * np.uint64(
+            0x9E3779B97F4A7C15
+        )
+        hashes ^= hashes >> np.uint64(31)
+        return hashes, forward > reverse, forward == reverse
+
+    def _minimizers(self, sequence):
+        """Return the positions, hashes, and orientations of the minimizers (PRIVATE).
+
+        The orientation is True if the reverse complement of the k-mer is used.
+        K-mers containing letters other than A, C, G, T, or U, and k-mers equal
+        to their reverse complement, are skipped. The sequence is processed in
+        blocks to limit the memory used for long sequences.
+        """
+        k = self._k
+        w = self._w
+        codes = np.frombuffer(sequence.encode("latin-1", "replace"), np.uint8)
+        codes = self._codes[codes]
+        n = len(codes) - k + 1  # number of k-mers
+        if n <= 0:
+            return np.zeros(0, np.int32), np.zeros(0, np.uint64), np.zeros(0, bool)
+        # number of ambiguous letters before each position
+        ambiguous = np.zeros(len(codes) + 1, np.int32)
+        np.cumsum(codes == 4, out=ambiguous[1:])
+        values = np.minimum(codes, 3)
+        windows = max(n - w + 1, 1)
+        positions = []
+        hashes = []
+        orientations = []
+        for start in range(0, windows, self._block_size):
+            # the k-mers in the windows starting from start to end
+            end = min(start + self._block_size, windows)
+            stop = min(end + w - 1, n)
+            size = stop - start
+            block_hashes, orientation, palindromic = self._hash_kmers(
+                values, start, size
+            )
+            invalid = palindromic
+            invalid |= ambiguous[start + k : stop + k] != ambiguous[start:stop]
+            block_hashes[invalid] = np.iinfo(np.uint64).max
+            if size >= w:
+                # find the leftmost lowest hash in each window
+                count = size - w + 1
+                lowest = block_hashes[:count].copy()
+                minimizers = np.arange(count)
+                for offset in range(1, w):
+                    candidates = block_hashes[offset : offset + count]
+                    lower = candidates < lowest
+                    lowest[lower] = candidates[lower]
+                    minimizers[lower] = np.flatnonzero(lower) + offset
+                minimizers = np.unique(minimizers)
+            else:
+                minimizers = np.array([block_hashes.argmin()])
+            minimizers = minimizers[~invalid[minimizers]]
+            positions.append(start + minimizers)
+            hashes.append(block_hashes[minimizers])
+            orientations.append(orientation[minimizers])
+        positions = np.concatenate(positions)
+        hashes = np.concatenate(hashes)
+        orientations = np.concatenate(orientations)
+        # remove minimizers shared by the windows at both sides of a block edge
+        keep = np.diff(positions, prepend=-1) > 0
+        return positions[keep].astype(np.int32), hashes[keep], orientations[keep]
+
+    def _anchors(self, sequence):
+        """Return the seeds shared by the query and the targets (PRIVATE).
+
+        The seeds are returned as arrays of the target index, the strand
+        (True for the reverse strand), and the start positions in the target
+        and in the query; on the reverse strand, the query position is in the
+        reverse complement of the query. The seeds are sorted by target,
+        strand, target position, and query position.
+        """
+        k = self._k
+        positions, hashes, orientations = self._minimizers(sequence)
+        keys = self._keys
+        offsets = self._offsets
+        indices = np.searchsorted(keys, hashes)
+        found = indices < len(keys)
+        found[found] = keys[indices[found]] == hashes[found]
+        indices = indices[found]
+        positions = positions[found]
+        orientations = orientations[found]
+        counts = offsets[indices + 1] - offsets[indices]
+        found = counts <= self.max_occurrences
+        indices = indices[found]
+        positions = positions[found]
+        orientations = orientations[found]
+        counts = counts[found]
+        # the index of each hit in the index arrays
+        total = counts.sum()
+        hits = np.repeat(offsets[indices] - np.cumsum(counts) + counts, counts)
+        hits += np.arange(total)
+        target_ids = self._target_ids[hits]
+        target_positions = self._positions[hits].astype(np.int64)
+        strands = np.repeat(orientations, counts) != self._orientations[hits]
+        query_positions = np.repeat(positions, counts).astype(np.int64)
+        query_positions[strands] = len(sequence) - k - query_positions[strands]
+        order = np.lexsort((query_positions, target_positions, strands, target_ids))
+        return (
+            target_ids[order],
+            strands[order],
+            target_positions[order],
+            query_positions[order],
+        )
+
+    def _chain(self, target_positions, query_positions):
+        """Return the chains of seeds on one target and strand (PRIVATE).
+
+        The seeds should be sorted by target position. Each chain is returned
+        as a tuple of the chain score and the indices of the seeds in the chain.
+        """
+        k = self._k
+        max_gap = self.max_gap
+        t = target_positions.tolist()
+        q = query_positions.tolist()
+        n = len(t)
+        scores = [0.0] * n
+        predecessors = [-1] * n
+        for i in range(n):
+            best = k
+            predecessor = -1
+            ti = t[i]
+            qi = q[i]
+            for j in range(i - 1, max(i - self._max_predecessors, 0) - 1, -1):
+                dt = ti - t[j]
+                if dt > max_gap:
+                    break
+                dq = qi - q[j]
+                if dt == 0 or dq <= 0 or dq > max_gap:
+                    continue
+                score = scores[j] + min(dt, dq, k)
+                gap = abs(dt - dq)
+                if gap > 0:
+                    score -= 0.01 * k * gap + 0.5 * log2(gap)
+                if score > best:
+                    best = score
+                    predecessor = j
+            scores[i] = best
+            predecessors[i] = predecessor
+        chains = []
+        used = [False] * n
+        for i in sorted(range(n), key=scores.__getitem__, reverse=True):
+            if scores[i] < self.min_chain_score:
+                break
+            if used[i]:
+                continue
+            members = []
+            j = i
+            while j >= 0 and not used[j]:
+                used[j] = True
+                members.append(j)
+                j = predecessors[j]
+            score = scores[i]
+            if j >= 0:
+                # the chain was joined to a seed already used by a better chain
+                score -= scores[j]
+            if score >= self.min_chain_score:
+                members.reverse()
+                chains.append((score, members))
+        return chains
+
+    def _extend(self, query, sequence, target_id, strand, t, q):
+        """Extend a chain of seeds into an alignment, or return None (PRIVATE).
+
+        Here t and q are the target and query positions of the seeds in the
+        chain, with q in the reverse complement of the query for the reverse
+        strand.
+        """
+        target = self._sequences[target_id]
+        n = len(sequence)
+        diagonals = t - q
+        band_width = self.band_width
+        start = max(t[0] - q[0] - band_width, 0)
+        end = min(t[-1] + n - q[-1] + band_width, len(target))
+        # The band width depends on the chain, so set it on a copy of the
+        # aligner used by this thread only, made again if self.aligner is
+        # replaced
+        local = self._local
+        if getattr(local, "source", None) is not self.aligner:
+            local.aligner = copy.copy(self.aligner)
+            local.source = self.aligner
+        aligner = local.aligner
+        aligner.band_width = band_width + int(diagonals.max() - diagonals.min())
+        alignments = aligner.align(target[start:end], sequence, strand)
+        if len(alignments) == 0:
+            return None
+        coordinates = alignments[0].coordinates
+        coordinates[0, :] += start
+        alignment = Alignment([self.targets[target_id], query], coordinates)
+        alignment.score = alignments.score
+        return alignment
+
+    def align(self, query):
+        """Return the alignments of a query sequence to the target sequences.
+
+        The query can be a plain string, Seq, MutableSeq, or SeqRecord. The
+        alignments are returned as an Alignments object, sorted by score; see
+        the class documentation for the flag and mapq attributes.
+        """
+        sequence = self._get_sequence(query)
+        target_ids, strands, target_positions, query_positions = self._anchors(sequence)
+        chains = []
+        boundaries = np.flatnonzero(
+            (np.diff(target_ids) != 0) | (np.diff(strands) != 0)
+        )
+        starts = np.concatenate(([0], boundaries + 1))
+        ends = np.concatenate((boundaries + 1, [len(target_ids)]))
+        for start, end in zip(starts, ends):
+            if start == end:
+                continue
+            t = target_positions[start:end]
+            q = query_positions[start:end]
+            for score, members in self._chain(t, q):
+                chains.append(
+                    (score, target_ids[start], strands[start], t[members], q[members])
+                )
+        chains.sort(key=lambda chain: chain[0], reverse=True)
+        alignments = []
+        for score, target_id, strand, t, q in chains:
+            alignment = self._extend(
+                query, sequence, target_id, "-" if strand else "+", t, q
+            )
+            if alignment is None:
+                continue
+            for other in alignments:
+                if alignment.target is other.target and np.array_equal(
+                    alignment.coordinates, other.coordinates
+                ):
+                    # two chains were extended to the same alignment
+                    break
+            else:
+                alignments.append(alignment)
+        alignments.sort(key=lambda alignment: alignment.score, reverse=True)
+        self._set_flags(alignments)
+        alignments = Alignments(alignments)
+        if all(isinstance(target, SeqRecord) for target in self.targets):
+            alignments.targets = self.targets
+        return alignments
+
+    @staticmethod
+    def _set_flags(alignments):
+        """Set the SAM flag and mapq attributes of the alignments of a query (PRIVATE).
+
+        The alignments should be sorted by score.
+        """
+        intervals = []
+        for alignment in alignments:
+            start, end = sorted(alignment.coordinates[1, [0, -1]])
+            intervals.append((start, end))
+        for i, alignment in enumerate(alignments):
+            start, end = intervals[i]
+            coordinates = alignment.coordinates
+            if coordinates[1, 0] > coordinates[1, -1]:
+                alignment.flag = 0x10  # reverse strand
+            else:
+                alignment.flag = 0
+            for j in range(i):
+                if alignments[j].flag & 0x100:
+                    continue
+                overlap = min(end, intervals[j][1]) - max(start, intervals[j][0])
+                if 2 * overlap >= end - start:
+                    # secondary alignment of the same part of the query
+                    alignment.flag |= 0x100
+                    break
+            else:
+                if i > 0:
+                    # supplementary alignment of another part of the query
+                    alignment.flag |= 0x800
+        for i, alignment in enumerate(alignments):
+            if alignment.flag & 0x100:
+                alignment.mapq = 0
+                continue
+            start, end = intervals[i]
+            score = max(alignment.score, 1)
+            second = 0
+            for j, other in enumerate(alignments):
+                if other.flag & 0x100 and j > i:
+                    overlap = min(end, intervals[j][1]) - max(start, intervals[j][0])
+                    if 2 * overlap >= intervals[j][1] - intervals[j][0]:
+                        second = max(second, other.score)
+            alignment.mapq = int(round(60 * (1 - max(second, 0) / score)))
+
+    def map(self, queries):
+        """Align each query sequence, and return all alignments.
+
+        The queries can be any iterable of sequences, for example the records
+        returned by Bio.SeqIO.parse. Queries without an alignment are skipped.
+        The alignments are returned as an Alignments object; if the targets
+        are SeqRecord objects, they are stored in its targets attribute, so
+        that the sequence names and lengths are written in the header of a
+        SAM file::
+
+            alignments = aligner.map(SeqIO.parse("reads.fastq", "fastq"))
+            Align.write(alignments, "reads.sam", "sam")
+
+        """
+        alignments = Alignments()
+        for query in queries:
+            alignments.extend(self.align(query))
+        if all(isinstance(target, SeqRecord) for target in self.targets):
+            alignments.targets = self.targets
+        return alignments
+
+
 class CodonAligner(_codonaligner.CodonAligner):
     """Aligns a nucleotide sequence to an amino acid sequence.
 
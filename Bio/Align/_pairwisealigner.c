@@ -10,6 +10,11 @@
 #define PY_SSIZE_T_CLEAN
 #include "Python.h"
 #include <float.h>
+#include <limits.h>
+#include <stdint.h>
+#if defined(__SSE2__)
+#include <emmintrin.h>
+#endif
 
 
 #define HORIZONTAL 0x1
@@ -25,6 +30,8 @@
 
 #define OVERFLOW_ERROR -1
 #define MEMORY_ERROR -2
+#define STRAND_ERROR -3
+#define ALGORITHM_ERROR -4
 
 #define MISSING_LETTER -1
 
@@ -1726,6 +1733,9 @@ typedef struct {
     PyObject* alphabet;
     int* mapping;
     int wildcard;
+    int band_width;
+    double xdrop;
+    int linear_space;
 } Aligner;
 
 
@@ -1841,6 +1851,9 @@ Aligner_init(Aligner *self, PyObject *args, PyObject *kwds)
     self->alphabet = NULL;
     self->mapping = NULL;
     self->wildcard = -1;
+    self->band_width = -1;
+    self->xdrop = -1.0;
+    self->linear_space = 0;
     return 0;
 }
 
@@ -1927,6 +1940,12 @@ Aligner_str(Aligner* self)
         p += sprintf(p, "  query_right_extend_gap_score: %f\n",
                      self->query_right_extend_gap_score);
     }
+    if (self->band_width >= 0)
+        p += sprintf(p, "  band_width: %d\n", self->band_width);
+    if (self->xdrop >= 0)
+        p += sprintf(p, "  xdrop: %f\n", self->xdrop);
+    if (self->linear_space)
+        p += sprintf(p, "  linear_space: True\n");
     switch (self->mode) {
         case Global: sprintf(p, "  mode: global\n"); break;
         case Local: sprintf(p, "  mode: local\n"); break;
@@ -3688,6 +3707,93 @@ Aligner_set_epsilon(Aligner* self, PyObject* value, void* closure)
     return 0;
 }
 
+static char Aligner_band_width__doc__[] =
+"restrict the alignment to a band of diagonals of this width (None: no band)";
+
+static PyObject*
+Aligner_get_band_width(Aligner* self, void* closure)
+{
+    if (self->band_width < 0) {
+        Py_INCREF(Py_None);
+        return Py_None;
+    }
+    return PyLong_FromLong(self->band_width);
+}
+
+static int
+Aligner_set_band_width(Aligner* self, PyObject* value, void* closure)
+{
+    long band_width;
+    if (value == Py_None) {
+        self->band_width = -1;
+        return 0;
+    }
+    if (!PyLong_Check(value)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "band_width should be an integer, or None");
+        return -1;
+    }
+    band_width = PyLong_AsLong(value);
+    if (band_width == -1 && PyErr_Occurred()) return -1;
+    if (band_width < 0 || band_width > INT_MAX) {
+        PyErr_SetString(PyExc_ValueError,
+                        "band_width should be a non-negative integer");
+        return -1;
+    }
+    self->band_width = (int)band_width;
+    return 0;
+}
+
+static char Aligner_xdrop__doc__[] =
+"X-drop threshold for terminating local alignments (None: no X-drop)";
+
+static PyObject*
+Aligner_get_xdrop(Aligner* self, void* closure)
+{
+    if (self->xdrop < 0) {
+        Py_INCREF(Py_None);
+        return Py_None;
+    }
+    return PyFloat_FromDouble(self->xdrop);
+}
+
+static int
+Aligner_set_xdrop(Aligner* self, PyObject* value, void* closure)
+{
+    double xdrop;
+    if (value == Py_None) {
+        self->xdrop = -1.0;
+        return 0;
+    }
+    xdrop = PyFloat_AsDouble(value);
+    if (PyErr_Occurred()) return -1;
+    if (!(xdrop >= 0 && xdrop < DBL_MAX)) {
+        PyErr_SetString(PyExc_ValueError,
+                        "xdrop should be a non-negative number");
+        return -1;
+    }
+    self->xdrop = xdrop;
+    return 0;
+}
+
+static char Aligner_linear_space__doc__[] =
+"find a single global alignment in linear space (Myers-Miller algorithm)";
+
+static PyObject*
+Aligner_get_linear_space(Aligner* self, void* closure)
+{
+    return PyBool_FromLong(self->linear_space);
+}
+
+static int
+Aligner_set_linear_space(Aligner* self, PyObject* value, void* closure)
+{
+    const int linear_space = PyObject_IsTrue(value);
+    if (linear_space < 0) return -1;
+    self->linear_space = linear_space;
+    return 0;
+}
+
 static PyObject*
 Aligner_get_wildcard(Aligner* self, void* closure)
 {
@@ -4020,6 +4126,18 @@ static PyGetSetDef Aligner_getset[] = {
         (getter)Aligner_get_wildcard,
         (setter)Aligner_set_wildcard,
         Aligner_wildcard__doc__, NULL},
+    {"band_width",
+        (getter)Aligner_get_band_width,
+        (setter)Aligner_set_band_width,
+        Aligner_band_width__doc__, NULL},
+    {"xdrop",
+        (getter)Aligner_get_xdrop,
+        (setter)Aligner_set_xdrop,
+        Aligner_xdrop__doc__, NULL},
+    {"linear_space",
+        (getter)Aligner_get_linear_space,
+        (setter)Aligner_set_linear_space,
+        Aligner_linear_space__doc__, NULL},
     {"algorithm",
         (getter)Aligner_get_algorithm,
         (setter)NULL,
@@ -4326,13 +4444,12 @@ static PyGetSetDef Aligner_getset[] = {
             right_gap_extend_B = self->query_left_extend_gap_score; \
             break; \
         default: \
-            PyErr_SetString(PyExc_RuntimeError, "strand was neither '+' nor '-'"); \
-            return NULL; \
+            return STRAND_ERROR; \
     } \
 \
     /* Needleman-Wunsch algorithm */ \
-    row = PyMem_Malloc((nB+1)*sizeof(double)); \
-    if (!row) return PyErr_NoMemory(); \
+    row = PyMem_RawMalloc((nB+1)*sizeof(double)); \
+    if (!row) return MEMORY_ERROR; \
 \
     /* The top row of the score matrix is a special case, \
      * as there are no previously aligned characters. \
@@ -4373,8 +4490,9 @@ static PyGetSetDef Aligner_getset[] = {
     SELECT_SCORE_GLOBAL(temp + (align_score), \
                         row[nB] + right_gap_extend_B, \
                         row[nB-1] + right_gap_extend_A); \
-    PyMem_Free(row); \
-    return PyFloat_FromDouble(score);
+    PyMem_RawFree(row); \
+    *result = score; \
+    return 0;
 
 
 #define SMITHWATERMAN_SCORE(align_score) \
@@ -4390,8 +4508,8 @@ static PyGetSetDef Aligner_getset[] = {
     double maximum = 0; \
 \
     /* Smith-Waterman algorithm */ \
-    row = PyMem_Malloc((nB+1)*sizeof(double)); \
-    if (!row) return PyErr_NoMemory(); \
+    row = PyMem_RawMalloc((nB+1)*sizeof(double)); \
+    if (!row) return MEMORY_ERROR; \
 \
     /* The top row of the score matrix is a special case, \
      * as there are no previously aligned characters. \
@@ -4424,8 +4542,9 @@ static PyGetSetDef Aligner_getset[] = {
     } \
     kB = sB[nB-1]; \
     SELECT_SCORE_LOCAL1(temp + (align_score)); \
-    PyMem_Free(row); \
-    return PyFloat_FromDouble(maximum);
+    PyMem_RawFree(row); \
+    *result = maximum; \
+    return 0;
 
 
 #define NEEDLEMANWUNSCH_ALIGN(align_score) \
@@ -4631,16 +4750,15 @@ static PyGetSetDef Aligner_getset[] = {
             right_gap_extend_B = self->query_left_extend_gap_score; \
             break; \
         default: \
-            PyErr_SetString(PyExc_RuntimeError, "strand was neither '+' nor '-'"); \
-            return NULL; \
+            return STRAND_ERROR; \
     } \
 \
     /* Gotoh algorithm with three states */ \
-    M_row = PyMem_Malloc((nB+1)*sizeof(double)); \
+    M_row = PyMem_RawMalloc((nB+1)*sizeof(double)); \
     if (!M_row) goto exit; \
-    Ix_row = PyMem_Malloc((nB+1)*sizeof(double)); \
+    Ix_row = PyMem_RawMalloc((nB+1)*sizeof(double)); \
     if (!Ix_row) goto exit; \
-    Iy_row = PyMem_Malloc((nB+1)*sizeof(double)); \
+    Iy_row = PyMem_RawMalloc((nB+1)*sizeof(double)); \
     if (!Iy_row) goto exit; \
 \
     /* The top row of the score matrix is a special case, \
@@ -4741,16 +4859,17 @@ static PyGetSetDef Aligner_getset[] = {
     Iy_row[nB] = score; \
 \
     SELECT_SCORE_GLOBAL(M_row[nB], Ix_row[nB], Iy_row[nB]); \
-    PyMem_Free(M_row); \
-    PyMem_Free(Ix_row); \
-    PyMem_Free(Iy_row); \
-    return PyFloat_FromDouble(score); \
+    PyMem_RawFree(M_row); \
+    PyMem_RawFree(Ix_row); \
+    PyMem_RawFree(Iy_row); \
+    *result = score; \
+    return 0; \
 \
 exit: \
-    if (M_row) PyMem_Free(M_row); \
-    if (Ix_row) PyMem_Free(Ix_row); \
-    if (Iy_row) PyMem_Free(Iy_row); \
-    return PyErr_NoMemory(); \
+    if (M_row) PyMem_RawFree(M_row); \
+    if (Ix_row) PyMem_RawFree(Ix_row); \
+    if (Iy_row) PyMem_RawFree(Iy_row); \
+    return MEMORY_ERROR; \
 
 
 #define GOTOH_LOCAL_SCORE(align_score) \
@@ -4773,11 +4892,11 @@ exit: \
     double maximum = 0.0; \
 \
     /* Gotoh algorithm with three states */ \
-    M_row = PyMem_Malloc((nB+1)*sizeof(double)); \
+    M_row = PyMem_RawMalloc((nB+1)*sizeof(double)); \
     if (!M_row) goto exit; \
-    Ix_row = PyMem_Malloc((nB+1)*sizeof(double)); \
+    Ix_row = PyMem_RawMalloc((nB+1)*sizeof(double)); \
     if (!Ix_row) goto exit; \
-    Iy_row = PyMem_Malloc((nB+1)*sizeof(double)); \
+    Iy_row = PyMem_RawMalloc((nB+1)*sizeof(double)); \
     if (!Iy_row) goto exit; \
  \
     /* The top row of the score matrix is a special case, \
@@ -4853,15 +4972,16 @@ exit: \
                                    Ix_temp, \
                                    Iy_temp, \
                                    (align_score)); \
-    PyMem_Free(M_row); \
-    PyMem_Free(Ix_row); \
-    PyMem_Free(Iy_row); \
-    return PyFloat_FromDouble(maximum); \
+    PyMem_RawFree(M_row); \
+    PyMem_RawFree(Ix_row); \
+    PyMem_RawFree(Iy_row); \
+    *result = maximum; \
+    return 0; \
 exit: \
-    if (M_row) PyMem_Free(M_row); \
-    if (Ix_row) PyMem_Free(Ix_row); \
-    if (Iy_row) PyMem_Free(Iy_row); \
-    return PyErr_NoMemory(); \
+    if (M_row) PyMem_RawFree(M_row); \
+    if (Ix_row) PyMem_RawFree(Ix_row); \
+    if (Iy_row) PyMem_RawFree(Iy_row); \
+    return MEMORY_ERROR; \
 
 
 #define GOTOH_GLOBAL_ALIGN(align_score) \
@@ -5986,11 +6106,12 @@ exit:
 #define COMPARE_SCORE (kA == wildcard || kB == wildcard) ? 0 : (kA == kB) ? match : mismatch
 
 
-static PyObject*
+static int
 Aligner_needlemanwunsch_score_compare(Aligner* self,
                                       const int* sA, int nA,
                                       const int* sB, int nB,
-                                      unsigned char strand)
+                                      unsigned char strand,
+                                      double* result)
 {
     const double match = self->match;
     const double mismatch = self->mismatch;
@@ -5998,21 +6119,23 @@ Aligner_needlemanwunsch_score_compare(Aligner* self,
     NEEDLEMANWUNSCH_SCORE(COMPARE_SCORE);
 }
 
-static PyObject*
+static int
 Aligner_needlemanwunsch_score_matrix(Aligner* self,
                                      const int* sA, int nA,
                                      const int* sB, int nB,
-                                     unsigned char strand)
+                                     unsigned char strand,
+                                     double* result)
 {
     const Py_ssize_t n = self->substitution_matrix.shape[0];
     const double* scores = self->substitution_matrix.buf;
     NEEDLEMANWUNSCH_SCORE(MATRIX_SCORE);
 }
 
-static PyObject*
+static int
 Aligner_smithwaterman_score_compare(Aligner* self,
                                     const int* sA, int nA,
-                                    const int* sB, int nB)
+                                    const int* sB, int nB,
+                                    double* result)
 {
     const double match = self->match;
     const double mismatch = self->mismatch;
@@ -6020,10 +6143,11 @@ Aligner_smithwaterman_score_compare(Aligner* self,
     SMITHWATERMAN_SCORE(COMPARE_SCORE);
 }
 
-static PyObject*
+static int
 Aligner_smithwaterman_score_matrix(Aligner* self,
                                    const int* sA, int nA,
-                                   const int* sB, int nB)
+                                   const int* sB, int nB,
+                                   double* result)
 {
     const Py_ssize_t n = self->substitution_matrix.shape[0];
     const double* scores = self->substitution_matrix.buf;
@@ -6076,11 +6200,12 @@ Aligner_smithwaterman_align_matrix(Aligner* self,
     SMITHWATERMAN_ALIGN(MATRIX_SCORE);
 }
 
-static PyObject*
+static int
 Aligner_gotoh_global_score_compare(Aligner* self,
                                    const int* sA, int nA,
                                    const int* sB, int nB,
-                                   unsigned char strand)
+                                   unsigned char strand,
+                                   double* result)
 {
     const double match = self->match;
     const double mismatch = self->mismatch;
@@ -6088,21 +6213,23 @@ Aligner_gotoh_global_score_compare(Aligner* self,
     GOTOH_GLOBAL_SCORE(COMPARE_SCORE);
 }
 
-static PyObject*
+static int
 Aligner_gotoh_global_score_matrix(Aligner* self,
                                   const int* sA, int nA,
                                   const int* sB, int nB,
-                                  unsigned char strand)
+                                  unsigned char strand,
+                                  double* result)
 {
     const Py_ssize_t n = self->substitution_matrix.shape[0];
     const double* scores = self->substitution_matrix.buf;
     GOTOH_GLOBAL_SCORE(MATRIX_SCORE);
 }
 
-static PyObject*
+static int
 Aligner_gotoh_local_score_compare(Aligner* self,
                                   const int* sA, int nA,
-                                  const int* sB, int nB)
+                                  const int* sB, int nB,
+                                  double* result)
 {
     const double match = self->match;
     const double mismatch = self->mismatch;
@@ -6110,10 +6237,11 @@ Aligner_gotoh_local_score_compare(Aligner* self,
     GOTOH_LOCAL_SCORE(COMPARE_SCORE);
 }
 
-static PyObject*
+static int
 Aligner_gotoh_local_score_matrix(Aligner* self,
                                  const int* sA, int nA,
-                                 const int* sB, int nB)
+                                 const int* sB, int nB,
+                                 double* result)
 {
     const Py_ssize_t n = self->substitution_matrix.shape[0];
     const double* scores = self->substitution_matrix.buf;
@@ -6697,153 +6825,1665 @@ error:
     return 0;
 }
 
-static const char Aligner_score__doc__[] = "calculates the alignment score";
-
-static PyObject*
-Aligner_score(Aligner* self, PyObject* args, PyObject* keywords)
+static void
+set_kernel_error(int status)
 {
-    const int* sA;
-    const int* sB;
-    int nA;
-    int nB;
-    Py_buffer bA = {0};
-    Py_buffer bB = {0};
-    const Mode mode = self->mode;
-    const Algorithm algorithm = _get_algorithm(self);
-    char strand = '+';
-    PyObject* result = NULL;
-    PyObject* substitution_matrix = self->substitution_matrix.obj;
-
-    static char *kwlist[] = {"sequenceA", "sequenceB", "strand", NULL};
-
-    bA.obj = (PyObject*)self;
-    bB.obj = (PyObject*)self;
-    if(!PyArg_ParseTupleAndKeywords(args, keywords, "O&O&O&", kwlist,
-                                    sequence_converter, &bA,
-                                    sequence_converter, &bB,
-                                    strand_converter, &strand))
-        return NULL;
-
-    nA = (int) (bA.len / bA.itemsize);
-    nB = (int) (bB.len / bB.itemsize);
-    if (nA != bA.len / bA.itemsize || nB != bB.len / bB.itemsize) {
-        sequence_converter(NULL, &bA);
-        sequence_converter(NULL, &bB);
-        PyErr_SetString(PyExc_ValueError, "sequences too long");
-        return 0;
-    }
-    sA = bA.buf;
-    sB = bB.buf;
-
-    switch (algorithm) {
-        case NeedlemanWunschSmithWaterman:
-            switch (mode) {
-                case Global:
-                    if (substitution_matrix)
-                        result = Aligner_needlemanwunsch_score_matrix(self, sA, nA, sB, nB, strand);
-                    else
-                        result = Aligner_needlemanwunsch_score_compare(self, sA, nA, sB, nB, strand);
-                    break;
-                case Local:
-                    if (substitution_matrix)
-                        result = Aligner_smithwaterman_score_matrix(self, sA, nA, sB, nB);
-                    else
-                        result = Aligner_smithwaterman_score_compare(self, sA, nA, sB, nB);
-                    break;
-            }
-            break;
-        case Gotoh:
-            switch (mode) {
-                case Global:
-                    if (substitution_matrix)
-                        result = Aligner_gotoh_global_score_matrix(self, sA, nA, sB, nB, strand);
-                    else
-                        result = Aligner_gotoh_global_score_compare(self, sA, nA, sB, nB, strand);
-                    break;
-                case Local:
-                    if (substitution_matrix)
-                        result = Aligner_gotoh_local_score_matrix(self, sA, nA, sB, nB);
-                    else
-                        result = Aligner_gotoh_local_score_compare(self, sA, nA, sB, nB);
-                    break;
-            }
+    switch (status) {
+        case MEMORY_ERROR:
+            PyErr_NoMemory();
             break;
-        case WatermanSmithBeyer:
-            switch (mode) {
-                case Global:
-                    if (substitution_matrix)
-                        result = Aligner_watermansmithbeyer_global_score_matrix(self, sA, nA, sB, nB, strand);
-                    else
-                        result = Aligner_watermansmithbeyer_global_score_compare(self, sA, nA, sB, nB, strand);
-                    break;
-                case Local:
-                    if (substitution_matrix)
-                        result = Aligner_watermansmithbeyer_local_score_matrix(self, sA, nA, sB, nB, strand);
-                    else
-                        result = Aligner_watermansmithbeyer_local_score_compare(self, sA, nA, sB, nB, strand);
-                    break;
-            }
+        case STRAND_ERROR:
+            PyErr_SetString(PyExc_RuntimeError, "strand was neither '+' nor '-'");
             break;
-        case Unknown:
+        case ALGORITHM_ERROR:
         default:
             PyErr_SetString(PyExc_RuntimeError, "unknown algorithm");
             break;
     }
+}
 
-    sequence_converter(NULL, &bA);
-    sequence_converter(NULL, &bB);
+/* Banded and X-drop alignment.
+ *
+ * If band_width is set, only the cells (i, j) of the dynamic programming
+ * matrix with j - i between min(0, nB - nA) - band_width and
+ * max(0, nB - nA) + band_width are calculated. If xdrop is set (in local
+ * mode only), cells scoring more than xdrop below the best score found so
+ * far are dropped, and each row is only calculated as far as it can be
+ * reached from the cells that remain in the previous row. The calculation
+ * stops if no cells remain.
+ *
+ * The same three-state (Gotoh) recurrence is used for linear and affine gap
+ * scores. In the score-only case, only three rows of scores are stored; for
+ * the traceback, one byte is stored for each cell that was calculated, so
+ * time and memory scale with the size of the band instead of nA * nB. Only
+ * one optimal alignment is returned.
+ */
 
-    return result;
-}
+#define RESTRICTED_FROM_M 0
+#define RESTRICTED_FROM_Ix 1
+#define RESTRICTED_FROM_Iy 2
+#define RESTRICTED_START 3
 
-static const char Aligner_align__doc__[] = "align two sequences";
+typedef struct {
+    unsigned char* cells;   /* traces of the calculated cells, row by row */
+    size_t size;
+    size_t allocated;
+    size_t* offsets;        /* position of the first cell of each row */
+    int* starts;            /* first column calculated in each row */
+    int* ends;              /* last column calculated in each row */
+} RestrictedTrace;
 
-static PyObject*
-Aligner_align(Aligner* self, PyObject* args, PyObject* keywords)
+static int
+restricted_uses_xdrop(const Aligner* self)
 {
-    const int* sA;
-    const int* sB;
-    int nA;
-    int nB;
-    Py_buffer bA = {0};
-    Py_buffer bB = {0};
-    const Mode mode = self->mode;
-    const Algorithm algorithm = _get_algorithm(self);
-    char strand = '+';
-    PyObject* result = NULL;
-    PyObject* substitution_matrix = self->substitution_matrix.obj;
+    return self->xdrop >= 0;
+}
 
-    static char *kwlist[] = {"sequenceA", "sequenceB", "strand", NULL};
+static int
+restricted_is_used(const Aligner* self)
+{
+    return self->band_width >= 0 || self->xdrop >= 0;
+}
 
-    bA.obj = (PyObject*)self;
-    bB.obj = (PyObject*)self;
-    if(!PyArg_ParseTupleAndKeywords(args, keywords, "O&O&O&", kwlist,
-                                    sequence_converter, &bA,
-                                    sequence_converter, &bB,
-                                    strand_converter, &strand))
-        return NULL;
+/* Check if banded or X-drop alignment can be used with the current
+ * settings. Returns 1 if it can be used or is not requested; otherwise
+ * sets an exception and returns 0.
+ */
+static int
+check_restricted(const Aligner* self, Algorithm algorithm)
+{
+    if (!restricted_is_used(self)) return 1;
+    if (algorithm == WatermanSmithBeyer) {
+        PyErr_SetString(PyExc_ValueError,
+                        "band_width and xdrop cannot be used with "
+                        "gap score functions");
+        return 0;
+    }
+    if (restricted_uses_xdrop(self) && self->mode != Local) {
+        PyErr_SetString(PyExc_ValueError,
+                        "xdrop can only be used in local mode");
+        return 0;
+    }
+    return 1;
+}
 
-    nA = (int) (bA.len / bA.itemsize);
-    nB = (int) (bB.len / bB.itemsize);
-    if (nA != bA.len / bA.itemsize || nB != bB.len / bB.itemsize) {
-        sequence_converter(NULL, &bA);
-        sequence_converter(NULL, &bB);
-        PyErr_SetString(PyExc_ValueError, "sequences too long");
+/* Check if a linear-space alignment can be used with the current settings.
+ * Returns 1 if it can be used or is not requested; otherwise sets an
+ * exception and returns 0.
+ */
+static int
+check_linear_space(const Aligner* self, Algorithm algorithm)
+{
+    if (!self->linear_space) return 1;
+    if (algorithm == WatermanSmithBeyer) {
+        PyErr_SetString(PyExc_ValueError,
+                        "linear_space cannot be used with gap score functions");
         return 0;
     }
-    sA = bA.buf;
-    sB = bB.buf;
+    if (self->mode != Global) {
+        PyErr_SetString(PyExc_ValueError,
+                        "linear_space can only be used in global mode");
+        return 0;
+    }
+    if (restricted_is_used(self)) {
+        PyErr_SetString(PyExc_ValueError,
+                        "linear_space cannot be combined with band_width "
+                        "or xdrop");
+        return 0;
+    }
+    return 1;
+}
 
-    switch (algorithm) {
-        case NeedlemanWunschSmithWaterman:
-            switch (mode) {
-                case Global:
-                    if (substitution_matrix)
-                        result = Aligner_needlemanwunsch_align_matrix(self, sA, nA, sB, nB, strand);
-                    else
-                        result = Aligner_needlemanwunsch_align_compare(self, sA, nA, sB, nB, strand);
-                    break;
-                case Local:
+static double
+restricted_pair_score(const Aligner* self, int kA, int kB)
+{
+    if (self->substitution_matrix.obj) {
+        const Py_ssize_t n = self->substitution_matrix.shape[0];
+        const double* scores = self->substitution_matrix.buf;
+        return scores[kA*n+kB];
+    }
+    if (kA == self->wildcard || kB == self->wildcard) return 0;
+    return (kA == kB) ? self->match : self->mismatch;
+}
+
+static int
+restricted_trace_reserve(RestrictedTrace* trace, size_t n)
+{
+    unsigned char* cells;
+    size_t allocated = trace->allocated;
+    if (trace->size + n <= allocated) return 1;
+    if (allocated < 1024) allocated = 1024;
+    while (trace->size + n > allocated) allocated *= 2;
+    cells = PyMem_RawRealloc(trace->cells, allocated);
+    if (!cells) return 0;
+    trace->cells = cells;
+    trace->allocated = allocated;
+    return 1;
+}
+
+/* Calculate the banded or X-drop alignment score, without using the Python
+ * C API. If trace is not NULL, the traceback is stored in it, and the cell
+ * and the state where the alignment ends are returned in end_i, end_j, and
+ * end_state (end_i is -1 if there is no local alignment with a positive
+ * score).
+ */
+static int
+Aligner_restricted_dp(Aligner* self,
+                      const int* sA, int nA,
+                      const int* sB, int nB,
+                      unsigned char strand,
+                      double* result,
+                      RestrictedTrace* trace,
+                      int* end_i, int* end_j, int* end_state)
+{
+    const int local = (self->mode == Local);
+    const int xdrop = restricted_uses_xdrop(self);
+    const double x = self->xdrop;
+    const double gap_open_A = self->target_internal_open_gap_score;
+    const double gap_open_B = self->query_internal_open_gap_score;
+    const double gap_extend_A = self->target_internal_extend_gap_score;
+    const double gap_extend_B = self->query_internal_extend_gap_score;
+    double left_gap_open_A = gap_open_A;
+    double left_gap_open_B = gap_open_B;
+    double left_gap_extend_A = gap_extend_A;
+    double left_gap_extend_B = gap_extend_B;
+    double right_gap_open_A = gap_open_A;
+    double right_gap_open_B = gap_open_B;
+    double right_gap_extend_A = gap_extend_A;
+    double right_gap_extend_B = gap_extend_B;
+    double open_A, extend_A, open_B, extend_B;
+    double* memory;
+    double* M_prev;
+    double* Ix_prev;
+    double* Iy_prev;
+    double* M_row;
+    double* Ix_row;
+    double* Iy_row;
+    double* swap;
+    double M, Ix, Iy, score, temp;
+    double maximum = 0.0;
+    int i, j;
+    int kA = 0;
+    int dmin, dmax;
+    int lo, hi, last;
+    int plo = 0, phi = -1;
+    int first_live, last_live;
+    int from_M, from_Ix, from_Iy;
+    unsigned char* cells = NULL;
+
+    if (!local) {
+        switch (strand) {
+            case '+':
+                left_gap_open_A = self->target_left_open_gap_score;
+                left_gap_open_B = self->query_left_open_gap_score;
+                left_gap_extend_A = self->target_left_extend_gap_score;
+                left_gap_extend_B = self->query_left_extend_gap_score;
+                right_gap_open_A = self->target_right_open_gap_score;
+                right_gap_open_B = self->query_right_open_gap_score;
+                right_gap_extend_A = self->target_right_extend_gap_score;
+                right_gap_extend_B = self->query_right_extend_gap_score;
+                break;
+            case '-':
+                left_gap_open_A = self->target_right_open_gap_score;
+                left_gap_open_B = self->query_right_open_gap_score;
+                left_gap_extend_A = self->target_right_extend_gap_score;
+                left_gap_extend_B = self->query_right_extend_gap_score;
+                right_gap_open_A = self->target_left_open_gap_score;
+                right_gap_open_B = self->query_left_open_gap_score;
+                right_gap_extend_A = self->target_left_extend_gap_score;
+                right_gap_extend_B = self->query_left_extend_gap_score;
+                break;
+            default:
+                return STRAND_ERROR;
+        }
+    }
+    if (self->band_width >= 0) {
+        dmin = ((nB < nA) ? nB - nA : 0) - self->band_width;
+        dmax = ((nB > nA) ? nB - nA : 0) + self->band_width;
+    }
+    else {
+        dmin = -nA;
+        dmax = nB;
+    }
+
+    memory = PyMem_RawMalloc(6*(size_t)(nB+1)*sizeof(double));
+    if (!memory) return MEMORY_ERROR;
+    M_prev = memory;
+    Ix_prev = M_prev + nB + 1;
+    Iy_prev = Ix_prev + nB + 1;
+    M_row = Iy_prev + nB + 1;
+    Ix_row = M_row + nB + 1;
+    Iy_row = Ix_row + nB + 1;
+
+    if (trace) *end_i = -1;
+    for (i = 0; i <= nA; i++) {
+        lo = i + dmin;
+        if (lo < 0) lo = 0;
+        hi = i + dmax;
+        if (hi > nB) hi = nB;
+        if (i > 0) {
+            /* Cells left of the previous row cannot be reached */
+            if (lo < plo) lo = plo;
+            kA = sA[i-1];
+        }
+        if (lo > hi) break;
+        if (i == 0) {
+            open_A = left_gap_open_A;
+            extend_A = left_gap_extend_A;
+        }
+        else if (i == nA) {
+            open_A = right_gap_open_A;
+            extend_A = right_gap_extend_A;
+        }
+        else {
+            open_A = gap_open_A;
+            extend_A = gap_extend_A;
+        }
+        if (trace) {
+            if (!restricted_trace_reserve(trace, hi - lo + 1)) {
+                PyMem_RawFree(memory);
+                return MEMORY_ERROR;
+            }
+            trace->offsets[i] = trace->size;
+            trace->starts[i] = lo;
+            cells = trace->cells + trace->size;
+        }
+        last = lo - 1;
+        for (j = lo; j <= hi; j++) {
+            /* M: the letters i-1 and j-1 are aligned to each other */
+            from_M = RESTRICTED_START;
+            if (i == 0 || j == 0) M = (local || (i == 0 && j == 0)) ? 0 : -DBL_MAX;
+            else {
+                score = -DBL_MAX;
+                if (j - 1 >= plo && j - 1 <= phi) {
+                    score = M_prev[j-1];
+                    from_M = RESTRICTED_FROM_M;
+                    temp = Ix_prev[j-1];
+                    if (temp > score) {
+                        score = temp;
+                        from_M = RESTRICTED_FROM_Ix;
+                    }
+                    temp = Iy_prev[j-1];
+                    if (temp > score) {
+                        score = temp;
+                        from_M = RESTRICTED_FROM_Iy;
+                    }
+                }
+                if (local && score <= 0) {
+                    score = 0;
+                    from_M = RESTRICTED_START;
+                }
+                if (score == -DBL_MAX) M = -DBL_MAX;
+                else M = score + restricted_pair_score(self, kA, sB[j-1]);
+            }
+            /* Ix: gap in the query (vertical) */
+            from_Ix = RESTRICTED_FROM_M;
+            Ix = -DBL_MAX;
+            if (i > 0 && j >= plo && j <= phi) {
+                if (j == 0) {
+                    open_B = left_gap_open_B;
+                    extend_B = left_gap_extend_B;
+                }
+                else if (j == nB) {
+                    open_B = right_gap_open_B;
+                    extend_B = right_gap_extend_B;
+                }
+                else {
+                    open_B = gap_open_B;
+                    extend_B = gap_extend_B;
+                }
+                Ix = M_prev[j] + open_B;
+                temp = Ix_prev[j] + extend_B;
+                if (temp > Ix) {
+                    Ix = temp;
+                    from_Ix = RESTRICTED_FROM_Ix;
+                }
+                temp = Iy_prev[j] + open_B;
+                if (temp > Ix) {
+                    Ix = temp;
+                    from_Ix = RESTRICTED_FROM_Iy;
+                }
+            }
+            /* Iy: gap in the target (horizontal) */
+            from_Iy = RESTRICTED_FROM_M;
+            Iy = -DBL_MAX;
+            if (j > lo) {
+                Iy = M_row[j-1] + open_A;
+                temp = Ix_row[j-1] + open_A;
+                if (temp > Iy) {
+                    Iy = temp;
+                    from_Iy = RESTRICTED_FROM_Ix;
+                }
+                temp = Iy_row[j-1] + extend_A;
+                if (temp > Iy) {
+                    Iy = temp;
+                    from_Iy = RESTRICTED_FROM_Iy;
+                }
+            }
+            if (xdrop) {
+                score = M;
+                if (Ix > score) score = Ix;
+                if (Iy > score) score = Iy;
+                if (score < maximum - x) {
+                    /* drop this cell; beyond the previous row, only
+                     * horizontal gaps can continue, so stop there */
+                    if (j > phi) break;
+                    M = -DBL_MAX;
+                    Ix = -DBL_MAX;
+                    Iy = -DBL_MAX;
+                }
+            }
+            M_row[j] = M;
+            Ix_row[j] = Ix;
+            Iy_row[j] = Iy;
+            if (trace) cells[j-lo] = from_M | (from_Ix << 2) | (from_Iy << 4);
+            if (local && i > 0 && j > 0 && M > maximum) {
+                maximum = M;
+                if (trace) {
+                    *end_i = i;
+                    *end_j = j;
+                    *end_state = RESTRICTED_FROM_M;
+                }
+            }
+            last = j;
+        }
+        if (trace) {
+            trace->ends[i] = last;
+            trace->size += last - lo + 1;
+        }
+        plo = lo;
+        phi = last;
+        if (xdrop) {
+            /* Only continue from the cells that were not dropped */
+            first_live = phi + 1;
+            last_live = plo - 1;
+            for (j = plo; j <= phi; j++) {
+                score = M_row[j];
+                if (Ix_row[j] > score) score = Ix_row[j];
+                if (Iy_row[j] > score) score = Iy_row[j];
+                if (score >= maximum - x) {
+                    if (j < first_live) first_live = j;
+                    last_live = j;
+                }
+            }
+            plo = first_live;
+            phi = last_live;
+            if (plo > phi) {
+                i++;
+                break;
+            }
+        }
+        swap = M_prev; M_prev = M_row; M_row = swap;
+        swap = Ix_prev; Ix_prev = Ix_row; Ix_row = swap;
+        swap = Iy_prev; Iy_prev = Iy_row; Iy_row = swap;
+    }
+    if (trace) {
+        /* rows that were not reached */
+        for ( ; i <= nA; i++) {
+            trace->offsets[i] = trace->size;
+            trace->starts[i] = 0;
+            trace->ends[i] = -1;
+        }
+    }
+    if (local) *result = maximum;
+    else {
+        /* The last cell (nA, nB) is always inside the band */
+        score = M_prev[nB];
+        if (trace) *end_state = RESTRICTED_FROM_M;
+        if (Ix_prev[nB] > score) {
+            score = Ix_prev[nB];
+            if (trace) *end_state = RESTRICTED_FROM_Ix;
+        }
+        if (Iy_prev[nB] > score) {
+            score = Iy_prev[nB];
+            if (trace) *end_state = RESTRICTED_FROM_Iy;
+        }
+        if (trace) {
+            *end_i = nA;
+            *end_j = nB;
+        }
+        *result = score;
+    }
+    PyMem_RawFree(memory);
+    return 0;
+}
+
+static int
+Aligner_restricted_score(Aligner* self,
+                         const int* sA, int nA,
+                         const int* sB, int nB,
+                         unsigned char strand,
+                         double* score)
+{
+    return Aligner_restricted_dp(self, sA, nA, sB, nB, strand, score,
+                                 NULL, NULL, NULL, NULL);
+}
+
+static PyObject*
+restricted_path(const RestrictedTrace* trace, Mode mode,
+                int i, int j, int state, int nA, int nB,
+                unsigned char strand)
+{
+    int n = 0;
+    int k;
+    int direction = 0;
+    int step;
+    int source;
+    unsigned char cell;
+    int* coordinates;
+    PyObject* target_row = NULL;
+    PyObject* query_row = NULL;
+    PyObject* value;
+
+    /* turning points of the path, from the end to the start */
+    coordinates = PyMem_Malloc(2*((size_t)nA+nB+2)*sizeof(int));
+    if (!coordinates) return PyErr_NoMemory();
+    coordinates[n++] = i;
+    coordinates[n++] = j;
+    while (i > 0 || j > 0) {
+        cell = trace->cells[trace->offsets[i] + j - trace->starts[i]];
+        switch (state) {
+            case RESTRICTED_FROM_M:
+                if (i == 0 || j == 0) goto done;
+                source = cell & 0x3;
+                step = DIAGONAL;
+                break;
+            case RESTRICTED_FROM_Ix:
+                source = (cell >> 2) & 0x3;
+                step = VERTICAL;
+                break;
+            case RESTRICTED_FROM_Iy:
+            default:
+                source = (cell >> 4) & 0x3;
+                step = HORIZONTAL;
+                break;
+        }
+        if (direction && step != direction) {
+            coordinates[n++] = i;
+            coordinates[n++] = j;
+        }
+        direction = step;
+        if (step & VERTICAL) i--;
+        if (step & HORIZONTAL) j--;
+        if (step == DIAGONAL) {
+            i--;
+            j--;
+        }
+        if (source == RESTRICTED_START) break;
+        state = source;
+    }
+done:
+    coordinates[n++] = i;
+    coordinates[n++] = j;
+    n /= 2;
+    target_row = PyTuple_New(n);
+    if (!target_row) goto exit;
+    query_row = PyTuple_New(n);
+    if (!query_row) goto exit;
+    for (k = 0; k < n; k++) {
+        i = coordinates[2*(n-1-k)];
+        j = coordinates[2*(n-1-k)+1];
+        if (strand == '-') j = nB - j;
+        value = PyLong_FromLong(i);
+        if (!value) goto exit;
+        PyTuple_SET_ITEM(target_row, k, value);
+        value = PyLong_FromLong(j);
+        if (!value) goto exit;
+        PyTuple_SET_ITEM(query_row, k, value);
+    }
+    PyMem_Free(coordinates);
+    return Py_BuildValue("NN", target_row, query_row);
+exit:
+    PyMem_Free(coordinates);
+    Py_XDECREF(target_row);
+    Py_XDECREF(query_row);
+    return NULL;
+}
+
+static PyObject*
+Aligner_restricted_align(Aligner* self,
+                         const int* sA, int nA,
+                         const int* sB, int nB,
+                         unsigned char strand)
+{
+    RestrictedTrace trace = {0};
+    PyObject* path = NULL;
+    PyObject* result = NULL;
+    double score;
+    int end_i = -1;
+    int end_j = 0;
+    int end_state = RESTRICTED_FROM_M;
+    int status;
+
+    trace.offsets = PyMem_RawMalloc(((size_t)nA+1)*sizeof(size_t));
+    trace.starts = PyMem_RawMalloc(((size_t)nA+1)*sizeof(int));
+    trace.ends = PyMem_RawMalloc(((size_t)nA+1)*sizeof(int));
+    if (!trace.offsets || !trace.starts || !trace.ends) {
+        PyErr_NoMemory();
+        goto exit;
+    }
+    Py_BEGIN_ALLOW_THREADS
+    status = Aligner_restricted_dp(self, sA, nA, sB, nB, strand, &score,
+                                   &trace, &end_i, &end_j, &end_state);
+    Py_END_ALLOW_THREADS
+    if (status < 0) {
+        set_kernel_error(status);
+        goto exit;
+    }
+    if (end_i < 0) {
+        Py_INCREF(Py_None);
+        path = Py_None;
+    }
+    else {
+        path = restricted_path(&trace, self->mode, end_i, end_j, end_state,
+                               nA, nB, strand);
+        if (!path) goto exit;
+    }
+    result = Py_BuildValue("dN", score, path);
+exit:
+    if (trace.cells) PyMem_RawFree(trace.cells);
+    if (trace.offsets) PyMem_RawFree(trace.offsets);
+    if (trace.starts) PyMem_RawFree(trace.starts);
+    if (trace.ends) PyMem_RawFree(trace.ends);
+    return result;
+}
+
+/* Linear-space global alignment.
+ *
+ * If linear_space is set, a single optimal global alignment is found with
+ * the divide-and-conquer algorithm of Hirschberg, extended to affine gaps by
+ * Myers and Miller (CABIOS 4: 11-17 (1988)), in O(nA + nB) memory. For each
+ * subproblem, the scores of the best paths from its start to each cell of
+ * the middle row, and from each cell of the middle row to its end, are
+ * calculated separately for the three states (M, Ix, Iy), and the
+ * subproblem is split at the cell and state with the highest total score.
+ * Small subproblems are solved directly with a traceback matrix. As the
+ * recurrences are the same as in the Gotoh algorithm, including the end gap
+ * scores, the score is the same as for the other algorithms.
+ */
+
+#define LINEAR_STATE_M 0
+#define LINEAR_STATE_Ix 1
+#define LINEAR_STATE_Iy 2
+#define LINEAR_STATE_ANY 3
+#define LINEAR_BASE_CELLS 65536
+
+typedef struct {
+    const Aligner* aligner;
+    const int* sA;
+    const int* sB;
+    int nA;
+    int nB;
+    double left_open_A;
+    double left_extend_A;
+    double right_open_A;
+    double right_extend_A;
+    double left_open_B;
+    double left_extend_B;
+    double right_open_B;
+    double right_extend_B;
+    double* rows;           /* six rows of nB + 1 scores */
+    int* path;              /* cells (i, j) on the path, from the start */
+    int length;             /* number of cells on the path */
+} LinearSpace;
+
+static double
+linear_open_A(const LinearSpace* ls, int i)
+{
+    if (i == 0) return ls->left_open_A;
+    if (i == ls->nA) return ls->right_open_A;
+    return ls->aligner->target_internal_open_gap_score;
+}
+
+static double
+linear_extend_A(const LinearSpace* ls, int i)
+{
+    if (i == 0) return ls->left_extend_A;
+    if (i == ls->nA) return ls->right_extend_A;
+    return ls->aligner->target_internal_extend_gap_score;
+}
+
+static double
+linear_open_B(const LinearSpace* ls, int j)
+{
+    if (j == 0) return ls->left_open_B;
+    if (j == ls->nB) return ls->right_open_B;
+    return ls->aligner->query_internal_open_gap_score;
+}
+
+static double
+linear_extend_B(const LinearSpace* ls, int j)
+{
+    if (j == 0) return ls->left_extend_B;
+    if (j == ls->nB) return ls->right_extend_B;
+    return ls->aligner->query_internal_extend_gap_score;
+}
+
+static void
+linear_append(LinearSpace* ls, int i, int j)
+{
+    const int n = ls->length;
+    if (n > 0 && ls->path[2*n-2] == i && ls->path[2*n-1] == j) return;
+    ls->path[2*n] = i;
+    ls->path[2*n+1] = j;
+    ls->length++;
+}
+
+/* Solve a small subproblem directly, storing the traceback for each cell. */
+static int
+linear_base(LinearSpace* ls, int i0, int j0, int start, int i1, int j1, int end,
+            double* result)
+{
+    const Aligner* self = ls->aligner;
+    const int* sA = ls->sA;
+    const int* sB = ls->sB;
+    const int m = i1 - i0;
+    const int n = j1 - j0;
+    double* M_row = ls->rows;
+    double* Ix_row = M_row + n + 1;
+    double* Iy_row = Ix_row + n + 1;
+    unsigned char* traces;
+    unsigned char trace;
+    double M_temp, Ix_temp, Iy_temp, M_diag, Ix_diag, Iy_diag;
+    double score, temp, open, extend;
+    int* cells;
+    int i, j, k, state, source;
+
+    traces = PyMem_RawMalloc((size_t)(m+1)*(n+1));
+    if (!traces) return MEMORY_ERROR;
+    for (i = i0; i <= i1; i++) {
+        M_diag = Ix_diag = Iy_diag = -DBL_MAX;
+        for (j = j0; j <= j1; j++) {
+            trace = 0;
+            if (i == i0 && j == j0) {
+                M_temp = (start == LINEAR_STATE_M) ? 0 : -DBL_MAX;
+                Ix_temp = (start == LINEAR_STATE_Ix) ? 0 : -DBL_MAX;
+                Iy_temp = (start == LINEAR_STATE_Iy) ? 0 : -DBL_MAX;
+            }
+            else {
+                /* M */
+                M_temp = -DBL_MAX;
+                if (i > i0 && j > j0) {
+                    score = M_diag;
+                    temp = Ix_diag;
+                    if (temp > score) {
+                        score = temp;
+                        trace = LINEAR_STATE_Ix;
+                    }
+                    temp = Iy_diag;
+                    if (temp > score) {
+                        score = temp;
+                        trace = LINEAR_STATE_Iy;
+                    }
+                    if (score > -DBL_MAX)
+                        M_temp = score + restricted_pair_score(self, sA[i-1], sB[j-1]);
+                }
+                /* Ix, from the cell above */
+                Ix_temp = -DBL_MAX;
+                if (i > i0) {
+                    open = linear_open_B(ls, j);
+                    extend = linear_extend_B(ls, j);
+                    Ix_temp = M_row[j-j0] + open;
+                    source = LINEAR_STATE_M;
+                    temp = Ix_row[j-j0] + extend;
+                    if (temp > Ix_temp) {
+                        Ix_temp = temp;
+                        source = LINEAR_STATE_Ix;
+                    }
+                    temp = Iy_row[j-j0] + open;
+                    if (temp > Ix_temp) {
+                        Ix_temp = temp;
+                        source = LINEAR_STATE_Iy;
+                    }
+                    trace |= source << 2;
+                }
+                /* Iy, from the cell to the left */
+                Iy_temp = -DBL_MAX;
+                if (j > j0) {
+                    open = linear_open_A(ls, i);
+                    extend = linear_extend_A(ls, i);
+                    Iy_temp = M_row[j-j0-1] + open;
+                    source = LINEAR_STATE_M;
+                    temp = Ix_row[j-j0-1] + open;
+                    if (temp > Iy_temp) {
+                        Iy_temp = temp;
+                        source = LINEAR_STATE_Ix;
+                    }
+                    temp = Iy_row[j-j0-1] + extend;
+                    if (temp > Iy_temp) {
+                        Iy_temp = temp;
+                        source = LINEAR_STATE_Iy;
+                    }
+                    trace |= source << 4;
+                }
+            }
+            if (i > i0) {
+                M_diag = M_row[j-j0];
+                Ix_diag = Ix_row[j-j0];
+                Iy_diag = Iy_row[j-j0];
+            }
+            M_row[j-j0] = M_temp;
+            Ix_row[j-j0] = Ix_temp;
+            Iy_row[j-j0] = Iy_temp;
+            traces[(size_t)(i-i0)*(n+1)+(j-j0)] = trace;
+        }
+    }
+    state = end;
+    if (state == LINEAR_STATE_ANY) {
+        state = LINEAR_STATE_M;
+        score = M_row[n];
+        if (Ix_row[n] > score) {
+            state = LINEAR_STATE_Ix;
+            score = Ix_row[n];
+        }
+        if (Iy_row[n] > score) state = LINEAR_STATE_Iy;
+    }
+    if (result) {
+        switch (state) {
+            case LINEAR_STATE_M: *result = M_row[n]; break;
+            case LINEAR_STATE_Ix: *result = Ix_row[n]; break;
+            case LINEAR_STATE_Iy: *result = Iy_row[n]; break;
+        }
+    }
+    /* trace back from the end to the start, then add the cells in order */
+    cells = PyMem_RawMalloc(2*((size_t)m+n+1)*sizeof(int));
+    if (!cells) {
+        PyMem_RawFree(traces);
+        return MEMORY_ERROR;
+    }
+    i = i1;
+    j = j1;
+    k = 0;
+    while (1) {
+        cells[k++] = i;
+        cells[k++] = j;
+        if (i == i0 && j == j0) break;
+        trace = traces[(size_t)(i-i0)*(n+1)+(j-j0)];
+        switch (state) {
+            case LINEAR_STATE_M:
+                state = trace & 0x3;
+                i--;
+                j--;
+                break;
+            case LINEAR_STATE_Ix:
+                state = (trace >> 2) & 0x3;
+                i--;
+                break;
+            case LINEAR_STATE_Iy:
+                state = (trace >> 4) & 0x3;
+                j--;
+                break;
+        }
+    }
+    while (k > 0) {
+        k -= 2;
+        linear_append(ls, cells[k], cells[k+1]);
+    }
+    PyMem_RawFree(cells);
+    PyMem_RawFree(traces);
+    return 0;
+}
+
+/* Find the cell and state in row imid where the best path from (i0, j0) in
+ * state start to (i1, j1) in state end crosses, and return its score.
+ */
+static double
+linear_split(LinearSpace* ls, int i0, int j0, int start, int i1, int j1, int end,
+             int imid, int* jmid, int* state)
+{
+    const Aligner* self = ls->aligner;
+    const int* sA = ls->sA;
+    const int* sB = ls->sB;
+    const int n = j1 - j0;
+    double* M_row = ls->rows;
+    double* Ix_row = M_row + n + 1;
+    double* Iy_row = Ix_row + n + 1;
+    double* M_back = Iy_row + n + 1;
+    double* Ix_back = M_back + n + 1;
+    double* Iy_back = Ix_back + n + 1;
+    double M_diag, Ix_diag, Iy_diag, M_temp, Ix_temp, Iy_temp;
+    double score, temp, open, diagonal, vertical_open, vertical_extend;
+    double horizontal_open, horizontal_extend;
+    double best = -DBL_MAX;
+    int i, j;
+
+    /* forward: best scores from the start to each cell in row imid */
+    for (i = i0; i <= imid; i++) {
+        M_diag = Ix_diag = Iy_diag = -DBL_MAX;
+        for (j = j0; j <= j1; j++) {
+            if (i == i0 && j == j0) {
+                M_temp = (start == LINEAR_STATE_M) ? 0 : -DBL_MAX;
+                Ix_temp = (start == LINEAR_STATE_Ix) ? 0 : -DBL_MAX;
+                Iy_temp = (start == LINEAR_STATE_Iy) ? 0 : -DBL_MAX;
+            }
+            else {
+                M_temp = -DBL_MAX;
+                if (i > i0 && j > j0) {
+                    score = M_diag;
+                    if (Ix_diag > score) score = Ix_diag;
+                    if (Iy_diag > score) score = Iy_diag;
+                    if (score > -DBL_MAX)
+                        M_temp = score + restricted_pair_score(self, sA[i-1], sB[j-1]);
+                }
+                Ix_temp = -DBL_MAX;
+                if (i > i0) {
+                    open = linear_open_B(ls, j);
+                    Ix_temp = M_row[j-j0] + open;
+                    temp = Ix_row[j-j0] + linear_extend_B(ls, j);
+                    if (temp > Ix_temp) Ix_temp = temp;
+                    temp = Iy_row[j-j0] + open;
+                    if (temp > Ix_temp) Ix_temp = temp;
+                }
+                Iy_temp = -DBL_MAX;
+                if (j > j0) {
+                    open = linear_open_A(ls, i);
+                    Iy_temp = M_row[j-j0-1] + open;
+                    temp = Ix_row[j-j0-1] + open;
+                    if (temp > Iy_temp) Iy_temp = temp;
+                    temp = Iy_row[j-j0-1] + linear_extend_A(ls, i);
+                    if (temp > Iy_temp) Iy_temp = temp;
+                }
+            }
+            if (i > i0) {
+                M_diag = M_row[j-j0];
+                Ix_diag = Ix_row[j-j0];
+                Iy_diag = Iy_row[j-j0];
+            }
+            M_row[j-j0] = M_temp;
+            Ix_row[j-j0] = Ix_temp;
+            Iy_row[j-j0] = Iy_temp;
+        }
+    }
+    /* backward: best scores from each cell in row imid, in each state, to
+     * the end */
+    for (i = i1; i >= imid; i--) {
+        M_diag = -DBL_MAX;
+        for (j = j1; j >= j0; j--) {
+            if (i == i1 && j == j1) {
+                M_temp = (end == LINEAR_STATE_M || end == LINEAR_STATE_ANY) ? 0 : -DBL_MAX;
+                Ix_temp = (end == LINEAR_STATE_Ix || end == LINEAR_STATE_ANY) ? 0 : -DBL_MAX;
+                Iy_temp = (end == LINEAR_STATE_Iy || end == LINEAR_STATE_ANY) ? 0 : -DBL_MAX;
+            }
+            else {
+                diagonal = -DBL_MAX;
+                if (i < i1 && j < j1 && M_diag > -DBL_MAX)
+                    diagonal = M_diag + restricted_pair_score(self, sA[i], sB[j]);
+                vertical_open = -DBL_MAX;
+                vertical_extend = -DBL_MAX;
+                if (i < i1) {
+                    vertical_open = Ix_back[j-j0] + linear_open_B(ls, j);
+                    vertical_extend = Ix_back[j-j0] + linear_extend_B(ls, j);
+                }
+                horizontal_open = -DBL_MAX;
+                horizontal_extend = -DBL_MAX;
+                if (j < j1) {
+                    horizontal_open = Iy_back[j-j0+1] + linear_open_A(ls, i);
+                    horizontal_extend = Iy_back[j-j0+1] + linear_extend_A(ls, i);
+                }
+                M_temp = diagonal;
+                if (vertical_open > M_temp) M_temp = vertical_open;
+                if (horizontal_open > M_temp) M_temp = horizontal_open;
+                Ix_temp = diagonal;
+                if (vertical_extend > Ix_temp) Ix_temp = vertical_extend;
+                if (horizontal_open > Ix_temp) Ix_temp = horizontal_open;
+                Iy_temp = diagonal;
+                if (vertical_open > Iy_temp) Iy_temp = vertical_open;
+                if (horizontal_extend > Iy_temp) Iy_temp = horizontal_extend;
+            }
+            if (i < i1) M_diag = M_back[j-j0];
+            M_back[j-j0] = M_temp;
+            Ix_back[j-j0] = Ix_temp;
+            Iy_back[j-j0] = Iy_temp;
+        }
+    }
+    /* combine the two halves in row imid */
+    for (j = j0; j <= j1; j++) {
+        if (M_row[j-j0] > -DBL_MAX && M_back[j-j0] > -DBL_MAX) {
+            score = M_row[j-j0] + M_back[j-j0];
+            if (score > best) {
+                best = score;
+                *jmid = j;
+                *state = LINEAR_STATE_M;
+            }
+        }
+        if (Ix_row[j-j0] > -DBL_MAX && Ix_back[j-j0] > -DBL_MAX) {
+            score = Ix_row[j-j0] + Ix_back[j-j0];
+            if (score > best) {
+                best = score;
+                *jmid = j;
+                *state = LINEAR_STATE_Ix;
+            }
+        }
+        if (Iy_row[j-j0] > -DBL_MAX && Iy_back[j-j0] > -DBL_MAX) {
+            score = Iy_row[j-j0] + Iy_back[j-j0];
+            if (score > best) {
+                best = score;
+                *jmid = j;
+                *state = LINEAR_STATE_Iy;
+            }
+        }
+    }
+    return best;
+}
+
+/* Find the best path from (i0, j0) in state start to (i1, j1) in state end,
+ * and add its cells to the path. If result is not NULL, the score of the
+ * path is stored in it.
+ */
+static int
+linear_align(LinearSpace* ls, int i0, int j0, int start, int i1, int j1, int end,
+             double* result)
+{
+    int imid, jmid = j0, state = LINEAR_STATE_M;
+    int status;
+    double score;
+
+    if (i1 - i0 <= 1
+     || (double)(i1 - i0 + 1) * (j1 - j0 + 1) <= LINEAR_BASE_CELLS)
+        return linear_base(ls, i0, j0, start, i1, j1, end, result);
+    imid = (i0 + i1) / 2;
+    score = linear_split(ls, i0, j0, start, i1, j1, end, imid, &jmid, &state);
+    if (score == -DBL_MAX)
+        return linear_base(ls, i0, j0, start, i1, j1, end, result);
+    if (result) *result = score;
+    status = linear_align(ls, i0, j0, start, imid, jmid, state, NULL);
+    if (status < 0) return status;
+    return linear_align(ls, imid, jmid, state, i1, j1, end, NULL);
+}
+
+static PyObject*
+Aligner_linear_align(Aligner* self,
+                     const int* sA, int nA,
+                     const int* sB, int nB,
+                     unsigned char strand)
+{
+    LinearSpace ls;
+    PyObject* target_row = NULL;
+    PyObject* query_row = NULL;
+    PyObject* value;
+    double score;
+    int status;
+    int i, j, k, n, di, dj, direction;
+    int* coordinates = NULL;
+
+    ls.aligner = self;
+    ls.sA = sA;
+    ls.sB = sB;
+    ls.nA = nA;
+    ls.nB = nB;
+    switch (strand) {
+        case '+':
+            ls.left_open_A = self->target_left_open_gap_score;
+            ls.left_extend_A = self->target_left_extend_gap_score;
+            ls.right_open_A = self->target_right_open_gap_score;
+            ls.right_extend_A = self->target_right_extend_gap_score;
+            ls.left_open_B = self->query_left_open_gap_score;
+            ls.left_extend_B = self->query_left_extend_gap_score;
+            ls.right_open_B = self->query_right_open_gap_score;
+            ls.right_extend_B = self->query_right_extend_gap_score;
+            break;
+        case '-':
+            ls.left_open_A = self->target_right_open_gap_score;
+            ls.left_extend_A = self->target_right_extend_gap_score;
+            ls.right_open_A = self->target_left_open_gap_score;
+            ls.right_extend_A = self->target_left_extend_gap_score;
+            ls.left_open_B = self->query_right_open_gap_score;
+            ls.left_extend_B = self->query_right_extend_gap_score;
+            ls.right_open_B = self->query_left_open_gap_score;
+            ls.right_extend_B = self->query_left_extend_gap_score;
+            break;
+        default:
+            PyErr_SetString(PyExc_RuntimeError, "strand was neither '+' nor '-'");
+            return NULL;
+    }
+    ls.rows = PyMem_RawMalloc(6*((size_t)nB+1)*sizeof(double));
+    ls.path = PyMem_RawMalloc(2*((size_t)nA+nB+1)*sizeof(int));
+    ls.length = 0;
+    if (!ls.rows || !ls.path) {
+        PyErr_NoMemory();
+        goto exit;
+    }
+    Py_BEGIN_ALLOW_THREADS
+    status = linear_align(&ls, 0, 0, LINEAR_STATE_M, nA, nB, LINEAR_STATE_ANY,
+                          &score);
+    Py_END_ALLOW_THREADS
+    if (status < 0) {
+        set_kernel_error(status);
+        goto exit;
+    }
+
+    /* keep only the cells where the direction changes */
+    coordinates = ls.path;
+    n = 1;
+    direction = -1;
+    for (k = 1; k < ls.length; k++) {
+        di = coordinates[2*k] - coordinates[2*k-2];
+        dj = coordinates[2*k+1] - coordinates[2*k-1];
+        if (2*di + dj != direction) {
+            coordinates[2*n-2] = coordinates[2*k-2];
+            coordinates[2*n-1] = coordinates[2*k-1];
+            n++;
+            direction = 2*di + dj;
+        }
+    }
+    coordinates[2*n-2] = coordinates[2*ls.length-2];
+    coordinates[2*n-1] = coordinates[2*ls.length-1];
+    target_row = PyTuple_New(n);
+    if (!target_row) goto exit;
+    query_row = PyTuple_New(n);
+    if (!query_row) goto exit;
+    for (k = 0; k < n; k++) {
+        i = coordinates[2*k];
+        j = coordinates[2*k+1];
+        if (strand == '-') j = nB - j;
+        value = PyLong_FromLong(i);
+        if (!value) goto exit;
+        PyTuple_SET_ITEM(target_row, k, value);
+        value = PyLong_FromLong(j);
+        if (!value) goto exit;
+        PyTuple_SET_ITEM(query_row, k, value);
+    }
+    PyMem_RawFree(ls.rows);
+    PyMem_RawFree(ls.path);
+    return Py_BuildValue("d(NN)", score, target_row, query_row);
+
+exit:
+    if (ls.rows) PyMem_RawFree(ls.rows);
+    if (ls.path) PyMem_RawFree(ls.path);
+    Py_XDECREF(target_row);
+    Py_XDECREF(query_row);
+    return NULL;
+}
+
+/* Striped score-only kernel.
+ *
+ * For global and local alignments using a substitution matrix, the score can
+ * be calculated with the query striped across the eight 16-bit lanes of an
+ * SSE2 register, as described by Farrar (Bioinformatics 23: 156-161 (2007)).
+ * This is used if all substitution scores and gap scores are integers, gaps
+ * are penalized (the gap scores are not positive, and the open gap score is
+ * not higher than the extend gap score), and, in global mode, the end gap
+ * scores are equal to the internal gap scores. STRIPED_UNAVAILABLE is
+ * returned if these conditions are not met, or if the scores may have
+ * saturated; the caller then falls back to the scalar kernels, which use
+ * doubles.
+ */
+
+#define STRIPED_UNAVAILABLE 1
+
+#if defined(__SSE2__)
+
+#define STRIPED_LANES 8
+#define STRIPED_LIMIT 16384
+
+static int
+striped_integer(double value, int* result)
+{
+    if (!(value >= -STRIPED_LIMIT && value <= STRIPED_LIMIT)) return 0;
+    *result = (int)value;
+    return (*result == value);
+}
+
+static int
+striped_gap_costs(Aligner* self,
+                  int* open_A, int* extend_A, int* open_B, int* extend_B)
+{
+    const double target_open = self->target_internal_open_gap_score;
+    const double target_extend = self->target_internal_extend_gap_score;
+    const double query_open = self->query_internal_open_gap_score;
+    const double query_extend = self->query_internal_extend_gap_score;
+
+    if (self->mode == Global) {
+        if (self->target_left_open_gap_score != target_open
+         || self->target_right_open_gap_score != target_open
+         || self->target_left_extend_gap_score != target_extend
+         || self->target_right_extend_gap_score != target_extend
+         || self->query_left_open_gap_score != query_open
+         || self->query_right_open_gap_score != query_open
+         || self->query_left_extend_gap_score != query_extend
+         || self->query_right_extend_gap_score != query_extend) return 0;
+    }
+    if (!striped_integer(-target_open, open_A)) return 0;
+    if (!striped_integer(-target_extend, extend_A)) return 0;
+    if (!striped_integer(-query_open, open_B)) return 0;
+    if (!striped_integer(-query_extend, extend_B)) return 0;
+    if (*extend_A < 0 || *open_A < *extend_A) return 0;
+    if (*extend_B < 0 || *open_B < *extend_B) return 0;
+    return 1;
+}
+
+static int
+Aligner_striped_score(Aligner* self,
+                      const int* sA, int nA,
+                      const int* sB, int nB,
+                      double* result)
+{
+    const Py_ssize_t n = self->substitution_matrix.shape[0];
+    const double* scores = self->substitution_matrix.buf;
+    const int local = (self->mode == Local);
+    const int segLen = (nB + STRIPED_LANES - 1) / STRIPED_LANES;
+    int open_A;
+    int extend_A;
+    int open_B;
+    int extend_B;
+    int i;
+    int j;
+    int k;
+    int s;
+    int position;
+    int value;
+    int maximum = 0;
+    int minimum = 0;
+    int margin;
+    int nletters = 0;
+    int* rows = NULL;
+    void* memory = NULL;
+    short lanes[STRIPED_LANES];
+    __m128i* profile;
+    __m128i* pvHStore;
+    __m128i* pvHLoad;
+    __m128i* pvE;
+    __m128i* pv;
+    const __m128i* vP;
+    __m128i vH;
+    __m128i vE;
+    __m128i vF;
+    __m128i vMax;
+    __m128i vMin;
+    __m128i vOpenA;
+    __m128i vExtendA;
+    __m128i vOpenB;
+    __m128i vExtendB;
+    const __m128i vZero = _mm_setzero_si128();
+    const __m128i vNegInf = _mm_set1_epi16(SHRT_MIN);
+    int status = STRIPED_UNAVAILABLE;
+
+    if (nA == 0 || nB == 0) return STRIPED_UNAVAILABLE;
+    if (!striped_gap_costs(self, &open_A, &extend_A, &open_B, &extend_B))
+        return STRIPED_UNAVAILABLE;
+
+    /* Only store the query profile for letters that occur in the target */
+    rows = PyMem_RawMalloc(n*sizeof(int));
+    if (!rows) return MEMORY_ERROR;
+    for (k = 0; k < n; k++) rows[k] = -1;
+    for (i = 0; i < nA; i++) {
+        k = sA[i];
+        if (rows[k] < 0) rows[k] = nletters++;
+    }
+    memory = PyMem_RawMalloc(((size_t)(nletters + 3) * segLen + 1)
+                             * sizeof(__m128i));
+    if (!memory) {
+        status = MEMORY_ERROR;
+        goto exit;
+    }
+    profile = (__m128i*)(((uintptr_t)memory + 15) & ~(uintptr_t)15);
+    pvHStore = profile + (size_t)nletters * segLen;
+    pvHLoad = pvHStore + segLen;
+    pvE = pvHLoad + segLen;
+
+    /* Position j of the query is stored in segment j % segLen, in lane
+     * j / segLen. The padding at the end of the query scores zero; it
+     * cannot affect the score, as nothing follows it in the query.
+     */
+    for (k = 0; k < n; k++) {
+        if (rows[k] < 0) continue;
+        pv = profile + (size_t)rows[k] * segLen;
+        for (s = 0; s < segLen; s++) {
+            for (j = 0; j < STRIPED_LANES; j++) {
+                position = s + j * segLen;
+                if (position < nB) {
+                    if (!striped_integer(scores[k*n+sB[position]], &value))
+                        goto exit;
+                    if (value > maximum) maximum = value;
+                    else if (value < minimum) minimum = value;
+                }
+                else value = 0;
+                lanes[j] = (short)value;
+            }
+            pv[s] = _mm_loadu_si128((const __m128i*)lanes);
+        }
+    }
+
+    margin = -minimum;
+    if (open_A > margin) margin = open_A;
+    if (open_B > margin) margin = open_B;
+    if (!local) {
+        /* The first row and column hold the end gap scores */
+        if (open_A + (int64_t)(nB - 1) * extend_A + open_B >= SHRT_MAX - margin
+         || open_B + (int64_t)(nA - 1) * extend_B + open_A >= SHRT_MAX - margin)
+            goto exit;
+    }
+
+    vOpenA = _mm_set1_epi16((short)open_A);
+    vExtendA = _mm_set1_epi16((short)extend_A);
+    vOpenB = _mm_set1_epi16((short)open_B);
+    vExtendB = _mm_set1_epi16((short)extend_B);
+
+    for (s = 0; s < segLen; s++) {
+        for (j = 0; j < STRIPED_LANES; j++) {
+            position = s + j * segLen;
+            if (position >= nB) position = nB - 1;
+            lanes[j] = local ? 0 : (short)(-(open_A + position * extend_A));
+        }
+        vH = _mm_loadu_si128((const __m128i*)lanes);
+        pvHStore[s] = vH;
+        pvE[s] = _mm_subs_epi16(vH, vOpenB);
+    }
+
+    vMax = vZero;
+    vMin = vZero;
+    for (i = 0; i < nA; i++) {
+        vP = profile + (size_t)rows[sA[i]] * segLen;
+        /* Column 0 of the previous row and of the current row */
+        if (local) {
+            vH = _mm_slli_si128(pvHStore[segLen-1], 2);
+            vF = _mm_insert_epi16(vNegInf, -open_A, 0);
+        }
+        else {
+            value = (i == 0) ? 0 : -(open_B + (i - 1) * extend_B);
+            vH = _mm_slli_si128(pvHStore[segLen-1], 2);
+            vH = _mm_insert_epi16(vH, value, 0);
+            value = -(open_B + i * extend_B) - open_A;
+            vF = _mm_insert_epi16(vNegInf, value, 0);
+        }
+        pv = pvHLoad;
+        pvHLoad = pvHStore;
+        pvHStore = pv;
+        for (s = 0; s < segLen; s++) {
+            vH = _mm_adds_epi16(vH, vP[s]);
+            vE = pvE[s];
+            vH = _mm_max_epi16(vH, vE);
+            vH = _mm_max_epi16(vH, vF);
+            if (local) vH = _mm_max_epi16(vH, vZero);
+            vMax = _mm_max_epi16(vMax, vH);
+            vMin = _mm_min_epi16(vMin, vH);
+            pvHStore[s] = vH;
+            vE = _mm_subs_epi16(vE, vExtendB);
+            vE = _mm_max_epi16(vE, _mm_subs_epi16(vH, vOpenB));
+            pvE[s] = vE;
+            vF = _mm_subs_epi16(vF, vExtendA);
+            vF = _mm_max_epi16(vF, _mm_subs_epi16(vH, vOpenA));
+            vH = pvHLoad[s];
+        }
+        /* Lazy evaluation of the horizontal gaps crossing segment borders.
+         * Each pass moves them one lane further, so at most STRIPED_LANES
+         * passes are needed. The scores changed here cannot exceed the
+         * maximum found above, nor go below the minimum.
+         */
+        for (k = 0; k < STRIPED_LANES; k++) {
+            vF = _mm_slli_si128(vF, 2);
+            vF = _mm_insert_epi16(vF, SHRT_MIN, 0);
+            for (s = 0; s < segLen; s++) {
+                vH = pvHStore[s];
+                if (!_mm_movemask_epi8(_mm_cmpgt_epi16(vF, _mm_subs_epi16(vH, vOpenA))))
+                    break;
+                vH = _mm_max_epi16(vH, vF);
+                pvHStore[s] = vH;
+                pvE[s] = _mm_max_epi16(pvE[s], _mm_subs_epi16(vH, vOpenB));
+                vF = _mm_subs_epi16(vF, vExtendA);
+            }
+            if (s < segLen) break;
+        }
+    }
+
+    /* A saturated score can only have been used if the maximum or minimum
+     * score is close to the limits of the 16-bit range.
+     */
+    _mm_storeu_si128((__m128i*)lanes, vMax);
+    value = lanes[0];
+    for (j = 1; j < STRIPED_LANES; j++) if (lanes[j] > value) value = lanes[j];
+    if (value >= SHRT_MAX - maximum) goto exit;
+    if (local) *result = value;
+    else {
+        _mm_storeu_si128((__m128i*)lanes, vMin);
+        for (j = 0; j < STRIPED_LANES; j++)
+            if (lanes[j] <= SHRT_MIN + margin) goto exit;
+        position = nB - 1;
+        _mm_storeu_si128((__m128i*)lanes, pvHStore[position % segLen]);
+        *result = lanes[position / segLen];
+    }
+    status = 0;
+
+exit:
+    if (memory) PyMem_RawFree(memory);
+    PyMem_RawFree(rows);
+    return status;
+}
+
+#else
+
+static int
+Aligner_striped_score(Aligner* self,
+                      const int* sA, int nA,
+                      const int* sB, int nB,
+                      double* result)
+{
+    return STRIPED_UNAVAILABLE;
+}
+
+#endif
+
+/* Calculate the score without using the Python C API, so that this can be
+ * called without holding the GIL. This can be used for all algorithms except
+ * Waterman-Smith-Beyer, which may call Python gap score functions. Returns 0
+ * if successful, or a negative error code.
+ */
+static int
+Aligner_score_kernel(Aligner* self, Algorithm algorithm,
+                     const int* sA, int nA,
+                     const int* sB, int nB,
+                     unsigned char strand,
+                     double* score)
+{
+    const Mode mode = self->mode;
+    const PyObject* substitution_matrix = self->substitution_matrix.obj;
+    int status;
+
+    if (restricted_is_used(self))
+        return Aligner_restricted_score(self, sA, nA, sB, nB, strand, score);
+    if (substitution_matrix && (algorithm == NeedlemanWunschSmithWaterman
+                             || algorithm == Gotoh)) {
+        status = Aligner_striped_score(self, sA, nA, sB, nB, score);
+        if (status != STRIPED_UNAVAILABLE) return status;
+    }
+    switch (algorithm) {
+        case NeedlemanWunschSmithWaterman:
+            switch (mode) {
+                case Global:
+                    if (substitution_matrix)
+                        return Aligner_needlemanwunsch_score_matrix(self, sA, nA, sB, nB, strand, score);
+                    else
+                        return Aligner_needlemanwunsch_score_compare(self, sA, nA, sB, nB, strand, score);
+                case Local:
+                    if (substitution_matrix)
+                        return Aligner_smithwaterman_score_matrix(self, sA, nA, sB, nB, score);
+                    else
+                        return Aligner_smithwaterman_score_compare(self, sA, nA, sB, nB, score);
+            }
+            break;
+        case Gotoh:
+            switch (mode) {
+                case Global:
+                    if (substitution_matrix)
+                        return Aligner_gotoh_global_score_matrix(self, sA, nA, sB, nB, strand, score);
+                    else
+                        return Aligner_gotoh_global_score_compare(self, sA, nA, sB, nB, strand, score);
+                case Local:
+                    if (substitution_matrix)
+                        return Aligner_gotoh_local_score_matrix(self, sA, nA, sB, nB, score);
+                    else
+                        return Aligner_gotoh_local_score_compare(self, sA, nA, sB, nB, score);
+            }
+            break;
+        case WatermanSmithBeyer:
+        case Unknown:
+        default:
+            break;
+    }
+    return ALGORITHM_ERROR;
+}
+
+static PyObject*
+Aligner_watermansmithbeyer_score(Aligner* self,
+                                 const int* sA, int nA,
+                                 const int* sB, int nB,
+                                 unsigned char strand)
+{
+    const Mode mode = self->mode;
+    PyObject* substitution_matrix = self->substitution_matrix.obj;
+
+    switch (mode) {
+        case Global:
+            if (substitution_matrix)
+                return Aligner_watermansmithbeyer_global_score_matrix(self, sA, nA, sB, nB, strand);
+            else
+                return Aligner_watermansmithbeyer_global_score_compare(self, sA, nA, sB, nB, strand);
+        case Local:
+            if (substitution_matrix)
+                return Aligner_watermansmithbeyer_local_score_matrix(self, sA, nA, sB, nB, strand);
+            else
+                return Aligner_watermansmithbeyer_local_score_compare(self, sA, nA, sB, nB, strand);
+    }
+    PyErr_SetString(PyExc_RuntimeError, "unknown mode");
+    return NULL;
+}
+
+static const char Aligner_score__doc__[] = "calculates the alignment score";
+
+static PyObject*
+Aligner_score(Aligner* self, PyObject* args, PyObject* keywords)
+{
+    const int* sA;
+    const int* sB;
+    int nA;
+    int nB;
+    Py_buffer bA = {0};
+    Py_buffer bB = {0};
+    const Algorithm algorithm = _get_algorithm(self);
+    char strand = '+';
+    double score;
+    int status;
+    PyObject* result = NULL;
+
+    static char *kwlist[] = {"sequenceA", "sequenceB", "strand", NULL};
+
+    if (!check_restricted(self, algorithm)) return NULL;
+    bA.obj = (PyObject*)self;
+    bB.obj = (PyObject*)self;
+    if(!PyArg_ParseTupleAndKeywords(args, keywords, "O&O&O&", kwlist,
+                                    sequence_converter, &bA,
+                                    sequence_converter, &bB,
+                                    strand_converter, &strand))
+        return NULL;
+
+    nA = (int) (bA.len / bA.itemsize);
+    nB = (int) (bB.len / bB.itemsize);
+    if (nA != bA.len / bA.itemsize || nB != bB.len / bB.itemsize) {
+        sequence_converter(NULL, &bA);
+        sequence_converter(NULL, &bB);
+        PyErr_SetString(PyExc_ValueError, "sequences too long");
+        return 0;
+    }
+    sA = bA.buf;
+    sB = bB.buf;
+
+    if (algorithm == WatermanSmithBeyer)
+        result = Aligner_watermansmithbeyer_score(self, sA, nA, sB, nB, strand);
+    else {
+        status = Aligner_score_kernel(self, algorithm, sA, nA, sB, nB, strand, &score);
+        if (status < 0) set_kernel_error(status);
+        else result = PyFloat_FromDouble(score);
+    }
+
+    sequence_converter(NULL, &bA);
+    sequence_converter(NULL, &bB);
+
+    return result;
+}
+
+static const char Aligner_score_many__doc__[] =
+"calculates the alignment scores of each sequence in sequencesA against sequenceB,\n"
+"and stores them in scores (a writable one-dimensional buffer of doubles).\n"
+"The GIL is released while calculating the scores, unless gap score functions\n"
+"are used.";
+
+static PyObject*
+Aligner_score_many(Aligner* self, PyObject* args, PyObject* keywords)
+{
+    PyObject* sequences;
+    PyObject* argument;
+    Py_buffer bB = {0};
+    Py_buffer scores = {0};
+    Py_buffer* views = NULL;
+    int* lengths = NULL;
+    const int* sB;
+    int nB;
+    Py_ssize_t i;
+    Py_ssize_t n;
+    Py_ssize_t m = 0;
+    double* buffer;
+    const Algorithm algorithm = _get_algorithm(self);
+    char strand = '+';
+    int status = 0;
+    PyObject* result = NULL;
+    PyObject* score;
+
+    static char *kwlist[] = {"sequencesA", "sequenceB", "strand", "scores", NULL};
+
+    if (!check_restricted(self, algorithm)) return NULL;
+    bB.obj = (PyObject*)self;
+    if(!PyArg_ParseTupleAndKeywords(args, keywords, "OO&O&O", kwlist,
+                                    &sequences,
+                                    sequence_converter, &bB,
+                                    strand_converter, &strand,
+                                    &argument))
+        return NULL;
+
+    sequences = PySequence_Fast(sequences,
+                                "sequencesA should support the sequence protocol");
+    if (!sequences) {
+        sequence_converter(NULL, &bB);
+        return NULL;
+    }
+    if (PyObject_GetBuffer(argument, &scores,
+                           PyBUF_WRITABLE | PyBUF_FORMAT | PyBUF_C_CONTIGUOUS) == -1)
+        goto exit;
+    n = PySequence_Fast_GET_SIZE(sequences);
+    if (scores.ndim != 1 || strcmp(scores.format, "d") != 0
+     || scores.len != n * (Py_ssize_t)sizeof(double)) {
+        PyErr_Format(PyExc_ValueError,
+                     "scores should be a one-dimensional buffer of %zd doubles",
+                     n);
+        goto exit;
+    }
+    nB = (int) (bB.len / bB.itemsize);
+    if (nB != bB.len / bB.itemsize) {
+        PyErr_SetString(PyExc_ValueError, "sequences too long");
+        goto exit;
+    }
+    sB = bB.buf;
+    buffer = scores.buf;
+
+    views = PyMem_Calloc(n, sizeof(Py_buffer));
+    lengths = PyMem_Malloc(n * sizeof(int));
+    if (n && (!views || !lengths)) {
+        PyErr_NoMemory();
+        goto exit;
+    }
+    for (m = 0; m < n; m++) {
+        views[m].obj = (PyObject*)self;
+        if (!sequence_converter(PySequence_Fast_GET_ITEM(sequences, m), &views[m]))
+            goto exit;
+        lengths[m] = (int) (views[m].len / views[m].itemsize);
+        if (lengths[m] != views[m].len / views[m].itemsize) {
+            m++;
+            PyErr_SetString(PyExc_ValueError, "sequences too long");
+            goto exit;
+        }
+    }
+
+    if (algorithm == WatermanSmithBeyer) {
+        /* The gap score functions are Python objects, so keep the GIL */
+        for (i = 0; i < n; i++) {
+            score = Aligner_watermansmithbeyer_score(self, views[i].buf, lengths[i],
+                                                     sB, nB, strand);
+            if (!score) goto exit;
+            buffer[i] = PyFloat_AsDouble(score);
+            Py_DECREF(score);
+        }
+    }
+    else {
+        Py_BEGIN_ALLOW_THREADS
+        for (i = 0; i < n; i++) {
+            status = Aligner_score_kernel(self, algorithm,
+                                          views[i].buf, lengths[i],
+                                          sB, nB, strand, &buffer[i]);
+            if (status < 0) break;
+        }
+        Py_END_ALLOW_THREADS
+        if (status < 0) {
+            set_kernel_error(status);
+            goto exit;
+        }
+    }
+
+    Py_INCREF(Py_None);
+    result = Py_None;
+
+exit:
+    for (i = 0; i < m; i++) sequence_converter(NULL, &views[i]);
+    PyMem_Free(views);
+    PyMem_Free(lengths);
+    if (scores.obj) PyBuffer_Release(&scores);
+    sequence_converter(NULL, &bB);
+    Py_DECREF(sequences);
+    return result;
+}
+
+static const char Aligner_align__doc__[] = "align two sequences";
+
+static PyObject*
+Aligner_align(Aligner* self, PyObject* args, PyObject* keywords)
+{
+    const int* sA;
+    const int* sB;
+    int nA;
+    int nB;
+    Py_buffer bA = {0};
+    Py_buffer bB = {0};
+    const Mode mode = self->mode;
+    const Algorithm algorithm = _get_algorithm(self);
+    char strand = '+';
+    PyObject* result = NULL;
+    PyObject* substitution_matrix = self->substitution_matrix.obj;
+
+    static char *kwlist[] = {"sequenceA", "sequenceB", "strand", NULL};
+
+    if (!check_restricted(self, algorithm)) return NULL;
+    if (!check_linear_space(self, algorithm)) return NULL;
+    bA.obj = (PyObject*)self;
+    bB.obj = (PyObject*)self;
+    if(!PyArg_ParseTupleAndKeywords(args, keywords, "O&O&O&", kwlist,
+                                    sequence_converter, &bA,
+                                    sequence_converter, &bB,
+                                    strand_converter, &strand))
+        return NULL;
+
+    nA = (int) (bA.len / bA.itemsize);
+    nB = (int) (bB.len / bB.itemsize);
+    if (nA != bA.len / bA.itemsize || nB != bB.len / bB.itemsize) {
+        sequence_converter(NULL, &bA);
+        sequence_converter(NULL, &bB);
+        PyErr_SetString(PyExc_ValueError, "sequences too long");
+        return 0;
+    }
+    sA = bA.buf;
+    sB = bB.buf;
+
+    if (restricted_is_used(self)) {
+        result = Aligner_restricted_align(self, sA, nA, sB, nB, strand);
+        sequence_converter(NULL, &bA);
+        sequence_converter(NULL, &bB);
+        return result;
+    }
+
+    if (self->linear_space) {
+        result = Aligner_linear_align(self, sA, nA, sB, nB, strand);
+        sequence_converter(NULL, &bA);
+        sequence_converter(NULL, &bB);
+        return result;
+    }
+
+    switch (algorithm) {
+        case NeedlemanWunschSmithWaterman:
+            switch (mode) {
+                case Global:
+                    if (substitution_matrix)
+                        result = Aligner_needlemanwunsch_align_matrix(self, sA, nA, sB, nB, strand);
+                    else
+                        result = Aligner_needlemanwunsch_align_compare(self, sA, nA, sB, nB, strand);
+                    break;
+                case Local:
                     if (substitution_matrix)
                         result = Aligner_smithwaterman_align_matrix(self, sA, nA, sB, nB, strand);
                     else
@@ -6910,6 +8550,11 @@ static PyMethodDef Aligner_methods[] = {
      METH_VARARGS | METH_KEYWORDS,
      Aligner_align__doc__
     },
+    {"score_many",
+     (PyCFunction)Aligner_score_many,
+     METH_VARARGS | METH_KEYWORDS,
+     Aligner_score_many__doc__
+    },
     {NULL, NULL, 0, NULL}  /* Sentinel */
 };
 
@@ -13,10 +13,20 @@ indexing files. These are not intended for direct use.
 
 import collections.abc
 import contextlib
+import hashlib
+import io
 import itertools
+import json
 import os
+import sys
+import threading
+import warnings
+import weakref
 from abc import ABC
 from abc import abstractmethod
+from array import array
+from collections import namedtuple
+from collections import OrderedDict
 
 try:
     import sqlite3
@@ -25,6 +35,49 @@ except ImportError:
     sqlite3 = None  # type: ignore
 
 
+RecordCacheInfo = namedtuple(
+    "RecordCacheInfo", ["hits", "misses", "max_cache", "current_size"]
+)
+
+# Maximum number of keys in each SQL query used by the get_many method
+_QUERY_BATCH_SIZE = 500
+
+# Index dictionaries (by id, as they are not hashable), which must stop using
+# their file handles after a fork
+_index_dicts = weakref.WeakValueDictionary()
+
+# SQLite connections inherited from the parent process after a fork, which
+# are kept so they are never closed (which could roll back the parent's
+# transaction)
+_inherited_connections = []
+
+
+def _after_fork_in_child():
+    """Reset the per-thread state of all the index dictionaries (PRIVATE)."""
+    for index_dict in list(_index_dicts.values()):
+        index_dict._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    # Not available on Windows
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+# Positional reads, not available on Windows
+_pread = getattr(os, "pread", None)
+
+
+def _read_at(handle, offset, length):
+    """Read length bytes from the offset in the file (PRIVATE).
+
+    For plain files this uses os.pread (where available), which does not move
+    the file position, otherwise the handle is moved to the offset first.
+    """
+    if _pread is not None and isinstance(handle, io.BufferedReader):
+        return _pread(handle.fileno(), length, offset)
+    handle.seek(offset)
+    return handle.read(length)
+
+
 @contextlib.contextmanager
 def as_handle(handleish, mode="r", **kwargs):
     r"""Context manager to ensure we are using a handle.
@@ -110,6 +163,119 @@ def _open_for_random_access(filename):
 # for indexing
 
 
+# Sidecar offset index files (default extension .bpi) start with this line,
+# followed by a one line JSON header describing the indexed file, then the
+# record offsets as 64 bit integers, and finally the identifiers as UTF-8
+# text separated by newlines.
+_SIDECAR_MAGIC = b"Biopython offsets index v1\n"
+
+
+def _sidecar_header(filename, format):
+    """Describe the indexed file, used to spot when a sidecar is stale (PRIVATE).
+
+    Besides the file size and modification time, this records a checksum of
+    the start and end of the file (rather than the whole file, which would
+    take almost as long as re-indexing it).
+    """
+    stat = os.stat(filename)
+    digest = hashlib.sha1()
+    with open(filename, "rb") as handle:
+        digest.update(handle.read(65536))
+        if stat.st_size > 65536:
+            handle.seek(max(65536, stat.st_size - 65536))
+            digest.update(handle.read())
+    return {
+        "format": format,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha1": digest.hexdigest(),
+        "byteorder": sys.byteorder,
+    }
+
+
+def _read_sidecar(index_filename, header):
+    """Return the (identifier, offset) lists from a sidecar file (PRIVATE).
+
+    Returns None if the file is missing, is not a sidecar index, or does not
+    match the expected header (i.e. the indexed file has changed).
+    """
+    try:
+        handle = open(index_filename, "rb")
+    except FileNotFoundError:
+        return None
+    with handle:
+        if handle.readline() != _SIDECAR_MAGIC:
+            return None
+        try:
+            saved = json.loads(handle.readline())
+        except ValueError:
+            return None
+        count = saved.pop("count", None)
+        if saved != header or not isinstance(count, int):
+            return None
+        offsets = array("q")
+        try:
+            offsets.fromfile(handle, count)
+        except EOFError:
+            return None
+        identifiers = handle.read().decode()
+    identifiers = identifiers.split("\n") if count else []
+    if len(identifiers) != count:
+        return None
+    return identifiers, offsets
+
+
+def _write_sidecar(index_filename, header, identifiers, offsets):
+    """Save the identifiers and offsets to a sidecar file (PRIVATE).
+
+    The file is written under a temporary name and then renamed, so that
+    concurrent processes never see a partially written index. A warning
+    is given if it cannot be written (e.g. a read only directory).
+    """
+    if any("\n" in identifier for identifier in identifiers):
+        raise ValueError("Identifiers containing newlines cannot be saved")
+    header = dict(header, count=len(identifiers))
+    tmp_filename = f"{os.fspath(index_filename)}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_filename, "wb") as handle:
+            handle.write(_SIDECAR_MAGIC)
+            handle.write(json.dumps(header).encode() + b"\n")
+            array("q", offsets).tofile(handle)
+            handle.write("\n".join(identifiers).encode())
+        os.replace(tmp_filename, index_filename)
+    except OSError as err:
+        from Bio import BiopythonWarning
+
+        warnings.warn(
+            f"Could not save the offsets index {index_filename!r}: {err}",
+            BiopythonWarning,
+        )
+        with contextlib.suppress(OSError):
+            os.remove(tmp_filename)
+
+
+def _sidecar_offsets(random_access_proxy, filename, format, index_filename):
+    """Return (identifier, offset, length) tuples using a sidecar index (PRIVATE).
+
+    If the sidecar index file exists and matches the file being indexed, the
+    offsets are loaded from it. Otherwise the file is scanned as usual, and
+    the sidecar index file is (re)written for next time. The record lengths
+    are not saved, so are given as zero.
+    """
+    header = _sidecar_header(filename, format)
+    saved = _read_sidecar(index_filename, header)
+    if saved is None:
+        identifiers = []
+        offsets = []
+        for identifier, offset, length in random_access_proxy:
+            identifiers.append(identifier)
+            offsets.append(offset)
+        _write_sidecar(index_filename, header, identifiers, offsets)
+    else:
+        identifiers, offsets = saved
+    return zip(identifiers, offsets, itertools.repeat(0))
+
+
 class _IndexedSeqFileProxy(ABC):
     """Abstract base class for file format specific random access (PRIVATE).
 
@@ -147,6 +313,33 @@ class _IndexedSeqFileProxy(ABC):
         raise NotImplementedError("Not available for this file format.")
 
 
+class _ThreadResources:
+    """File handles and SQLite connection of one thread (PRIVATE).
+
+    The index dictionaries keep these in the thread-local storage via a
+    _ThreadToken, and close them when the thread ends (so its thread-local
+    storage is deleted), or when the dictionary is closed.
+    """
+
+    def __init__(self):
+        self.proxies = {}
+        self.con = None
+
+    def close(self):
+        """Close the file handles and connection."""
+        while self.proxies:
+            self.proxies.popitem()[1]._handle.close()
+        if self.con is not None:
+            self.con.close()
+            self.con = None
+
+
+class _ThreadToken:
+    """Holds the resources of a thread in its thread-local storage (PRIVATE)."""
+
+    __slots__ = ("resources", "__weakref__")
+
+
 class _IndexedSeqFileDict(collections.abc.Mapping):
     """Read only dictionary interface to a sequential record file.
 
@@ -170,23 +363,54 @@ class _IndexedSeqFileDict(collections.abc.Mapping):
 
     Note that this dictionary is essentially read only. You cannot
     add or change values, pop values, nor clear the dictionary.
+
+    The (identifier, offset, length) tuples are usually taken from the
+    random access proxy, which scans the file. Alternatively these can be
+    given as offset_iter, e.g. when loaded from a sidecar index file.
+
+    The most recently used records are kept in a cache of up to cache_size
+    records (by default just one), removing the least recently used record
+    when full. Note the cached objects are returned as is, so any changes
+    made to a record will be seen the next time it is looked up. The number
+    of cache hits and misses are kept in the ``cache_hits`` and
+    ``cache_misses`` attributes, see also the ``cache_info()`` method.
+
+    If reopen_proxy is given, this should be a function with no arguments
+    returning a new random access proxy for the same file. It is used to give
+    each thread its own file handle, and to open new handles in a child
+    process after a fork (rather than sharing the file position with the
+    parent process). Otherwise the given random access proxy is shared.
+    The handle opened by each thread is closed when the thread ends.
     """
 
-    def __init__(self, random_access_proxy, key_function, repr, obj_repr):
+    def __init__(
+        self,
+        random_access_proxy,
+        key_function,
+        repr,
+        obj_repr,
+        offset_iter=None,
+        cache_size=1,
+        reopen_proxy=None,
+    ):
         """Initialize the class."""
         # Use key_function=None for default value
-        self._proxy = random_access_proxy
         self._key_function = key_function
         self._repr = repr
         self._obj_repr = obj_repr
-        self._cached_prev_record = (None, None)  # (key, record)
+        self._reopen_proxy = reopen_proxy
+        self._shared_proxy = random_access_proxy
+        self._init_local()
+        if reopen_proxy is not None:
+            self._resources.proxies[0] = random_access_proxy
+        self._init_cache(cache_size)
+        if offset_iter is None:
+            offset_iter = random_access_proxy
         if key_function:
             offset_iter = (
                 (key_function(key), offset, length)
-                for (key, offset, length) in random_access_proxy
+                for (key, offset, length) in offset_iter
             )
-        else:
-            offset_iter = random_access_proxy
         offsets = {}
         for key, offset, length in offset_iter:
             # Note - we don't store the length because I want to minimise the
@@ -225,26 +449,159 @@ class _IndexedSeqFileDict(collections.abc.Mapping):
         """Iterate over the keys."""
         return iter(self._offsets)
 
-    def __getitem__(self, key):
-        """Return record for the specified key.
-
-        As an optimization when repeatedly asked to look up the same record,
-        the key and record are cached so that if the *same* record is
-        requested next time, it can be returned without going to disk.
+    def _init_local(self):
+        """Set up the per-thread state (PRIVATE)."""
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._tokens = weakref.WeakSet()
+        _index_dicts[id(self)] = self
+
+    def _after_fork(self):
+        """Close any file handles inherited from the parent process (PRIVATE)."""
+        with self._lock:
+            tokens = list(self._tokens)
+        for token in tokens:
+            if token.resources.con is not None:
+                _inherited_connections.append(token.resources.con)
+                token.resources.con = None
+        self._close_handles()
+        self._init_local()
+
+    @property
+    def _resources(self):
+        """File handles and connection of the current thread (PRIVATE).
+
+        A finalizer closes these when the thread ends, and its thread-local
+        storage (holding the only reference to the token) is deleted.
+        """
+        local = self._local
+        try:
+            return local.token.resources
+        except AttributeError:
+            pass
+        token = _ThreadToken()
+        resources = token.resources = _ThreadResources()
+        weakref.finalize(token, resources.close)
+        with self._lock:
+            self._tokens.add(token)
+        local.token = token
+        return resources
+
+    def _close_handles(self):
+        """Close the file handles opened by any thread (PRIVATE)."""
+        with self._lock:
+            tokens = list(self._tokens)
+        for token in tokens:
+            token.resources.close()
+
+    @property
+    def _proxy(self):
+        """Random access proxy for use in the current thread (PRIVATE)."""
+        if self._reopen_proxy is None:
+            return self._shared_proxy
+        proxies = self._resources.proxies
+        try:
+            return proxies[0]
+        except KeyError:
+            proxy = proxies[0] = self._reopen_proxy()
+            return proxy
+
+    def _init_cache(self, cache_size):
+        """Set up the cache of recently used records (PRIVATE)."""
+        self._max_cache = cache_size
+        self._cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _cache_record(self, key, record):
+        """Add a record to the cache, removing the oldest record if full (PRIVATE)."""
+        cache = self._cache
+        if self._max_cache:
+            if len(cache) >= self._max_cache:
+                cache.popitem(last=False)
+            cache[key] = record
+
+    def _get_offset(self, key):
+        """Return the position of the record for this key (PRIVATE)."""
+        return self._offsets[key]
+
+    def _get_offsets(self, keys):
+        """Return a dictionary of the record positions for these keys (PRIVATE).
+
+        The positions sort in the order the records appear in the file(s).
         """
-        if key == self._cached_prev_record[0]:
-            return self._cached_prev_record[1]
+        offsets = self._offsets
+        return {key: offsets[key] for key in keys}
+
+    def _read_record(self, key, offset):
+        """Parse the record at the given position, and check its key (PRIVATE)."""
         # Pass the offset to the proxy
-        record = self._proxy.get(self._offsets[key])
+        record = self._proxy.get(offset)
         if self._key_function:
             key2 = self._key_function(record.id)
         else:
             key2 = record.id
         if key != key2:
             raise ValueError(f"Key did not match ({key} vs {key2})")
-        self._cached_prev_record = (key, record)
         return record
 
+    def __getitem__(self, key):
+        """Return record for the specified key.
+
+        As an optimization when repeatedly asked to look up the same records,
+        the most recently used records are cached (see the cache_size
+        argument), so that they can be returned without going to disk.
+        """
+        cache = self._cache
+        with self._lock:
+            try:
+                record = cache[key]
+            except KeyError:
+                self.cache_misses += 1
+            else:
+                cache.move_to_end(key)
+                self.cache_hits += 1
+                return record
+        record = self._read_record(key, self._get_offset(key))
+        with self._lock:
+            self._cache_record(key, record)
+        return record
+
+    def get_many(self, keys):
+        """Return a list of the records for the specified keys.
+
+        This gives the same records as ``[self[key] for key in keys]``, but
+        any records not already cached are read in the order they appear in
+        the file(s), which minimises the seeks needed. If any of the keys
+        are not found, a KeyError exception is raised.
+        """
+        keys = list(keys)
+        records = {}
+        for key in keys:
+            if key not in records and key in self._cache:
+                records[key] = self[key]
+        wanted = [key for key in dict.fromkeys(keys) if key not in records]
+        offsets = self._get_offsets(wanted)
+        for key in sorted(wanted, key=offsets.__getitem__):
+            record = self._read_record(key, offsets[key])
+            with self._lock:
+                self.cache_misses += 1
+                self._cache_record(key, record)
+            records[key] = record
+        return [records[key] for key in keys]
+
+    def cache_info(self):
+        """Return the record cache statistics as a named tuple.
+
+        This gives the number of cache hits and misses since the index was
+        opened (you can reset these by setting the ``cache_hits`` and
+        ``cache_misses`` attributes to zero), the maximum number of records
+        cached, and the number of records currently cached.
+        """
+        return RecordCacheInfo(
+            self.cache_hits, self.cache_misses, self._max_cache, len(self._cache)
+        )
+
     def get_raw(self, key):
         """Return the raw record from the file as a bytes string.
 
@@ -261,7 +618,26 @@ class _IndexedSeqFileDict(collections.abc.Mapping):
         if you wish to delete the file, on Windows you must first close
         all open handles to that file.
         """
-        self._proxy._handle.close()
+        self._cache.clear()
+        self._close_handles()
+        self._shared_proxy._handle.close()
+
+
+# Number of offsets added to an index_db database in each executemany call
+_INSERT_BATCH_SIZE = 10000
+
+
+def _scan_offsets(proxy_factory, fmt, filename):
+    """Return a list of (key, offset, length) tuples for one file (PRIVATE).
+
+    This is run in worker processes when building an index_db database, so
+    the proxy_factory must be a module level function (which can be pickled).
+    """
+    random_access_proxy = proxy_factory(fmt, filename)
+    try:
+        return list(random_access_proxy)
+    finally:
+        random_access_proxy._handle.close()
 
 
 class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
@@ -277,6 +653,18 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
     There are OS limits on the number of files that can be open at once,
     so a pool are kept. If a record is required from a closed file, then
     one of the open handles is closed first.
+
+    When building the index, the files can be scanned in parallel in a pool
+    of worker processes (optional workers argument). When reusing an existing
+    index, setting incremental=True rescans any files whose size or
+    modification time has changed since they were indexed.
+
+    Each thread uses its own SQLite connection and pool of open files, so
+    the dictionary can be used from several threads at once. These are
+    closed when the thread ends. After a fork,
+    the child process opens its own connection and files (rather than
+    sharing the file positions with the parent process). The exception is
+    an in memory database, where all the threads share one connection.
     """
 
     def __init__(
@@ -288,6 +676,9 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
         key_function,
         repr,
         max_open=10,
+        workers=None,
+        incremental=False,
+        cache_size=1,
     ):
         """Initialize the class."""
         # TODO? - Don't keep filename list in memory (just in DB)?
@@ -313,14 +704,21 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
         self._proxy_factory = proxy_factory
         self._repr = repr
         self._max_open = max_open
-        self._proxies = {}
+        self._workers = workers
+        self._shared_con = None
+        self._init_local()
+        self._init_cache(cache_size)
 
         # Note if using SQLite :memory: trick index filename, this will
         # give $PWD as the relative path (which is fine).
         self._relative_path = os.path.abspath(os.path.dirname(index_filename))
+        # Used to open a connection in each thread
+        self._index_path = os.path.abspath(index_filename)
 
         if os.path.isfile(index_filename):
             self._load_index()
+            if incremental:
+                self._update_index()
         else:
             self._build_index()
 
@@ -432,10 +830,7 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
         relative_path = self._relative_path
         filenames = self._filenames
         fmt = self._format
-        key_function = self._key_function
         proxy_factory = self._proxy_factory
-        max_open = self._max_open
-        random_access_proxies = self._proxies
 
         if not fmt or not filenames:
             raise ValueError(
@@ -444,7 +839,7 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
         if not proxy_factory(fmt):
             raise ValueError(f"Unsupported format '{fmt}'")
         # Create the index
-        con = sqlite3.dbapi2.connect(index_filename)
+        con = sqlite3.dbapi2.connect(index_filename, check_same_thread=False)
         self._con = con
         # print("Creating index")
         # Sqlite PRAGMA settings for speed
@@ -460,13 +855,14 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
             "INSERT INTO meta_data (key, value) VALUES (?,?);",
             ("filenames_relative_to_index", "True"),
         )
-        # TODO - Record the file size and modified date?
-        con.execute("CREATE TABLE file_data (file_number INTEGER, name TEXT);")
+        con.execute(
+            "CREATE TABLE file_data (file_number INTEGER, name TEXT, "
+            "size INTEGER, mtime_ns INTEGER);"
+        )
         con.execute(
             "CREATE TABLE offset_data (key TEXT, "
             "file_number INTEGER, offset INTEGER, length INTEGER);"
         )
-        count = 0
         for file_index, filename in enumerate(filenames):
             # Default to storing as an absolute path,
             f = os.path.abspath(filename)
@@ -485,52 +881,198 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
                 f = os.path.relpath(filename, relative_path).replace(os.path.sep, "/")
                 assert not f.startswith("../"), f
             # print("DEBUG - storing %r as [%r] %r" % (filename, relative_path, f))
+            # The size and modification time are used by incremental updates.
+            # Take them before scanning, so a file changed while it is being
+            # scanned will be scanned again next time.
+            stat = os.stat(filename)
             con.execute(
-                "INSERT INTO file_data (file_number, name) VALUES (?,?);",
-                (file_index, f),
+                "INSERT INTO file_data (file_number, name, size, mtime_ns) "
+                "VALUES (?,?,?,?);",
+                (file_index, f, stat.st_size, stat.st_mtime_ns),
             )
-            random_access_proxy = proxy_factory(fmt, filename)
-            if key_function:
-                offset_iter = (
-                    (key_function(key), file_index, offset, length)
-                    for (key, offset, length) in random_access_proxy
+        count = 0
+        for file_index, offsets in self._scan_files(range(len(filenames))):
+            count += self._insert_offsets(file_index, offsets)
+            con.commit()
+        self._length = count
+        # print("About to index %i entries" % count)
+        self._finish_index(count)
+        # print("Index created")
+
+    def _update_index(self):
+        """Call from __init__ to rescan any changed files in an index (PRIVATE).
+
+        A file is rescanned if its size or modification time differs from
+        that recorded in the index (indexes made by older versions of
+        Biopython do not record these, so all their files are rescanned).
+        """
+        con = self._con
+        columns = [row[1] for row in con.execute("PRAGMA table_info(file_data);")]
+        if "size" in columns:
+            recorded = {
+                file_number: (size, mtime_ns)
+                for file_number, size, mtime_ns in con.execute(
+                    "SELECT file_number, size, mtime_ns FROM file_data;"
                 )
-            else:
-                offset_iter = (
-                    (key, file_index, offset, length)
-                    for (key, offset, length) in random_access_proxy
+            }
+        else:
+            recorded = {}
+        changed = {}
+        for file_number, filename in enumerate(self._filenames):
+            stat = os.stat(filename)
+            if recorded.get(file_number) != (stat.st_size, stat.st_mtime_ns):
+                changed[file_number] = stat
+        if not changed:
+            return
+        # Make all the changes in a single transaction, committed by
+        # _finish_index, so that if the update fails (e.g. on a duplicate
+        # key) the index is left as it was
+        con.execute("BEGIN;")
+        try:
+            if "size" not in columns:
+                con.execute("ALTER TABLE file_data ADD COLUMN size INTEGER;")
+                con.execute("ALTER TABLE file_data ADD COLUMN mtime_ns INTEGER;")
+            con.execute("DROP INDEX IF EXISTS key_index;")
+            for file_number in changed:
+                con.execute(
+                    "DELETE FROM offset_data WHERE file_number=?;", (file_number,)
                 )
-            while True:
-                batch = list(itertools.islice(offset_iter, 100))
-                if not batch:
-                    break
-                # print("Inserting batch of %i offsets, %s ... %s"
-                #       % (len(batch), batch[0][0], batch[-1][0]))
-                con.executemany(
-                    "INSERT INTO offset_data (key,file_number,offset,length) VALUES (?,?,?,?);",
-                    batch,
+            for file_number, offsets in self._scan_files(changed):
+                self._insert_offsets(file_number, offsets)
+                stat = changed[file_number]
+                con.execute(
+                    "UPDATE file_data SET size=?, mtime_ns=? WHERE file_number=?;",
+                    (stat.st_size, stat.st_mtime_ns, file_number),
                 )
-                con.commit()
-                count += len(batch)
-            if len(random_access_proxies) < max_open:
-                random_access_proxies[file_index] = random_access_proxy
-            else:
-                random_access_proxy._handle.close()
+            # Copy the offsets to a new table, so that the row identifiers are
+            # again numbered from one (checked against the count when loading)
+            con.execute(
+                "CREATE TABLE offset_data_new (key TEXT, "
+                "file_number INTEGER, offset INTEGER, length INTEGER);"
+            )
+            con.execute(
+                "INSERT INTO offset_data_new (key, file_number, offset, length) "
+                "SELECT key, file_number, offset, length FROM offset_data "
+                "ORDER BY file_number, offset;"
+            )
+            con.execute("DROP TABLE offset_data;")
+            con.execute("ALTER TABLE offset_data_new RENAME TO offset_data;")
+            (count,) = con.execute("SELECT COUNT(*) FROM offset_data;").fetchone()
+        except BaseException:
+            con.rollback()
+            raise
         self._length = count
-        # print("About to index %i entries" % count)
+        self._finish_index(count)
+
+    def _scan_files(self, file_numbers):
+        """Return (file number, offsets) for the given files (PRIVATE).
+
+        The offsets are an iterable of (key, offset, length) tuples, in the
+        order of the given file numbers. If the number of workers was set, the
+        files are scanned in a pool of worker processes, with a few files per
+        worker scanned ahead of those being inserted into the database.
+        Otherwise the files are scanned one at a time in this process, and
+        the first few random access proxies are kept open for later use.
+        """
+        filenames = self._filenames
+        fmt = self._format
+        proxy_factory = self._proxy_factory
+        workers = self._workers
+        if workers is None:
+            random_access_proxies = self._proxies
+            for file_number in file_numbers:
+                random_access_proxy = proxy_factory(fmt, filenames[file_number])
+                yield file_number, random_access_proxy
+                if len(random_access_proxies) < self._max_open:
+                    random_access_proxies[file_number] = random_access_proxy
+                else:
+                    random_access_proxy._handle.close()
+            return
+        from concurrent.futures import ProcessPoolExecutor
+
+        file_numbers = iter(file_numbers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = collections.deque()
+            for file_number in itertools.islice(file_numbers, 2 * workers):
+                future = executor.submit(
+                    _scan_offsets, proxy_factory, fmt, filenames[file_number]
+                )
+                pending.append((file_number, future))
+            while pending:
+                file_number, future = pending.popleft()
+                for next_file_number in itertools.islice(file_numbers, 1):
+                    next_future = executor.submit(
+                        _scan_offsets, proxy_factory, fmt, filenames[next_file_number]
+                    )
+                    pending.append((next_file_number, next_future))
+                yield file_number, future.result()
+
+    def _insert_offsets(self, file_number, offsets):
+        """Add the offsets for a file to the database, return the count (PRIVATE)."""
+        key_function = self._key_function
+        if key_function:
+            offset_iter = (
+                (key_function(key), file_number, offset, length)
+                for (key, offset, length) in offsets
+            )
+        else:
+            offset_iter = (
+                (key, file_number, offset, length) for (key, offset, length) in offsets
+            )
+        count = 0
+        while True:
+            batch = list(itertools.islice(offset_iter, _INSERT_BATCH_SIZE))
+            if not batch:
+                break
+            # print("Inserting batch of %i offsets, %s ... %s"
+            #       % (len(batch), batch[0][0], batch[-1][0]))
+            self._con.executemany(
+                "INSERT INTO offset_data (key,file_number,offset,length) VALUES (?,?,?,?);",
+                batch,
+            )
+            count += len(batch)
+        return count
+
+    def _finish_index(self, count):
+        """Index the keys and record the count, after adding offsets (PRIVATE)."""
+        con = self._con
         try:
             con.execute(
                 "CREATE UNIQUE INDEX IF NOT EXISTS key_index ON offset_data(key);"
             )
         except sqlite3.IntegrityError as err:
-            self._proxies = random_access_proxies
+            con.rollback()
             self.close()
             con.close()
             raise ValueError(f"Duplicate key? {err}") from None
         con.execute("PRAGMA locking_mode=NORMAL")
         con.execute("UPDATE meta_data SET value = ? WHERE key = ?;", (count, "count"))
         con.commit()
-        # print("Index created")
+
+    @property
+    def _con(self):
+        """SQLite connection for use in the current thread (PRIVATE)."""
+        if self._shared_con is not None:
+            return self._shared_con
+        resources = self._resources
+        if resources.con is None:
+            resources.con = sqlite3.dbapi2.connect(
+                self._index_path, check_same_thread=False
+            )
+        return resources.con
+
+    @_con.setter
+    def _con(self, con):
+        if os.fspath(self._index_filename) in ("", ":memory:"):
+            # Private to this connection, so cannot open another
+            self._shared_con = con
+        else:
+            self._resources.con = con
+
+    @property
+    def _proxies(self):
+        """Pool of random access proxies for the current thread (PRIVATE)."""
+        return self._resources.proxies
 
     def __repr__(self):
         return self._repr
@@ -554,15 +1096,40 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
         ):
             yield str(row[0])
 
-    def __getitem__(self, key):
-        """Return record for the specified key."""
-        # Pass the offset to the proxy
+    def _get_offset(self, key):
+        """Return the file number and offset of the record for this key (PRIVATE)."""
         row = self._con.execute(
             "SELECT file_number, offset FROM offset_data WHERE key=?;", (key,)
         ).fetchone()
         if not row:
-            raise KeyError
-        file_number, offset = row
+            raise KeyError(key)
+        return row
+
+    def _get_offsets(self, keys):
+        """Return a dictionary of file numbers and offsets for these keys (PRIVATE)."""
+        con = self._con
+        rows = {}
+        for start in range(0, len(keys), _QUERY_BATCH_SIZE):
+            batch = keys[start : start + _QUERY_BATCH_SIZE]
+            rows.update(
+                (key, (file_number, offset))
+                for key, file_number, offset in con.execute(
+                    "SELECT key, file_number, offset FROM offset_data "
+                    "WHERE key IN (%s);" % ",".join("?" * len(batch)),
+                    batch,
+                )
+            )
+        offsets = {}
+        for key in keys:
+            try:
+                offsets[key] = rows[key]
+            except KeyError:
+                raise KeyError(key) from None
+        return offsets
+
+    def _read_record(self, key, offset):
+        """Parse the record at the given file number and offset (PRIVATE)."""
+        file_number, offset = offset
         proxies = self._proxies
         if file_number in proxies:
             record = proxies[file_number].get(offset)
@@ -598,13 +1165,11 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
         if file_number in proxies:
             if length:
                 # Shortcut if we have the length
-                h = proxies[file_number]._handle
-                h.seek(offset)
-                return h.read(length)
+                return _read_at(proxies[file_number]._handle, offset, length)
             else:
                 return proxies[file_number].get_raw(offset)
         else:
-            # This code is duplicated from __getitem__ to avoid a function call
+            # This code is duplicated from _read_record to avoid a function call
             if len(proxies) >= self._max_open:
                 # Close an old handle...
                 proxies.popitem()[1]._handle.close()
@@ -613,14 +1178,13 @@ class _SQLiteManySeqFilesDict(_IndexedSeqFileDict):
             proxies[file_number] = proxy
             if length:
                 # Shortcut if we have the length
-                h = proxy._handle
-                h.seek(offset)
-                return h.read(length)
+                return _read_at(proxy._handle, offset, length)
             else:
                 return proxy.get_raw(offset)
 
     def close(self):
-        """Close any open file handles."""
-        proxies = self._proxies
-        while proxies:
-            proxies.popitem()[1]._handle.close()
+        """Close any open file handles and SQLite connections."""
+        self._cache.clear()
+        self._close_handles()
+        if self._shared_con is not None:
+            self._shared_con.close()
@@ -143,7 +143,7 @@ class InsdcScanner:
         self.line = line
         return header_lines
 
-    def parse_features(self, skip=False):
+    def parse_features(self, skip=False, lazy=False):
         """Return list of tuples for the features (if present).
 
         Each feature is returned as a tuple (key, location, qualifiers)
@@ -151,6 +151,11 @@ class InsdcScanner:
         "complement(join(490883..490885,1..879))") while qualifiers
         is a list of two string tuples (feature qualifier keys and values).
 
+        If lazy=True, each feature is instead returned as a tuple (key, text)
+        where text holds the lines of the feature (as given to the
+        parse_feature method) joined with new line characters. This is much
+        faster, and the parse_feature method can be used later as needed.
+
         Assumes you have already read to the start of the features table.
         """
         if self.line.rstrip() not in self.FEATURE_START_MARKERS:
@@ -226,7 +231,10 @@ class InsdcScanner:
                     # white space (e.g. out of spec files with too much indentation)
                     feature_lines.append(line[self.FEATURE_QUALIFIER_INDENT :].strip())
                     line = self.handle.readline()
-                features.append(self.parse_feature(feature_key, feature_lines))
+                if lazy:
+                    features.append((feature_key, "\n".join(feature_lines)))
+                else:
+                    features.append(self.parse_feature(feature_key, feature_lines))
         self.line = line
         return features
 
@@ -389,6 +397,24 @@ class InsdcScanner:
         self.line = line
         return [], ""  # Dummy values!
 
+    def skip_to_end(self):
+        """Read in lines until the // line marking the end of the record.
+
+        This is used to skip the feature table and sequence of a record
+        after parsing the header. A missing // line at the end of the file
+        is treated as the end of the record, with a warning.
+        """
+        readline = self.handle.readline
+        line = self.line
+        while line[:2] != "//" or line.rstrip() != "//":
+            if not line:
+                warnings.warn(
+                    "Premature end of file, missing // line", BiopythonParserWarning
+                )
+                break
+            line = readline()
+        self.line = "//"
+
     def _feed_first_line(self, consumer, line):
         """Handle the LOCUS/ID line, passing data to the consumer (PRIVATE).
 
@@ -429,7 +455,9 @@ class InsdcScanner:
         Used by the parse_records() and parse() methods.
         """
 
-    def feed(self, handle, consumer, do_features=True):
+    def feed(
+        self, handle, consumer, do_features=True, lazy_features=False, header_only=False
+    ):
         """Feed a set of data into the consumer.
 
         This method is intended for use with the "old" code in Bio.GenBank
@@ -439,6 +467,11 @@ class InsdcScanner:
          - consumer - The consumer that should be informed of events.
          - do_features - Boolean, should the features be parsed?
            Skipping the features can be much faster.
+         - lazy_features - Boolean, should the features be passed to the
+           consumer as raw text, to be parsed on demand? This requires a
+           consumer with a lazy_feature_table method.
+         - header_only - Boolean, should everything after the header lines
+           (the features, any misc lines, and the sequence) be skipped?
 
         Return values:
          - true  - Passed a record
@@ -461,8 +494,17 @@ class InsdcScanner:
         self._feed_first_line(consumer, self.line)
         self._feed_header_lines(consumer, self.parse_header())
 
+        if header_only:
+            # Finishes off the last reference
+            consumer.start_feature_table()
+            self.skip_to_end()
+            consumer.record_end("//")
+            return True
+
         # Features (common to both EMBL and GenBank):
-        if do_features:
+        if do_features and lazy_features:
+            consumer.lazy_feature_table(self, self.parse_features(lazy=True))
+        elif do_features:
             self._feed_feature_table(consumer, self.parse_features(skip=False))
         else:
             self.parse_features(skip=True)  # ignore the data
@@ -480,9 +522,18 @@ class InsdcScanner:
         # And we are done
         return True
 
-    def parse(self, handle, do_features=True):
+    def parse(self, handle, do_features=True, lazy_features=False, header_only=False):
         """Return a SeqRecord (with SeqFeatures if do_features=True).
 
+        If lazy_features=True, the features are kept as raw text and only
+        parsed into SeqFeature objects when the record's features list is
+        used (see the of_type method of the list to parse only some of the
+        features).
+
+        If header_only=True, only the header is parsed, and the rest of the
+        record is skipped. The SeqRecord has no features, and its sequence
+        is undefined (but has the length given in the ID/LOCUS line).
+
         See also the method parse_records() for use on multi-record files.
         """
         from Bio.GenBank import _FeatureConsumer
@@ -492,24 +543,28 @@ class InsdcScanner:
             use_fuzziness=1, feature_cleaner=FeatureValueCleaner()
         )
 
-        if self.feed(handle, consumer, do_features):
+        if self.feed(handle, consumer, do_features, lazy_features, header_only):
             return consumer.data
         else:
             return None
 
-    def parse_records(self, handle, do_features=True):
+    def parse_records(
+        self, handle, do_features=True, lazy_features=False, header_only=False
+    ):
         """Parse records, return a SeqRecord object iterator.
 
         Each record (from the ID/LOCUS line to the // line) becomes a SeqRecord
 
-        The SeqRecord objects include SeqFeatures if do_features=True
+        The SeqRecord objects include SeqFeatures if do_features=True, which
+        are parsed on demand if lazy_features=True. If header_only=True, only
+        the header of each record is parsed (see the parse method).
 
         This method is intended for use in Bio.SeqIO
         """
         # This is a generator function
         with as_handle(handle) as handle:
             while True:
-                record = self.parse(handle, do_features)
+                record = self.parse(handle, do_features, lazy_features, header_only)
                 if record is None:
                     break
                 if record.id is None:
@@ -1206,10 +1261,20 @@ class GenBankScanner(InsdcScanner):
             raise ValueError(f"Eh? '{self.line}'")
 
         # Now just consume the sequence lines until reach the // marker
-        # or a CONTIG line
+        # or a CONTIG line. Well formed lines (with the sequence starting
+        # in column 11) are handled first, and the spaces removed from all
+        # the lines in one go at the end.
         seq_lines = []
+        append = seq_lines.append
+        readline = self.handle.readline
         line = self.line
         while True:
+            if line[9:10] == " ":
+                data = line[10:].rstrip()
+                if data and line[:6] != "CONTIG":
+                    append(data)
+                    line = readline()
+                    continue
             if not line:
                 warnings.warn(
                     "Premature end of file in sequence data", BiopythonParserWarning
@@ -1234,8 +1299,8 @@ class GenBankScanner(InsdcScanner):
                 line = line[1:]
                 if len(line) > 9 and line[9:10] != " ":
                     raise ValueError(f"Sequence line mal-formed, '{line}'")
-            seq_lines.append(line[10:])  # remove spaces later
-            line = self.handle.readline()
+            append(line[10:])  # remove spaces later
+            line = readline()
 
         self.line = line
         return misc_lines, "".join(seq_lines).replace(" ", "")
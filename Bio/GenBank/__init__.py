@@ -38,6 +38,7 @@ Exceptions:
 """
 
 import re
+import sys
 import warnings
 
 from Bio import BiopythonParserWarning
@@ -47,6 +48,7 @@ from Bio.SeqFeature import LocationParserError
 from Bio.SeqFeature import Reference
 from Bio.SeqFeature import SeqFeature
 from Bio.SeqFeature import SimpleLocation
+from Bio.SeqFeature import _pooled
 
 from .Scanner import GenBankScanner
 from .utils import FeatureValueCleaner
@@ -321,6 +323,8 @@ class _FeatureConsumer(_BaseGenBankConsumer):
         self._cur_reference = None
         self._cur_feature = None
         self._expected_size = None
+        # Shared copies of short qualifier values, see feature_qualifier
+        self._qualifier_values = {}
 
     def locus(self, locus_name):
         """Set the locus name is set as the name of the Sequence."""
@@ -689,6 +693,26 @@ class _FeatureConsumer(_BaseGenBankConsumer):
             self.data.annotations["references"].append(self._cur_reference)
             self._cur_reference = None
 
+    def lazy_feature_table(self, scanner, raw_features):
+        """Store the feature table as raw text, parsing it on demand.
+
+        Used instead of the feature_key, location and feature_qualifier
+        events, with the (key, text) tuples from the scanner's
+        parse_features method called with lazy=True.
+        """
+        self.start_feature_table()
+        self.data.features = _LazyFeatureList(
+            raw_features,
+            (
+                scanner.__class__,
+                self._use_fuzziness,
+                self._feature_cleaner,
+                self._expected_size,
+                self._seq_type,
+                self.data.annotations.get("topology"),
+            ),
+        )
+
     def feature_key(self, content):
         # start a new feature
         self._cur_feature = SeqFeature()
@@ -733,6 +757,9 @@ class _FeatureConsumer(_BaseGenBankConsumer):
 
         Can receive None, since you can have valueless keys such as /pseudo
         """
+        # Large genomes repeat the same few keys (and many short values such
+        # as /codon_start=1) on millions of features, so share the strings.
+        key = sys.intern(key)
         # Hack to try to preserve historical behaviour of /pseudo etc
         if value is None:
             # if the key doesn't exist yet, add an empty string
@@ -760,6 +787,8 @@ class _FeatureConsumer(_BaseGenBankConsumer):
         if self._feature_cleaner is not None:
             value = self._feature_cleaner.clean_value(key, value)
 
+        value = _pooled(value, self._qualifier_values)
+
         # if the qualifier name exists, append the value
         if key in self._cur_feature.qualifiers:
             self._cur_feature.qualifiers[key].append(value)
@@ -878,6 +907,134 @@ class _FeatureConsumer(_BaseGenBankConsumer):
             self.data.seq = Seq(sequence)
 
 
+class _LazyFeatureList(list):
+    """List of SeqFeature objects parsed from the raw feature table on demand (PRIVATE).
+
+    This is used as the features list of the SeqRecord objects returned by
+    the GenBank and EMBL parsers with lazy_features=True. It holds the text
+    of each feature from the feature table, and parses all the features
+    (using the same scanner and consumer code as usual) the first time the
+    list is used in any way. Any warnings or errors from parsing the feature
+    table are therefore only raised at that point.
+
+    The of_type method can be used to parse only the features of the given
+    types, which is much faster if for example only the CDS features of an
+    annotated genome are needed.
+
+    Copying or pickling the list gives an ordinary list.
+    """
+
+    __slots__ = ("_context", "_parsed", "_raw")
+
+    def __init__(self, raw_features, context):
+        """Initialize with a list of (key, text) tuples and the parser settings."""
+        list.__init__(self)
+        self._raw = raw_features
+        self._parsed = {}
+        self._context = context
+
+    def _parse(self, indices):
+        """Return the SeqFeature objects for the given entries (PRIVATE).
+
+        Any feature already parsed is taken from the cache, so that the
+        same SeqFeature object is returned each time.
+        """
+        parsed = self._parsed
+        missing = [i for i in indices if i not in parsed]
+        if missing:
+            scanner_class, use_fuzziness, cleaner, size, seq_type, topology = (
+                self._context
+            )
+            consumer = _FeatureConsumer(use_fuzziness, cleaner)
+            consumer._expected_size = size
+            consumer._seq_type = seq_type
+            if topology is not None:
+                consumer.data.annotations["topology"] = topology
+            scanner = scanner_class()
+            feature_tuples = []
+            for i in missing:
+                key, text = self._raw[i]
+                feature_tuples.append(scanner.parse_feature(key, text.split("\n")))
+            scanner._feed_feature_table(consumer, feature_tuples)
+            parsed.update(zip(missing, consumer.data.features))
+        return [parsed[i] for i in indices]
+
+    def _load(self):
+        """Parse any features not yet parsed, and fill in the list (PRIVATE)."""
+        if self._raw is not None:
+            features = self._parse(range(len(self._raw)))
+            self._raw = self._parsed = self._context = None
+            list.extend(self, features)
+
+    def of_type(self, *feature_types):
+        """Return a list of the features of the given types (e.g. "CDS").
+
+        Only these features are parsed if the rest of the list has not been
+        used yet. The features are returned in their original order.
+        """
+        if self._raw is None:
+            return [feature for feature in self if feature.type in feature_types]
+        indices = [i for i, (key, text) in enumerate(self._raw) if key in feature_types]
+        return self._parse(indices)
+
+    def __reduce_ex__(self, protocol):
+        """Pickle (and copy) as a plain list of the parsed features."""
+        self._load()
+        return list, (list(self),)
+
+
+def _lazy_list_method(name):
+    """Wrap a list method to parse the features first (PRIVATE)."""
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        self._load()
+        for arg in args:
+            if isinstance(arg, _LazyFeatureList):
+                arg._load()
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in (
+    "__add__",
+    "__contains__",
+    "__delitem__",
+    "__eq__",
+    "__ge__",
+    "__getitem__",
+    "__gt__",
+    "__iadd__",
+    "__imul__",
+    "__iter__",
+    "__le__",
+    "__len__",
+    "__lt__",
+    "__mul__",
+    "__ne__",
+    "__repr__",
+    "__reversed__",
+    "__rmul__",
+    "__setitem__",
+    "append",
+    "clear",
+    "copy",
+    "count",
+    "extend",
+    "index",
+    "insert",
+    "pop",
+    "remove",
+    "reverse",
+    "sort",
+):
+    setattr(_LazyFeatureList, _name, _lazy_list_method(_name))
+del _name
+
+
 class _RecordConsumer(_BaseGenBankConsumer):
     """Create a GenBank Record object from scanner generated information (PRIVATE)."""
 
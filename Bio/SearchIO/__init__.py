@@ -193,6 +193,8 @@ of the format's documentation.
 
 """
 
+import functools
+
 from Bio.File import as_handle
 from Bio.SearchIO._model import Hit
 from Bio.SearchIO._model import HSP
@@ -483,7 +485,11 @@ def index(filename, format=None, key_function=None, **kwargs):
     proxy_class = get_processor(format, _INDEXER_MAP)
     repr = f"SearchIO.index({filename!r}, {format!r}, key_function={key_function!r})"
     return _IndexedSeqFileDict(
-        proxy_class(filename, **kwargs), key_function, repr, "QueryResult"
+        proxy_class(filename, **kwargs),
+        key_function,
+        repr,
+        "QueryResult",
+        reopen_proxy=functools.partial(proxy_class, filename, **kwargs),
     )
 
 
@@ -21,10 +21,12 @@ See also the Seq_ wiki and the chapter in our tutorial:
 """
 
 import collections
+import heapq
 import numbers
 import warnings
 from abc import ABC
 from abc import abstractmethod
+from array import array
 from typing import Optional
 from typing import overload
 from typing import Union
@@ -983,8 +985,28 @@ class _SeqAbstractBaseClass(ABC):
         34 CC
         34 CCC
         35 CC
+
+        The substrings must match exactly. All substrings are found in a single
+        pass over the sequence, using a PatternSet. To search for the same
+        substrings in many sequences, or to search for degenerate patterns on
+        both strands, create a PatternSet and pass it to this method instead of
+        the list of substrings. This yields a PatternMatch for each match:
+
+        >>> from Bio.Seq import PatternSet
+        >>> patterns = PatternSet(["GCCR", "CAAT"])
+        >>> for match in dna.search(patterns):
+        ...     print(match.start, match.pattern, match.strand)
+        ...
+        4 GCCR -1
+        6 GCCR 1
+        9 CAAT -1
+        19 GCCR 1
         """
-        subdict = collections.defaultdict(set)
+        if isinstance(subs, PatternSet):
+            yield from subs.search(self)
+            return
+        unique = {}
+        lengths = {}
         for index, sub in enumerate(subs):
             if isinstance(sub, (_SeqAbstractBaseClass, bytearray)):
                 sub = bytes(sub)
@@ -995,15 +1017,34 @@ class _SeqAbstractBaseClass(ABC):
                     "subs[%d]: a Seq, MutableSeq, str, bytes, or bytearray object is required, not '%s'"
                     % (index, type(sub))
                 )
-            length = len(sub)
-            subdict[length].add(sub)
-        for start in range(len(self) - 1):
-            for length, subs in subdict.items():
-                stop = start + length
-                for sub in subs:
-                    if self._data[start:stop] == sub:
-                        yield (start, sub.decode())
-                        break
+            unique[sub] = None
+            lengths.setdefault(len(sub), len(lengths))
+        # The automaton finds the matches in order of their end position, as
+        # (end, start, substring); an empty substring matches everywhere.
+        empty = unique.pop(b"", False) is None
+        if unique:
+            patterns = PatternSet(unique, degenerate=False, both_strands=False)
+            found = (
+                (match.start + len(match.pattern), match.start, match.pattern)
+                for match in patterns.search(self)
+            )
+        else:
+            found = iter(())
+        if empty:
+            found = heapq.merge(found, ((i, i, "") for i in range(len(self))))
+        # Report matches in order of their start position, and matches at the
+        # same position in the order of the lengths, once no match starting
+        # earlier can be found.
+        longest = max(lengths, default=0)
+        pending = []
+        for end, start, sub in found:
+            while pending and pending[0][0] < end - longest:
+                index, order, sub_found = heapq.heappop(pending)
+                yield (index, sub_found)
+            heapq.heappush(pending, (start, lengths[len(sub)], sub))
+        while pending:
+            index, order, sub_found = heapq.heappop(pending)
+            yield (index, sub_found)
 
     def startswith(self, prefix, start=None, end=None):
         """Return True if the sequence starts with the given prefix, False otherwise.
@@ -2172,6 +2213,68 @@ class Seq(_SeqAbstractBaseClass):
         """
         return hash(self._data)
 
+    def pack(self, bits=None):
+        """Return a copy of the nucleotide sequence stored in less memory.
+
+        Sequences are normally stored using one byte per letter. This method
+        returns a new Seq object with the sequence stored using two bits per
+        letter for A, C, G and T, or using four bits per letter for all IUPAC
+        ambiguous nucleotides and the gap "-". Runs of lower case letters, and
+        runs of any other letters (such as N in a 2-bit sequence), are stored
+        separately, so the sequence contents is unchanged:
+
+        >>> from Bio.Seq import Seq
+        >>> seq = Seq("ACGTNNNNNNNNNNacgtRYacgt" * 1000)
+        >>> packed = seq.pack()
+        >>> packed
+        Seq('ACGTNNNNNNNNNNacgtRYacgtACGTNNNNNNNNNNacgtRYacgtACGTNN...cgt')
+        >>> packed == seq
+        True
+
+        Slicing, reverse_complement, complement, count, and find work on the
+        packed data directly (though short slices of less than 1024 letters
+        are returned unpacked), so regions of a packed genome can be used
+        without unpacking the full sequence:
+
+        >>> packed[2400:].reverse_complement()
+        Seq('acgtRYacgtNNNNNNNNNNACGTacgtRYacgtNNNNNNNNNNACGTacgtRY...CGT')
+        >>> packed.count("N") == seq.count("N")
+        True
+        >>> packed.find("ACGTNNN", 50)
+        72
+
+        Arguments:
+         - bits - number of bits per letter, 2 or 4. By default, the one
+           using the least memory is used, or the sequence is returned
+           unchanged if packing would not save any memory (for example for
+           protein sequences).
+
+        This requires NumPy. Sequences with an undefined sequence contents
+        are returned unchanged.
+        """
+        data = self._data
+        if bits is None:
+            if isinstance(data, _PackedSequenceData):
+                return self
+        elif bits not in _PACKED_ALPHABETS:
+            raise ValueError(f"bits should be 2 or 4, not {bits!r}")
+        elif isinstance(data, _PackedSequenceData) and data._bits == bits:
+            return self
+        if len(self) == 0 or not self.defined:
+            return self
+        data = bytes(data)
+        if bits is None:
+            packed = _PackedSequenceData(data, 2)
+            if packed._nbytes > len(data) // 2:
+                other = _PackedSequenceData(data, 4)
+                if other._nbytes < packed._nbytes:
+                    packed = other
+            if packed._nbytes >= len(data):
+                return self
+        else:
+            packed = _PackedSequenceData(data, bits)
+        return self.__class__(packed)
+
 
 class MutableSeq(_SeqAbstractBaseClass):
     """An editable sequence object.
@@ -2686,6 +2789,783 @@ class _PartiallyDefinedSequenceData(SequenceDataAbstractBaseClass):
         return tuple((start, start + len(seq)) for start, seq in self._data.items())
 
 
+# Letters stored as codes in packed sequence data. The 4-bit codes follow the
+# BAM convention, where the bits stand for A, C, G and T, so the complement of
+# a code has its bits in reverse order (with the gap "-" in place of "=").
+_PACKED_ALPHABETS = {2: b"ACGT", 4: b"-ACMGRSVTWYHKDBN"}
+
+# Number of letters packed, or unpacked when searching, at a time.
+_PACKED_BLOCK_SIZE = 1048576
+
+# Shorter slices of packed sequence data are returned as bytes, which use less
+# memory than a packed object of this size.
+_PACKED_MIN_SIZE = 1024
+
+# Maps the number of bits per letter to the NumPy lookup tables.
+_packed_tables = {}
+
+# Maps (bits, translation table) to the lookup table for translating packed
+# bytes, or to None if the translation cannot be done on the packed codes.
+_packed_translations = {}
+
+
+def _get_packed_tables(bits):
+    """Return the NumPy lookup tables for packed sequence data (PRIVATE).
+
+    Returns the code of each byte value (or 255 if not in the alphabet), the
+    codes stored in each possible packed byte, the letters stored in each
+    packed byte, and each packed byte with its codes in reverse order.
+    """
+    import numpy as np
+
+    try:
+        return _packed_tables[bits]
+    except KeyError:
+        pass
+    alphabet = np.frombuffer(_PACKED_ALPHABETS[bits], np.uint8)
+    codes = np.full(256, 255, np.uint8)
+    codes[alphabet] = np.arange(len(alphabet))
+    shifts = np.arange(8 - bits, -1, -bits)
+    fields = ((np.arange(256)[:, None] >> shifts) & ((1 << bits) - 1)).astype(np.uint8)
+    letters = alphabet[fields]
+    reverse = (fields[:, ::-1].astype(np.intp) << shifts).sum(axis=1).astype(np.uint8)
+    tables = (codes, fields, letters, reverse)
+    _packed_tables[bits] = tables
+    return tables
+
+
+def _get_packed_translation(bits, table):
+    """Return a lookup table to translate packed bytes, or None (PRIVATE).
+
+    Translating the packed codes is possible if the translation table maps
+    each letter in the alphabet to a letter in the alphabet, and maps its
+    lower case version to the lower case version of that letter, as for the
+    (ambiguous) complement tables.
+    """
+    import numpy as np
+
+    key = (bits, table)
+    try:
+        return _packed_translations[key]
+    except KeyError:
+        pass
+    alphabet = _PACKED_ALPHABETS[bits]
+    codes, fields = _get_packed_tables(bits)[:2]
+    letters = alphabet.translate(table)
+    new_codes = codes[np.frombuffer(letters, np.uint8)]
+    if (new_codes == 255).any() or letters.lower() != alphabet.lower().translate(table):
+        lookup = None
+    else:
+        shifts = np.arange(8 - bits, -1, -bits)
+        lookup = (new_codes[fields].astype(np.intp) << shifts).sum(axis=1)
+        lookup = lookup.astype(np.uint8)
+    _packed_translations[key] = lookup
+    return lookup
+
+
+def _select_runs(runs, start, end):
+    """Return the runs overlapping start:end, relative to start (PRIVATE).
+
+    Returns the (clipped) runs, and the index of the first and last plus one
+    of the overlapping runs in the runs array.
+    """
+    import numpy as np
+
+    i = np.searchsorted(runs[:, 1], start, "right")
+    j = np.searchsorted(runs[:, 0], end, "left")
+    return np.clip(runs[i:j], start, end) - start, i, j
+
+
+def _join_runs(runs, letters):
+    """Join adjacent runs of the same letter (PRIVATE).
+
+    Returns the joined runs as an (n, 2) array, and the letter of each run.
+    """
+    import numpy as np
+
+    if len(runs) < 2:
+        return runs, letters
+    joined = (runs[1:, 0] == runs[:-1, 1]) & (letters[1:] == letters[:-1])
+    first = np.insert(~joined, 0, True)
+    last = np.append(~joined, True)
+    return np.column_stack((runs[first, 0], runs[last, 1])), letters[first]
+
+
+class _PackedSequenceData(SequenceDataAbstractBaseClass):
+    """Stores a nucleotide sequence using two or four bits per letter (PRIVATE).
+
+    Objects of this class are created by the ``pack`` method of Seq objects.
+    The letters are stored as 2-bit codes (for A, C, G, T) or 4-bit codes (for
+    the IUPAC ambiguous nucleotides and the gap "-") in a NumPy array, with
+    the first letter in the most significant bits of each byte. Runs of lower
+    case letters, and runs of letters that are not in the alphabet (such as N
+    in a 2-bit sequence), are stored separately as arrays of (start, end)
+    pairs. This makes it possible to store genomic sequences in about a
+    quarter of the memory, while keeping the sequence contents unchanged.
+
+    Slicing with a step of 1 or -1, count, find, rfind, and translating with
+    a complement table are done on the packed data; the packed data are then
+    unpacked only in blocks of ``_PACKED_BLOCK_SIZE`` letters. Other methods
+    use the full unpacked sequence, as returned by ``bytes``.
+    """
+
+    __slots__ = (
+        "_bits",
+        "_packed",
+        "_offset",
+        "_length",
+        "_masked",
+        "_exceptions",
+        "_letters",
+    )
+
+    def __init__(self, data, bits=2):
+        """Pack the sequence in a bytes object using the given number of bits."""
+        import numpy as np
+
+        if bits not in _PACKED_ALPHABETS:
+            raise ValueError(f"bits should be 2 or 4, not {bits!r}")
+        codes_table = _get_packed_tables(bits)[0]
+        per_byte = 8 // bits
+        length = len(data)
+        shifts = np.arange(8 - bits, -1, -bits, dtype=np.uint8)
+        packed = []
+        masked = []
+        exceptions = []
+        for start in range(0, length, _PACKED_BLOCK_SIZE):
+            block = data[start : start + _PACKED_BLOCK_SIZE]
+            letters = np.frombuffer(block, np.uint8)
+            upper = np.frombuffer(block.upper(), np.uint8)
+            codes = codes_table[upper]
+            other = codes == 255
+            changes = np.diff(letters, prepend=0, append=0) != 0
+            changes[0] = changes[-1] = True
+            # runs of the same letter that is not in the alphabet
+            edges = np.diff(other, prepend=False, append=False)
+            starts = np.flatnonzero(other & (edges[:-1] | changes[:-1]))
+            ends = np.flatnonzero(other & (edges[1:] | changes[1:])) + 1
+            exceptions.append(
+                (np.column_stack((starts, ends)) + start, letters[starts])
+            )
+            mask = letters != upper
+            edges = np.flatnonzero(np.diff(mask, prepend=False, append=False))
+            masked.append(edges.reshape(-1, 2) + start)
+            codes[other] = 0
+            codes = np.append(codes, np.zeros(-len(codes) % per_byte, np.uint8))
+            packed.append(
+                np.bitwise_or.reduce(codes.reshape(-1, per_byte) << shifts, 1)
+            )
+        self._bits = bits
+        self._length = length
+        self._offset = 0
+        if packed:
+            self._packed = np.concatenate(packed)
+        else:
+            self._packed = np.zeros(0, np.uint8)
+        # join the runs continuing across block boundaries
+        masked = np.concatenate(masked + [np.zeros((0, 2), np.intp)])
+        self._masked = _join_runs(masked, np.zeros(len(masked), np.uint8))[0]
+        runs = np.concatenate([runs for runs, letters in exceptions] + [masked[:0]])
+        letters = np.concatenate([letters for runs, letters in exceptions] + [[]])
+        runs, letters = _join_runs(runs, letters.astype(np.uint8))
+        self._exceptions = runs
+        self._letters = letters.tobytes()
+        super().__init__()
+
+    @classmethod
+    def _create(cls, bits, packed, offset, length, masked, exceptions, letters):
+        """Create a new object from the packed data and runs (PRIVATE)."""
+        data = cls.__new__(cls)
+        data._bits = bits
+        data._packed = packed
+        data._offset = offset
+        data._length = length
+        data._masked = masked
+        data._exceptions = exceptions
+        data._letters = letters
+        return data
+
+    @property
+    def _nbytes(self):
+        """Approximate memory used by the packed data and runs (PRIVATE)."""
+        return (
+            self._packed.nbytes
+            + self._masked.nbytes
+            + self._exceptions.nbytes
+            + len(self._letters)
+        )
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, key):
+        length = self._length
+        if isinstance(key, slice):
+            start, end, step = key.indices(length)
+            size = len(range(start, end, step))
+            if size == 0:
+                return b""
+            if step == 1:
+                if size == length or size < _PACKED_MIN_SIZE:
+                    return self._unpack(start, end)
+                return self._slice(start, end)
+            if step == -1:
+                if size < _PACKED_MIN_SIZE:
+                    return self._unpack(end + 1, start + 1)[::-1]
+                if size == length:
+                    return self._reverse()
+                return self._slice(end + 1, start + 1)._reverse()
+            indices = range(start, end, step)
+            first = min(indices[0], indices[-1])
+            last = max(indices[0], indices[-1]) + 1
+            return self._unpack(first, last)[indices[0] - first :: step]
+        if key < 0:
+            key += length
+        if key < 0 or key >= length:
+            raise IndexError("index out of range")
+        return self._unpack(key, key + 1)[0]
+
+    def _unpack(self, start, end):
+        """Return the letters in start:end as a bytes object (PRIVATE)."""
+        import numpy as np
+
+        letters_table = _get_packed_tables(self._bits)[2]
+        per_byte = 8 // self._bits
+        first = start + self._offset
+        last = end + self._offset
+        packed = self._packed[first // per_byte : (last + per_byte - 1) // per_byte]
+        first %= per_byte
+        letters = letters_table[packed].ravel()[first : first + end - start]
+        runs = _select_runs(self._masked, start, end)[0]
+        if len(runs):
+            mask = np.zeros(end - start + 1, np.int8)
+            mask[runs[:, 0]] = 1
+            mask[runs[:, 1]] -= 1
+            letters[np.cumsum(mask[:-1], dtype=np.int8).view(bool)] |= 0x20
+        runs, i, j = _select_runs(self._exceptions, start, end)
+        if len(runs):
+            sizes = runs[:, 1] - runs[:, 0]
+            positions = np.repeat(runs[:, 0] - np.cumsum(sizes) + sizes, sizes)
+            positions += np.arange(len(positions))
+            values = np.frombuffer(self._letters, np.uint8)[i:j]
+            letters[positions] = np.repeat(values, sizes)
+        return letters.tobytes()
+
+    def _slice(self, start, end):
+        """Return start:end as a new packed object (PRIVATE)."""
+        per_byte = 8 // self._bits
+        first = start + self._offset
+        last = end + self._offset
+        packed = self._packed[first // per_byte : (last + per_byte - 1) // per_byte]
+        masked = _select_runs(self._masked, start, end)[0]
+        exceptions, i, j = _select_runs(self._exceptions, start, end)
+        return _PackedSequenceData._create(
+            self._bits,
+            packed.copy(),
+            first % per_byte,
+            end - start,
+            masked,
+            exceptions,
+            self._letters[i:j],
+        )
+
+    def _reverse(self):
+        """Return the reversed sequence as a new packed object (PRIVATE)."""
+        reverse = _get_packed_tables(self._bits)[3]
+        per_byte = 8 // self._bits
+        length = self._length
+        return _PackedSequenceData._create(
+            self._bits,
+            reverse[self._packed[::-1]],
+            len(self._packed) * per_byte - self._offset - length,
+            length,
+            length - self._masked[::-1, ::-1],
+            length - self._exceptions[::-1, ::-1],
+            self._letters[::-1],
+        )
+
+    def _is_plain(self, start, end):
+        """Return True if start:end has only upper case alphabet letters (PRIVATE)."""
+        for runs in (self._masked, self._exceptions):
+            if len(_select_runs(runs, start, end)[0]):
+                return False
+        return True
+
+    def _indices(self, start, end):
+        """Return start and end adjusted as for slicing bytes (PRIVATE)."""
+        length = self._length
+        if start is None:
+            start = 0
+        elif start < 0:
+            start = max(start + length, 0)
+        if end is None:
+            end = length
+        elif end < 0:
+            end = max(end + length, 0)
+        else:
+            end = min(end, length)
+        return start, end
+
+    def count(self, sub, start=None, end=None):
+        """Return the number of non-overlapping occurrences of sub in data[start:end].
+
+        Optional arguments start and end are interpreted as in slice notation.
+        This method behaves as the count method of Python strings.
+        """
+        if isinstance(sub, int):
+            sub = bytes([sub])
+        else:
+            sub = bytes(sub)
+        start, end = self._indices(start, end)
+        size = len(sub)
+        if size == 0:
+            if start > end or start > self._length:
+                return 0
+            return end - start + 1
+        if size == 1:
+            return self._count_letter(sub, start, end)
+        count = 0
+        position = start
+        while end - position >= size:
+            stop = min(position + _PACKED_BLOCK_SIZE, end)
+            text = self._unpack(position, min(stop + size - 1, end))
+            n = text.count(sub)
+            count += n
+            block = stop - position
+            if text.count(sub, 0, block) == n:
+                position = stop
+            else:
+                # The last match continues into the next block; find where it
+                # starts, after the last match that is inside this block.
+                i = block - size + 1
+                while True:
+                    i = text.find(sub, i)
+                    if text.count(sub, 0, i) == n - 1:
+                        break
+                    i += 1
+                position += i + size
+        return count
+
+    def _count_letter(self, letter, start, end):
+        """Count the occurrences of a single letter in start:end (PRIVATE)."""
+        codes, fields = _get_packed_tables(self._bits)[:2]
+        code = codes[letter[0]]
+        counts = (fields == code).sum(axis=1).astype(fields.dtype)
+        per_byte = 8 // self._bits
+        count = 0
+        for position in range(start, end, _PACKED_BLOCK_SIZE):
+            stop = min(position + _PACKED_BLOCK_SIZE, end)
+            if not self._is_plain(position, stop):
+                count += self._unpack(position, stop).count(letter)
+            elif code != 255:
+                first = position + self._offset
+                last = stop + self._offset
+                packed = self._packed[
+                    first // per_byte : (last + per_byte - 1) // per_byte
+                ]
+                count += int(counts[packed].sum())
+                # subtract the letters in the first and last byte outside the range
+                count -= int((fields[packed[0], : first % per_byte] == code).sum())
+                last -= (first // per_byte + len(packed) - 1) * per_byte
+                count -= int((fields[packed[-1], last:] == code).sum())
+        return count
+
+    def find(self, sub, start=None, end=None):
+        """Return the lowest index in data where subsection sub is found.
+
+        Return the lowest index in data where subsection sub is found,
+        such that sub is contained within data[start,end].  Optional
+        arguments start and end are interpreted as in slice notation.
+
+        Return -1 on failure.
+        """
+        if isinstance(sub, int):
+            sub = bytes([sub])
+        else:
+            sub = bytes(sub)
+        start, end = self._indices(start, end)
+        size = len(sub)
+        if size == 0:
+            if start > end or start > self._length:
+                return -1
+            return start
+        # Start with a small block, in case the match is near the start
+        block = 4096
+        position = start
+        while end - position >= size:
+            text = self._unpack(position, min(position + block + size - 1, end))
+            i = text.find(sub)
+            if i >= 0:
+                return position + i
+            position += block
+            block = min(2 * block, _PACKED_BLOCK_SIZE)
+        return -1
+
+    def rfind(self, sub, start=None, end=None):
+        """Return the highest index in data where subsection sub is found.
+
+        Return the highest index in data where subsection sub is found,
+        such that sub is contained within data[start,end].  Optional
+        arguments start and end are interpreted as in slice notation.
+
+        Return -1 on failure.
+        """
+        if isinstance(sub, int):
+            sub = bytes([sub])
+        else:
+            sub = bytes(sub)
+        start, end = self._indices(start, end)
+        size = len(sub)
+        if size == 0:
+            if start > end or start > self._length:
+                return -1
+            return end
+        block = 4096
+        position = end
+        while position - start >= size:
+            first = max(start, position - block - size + 1)
+            i = self._unpack(first, position).rfind(sub)
+            if i >= 0:
+                return first + i
+            position -= block
+            block = min(2 * block, _PACKED_BLOCK_SIZE)
+        return -1
+
+    def index(self, sub, start=None, end=None):
+        """Return the lowest index in data where subsection sub is found.
+
+        Return the lowest index in data where subsection sub is found,
+        such that sub is contained within data[start,end].  Optional
+        arguments start and end are interpreted as in slice notation.
+
+        Raises ValueError when the subsection is not found.
+        """
+        i = self.find(sub, start, end)
+        if i == -1:
+            raise ValueError("subsection not found")
+        return i
+
+    def rindex(self, sub, start=None, end=None):
+        """Return the highest index in data where subsection sub is found.
+
+        Return the highest index in data where subsection sub is found,
+        such that sub is contained within data[start,end].  Optional
+        arguments start and end are interpreted as in slice notation.
+
+        Raise ValueError when the subsection is not found.
+        """
+        i = self.rfind(sub, start, end)
+        if i == -1:
+            raise ValueError("subsection not found")
+        return i
+
+    def __contains__(self, item):
+        return self.find(item) != -1
+
+    def upper(self):
+        """Return an upper case copy of the sequence."""
+        return _PackedSequenceData._create(
+            self._bits,
+            self._packed,
+            self._offset,
+            self._length,
+            self._masked[:0],
+            self._exceptions,
+            self._letters.upper(),
+        )
+
+    def lower(self):
+        """Return a lower case copy of the sequence."""
+        import numpy as np
+
+        return _PackedSequenceData._create(
+            self._bits,
+            self._packed,
+            self._offset,
+            self._length,
+            np.array([[0, self._length]], np.intp),
+            self._exceptions,
+            self._letters.lower(),
+        )
+
+    def translate(self, table, delete=b""):
+        """Return a copy with each character mapped by the given translation table.
+
+          table
+            Translation table, which must be a bytes object of length 256.
+
+        All characters occurring in the optional argument delete are removed.
+        The remaining characters are mapped through the given translation table.
+        """
+        if table is not None and not delete:
+            lookup = _get_packed_translation(self._bits, bytes(table))
+            if lookup is not None:
+                return _PackedSequenceData._create(
+                    self._bits,
+                    lookup[self._packed],
+                    self._offset,
+                    self._length,
+                    self._masked,
+                    self._exceptions,
+                    self._letters.translate(table),
+                )
+        return bytes(self).translate(table, delete)
+
+
+def _python_scan(table, nsymbols, symbols, accept, data, state):
+    """Run the pattern automaton over the sequence data (PRIVATE).
+
+    This is the pure Python version of the scan function in the C module
+    Bio._ahocorasick, and returns the same (index, state) tuples for each
+    position where the automaton is in an accepting state, and the final
+    state.
+    """
+    hits = []
+    for index, symbol in enumerate(bytes(data).translate(symbols)):
+        state = table[state * nsymbols + symbol]
+        if accept[state]:
+            hits.append((index, state))
+    return hits, state
+
+
+try:
+    from Bio._ahocorasick import scan as _scan
+except ImportError:
+    # Fall back to the pure Python code if the C module was not compiled
+    _scan = _python_scan
+
+
+# Number of letters scanned at a time by PatternSet.search
+_PATTERN_SCAN_SIZE = 1048576
+
+# Maximum number of automaton states, to avoid running out of memory if the
+# degenerate letters or mismatches allowed give too many possible matches.
+_PATTERN_MAX_STATES = 1 << 22
+
+PatternMatch = collections.namedtuple(
+    "PatternMatch", ["start", "pattern", "strand", "mismatches"]
+)
+
+
+class PatternSet:
+    """A set of sequence patterns compiled for searching many sequences.
+
+    The patterns are compiled into an Aho-Corasick automaton, which finds
+    all occurrences of all patterns in a single pass over the sequence, so
+    the search time does not increase with the number of patterns. This is
+    useful for screening sequences for thousands of primers, adapters, or
+    barcodes at once:
+
+    >>> from Bio.Seq import PatternSet, Seq
+    >>> primers = PatternSet(["GGATCC", "CCRGG", "TTAAC"])
+    >>> for match in primers.search(Seq("ATGGATCCAAGTTAACCAGGAA")):
+    ...     print(match)
+    ...
+    PatternMatch(start=2, pattern='GGATCC', strand=1, mismatches=0)
+    PatternMatch(start=10, pattern='TTAAC', strand=-1, mismatches=0)
+    PatternMatch(start=11, pattern='TTAAC', strand=1, mismatches=0)
+    PatternMatch(start=15, pattern='CCRGG', strand=1, mismatches=0)
+
+    Each match gives the start position of the match on the forward strand
+    of the sequence, the pattern as a string, the strand (1 or -1, where -1
+    means the reverse complement of the pattern was found), and the number
+    of mismatches. The matches are returned in order of their end position.
+
+    Arguments:
+     - patterns - a list of strings, Seq, MutableSeq, bytes, or bytearray
+       objects containing the patterns to search for.
+     - degenerate - if True (default), the patterns are nucleotide sequences
+       which may contain IUPAC ambiguity codes (e.g. N or R), which match
+       the corresponding unambiguous letters in the sequence. Matching is
+       then case-insensitive, and U is treated as T. If False, the patterns
+       can contain any letters, which must match exactly (case-sensitive).
+     - both_strands - if True (default), the reverse complement of each
+       pattern is searched for as well. Patterns which are their own reverse
+       complement are reported once, with strand 1.
+     - mismatches - maximum number of mismatching letters (substitutions)
+       allowed in a match, by default 0. Each possible match is stored in the
+       automaton, so allowing mismatches is only practical for short
+       patterns such as barcodes:
+
+    >>> barcodes = PatternSet(["ACGTAC", "TTGCAG"], both_strands=False, mismatches=1)
+    >>> for match in barcodes.search("GGACTTACGG"):
+    ...     print(match)
+    ...
+    PatternMatch(start=2, pattern='ACGTAC', strand=1, mismatches=1)
+
+    The same PatternSet object can be used to search any number of
+    sequences. It can also be passed to the ``search`` method of Seq and
+    MutableSeq objects.
+    """
+
+    def __init__(self, patterns, degenerate=True, both_strands=True, mismatches=0):
+        """Compile the patterns into an automaton."""
+        if not isinstance(mismatches, int) or mismatches < 0:
+            raise ValueError(
+                f"mismatches should be a non-negative integer, not {mismatches!r}"
+            )
+        strings = []
+        for index, pattern in enumerate(patterns):
+            if isinstance(pattern, (_SeqAbstractBaseClass, bytearray, bytes)):
+                pattern = bytes(pattern).decode("ASCII")
+            elif not isinstance(pattern, str):
+                raise TypeError(
+                    "patterns[%d]: a Seq, MutableSeq, str, bytes, or bytearray object is required, not '%s'"
+                    % (index, type(pattern))
+                )
+            if not pattern:
+                raise ValueError("patterns[%d]: pattern is empty" % index)
+            strings.append(pattern)
+        self.patterns = strings
+        self.degenerate = degenerate
+        self.both_strands = both_strands
+        self.mismatches = mismatches
+        # Each pattern (and its reverse complement) is converted to a list of
+        # the symbols allowed at each position.
+        queries = []
+        for index, pattern in enumerate(strings):
+            queries.append((index, 1, pattern))
+            if both_strands:
+                other = reverse_complement(pattern)
+                if degenerate:
+                    if other.upper() != pattern.upper():
+                        queries.append((index, -1, other))
+                elif other != pattern:
+                    queries.append((index, -1, other))
+        if degenerate:
+            values = dict(IUPACData.ambiguous_dna_values)
+            values["U"] = "T"
+            codes = {letter: i for i, letter in enumerate("ACGT")}
+            allowed = {}
+            for letter, value in values.items():
+                allowed[letter] = {codes[c] for c in value}
+            nsymbols = 5  # A, C, G, T, and any other letter
+            symbols = bytearray([4] * 256)
+            for letter, code in (("A", 0), ("C", 1), ("G", 2), ("T", 3), ("U", 3)):
+                symbols[ord(letter)] = symbols[ord(letter.lower())] = code
+            classes = []
+            for index, strand, pattern in queries:
+                try:
+                    classes.append([allowed[letter] for letter in pattern.upper()])
+                except KeyError as exception:
+                    raise ValueError(
+                        "patterns[%d]: invalid letter %s" % (index, exception)
+                    ) from None
+        else:
+            letters = sorted(set("".join(pattern for i, s, pattern in queries)))
+            codes = {letter: i for i, letter in enumerate(letters)}
+            nsymbols = len(letters) + 1  # the last symbol is any other letter
+            symbols = bytearray([nsymbols - 1] * 256)
+            for letter, code in codes.items():
+                symbols[ord(letter)] = code
+            classes = [
+                [{codes[letter]} for letter in pattern] for i, s, pattern in queries
+            ]
+        # Build the trie of all possible matches
+        table = array("i", [-1]) * nsymbols
+        outputs = {}
+        for (index, strand, pattern), query in zip(queries, classes):
+            frontier = [(0, 0)]
+            for symbol_set in query:
+                states = []
+                for state, count in frontier:
+                    for symbol in range(nsymbols):
+                        if symbol not in symbol_set:
+                            if count == mismatches:
+                                continue
+                            cost = count + 1
+                        else:
+                            cost = count
+                        i = state * nsymbols + symbol
+                        child = table[i]
+                        if child < 0:
+                            child = len(table) // nsymbols
+                            if child == _PATTERN_MAX_STATES:
+                                raise ValueError(
+                                    "Too many possible matches; please use fewer "
+                                    "degenerate letters or allowed mismatches"
+                                )
+                            table[i] = child
+                            table.extend([-1] * nsymbols)
+                        states.append((child, cost))
+                frontier = states
+            for state, count in frontier:
+                outputs.setdefault(state, []).append((index, strand, count))
+        # Add the failure transitions, giving the Aho-Corasick automaton
+        nstates = len(table) // nsymbols
+        failure = array("i", [0]) * nstates
+        queue = collections.deque()
+        for symbol in range(nsymbols):
+            child = table[symbol]
+            if child < 0:
+                table[symbol] = 0
+            else:
+                queue.append(child)
+        while queue:
+            state = queue.popleft()
+            fallback = failure[state] * nsymbols
+            for symbol in range(nsymbols):
+                i = state * nsymbols + symbol
+                child = table[i]
+                if child < 0:
+                    table[i] = table[fallback + symbol]
+                else:
+                    failure[child] = table[fallback + symbol]
+                    # Include the patterns ending at the failure state
+                    suffix_outputs = outputs.get(failure[child])
+                    if suffix_outputs is not None:
+                        outputs[child] = outputs.get(child, []) + suffix_outputs
+                    queue.append(child)
+        accept = bytearray(nstates)
+        for state in outputs:
+            accept[state] = 1
+        self._table = table
+        self._nsymbols = nsymbols
+        self._symbols = bytes(symbols)
+        self._accept = bytes(accept)
+        self._outputs = outputs
+
+    def __len__(self):
+        """Return the number of patterns."""
+        return len(self.patterns)
+
+    def search(self, sequence):
+        """Search a sequence for the patterns, and yield a PatternMatch for each match.
+
+        Arguments:
+         - sequence - a string, Seq, MutableSeq, bytes, or bytearray object.
+
+        Long sequences are scanned in blocks, so that packed Seq objects are
+        not unpacked in full.
+        """
+        if isinstance(sequence, _SeqAbstractBaseClass):
+            data = sequence._data
+        elif isinstance(sequence, str):
+            data = sequence.encode("ASCII")
+        elif isinstance(sequence, (bytes, bytearray)):
+            data = sequence
+        else:
+            raise TypeError(
+                "a Seq, MutableSeq, str, bytes, or bytearray object is required, not '%s'"
+                % type(sequence)
+            )
+        patterns = self.patterns
+        outputs = self._outputs
+        state = 0
+        for offset in range(0, len(data), _PATTERN_SCAN_SIZE):
+            block = data[offset : offset + _PATTERN_SCAN_SIZE]
+            if not isinstance(block, (bytes, bytearray)):
+                block = bytes(block)
+            hits, state = _scan(
+                self._table, self._nsymbols, self._symbols, self._accept, block, state
+            )
+            for index, hit in hits:
+                end = offset + index + 1
+                for i, strand, count in outputs[hit]:
+                    pattern = patterns[i]
+                    yield PatternMatch(end - len(pattern), pattern, strand, count)
+
+
 # The transcribe, backward_transcribe, and translate functions are
 # user-friendly versions of the corresponding Seq/MutableSeq methods.
 # The functions work both on Seq objects, and on strings.
@@ -2735,6 +3615,68 @@ def back_transcribe(rna):
         return rna.replace("U", "T").replace("u", "t")
 
 
+def _get_codon_table(table):
+    """Return the codon table given its name, NCBI identifier or object (PRIVATE).
+
+    The same table can be used for RNA or DNA.
+
+    >>> _get_codon_table(2).names
+    ['Vertebrate Mitochondrial', 'SGC1']
+    """
+    try:
+        table_id = int(table)
+    except ValueError:
+        # Assume it's a table name
+        # The same table can be used for RNA or DNA
+        try:
+            codon_table = CodonTable.ambiguous_generic_by_name[table]
+        except KeyError:
+            if isinstance(table, str):
+                raise ValueError(
+                    "The Bio.Seq translate methods and function DO NOT "
+                    "take a character string mapping table like the python "
+                    "string object's translate method. "
+                    "Use str(my_seq).translate(...) instead."
+                ) from None
+            else:
+                raise TypeError("table argument must be integer or string") from None
+    except (AttributeError, TypeError):
+        # Assume it's a CodonTable object
+        if isinstance(table, CodonTable.CodonTable):
+            codon_table = table
+        else:
+            raise ValueError("Bad table argument") from None
+    else:
+        # Assume it's a table ID
+        # The same table can be used for RNA or DNA
+        codon_table = CodonTable.ambiguous_generic_by_id[table_id]
+    return codon_table
+
+
+def _check_dual_coding(codon_table, to_stop):
+    """Check for tables with 'ambiguous' (dual-coding) stop codons (PRIVATE).
+
+    Raises a ValueError if to_stop is True, otherwise warns that such codons
+    will be translated as an amino acid.
+    """
+    forward_table = codon_table.forward_table
+    dual_coding = [c for c in codon_table.stop_codons if c in forward_table]
+    if dual_coding:
+        c = dual_coding[0]
+        if to_stop:
+            raise ValueError(
+                "You cannot use 'to_stop=True' with this table as it contains"
+                f" {len(dual_coding)} codon(s) which can be both STOP and an"
+                f" amino acid (e.g. '{c}' -> '{forward_table[c]}' or STOP)."
+            )
+        warnings.warn(
+            f"This table contains {len(dual_coding)} codon(s) which code(s) for"
+            f" both STOP and an amino acid (e.g. '{c}' -> '{forward_table[c]}'"
+            " or STOP). Such codons will be translated as amino acid.",
+            BiopythonWarning,
+        )
+
+
 def _translate_str(
     sequence, table, stop_symbol="*", to_stop=False, cds=False, pos_stop="X", gap=None
 ):
@@ -2800,33 +3742,7 @@ def _translate_str(
        ...
     Bio.Data.CodonTable.TranslationError: Extra in frame stop codon 'TAG' found.
     """
-    try:
-        table_id = int(table)
-    except ValueError:
-        # Assume it's a table name
-        # The same table can be used for RNA or DNA
-        try:
-            codon_table = CodonTable.ambiguous_generic_by_name[table]
-        except KeyError:
-            if isinstance(table, str):
-                raise ValueError(
-                    "The Bio.Seq translate methods and function DO NOT "
-                    "take a character string mapping table like the python "
-                    "string object's translate method. "
-                    "Use str(my_seq).translate(...) instead."
-                ) from None
-            else:
-                raise TypeError("table argument must be integer or string") from None
-    except (AttributeError, TypeError):
-        # Assume it's a CodonTable object
-        if isinstance(table, CodonTable.CodonTable):
-            codon_table = table
-        else:
-            raise ValueError("Bad table argument") from None
-    else:
-        # Assume it's a table ID
-        # The same table can be used for RNA or DNA
-        codon_table = CodonTable.ambiguous_generic_by_id[table_id]
+    codon_table = _get_codon_table(table)
     sequence = sequence.upper()
     amino_acids = []
     forward_table = codon_table.forward_table
@@ -2841,22 +3757,7 @@ def _translate_str(
         )
     n = len(sequence)
 
-    # Check for tables with 'ambiguous' (dual-coding) stop codons:
-    dual_coding = [c for c in stop_codons if c in forward_table]
-    if dual_coding:
-        c = dual_coding[0]
-        if to_stop:
-            raise ValueError(
-                "You cannot use 'to_stop=True' with this table as it contains"
-                f" {len(dual_coding)} codon(s) which can be both STOP and an"
-                f" amino acid (e.g. '{c}' -> '{forward_table[c]}' or STOP)."
-            )
-        warnings.warn(
-            f"This table contains {len(dual_coding)} codon(s) which code(s) for"
-            f" both STOP and an amino acid (e.g. '{c}' -> '{forward_table[c]}'"
-            " or STOP). Such codons will be translated as amino acid.",
-            BiopythonWarning,
-        )
+    _check_dual_coding(codon_table, to_stop)
 
     if cds:
         if str(sequence[:3]).upper() not in codon_table.start_codons:
@@ -3018,6 +3919,292 @@ def translate(
         return _translate_str(sequence, table, stop_symbol, to_stop, cds, gap=gap)
 
 
+# Codes used in the codon lookup arrays of translate_many, in addition to the
+# single byte amino acid letters.
+_CODON_STOP = 256
+_CODON_INVALID = 257
+
+# Maps (codon table, gap) to the letter index and codon lookup arrays.
+_codon_lookup_cache = {}
+
+
+def _codon_lookup(codon_table, gap):
+    """Return NumPy arrays for translating codons in bulk (PRIVATE).
+
+    Returns an array mapping each byte value to a letter index, and an array
+    mapping each codon (as three letter indexes) to the amino acid letter, or
+    to _CODON_STOP or _CODON_INVALID. Each codon is translated once here in
+    the same way as by _translate_str, so the results are identical. Codons
+    using any other letters are marked as invalid, and left to be checked by
+    _translate_codon (as some codon tables accept letters like X).
+    """
+    import numpy as np
+
+    key = (codon_table, gap)
+    try:
+        return _codon_lookup_cache[key]
+    except KeyError:
+        pass
+    forward_table = codon_table.forward_table
+    stop_codons = codon_table.stop_codons
+    if codon_table.nucleotide_alphabet is not None:
+        valid_letters = set(codon_table.nucleotide_alphabet.upper())
+    else:
+        valid_letters = set(
+            IUPACData.ambiguous_dna_letters.upper()
+            + IUPACData.ambiguous_rna_letters.upper()
+        )
+    # Any codon using another letter is invalid
+    letters = set(IUPACData.ambiguous_dna_letters.upper())
+    letters.update(IUPACData.ambiguous_rna_letters.upper())
+    letters.update(valid_letters)
+    letters.update("".join(stop_codons))
+    if isinstance(forward_table, dict):
+        letters.update("".join(forward_table))
+    if gap is not None:
+        letters.add(gap)
+    letters = sorted(letter for letter in letters if ord(letter) < 128)
+    size = len(letters) + 1  # the last index is used for all other bytes
+    letter_index = np.full(256, size - 1, np.intp)
+    for i, letter in enumerate(letters):
+        letter_index[ord(letter)] = i
+    lookup = np.full(size**3, _CODON_INVALID, np.uint16)
+    for i, first in enumerate(letters):
+        for j, second in enumerate(letters):
+            for k, third in enumerate(letters):
+                codon = first + second + third
+                try:
+                    value = ord(forward_table[codon])
+                except (KeyError, CodonTable.TranslationError):
+                    if codon in stop_codons:
+                        value = _CODON_STOP
+                    elif valid_letters.issuperset(codon):
+                        # Possible stop codon (e.g. NNN or TAN)
+                        value = ord("X")
+                    elif gap is not None and codon == gap * 3:
+                        value = ord(gap)
+                    else:
+                        continue
+                lookup[(i * size + j) * size + k] = value
+    _codon_lookup_cache[key] = letter_index, lookup, size
+    return letter_index, lookup, size
+
+
+def _translate_codon(codon, codon_table, gap):
+    """Return the lookup array code for a codon marked as invalid (PRIVATE)."""
+    if codon in codon_table.stop_codons:
+        return _CODON_STOP
+    try:
+        return ord(_translate_str(codon, codon_table, gap=gap))
+    except CodonTable.TranslationError:
+        return _CODON_INVALID
+
+
+def translate_many(
+    sequences, table="Standard", stop_symbol="*", to_stop=False, cds=False, gap=None
+):
+    """Translate many nucleotide sequences into amino acids, returns a list.
+
+    This gives the same results as calling the ``translate`` function on each
+    sequence in turn (strings give strings, Seq and MutableSeq objects give
+    Seq objects), but is much faster for large numbers of sequences, such as
+    all the open reading frames in a genome. The sequences are joined into a
+    single buffer, and all the codons are translated at once using NumPy and
+    a lookup array built from the codon table.
+
+    >>> translate_many(["ATGGCCATTGTAATGGGCCGCTGA", "GTGGCCTAGatt", "TAN"])
+    ['MAIVMGR*', 'VA*I', 'X']
+    >>> translate_many([Seq("ATGGCCTAGGCC")], to_stop=True)
+    [Seq('MA')]
+    >>> translate_many(["GTGGCCATTGTAATGGGCCGCTGAAAGGGTGCCCGATAG"], table=2, cds=True)
+    ['MAIVMGRWKGAR']
+
+    The arguments are as for the ``translate`` function, including the checks
+    done if ``cds=True``, and any invalid codon raises a TranslationError:
+
+    >>> translate_many(["ATGCCC", "ATGTA?"])
+    Traceback (most recent call last):
+       ...
+    Bio.Data.CodonTable.TranslationError: Codon 'TA?' is invalid
+
+    Unlike calling ``translate`` repeatedly, any warnings (e.g. for partial
+    codons) are only given once. If ``gap`` is not given, ``Seq`` and
+    ``MutableSeq`` objects use the default gap character "-" as in their
+    ``translate`` method.
+    """
+    results = []
+    batch = []  # sequences to translate together, with their types
+    batch_size = 0
+    batch_gap = None
+    codon_table = None
+    for sequence in sequences:
+        if codon_table is None:
+            codon_table = _get_codon_table(table)
+            _check_dual_coding(codon_table, to_stop)
+            if gap is not None:
+                if not isinstance(gap, str):
+                    raise TypeError(
+                        "Gap character should be a single character string."
+                    )
+                elif len(gap) > 1:
+                    raise ValueError(
+                        "Gap character should be a single character string."
+                    )
+        if isinstance(sequence, (Seq, MutableSeq)):
+            try:
+                data = bytes(sequence)
+            except UndefinedSequenceError:
+                data = None
+            if isinstance(sequence, MutableSeq):
+                sequence_class = Seq
+            else:
+                sequence_class = type(sequence)
+            sequence_gap = "-" if gap is None else gap
+        else:
+            try:
+                data = sequence.encode("ASCII")
+            except UnicodeEncodeError:
+                data = None
+            sequence_class = None
+            sequence_gap = gap
+        if data is None or sequence_gap != batch_gap or batch_size > 16777216:
+            results.extend(
+                _translate_batch(
+                    batch, codon_table, stop_symbol, to_stop, cds, batch_gap
+                )
+            )
+            batch = []
+            batch_size = 0
+            batch_gap = sequence_gap
+        if data is None:
+            # e.g. undefined sequence contents, or non-ASCII strings
+            results.append(translate(sequence, table, stop_symbol, to_stop, cds, gap))
+        else:
+            batch.append((data, sequence_class))
+            batch_size += len(data)
+    results.extend(
+        _translate_batch(batch, codon_table, stop_symbol, to_stop, cds, batch_gap)
+    )
+    return results
+
+
+def _translate_batch(batch, codon_table, stop_symbol, to_stop, cds, gap):
+    """Translate a list of (bytes, sequence class) pairs using NumPy (PRIVATE).
+
+    The sequence class is None for strings. The first sequence which cannot
+    be translated raises an exception, as when translating them in turn.
+    """
+    import numpy as np
+
+    if not batch:
+        return []
+    letter_index, lookup, size = _codon_lookup(codon_table, gap)
+    data = b"".join(item[0] for item in batch).upper()
+    lengths = np.array([len(item[0]) for item in batch], np.intp)
+    starts = np.cumsum(lengths) - lengths
+    errors = {}
+    if cds:
+        start_codons = codon_table.start_codons
+        stop_codons = codon_table.stop_codons
+        for i, (start, n) in enumerate(zip(starts.tolist(), lengths.tolist())):
+            first_codon = data[start : start + min(3, n)].decode()
+            final_codon = data[start + max(n - 3, 0) : start + n].decode()
+            if first_codon not in start_codons:
+                errors[i] = CodonTable.TranslationError(
+                    f"First codon '{first_codon}' is not a start codon"
+                )
+            elif n % 3 != 0:
+                errors[i] = CodonTable.TranslationError(
+                    f"Sequence length {n} is not a multiple of three"
+                )
+            elif final_codon not in stop_codons:
+                errors[i] = CodonTable.TranslationError(
+                    f"Final codon '{final_codon}' is not a stop codon"
+                )
+        # Don't translate the start and stop codons
+        codon_starts = starts + 3
+        counts = np.maximum((lengths - 6) // 3, 0)
+        if errors:
+            counts[list(errors)] = 0
+    else:
+        if (lengths % 3).any():
+            warnings.warn(
+                "Partial codon, len(sequence) not a multiple of three. "
+                "Explicitly trim the sequence or add trailing N before "
+                "translation. This may become an error in future.",
+                BiopythonWarning,
+            )
+        codon_starts = starts
+        counts = lengths // 3
+    ends = np.cumsum(counts)
+    firsts = ends - counts
+    total = int(ends[-1])
+    # Position of each codon in the joined data
+    positions = np.repeat(codon_starts - 3 * firsts, counts)
+    positions += np.arange(0, 3 * total, 3)
+    letters = np.frombuffer(data, np.uint8)
+    indices = letter_index[letters[positions]] * size
+    indices += letter_index[letters[positions + 1]]
+    indices *= size
+    indices += letter_index[letters[positions + 2]]
+    codes = lookup[indices]
+    # Check any codons using letters not in the lookup array one at a time
+    unknown = np.flatnonzero(codes == _CODON_INVALID)
+    if len(unknown):
+        checked = {}
+        for index, position in zip(unknown.tolist(), positions[unknown].tolist()):
+            codon = data[position : position + 3].decode()
+            if codon not in checked:
+                checked[codon] = _translate_codon(codon, codon_table, gap)
+            codes[index] = checked[codon]
+    # Find the first stop codon and invalid codon (if any) of each sequence
+    stops = np.append(np.flatnonzero(codes == _CODON_STOP), total)
+    first_stops = np.minimum(stops[np.searchsorted(stops, firsts)], ends)
+    invalid = np.append(np.flatnonzero(codes == _CODON_INVALID), total)
+    first_invalid = np.minimum(invalid[np.searchsorted(invalid, firsts)], ends)
+    if len(stop_symbol) == 1 and stop_symbol < "\x80":
+        codes[stops[:-1]] = ord(stop_symbol)
+        replace_stop = False
+    else:
+        codes[stops[:-1]] = 0
+        replace_stop = True
+    proteins = codes.astype(np.uint8).tobytes()
+    results = []
+    for i, (first, end, first_stop, invalid_codon, codon_start) in enumerate(
+        zip(
+            firsts.tolist(),
+            ends.tolist(),
+            first_stops.tolist(),
+            first_invalid.tolist(),
+            codon_starts.tolist(),
+        )
+    ):
+        if i in errors:
+            raise errors[i]
+        if cds or to_stop:
+            end, last = first_stop, end
+        if invalid_codon < end:
+            position = codon_start + 3 * (invalid_codon - first)
+            codon = data[position : position + 3].decode()
+            raise CodonTable.TranslationError(f"Codon '{codon}' is invalid")
+        if cds and first_stop < last:
+            position = codon_start + 3 * (first_stop - first)
+            codon = data[position : position + 3].decode()
+            raise CodonTable.TranslationError(
+                f"Extra in frame stop codon '{codon}' found."
+            )
+        protein = proteins[first:end].decode()
+        if replace_stop:
+            protein = protein.replace("\0", stop_symbol)
+        if cds:
+            protein = "M" + protein
+        sequence_class = batch[i][1]
+        if sequence_class is not None:
+            protein = sequence_class(protein)
+        results.append(protein)
+    return results
+
+
 def reverse_complement(sequence, inplace=False):
     """Return the reverse complement as a DNA sequence.
 
@@ -3083,6 +4270,53 @@ def reverse_complement(sequence, inplace=False):
     return sequence[::-1]
 
 
+def reverse_complement_many(sequences):
+    """Return the reverse complements of many sequences as DNA, returns a list.
+
+    This gives the same results as calling the ``reverse_complement`` function
+    on each sequence in turn (strings give strings, Seq and MutableSeq objects
+    give new objects of the same class), but with much less overhead for large
+    numbers of sequences. The sequences are joined into a single buffer which
+    is complemented and reversed in one step, and each result is then a slice
+    of that buffer.
+
+    >>> reverse_complement_many(["CGA", Seq("CGAUT"), MutableSeq("aacN")])
+    ['TCG', Seq('AATCG'), MutableSeq('Ngtt')]
+    """
+    from Bio.SeqRecord import SeqRecord  # Lazy to avoid circular imports
+
+    sequences = list(sequences)
+    buffers = []
+    for sequence in sequences:
+        if isinstance(sequence, (Seq, MutableSeq)):
+            try:
+                data = bytes(sequence)
+            except UndefinedSequenceError:
+                data = None
+        elif isinstance(sequence, SeqRecord):
+            data = None
+        else:
+            # Assume it's a string.
+            data = sequence.encode("ASCII")
+        buffers.append(data)
+    # Reversing the joined buffer also reverses the order of the sequences
+    data = b"".join(data for data in buffers if data is not None)
+    data = data.translate(_dna_complement_table)[::-1]
+    end = len(data)
+    results = []
+    for sequence, buffer in zip(sequences, buffers):
+        if buffer is None:
+            results.append(reverse_complement(sequence))
+            continue
+        start = end - len(buffer)
+        if isinstance(sequence, (Seq, MutableSeq)):
+            results.append(sequence.__class__(data[start:end]))
+        else:
+            results.append(data[start:end].decode("ASCII"))
+        end = start
+    return results
+
+
 def reverse_complement_rna(sequence, inplace=False):
     """Return the reverse complement as an RNA sequence.
 
@@ -21,6 +21,10 @@ Base class to hold a Feature
 
 Classes:
  - SeqFeature
+ - FeatureTable - Compact columnar store for large numbers of features.
+
+Functions:
+ - intern_qualifiers - Share repeated qualifier keys and values.
 
 Hold information about a Reference
 ----------------------------------
@@ -63,9 +67,11 @@ Exceptions:
 
 import functools
 import re
+import sys
 import warnings
 from abc import ABC
 from abc import abstractmethod
+from array import array
 
 from Bio import BiopythonDeprecationWarning
 from Bio import BiopythonParserWarning
@@ -165,6 +171,26 @@ class LocationParserError(ValueError):
     """Could not parse a feature location string."""
 
 
+def _getstate(self):
+    """Return the attributes held in __slots__ and any __dict__ (PRIVATE).
+
+    Used as __getstate__ by the classes with __slots__, which pickle
+    protocols 0 and 1 cannot otherwise handle.
+    """
+    state = dict(getattr(self, "__dict__", ()))
+    for cls in type(self).__mro__:
+        for name in cls.__dict__.get("__slots__", ()):
+            if name not in ("__dict__", "__weakref__") and hasattr(self, name):
+                state[name] = getattr(self, name)
+    return state
+
+
+def _setstate(self, state):
+    """Restore the attributes returned by _getstate (PRIVATE)."""
+    for name, value in state.items():
+        object.__setattr__(self, name, value)
+
+
 class SeqFeature:
     """Represent a Sequence Feature on an object.
 
@@ -179,6 +205,11 @@ class SeqFeature:
 
     """
 
+    __slots__ = ("id", "location", "qualifiers", "type", "__dict__", "__weakref__")
+
+    __getstate__ = _getstate
+    __setstate__ = _setstate
+
     def __init__(
         self,
         location=None,
@@ -632,6 +663,202 @@ class SeqFeature:
         return value in self.location
 
 
+# Qualifier values longer than this are usually unique (e.g. translations),
+# so are not worth adding to a shared string pool.
+_POOL_MAX_LENGTH = 80
+
+
+def _pooled(value, pool):
+    """Return the pooled copy of a short qualifier value string (PRIVATE)."""
+    if isinstance(value, str) and len(value) <= _POOL_MAX_LENGTH:
+        return pool.setdefault(value, value)
+    return value
+
+
+def intern_qualifiers(features, pool=None):
+    """Share repeated qualifier keys and values between features, in place.
+
+    Arguments:
+     - features - an iterable of SeqFeature objects.
+     - pool - optional dictionary of previously seen values, used as the
+       shared string pool. Pass the return value of an earlier call to
+       share values between several lists of features.
+
+    The qualifier keys are interned, and the short string values are replaced
+    by a single shared copy, so that e.g. thousands of identical
+    ``/product="hypothetical protein"`` entries hold one string object. The
+    qualifier contents are unchanged. Returns the pool dictionary.
+
+    >>> from Bio.SeqFeature import SeqFeature, SimpleLocation
+    >>> features = [
+    ...     SeqFeature(SimpleLocation(i, i + 9), type="CDS",
+    ...                qualifiers={"product": ["hypothetical " + "protein"]})
+    ...     for i in range(3)
+    ... ]
+    >>> pool = intern_qualifiers(features)
+    >>> features[0].qualifiers["product"][0] is features[2].qualifiers["product"][0]
+    True
+
+    """
+    if pool is None:
+        pool = {}
+    for feature in features:
+        qualifiers = feature.qualifiers
+        for key, values in list(qualifiers.items()):
+            if isinstance(values, list):
+                values = [_pooled(value, pool) for value in values]
+            else:
+                values = _pooled(values, pool)
+            if isinstance(key, str):
+                del qualifiers[key]
+                key = sys.intern(key)
+            qualifiers[key] = values
+    return pool
+
+
+class FeatureTable:
+    """Compact columnar store for a large number of features.
+
+    A FeatureTable holds the start, end and strand of each feature in
+    ``array`` objects (``starts`` and ``ends`` as 64-bit integers, ``strands``
+    as 8-bit integers, using 2 for a strand of None), the feature types and
+    identifiers as lists of shared strings, and the qualifiers as tuples of
+    (key, values) pairs with interned keys and pooled values. The arrays can
+    be wrapped as NumPy arrays without copying, e.g. ``numpy.asarray(table.starts)``.
+
+    Features with an exact SimpleLocation are stored entirely in the columns.
+    For any other location (fuzzy positions, references to other sequences,
+    compound locations, or None) the columns hold the overall start, end and
+    strand, and the location object itself is kept separately.
+
+    Indexing or iterating over the table creates new SeqFeature objects:
+
+    >>> from Bio.SeqFeature import SeqFeature, SimpleLocation, FeatureTable
+    >>> features = [
+    ...     SeqFeature(SimpleLocation(10, 40, strand=1), type="gene",
+    ...                qualifiers={"locus_tag": ["b0001"]}),
+    ...     SeqFeature(SimpleLocation(10, 40, strand=1), type="CDS",
+    ...                qualifiers={"locus_tag": ["b0001"], "codon_start": ["1"]}),
+    ... ]
+    >>> table = FeatureTable(features)
+    >>> len(table)
+    2
+    >>> list(table.starts), list(table.ends), list(table.strands)
+    ([10, 10], [40, 40], [1, 1])
+    >>> table.types
+    ['gene', 'CDS']
+    >>> print(table[1].location)
+    [10:40](+)
+    >>> table[1].qualifiers
+    {'locus_tag': ['b0001'], 'codon_start': ['1']}
+    >>> table.to_features() == features
+    True
+
+    """
+
+    _NO_STRAND = 2
+
+    def __init__(self, features=()):
+        """Create the table, optionally from an iterable of SeqFeature objects."""
+        self.starts = array("q")
+        self.ends = array("q")
+        self.strands = array("b")
+        self.types = []
+        self.ids = []
+        self._qualifiers = []
+        self._locations = {}  # index -> location, when not stored in columns
+        self._pool = {}
+        self.extend(features)
+
+    def __len__(self):
+        """Return the number of features in the table."""
+        return len(self.types)
+
+    def __repr__(self):
+        """Represent the table as a string for debugging."""
+        return f"<{self.__class__.__name__} with {len(self)} features>"
+
+    def append(self, feature):
+        """Add a SeqFeature to the end of the table."""
+        pool = self._pool
+        index = len(self.types)
+        location = feature.location
+        if location is None:
+            start = end = 0
+            strand = None
+            self._locations[index] = None
+        else:
+            start = int(location.start)
+            end = int(location.end)
+            strand = location.strand
+            if not (
+                type(location) is SimpleLocation
+                and type(location._start) is ExactPosition
+                and type(location._end) is ExactPosition
+                and location.ref is None
+                and location.ref_db is None
+            ):
+                self._locations[index] = location
+        self.starts.append(start)
+        self.ends.append(end)
+        self.strands.append(self._NO_STRAND if strand is None else strand)
+        self.types.append(_pooled(feature.type, pool))
+        self.ids.append(_pooled(feature.id, pool))
+        qualifiers = []
+        for key, values in feature.qualifiers.items():
+            if isinstance(key, str):
+                key = sys.intern(key)
+            if isinstance(values, list):
+                values = tuple(_pooled(value, pool) for value in values)
+            else:
+                # Not the usual list of values, keep it as it is
+                values = [_pooled(values, pool)]
+            qualifiers.append((key, values))
+        self._qualifiers.append(tuple(qualifiers))
+
+    def extend(self, features):
+        """Add an iterable of SeqFeature objects to the end of the table."""
+        for feature in features:
+            self.append(feature)
+
+    def __getitem__(self, index):
+        """Return the feature at the given index as a new SeqFeature object."""
+        if not isinstance(index, int):
+            raise TypeError("FeatureTable indices must be integers")
+        length = len(self.types)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("FeatureTable index out of range")
+        try:
+            location = self._locations[index]
+        except KeyError:
+            strand = self.strands[index]
+            location = SimpleLocation(
+                self.starts[index],
+                self.ends[index],
+                None if strand == self._NO_STRAND else strand,
+            )
+        qualifiers = {}
+        for key, values in self._qualifiers[index]:
+            if isinstance(values, tuple):
+                qualifiers[key] = list(values)
+            else:
+                qualifiers[key] = values[0]
+        return SeqFeature(
+            location, type=self.types[index], id=self.ids[index], qualifiers=qualifiers
+        )
+
+    def __iter__(self):
+        """Iterate over the features as new SeqFeature objects."""
+        for index in range(len(self.types)):
+            yield self[index]
+
+    def to_features(self):
+        """Return the features as a list of new SeqFeature objects."""
+        return list(self)
+
+
 # --- References
 
 
@@ -704,10 +931,97 @@ class Reference:
 
 # --- Handling feature locations
 
+# Number of distinct location strings remembered by Location.fromstring
+_LOCATION_CACHE_SIZE = 4096
+
+
+def _fast_range(text, strand):
+    """Parse a plain range like 123..456 without regular expressions (PRIVATE).
+
+    Returns None if the text is not a plain range.
+    """
+    start, sep, end = text.partition("..")
+    if sep and start.isdecimal() and end.isdecimal():
+        start = int(start) - 1
+        end = int(end)
+        if 0 <= start < end:
+            return SimpleLocation(start, end, strand)
+    return None
+
+
+def _fast_location(text, stranded):
+    """Parse the most common location strings quickly (PRIVATE).
+
+    This handles plain ranges such as 123..456 and joins of plain ranges,
+    either of which may be wrapped in complement(...). Returns None for
+    anything else, which is left to the general parser.
+    """
+    if text.startswith("complement("):
+        if text[-1] != ")":
+            return None
+        text = text[11:-1]
+        strand = -1
+    elif stranded:
+        strand = 1
+    else:
+        strand = None
+    if not text.startswith("join("):
+        return _fast_range(text, strand)
+    if text[-1] != ")":
+        return None
+    locs = []
+    for part in text[5:-1].split(","):
+        loc = _fast_range(part, strand)
+        if loc is None:
+            return None
+        locs.append(loc)
+    if len(locs) == 1:
+        return locs[0]
+    if strand == -1:
+        # Reverse the backwards order used in GenBank files
+        # with complement(join(...))
+        locs.reverse()
+    return CompoundLocation(locs, operator="join")
+
+
+@functools.lru_cache(maxsize=_LOCATION_CACHE_SIZE)
+def _parse_location(text, length, circular, stranded):
+    """Parse a location string into a reusable description (PRIVATE).
+
+    Returns the operator (None for a SimpleLocation), a tuple of the start,
+    end, strand, ref and ref_db of each part, and a tuple of the message and
+    category of any warnings, which are cached so they can be repeated each
+    time the same string is parsed. If the string cannot be parsed, any
+    warnings are given before the exception is raised. The position objects
+    are shared between the locations built from the description, which is
+    safe as they are not modified in place.
+    """
+    messages = []
+    try:
+        location = Location._fromstring(text, length, circular, stranded, messages)
+    except Exception:
+        for message, category in messages:
+            warnings.warn(message, category)
+        raise
+    if isinstance(location, CompoundLocation):
+        operator = location.operator
+    else:
+        operator = None
+    parts = tuple(
+        (part._start, part._end, part._strand, part.ref, part.ref_db)
+        for part in location.parts
+    )
+    return operator, parts, tuple(messages)
+
 
 class Location(ABC):
     """Abstract base class representing a location."""
 
+    __slots__ = ()
+
+    __getstate__ = _getstate
+    __setstate__ = _setstate
+
     @abstractmethod
     def __repr__(self):
         """Represent the Location object as a string for debugging."""
@@ -759,6 +1073,32 @@ class Location(ABC):
 
         >>> Location.fromstring("<2644..159", 2868, "circular")
         CompoundLocation([SimpleLocation(BeforePosition(2643), ExactPosition(2868), strand=1), SimpleLocation(ExactPosition(0), ExactPosition(159), strand=1)], 'join')
+
+        Plain ranges and joins of plain ranges, which make up most of the
+        locations in a typical feature table, are parsed without using
+        regular expressions. Other location strings are parsed once and
+        remembered, so repeated strings (e.g. the same location on a gene,
+        mRNA and CDS feature) only create new Location objects.
+        """
+        location = _fast_location(text, stranded)
+        if location is not None:
+            return location
+        operator, parts, messages = _parse_location(text, length, circular, stranded)
+        for message, category in messages:
+            warnings.warn(message, category)
+        locs = [
+            SimpleLocation(start, end, strand, ref=ref, ref_db=ref_db)
+            for start, end, strand, ref, ref_db in parts
+        ]
+        if operator is None:
+            return locs[0]
+        return CompoundLocation(locs, operator=operator)
+
+    def _fromstring(text, length, circular, stranded, messages):
+        """Parse a location string using the general parser (PRIVATE).
+
+        Any warnings are added to the messages list as (message, category)
+        tuples, rather than given directly.
         """
         if text.startswith("complement("):
             if text[-1] != ")":
@@ -784,14 +1124,14 @@ class Location(ABC):
             parts = _split(text[5:-1])[1::2]
             # assert parts[0] == "" and parts[-1] == ""
         else:
-            loc = SimpleLocation.fromstring(text, length, circular)
+            loc = SimpleLocation._fromstring(text, length, circular, messages)
             loc.strand = strand
             if strand == -1:
                 loc.parts.reverse()
             return loc
         locs = []
         for part in parts:
-            loc = SimpleLocation.fromstring(part, length, circular)
+            loc = SimpleLocation._fromstring(part, length, circular, messages)
             if loc is None:
                 break
             if loc.strand == -1:
@@ -826,12 +1166,14 @@ class Location(ABC):
 
         # See issue #937. Note that NCBI has already fixed this record.
         if ",)" in text:
-            warnings.warn(
-                "Dropping trailing comma in malformed feature location",
-                BiopythonParserWarning,
+            messages.append(
+                (
+                    "Dropping trailing comma in malformed feature location",
+                    BiopythonParserWarning,
+                )
             )
             text = text.replace(",)", ")")
-            return Location.fromstring(text)
+            return Location._fromstring(text, None, False, True, messages)
 
         raise LocationParserError(f"failed to parse feature location '{text}'")
 
@@ -900,6 +1242,8 @@ class SimpleLocation(Location):
     would use a BeforePosition object for the start.
     """
 
+    __slots__ = ("_end", "_start", "_strand", "ref", "ref_db")
+
     def __init__(self, start, end, strand=None, ref=None, ref_db=None):
         """Initialize the class.
 
@@ -984,6 +1328,16 @@ class SimpleLocation(Location):
     @staticmethod
     def fromstring(text, length=None, circular=False):
         """Create a SimpleLocation object from a string."""
+        messages = []
+        try:
+            return SimpleLocation._fromstring(text, length, circular, messages)
+        finally:
+            for message, category in messages:
+                warnings.warn(message, category)
+
+    @staticmethod
+    def _fromstring(text, length, circular, messages):
+        """Parse a location string, adding any warnings to messages (PRIVATE)."""
         if text.startswith("complement("):
             text = text[11:-1]
             strand = -1
@@ -1013,9 +1367,8 @@ class SimpleLocation(Location):
         assert value == text
         if key == "bond":
             # e.g. bond(196)
-            warnings.warn(
-                "Dropping bond qualifier in feature location",
-                BiopythonParserWarning,
+            messages.append(
+                ("Dropping bond qualifier in feature location", BiopythonParserWarning)
             )
             text = text[5:-1]
             s_pos = Position.fromstring(text, -1)
@@ -1038,12 +1391,14 @@ class SimpleLocation(Location):
                     raise LocationParserError(
                         f"it appears that '{text}' is a feature that spans the origin, but the sequence topology is undefined"
                     )
-                warnings.warn(
-                    "Attempting to fix invalid location %r as "
-                    "it looks like incorrect origin wrapping. "
-                    "Please fix input file, this could have "
-                    "unintended behavior." % text,
-                    BiopythonParserWarning,
+                messages.append(
+                    (
+                        "Attempting to fix invalid location %r as "
+                        "it looks like incorrect origin wrapping. "
+                        "Please fix input file, this could have "
+                        "unintended behavior." % text,
+                        BiopythonParserWarning,
+                    )
                 )
 
                 f1 = SimpleLocation(s_pos, length, strand)
@@ -1398,6 +1753,8 @@ FeatureLocation = SimpleLocation  # OBSOLETE; for backward compatibility only.
 class CompoundLocation(Location):
     """For handling joins etc where a feature location has several parts."""
 
+    __slots__ = ("operator", "parts")
+
     def __init__(self, parts, operator="join"):
         """Initialize the class.
 
@@ -1798,6 +2155,8 @@ class CompoundLocation(Location):
 class Position(ABC):
     """Abstract base class representing a position."""
 
+    __slots__ = ()
+
     @abstractmethod
     def __repr__(self):
         """Represent the Position object as a string for debugging."""
@@ -1933,6 +2292,8 @@ class ExactPosition(int, Position):
 
     """
 
+    __slots__ = ()
+
     def __new__(cls, position, extension=0):
         """Create an ExactPosition object."""
         if extension != 0:
@@ -1966,6 +2327,8 @@ class UncertainPosition(ExactPosition):
     XML format explicitly marked as uncertain. Does not apply to GenBank/EMBL.
     """
 
+    __slots__ = ()
+
 
 class UnknownPosition(Position):
     """Specify a specific position which is unknown (has no position).
@@ -1973,6 +2336,8 @@ class UnknownPosition(Position):
     This is used in UniProt, e.g. ? or in the XML as unknown.
     """
 
+    __slots__ = ()
+
     def __repr__(self):
         """Represent the UnknownPosition object as a string for debugging."""
         return f"{self.__class__.__name__}()"
@@ -2238,6 +2603,8 @@ class BeforePosition(int, Position):
     like integers.
     """
 
+    __slots__ = ()
+
     # Subclasses int so can't use __init__
     def __new__(cls, position, extension=0):
         """Create a new instance in BeforePosition object."""
@@ -2302,6 +2669,8 @@ class AfterPosition(int, Position):
     like integers.
     """
 
+    __slots__ = ()
+
     # Subclasses int so can't use __init__
     def __new__(cls, position, extension=0):
         """Create a new instance of the AfterPosition object."""
@@ -13,7 +13,16 @@
 You are expected to use this module via the Bio.SeqIO functions.
 """
 
+import bisect
+import collections.abc
+import contextlib
+import os
+import struct
+import warnings
+
+from Bio import BiopythonWarning
 from Bio.Seq import Seq
+from Bio.Seq import SequenceDataAbstractBaseClass
 from Bio.SeqRecord import SeqRecord
 
 from .Interfaces import _clean
@@ -418,6 +427,304 @@ def as_fasta_2line(record):
     return f">{title}\n{data}\n"
 
 
+class _FaidxSequenceData(SequenceDataAbstractBaseClass):
+    """Sequence data loaded on demand from a FASTA file with a .fai index (PRIVATE).
+
+    Only the bytes of the file covering the requested region are read,
+    using the line length information from the index to compute their
+    location. This works for uncompressed and BGZF compressed files.
+    """
+
+    __slots__ = ("reader", "offset", "length", "linebases", "linewidth")
+
+    def __init__(self, reader, offset, length, linebases, linewidth):
+        """Store the file location and line layout of the sequence."""
+        self.reader = reader
+        self.offset = offset
+        self.length = length
+        self.linebases = linebases
+        self.linewidth = linewidth
+        super().__init__()
+
+    def __len__(self):
+        """Return the sequence length."""
+        return self.length
+
+    def __getitem__(self, key):
+        """Return the sequence contents (as a bytes object) for the requested region."""
+        if isinstance(key, slice):
+            indices = range(*key.indices(self.length))
+            if not indices:
+                return b""
+            start = min(indices[0], indices[-1])
+            end = max(indices[0], indices[-1]) + 1
+            data = self._fetch(start, end)
+            if indices.step == 1:
+                return data
+            return data[indices[0] - start :: indices.step][: len(indices)]
+        if key < 0:
+            key += self.length
+        if not 0 <= key < self.length:
+            raise IndexError("index out of range")
+        return self._fetch(key, key + 1)[0]
+
+    def _fetch(self, start, end):
+        """Return the bases from start to end, without line breaks."""
+        linebases = self.linebases
+        linewidth = self.linewidth
+        first = self.offset + (start // linebases) * linewidth + start % linebases
+        last = (
+            self.offset + ((end - 1) // linebases) * linewidth + (end - 1) % linebases
+        )
+        data = self.reader._read(first, last + 1 - first)
+        if linewidth != linebases:
+            data = data.replace(b"\n", b"").replace(b"\r", b"")
+        if len(data) != end - start:
+            raise ValueError("FASTA file does not match its .fai index")
+        return data
+
+
+def _unsaved_index(filename, err):
+    """Warn that an index could not be saved, and remove any partial file (PRIVATE).
+
+    The index is then only kept in memory, e.g. for a FASTA file in a read
+    only directory.
+    """
+    warnings.warn(f"Could not save the index {filename!r}: {err}", BiopythonWarning)
+    with contextlib.suppress(OSError):
+        os.remove(filename)
+
+
+def _build_fai(handle):
+    """Scan a FASTA file and return its samtools faidx index entries (PRIVATE).
+
+    Returns a list of (name, length, offset, linebases, linewidth) tuples,
+    using offsets in the uncompressed data. As in samtools, all sequence
+    lines in a record must be the same length apart from the last one.
+    """
+    entries = []
+    names = set()
+    position = 0
+    name = None
+    length = offset = linebases = linewidth = 0
+    last_line = False
+    for line in handle:
+        line_length = len(line)
+        if line.startswith(b">"):
+            if name is not None:
+                entries.append((name, length, offset, linebases, linewidth))
+            try:
+                name = line[1:].split()[0].decode()
+            except IndexError:
+                raise ValueError("FASTA record without a name") from None
+            if name in names:
+                raise ValueError(f"Duplicate sequence name '{name}'")
+            names.add(name)
+            offset = position + line_length
+            length = linebases = linewidth = 0
+            last_line = False
+        elif name is None:
+            if line.strip():
+                raise ValueError("Expected FASTA record starting with '>' character")
+        else:
+            bases = len(line.rstrip(b"\r\n"))
+            if bases:
+                if last_line:
+                    raise ValueError(f"Different line length in sequence '{name}'")
+                if not linebases:
+                    linebases = bases
+                    linewidth = line_length
+                elif bases > linebases or line_length > linewidth:
+                    raise ValueError(f"Different line length in sequence '{name}'")
+                if bases < linebases or line_length < linewidth:
+                    last_line = True
+                length += bases
+            else:
+                last_line = True
+        position += line_length
+    if name is not None:
+        entries.append((name, length, offset, linebases, linewidth))
+    return entries
+
+
+class FaidxReader(collections.abc.Mapping):
+    """Random access to FASTA files using a samtools compatible .fai index.
+
+    This provides a read only dictionary interface to the sequences in an
+    uncompressed or BGZF compressed FASTA file, with the sequence names as
+    keys. Rather than parsing the whole record, each sequence is returned as
+    a Seq object which reads only the requested region from the file, using
+    the line lengths recorded in the .fai index to find it. For BGZF files,
+    the .gzi index (as written by bgzip) maps offsets to compressed blocks.
+
+    If the index files do not exist, they are built by scanning the file
+    and saved for next time (unless you use build=False, in which case a
+    missing index is an error). If an index cannot be saved, for example in
+    a read only directory, a warning is given and the index is only kept in
+    memory:
+
+    >>> from Bio.SeqIO.FastaIO import FaidxReader
+    >>> with FaidxReader("Fasta/f002") as reader:
+    ...     print(list(reader))
+    ...     print(reader.fetch("gi|1348917|gb|G26685|G26685:11-20"))
+    ...     record = reader["gi|1348912|gb|G26680|G26680"]
+    ...     print(record.id, len(record), record.seq[:10])
+    ...
+    ['gi|1348912|gb|G26680|G26680', 'gi|1348917|gb|G26685|G26685', 'gi|1592936|gb|G29385|G29385']
+    GAGCATATGC
+    gi|1348912|gb|G26680|G26680 633 CGGACCAGAC
+    >>> import os
+    >>> os.remove("Fasta/f002.fai")
+
+    Arguments:
+     - filename - the FASTA file, uncompressed or BGZF compressed
+     - fai_filename - the .fai index (default filename plus ".fai")
+     - gzi_filename - the .gzi index for BGZF files (default filename plus
+       ".gzi")
+     - build - build and save any missing index files (default True)
+    """
+
+    def __init__(self, filename, fai_filename=None, gzi_filename=None, build=True):
+        """Open the FASTA file and load (or build) the indexes."""
+        from Bio import bgzf
+        from Bio.File import _open_for_random_access
+
+        filename = os.fspath(filename)
+        if fai_filename is None:
+            fai_filename = filename + ".fai"
+        if gzi_filename is None:
+            gzi_filename = filename + ".gzi"
+        self._handle = _open_for_random_access(filename)
+        try:
+            self._bgzf = isinstance(self._handle, bgzf.BgzfReader)
+            if self._bgzf:
+                self._blocks = self._load_gzi(filename, gzi_filename, build)
+            try:
+                with open(fai_filename) as handle:
+                    entries = self._parse_fai(handle)
+            except FileNotFoundError:
+                if not build:
+                    raise
+                self._handle.seek(0)
+                entries = _build_fai(self._handle)
+                try:
+                    with open(fai_filename, "w") as handle:
+                        for entry in entries:
+                            handle.write("%s\t%i\t%i\t%i\t%i\n" % entry)
+                except OSError as err:
+                    _unsaved_index(fai_filename, err)
+        except Exception:
+            self._handle.close()
+            raise
+        self._index = {entry[0]: entry[1:] for entry in entries}
+
+    @staticmethod
+    def _parse_fai(handle):
+        """Parse the lines of a .fai index file (PRIVATE)."""
+        entries = []
+        for line in handle:
+            fields = line.rstrip("\r\n").split("\t")
+            if len(fields) != 5:
+                raise ValueError(f"Expected 5 columns in .fai line, got {line!r}")
+            entries.append((fields[0], *(int(field) for field in fields[1:])))
+        return entries
+
+    @staticmethod
+    def _load_gzi(filename, gzi_filename, build):
+        """Return lists of compressed and uncompressed block offsets (PRIVATE).
+
+        The .gzi file holds the number of entries and then pairs of
+        compressed and uncompressed offsets for each BGZF block except
+        the first, all as little-endian unsigned 64 bit integers.
+        """
+        from Bio import bgzf
+
+        try:
+            with open(gzi_filename, "rb") as handle:
+                data = handle.read()
+        except FileNotFoundError:
+            if not build:
+                raise
+            with open(filename, "rb") as handle:
+                blocks = [
+                    (start, data_start)
+                    for start, raw_length, data_start, data_length in bgzf.BgzfBlocks(
+                        handle
+                    )
+                    if data_length
+                ]
+            try:
+                with open(gzi_filename, "wb") as handle:
+                    handle.write(struct.pack("<Q", len(blocks) - 1))
+                    for block in blocks[1:]:
+                        handle.write(struct.pack("<QQ", *block))
+            except OSError as err:
+                _unsaved_index(gzi_filename, err)
+        else:
+            (count,) = struct.unpack_from("<Q", data)
+            if len(data) != 8 + 16 * count:
+                raise ValueError(f"Corrupt .gzi index {gzi_filename}")
+            values = struct.unpack_from("<%iQ" % (2 * count), data, 8)
+            blocks = [(0, 0)] + list(zip(values[::2], values[1::2]))
+        return [block[0] for block in blocks], [block[1] for block in blocks]
+
+    def _read(self, offset, size):
+        """Read size bytes at the given offset in the uncompressed data (PRIVATE)."""
+        handle = self._handle
+        if self._bgzf:
+            starts, data_starts = self._blocks
+            i = bisect.bisect_right(data_starts, offset) - 1
+            handle.seek((starts[i] << 16) | (offset - data_starts[i]))
+        else:
+            handle.seek(offset)
+        return handle.read(size)
+
+    def __len__(self):
+        """Return the number of sequences."""
+        return len(self._index)
+
+    def __iter__(self):
+        """Iterate over the sequence names."""
+        return iter(self._index)
+
+    def __getitem__(self, name):
+        """Return a SeqRecord whose sequence is read from the file on demand."""
+        length, offset, linebases, linewidth = self._index[name]
+        data = _FaidxSequenceData(self, offset, length, linebases, linewidth)
+        return SeqRecord(Seq(data), id=name, name=name, description="")
+
+    def fetch(self, region):
+        """Return the sequence of a region, as a Seq object.
+
+        The region is given as in samtools faidx, using one-based inclusive
+        coordinates, e.g. "chr7:55,000,000-55,010,000", "chr7:55000000"
+        (to the end of chr7), or just "chr7" for the whole sequence.
+        """
+        if region in self._index:
+            name = region
+            start, end = 1, None
+        else:
+            name, _, interval = region.rpartition(":")
+            if name not in self._index:
+                raise KeyError(f"Sequence '{region}' not found")
+            begin, _, finish = interval.replace(",", "").partition("-")
+            start = int(begin)
+            end = int(finish) if finish else None
+        return self[name].seq[max(start - 1, 0) : end]
+
+    def close(self):
+        """Close the file handle being used to read the data."""
+        self._handle.close()
+
+    def __enter__(self):
+        """Use the reader in a with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the file at the end of a with statement."""
+        self.close()
+
+
 if __name__ == "__main__":
     from Bio._utils import run_doctest
 
@@ -37,7 +37,6 @@ from string import digits
 
 from Bio import BiopythonWarning
 from Bio import SeqFeature
-from Bio import SeqIO
 from Bio.GenBank.Scanner import _ImgtScanner
 from Bio.GenBank.Scanner import EmblScanner
 from Bio.GenBank.Scanner import GenBankScanner
@@ -62,13 +61,28 @@ _allowed_table_component_name_chars = set(ascii_letters + digits + "_-'*")
 class GenBankIterator(SequenceIterator):
     """Parser for GenBank files."""
 
-    def __init__(self, source):
+    def __init__(self, source, lazy_features=False, header_only=False):
         """Break up a Genbank file into SeqRecord objects.
 
         Argument source is a file-like object opened in text mode or a path to a file.
         Every section from the LOCUS line to the terminating // becomes
         a single SeqRecord with associated annotation and features.
 
+        If the optional argument lazy_features is True, the feature table is
+        kept as raw text, and only parsed into SeqFeature objects when the
+        record's features list is used. The list also has an of_type method
+        to parse only the features of the given types. This is much faster
+        when only the sequence, annotations, or a few features are needed.
+
+        If the optional argument header_only is True, only the header of each
+        record (the LOCUS line down to the FEATURES line) is parsed, and the
+        rest of the record is skipped. The records have no features, and an
+        undefined sequence of the length given in the LOCUS line, and lack
+        the annotations from any lines after the features (e.g. CONTIG or
+        WGS lines). This is useful to quickly collect the identifiers,
+        descriptions, and other annotations such as the taxonomy from large
+        files.
+
         Note that for genomes or chromosomes, there is typically only
         one record.
 
@@ -98,25 +112,57 @@ class GenBankIterator(SequenceIterator):
         L31939.1
         AF297471.1
 
+        Using lazy feature parsing to get the CDS features only,
+
+        >>> record = next(GenBankIterator("GenBank/NC_005816.gb", lazy_features=True))
+        >>> cds_features = record.features.of_type("CDS")
+        >>> len(cds_features)
+        10
+        >>> print(cds_features[0].location)
+        [86:1109](+)
+        >>> len(record.features)
+        41
+
+        Parsing only the record headers,
+
+        >>> for record in GenBankIterator("GenBank/cor6_6.gb", header_only=True):
+        ...     print(record.id, len(record), record.annotations["taxonomy"][-1])
+        ...
+        X55053.1 513 Arabidopsis
+        X62281.1 880 Arabidopsis
+        M81224.1 441 Brassica
+        AJ237582.1 206 Armoracia
+        L31939.1 282 Brassica
+        AF297471.1 497 Brassica
+
         """
+        self.lazy_features = lazy_features
+        self.header_only = header_only
         super().__init__(source, mode="t", fmt="GenBank")
 
     def parse(self, handle):
         """Start parsing the file, and return a SeqRecord generator."""
-        records = GenBankScanner(debug=0).parse_records(handle)
+        records = GenBankScanner(debug=0).parse_records(
+            handle, lazy_features=self.lazy_features, header_only=self.header_only
+        )
         return records
 
 
 class EmblIterator(SequenceIterator):
     """Parser for EMBL files."""
 
-    def __init__(self, source):
+    def __init__(self, source, lazy_features=False, header_only=False):
         """Break up an EMBL file into SeqRecord objects.
 
         Argument source is a file-like object opened in text mode or a path to a file.
         Every section from the LOCUS line to the terminating // becomes
         a single SeqRecord with associated annotation and features.
 
+        If the optional argument lazy_features is True, the feature table is
+        only parsed when the record's features list is used, and if the
+        optional argument header_only is True, only the header of each record
+        is parsed (see the GenBankIterator for details).
+
         Note that for genomes or chromosomes, there is typically only
         one record.
 
@@ -153,11 +199,15 @@ class EmblIterator(SequenceIterator):
         CQ797900.1
 
         """
+        self.lazy_features = lazy_features
+        self.header_only = header_only
         super().__init__(source, mode="t", fmt="EMBL")
 
     def parse(self, handle):
         """Start parsing the file, and return a SeqRecord generator."""
-        records = EmblScanner(debug=0).parse_records(handle)
+        records = EmblScanner(debug=0).parse_records(
+            handle, lazy_features=self.lazy_features, header_only=self.header_only
+        )
         return records
 
 
@@ -1514,20 +1564,6 @@ class ImgtWriter(EmblWriter):
     FEATURE_HEADER = "FH   Key                 Location/Qualifiers\nFH\n"
 
 
-def _genbank_convert_fasta(in_file, out_file):
-    """Fast GenBank to FASTA (PRIVATE)."""
-    # We don't need to parse the features...
-    records = GenBankScanner().parse_records(in_file, do_features=False)
-    return SeqIO.write(records, out_file, "fasta")
-
-
-def _embl_convert_fasta(in_file, out_file):
-    """Fast EMBL to FASTA (PRIVATE)."""
-    # We don't need to parse the features...
-    records = EmblScanner().parse_records(in_file, do_features=False)
-    return SeqIO.write(records, out_file, "fasta")
-
-
 if __name__ == "__main__":
     from Bio._utils import run_doctest
 
@@ -378,6 +378,7 @@ from Bio.SeqRecord import SeqRecord
 
 from .Interfaces import _clean
 from .Interfaces import _get_seq_string
+from .Interfaces import _IOSource
 from .Interfaces import _TextIOSource
 from .Interfaces import SequenceIterator
 from .Interfaces import SequenceWriter
@@ -992,6 +993,394 @@ def FastqGeneralIterator(source: _TextIOSource) -> Iterator[tuple[str, str, str]
                 break
 
 
+# Translation table from Sanger FASTQ quality letters to PHRED scores
+_sanger_to_phred_table = bytes(
+    (letter - SANGER_SCORE_OFFSET) % 256 for letter in range(256)
+)
+
+
+class FastqRecordView:
+    r"""Lightweight view of a FASTQ record held in a binary buffer.
+
+    These are returned by the FastqBinaryIterator function. The title (without
+    the leading "@"), sequence and quality are memoryview slices of the block
+    of data read from the file, so no strings are decoded and no data copied.
+    Unpacking a view gives these three values, as for the tuples returned by
+    FastqGeneralIterator:
+
+    >>> data = memoryview(b"@read1\nACGT\n+\nII!I\n")
+    >>> view = FastqRecordView(data[1:6], data[7:11], data[14:18])
+    >>> title, seq, qual = view
+    >>> bytes(title), bytes(seq), bytes(qual)
+    (b'read1', b'ACGT', b'II!I')
+
+    Use the phred_quality method to get the (Sanger) PHRED scores, or the
+    to_seqrecord method to promote the view to a full SeqRecord object:
+
+    >>> view.phred_quality()
+    b'((\x00('
+    >>> record = view.to_seqrecord()
+    >>> print(record.id, record.seq, record.letter_annotations["phred_quality"])
+    read1 ACGT [40, 40, 0, 40]
+
+    If NumPy is installed, numpy.frombuffer(view.qual, numpy.uint8) gives
+    the quality letters as an array without copying them.
+    """
+
+    __slots__ = ("title", "seq", "qual")
+
+    def __init__(self, title, seq, qual):
+        """Initialize from the title, sequence and quality slices."""
+        self.title = title
+        self.seq = seq
+        self.qual = qual
+
+    def __iter__(self):
+        """Iterate over the title, sequence and quality slices."""
+        return iter((self.title, self.seq, self.qual))
+
+    def __len__(self) -> int:
+        """Return the length of the sequence."""
+        return len(self.seq)
+
+    def __repr__(self) -> str:
+        """Return a concise summary of the record view."""
+        return (
+            f"{self.__class__.__name__}({bytes(self.title)!r}, length={len(self.seq)})"
+        )
+
+    def phred_quality(self) -> bytes:
+        """Return the Sanger FASTQ quality as PHRED scores, one byte per base.
+
+        A ValueError is raised for letters outside the valid range.
+        """
+        qual = self.qual
+        if qual and (min(qual) < SANGER_SCORE_OFFSET or max(qual) > 126):
+            raise ValueError("Invalid character in quality string")
+        return bytes(qual).translate(_sanger_to_phred_table)
+
+    def to_seqrecord(self) -> SeqRecord:
+        """Return a SeqRecord as created by the "fastq" SeqIO parser."""
+        descr = bytes(self.title).decode()
+        words = descr.split(None, 1)
+        id = words[0] if words else ""
+        record = SeqRecord(Seq(bytes(self.seq)), id=id, name=id, description=descr)
+        # Bypass the length check, as the iterator has already checked this:
+        qualities = list(self.phred_quality())
+        dict.__setitem__(record._per_letter_annotations, "phred_quality", qualities)
+        return record
+
+
+def FastqBinaryIterator(
+    source: _IOSource, block_size: int = 1048576
+) -> Iterator[FastqRecordView]:
+    """Iterate over FASTQ records as views of a binary buffer.
+
+    Arguments:
+     - source - input stream opened in binary mode, or a path to a file
+     - block_size - number of bytes to read from the file at a time
+
+    This is a low-level alternative to FastqGeneralIterator for large files.
+    The file is read in large blocks, and for each record a FastqRecordView
+    is returned whose title, sequence and quality are memoryview slices into
+    the block. Nothing is decoded or copied, so this is much faster than
+    creating strings or SeqRecord objects. Each block is only kept in memory
+    for as long as a view into it is referenced.
+
+    >>> for title, seq, qual in FastqBinaryIterator("Quality/example.fastq"):
+    ...     print(bytes(title).decode(), len(seq), min(qual) - 33)
+    ...
+    EAS54_6_R1_2_1_413_324 25 18
+    EAS54_6_R1_2_1_540_792 25 12
+    EAS54_6_R1_2_1_443_348 25 13
+
+    Unlike FastqGeneralIterator, this requires the usual four lines per
+    record layout. A ValueError is raised if the sequence or quality string
+    is split over multiple lines.
+    """
+    if block_size < 1:
+        raise ValueError(f"block_size should be positive, not {block_size!r}")
+    with as_handle(source, "rb") as handle:
+        if handle.read(0) != b"":
+            raise StreamModeError(
+                "FastqBinaryIterator requires a file opened in binary mode"
+            ) from None
+        data = b""
+        buffer = memoryview(data)
+        find = data.find
+        start = 0
+        eof = False
+        while True:
+            # Find the newlines ending the four lines of the next record
+            end1 = find(b"\n", start)
+            end2 = find(b"\n", end1 + 1) if end1 >= 0 else -1
+            end3 = find(b"\n", end2 + 1) if end2 >= 0 else -1
+            end4 = find(b"\n", end3 + 1) if end3 >= 0 else -1
+            if end4 < 0:
+                if eof:
+                    if data[start:].strip():
+                        raise ValueError("Unexpected end of file")
+                    break
+                # Keep the incomplete record, and read another block
+                block = handle.read(max(block_size, len(data) - start))
+                if block:
+                    data = data[start:] + block
+                else:
+                    eof = True
+                    data = data[start:]
+                    if data and data[-1] != 10:
+                        data += b"\n"
+                start = 0
+                buffer = memoryview(data)
+                find = data.find
+                continue
+            if data[start] != 64:  # "@"
+                raise ValueError(
+                    "Records in Fastq files should start with '@' character"
+                )
+            if data[end2 + 1] != 43:  # "+"
+                raise ValueError(
+                    "Expected '+' line after the sequence; FastqBinaryIterator "
+                    "does not support sequences split over multiple lines"
+                )
+            title_end, seq_end, plus_end, qual_end = end1, end2, end3, end4
+            if data[end1 - 1] == 13:
+                # Exclude the carriage returns of Windows line endings; an empty
+                # line is preceded by a newline, so is never affected.
+                title_end -= 1
+                seq_end -= data[end2 - 1] == 13
+                plus_end -= data[end3 - 1] == 13
+                qual_end -= data[end4 - 1] == 13
+            if plus_end > end2 + 2:
+                if data[end2 + 2 : plus_end] != data[start + 1 : title_end]:
+                    raise ValueError("Sequence and quality captions differ.")
+            if seq_end - end1 != qual_end - end3:
+                raise ValueError(
+                    "Lengths of sequence and quality values differs for %s (%i and %i)."
+                    % (
+                        data[start + 1 : title_end].decode(),
+                        seq_end - end1 - 1,
+                        qual_end - end3 - 1,
+                    )
+                )
+            yield FastqRecordView(
+                buffer[start + 1 : title_end],
+                buffer[end1 + 1 : seq_end],
+                buffer[end3 + 1 : qual_end],
+            )
+            start = end4 + 1
+
+
+class FastqBatch:
+    """Block of FASTQ reads held as columnar NumPy arrays.
+
+    These are returned by the FastqBatchReader function. Rather than one
+    object per read, the reads are stored using a ragged layout (as used by
+    Apache Arrow), which allows quality statistics, trimming and filtering
+    to be vectorized:
+
+     - titles - list of the title lines (without the leading "@") as strings
+     - sequences - NumPy uint8 array of all the sequence letters (as ASCII
+       codes) concatenated
+     - qualities - NumPy uint8 array of all the PHRED quality scores
+       concatenated
+     - offsets - NumPy int64 array of length one more than the number of
+       reads; read i is sequences[offsets[i]:offsets[i + 1]]
+
+    >>> import numpy as np
+    >>> batch = FastqBatch(
+    ...     ["r1", "r2"],
+    ...     np.frombuffer(b"ACGTAGG", np.uint8),
+    ...     np.array([30, 30, 2, 2, 40, 10, 40], np.uint8),
+    ...     np.array([0, 4, 7]),
+    ... )
+    >>> len(batch)
+    2
+    >>> batch.lengths().tolist()
+    [4, 3]
+    >>> batch.mean_quality().tolist()
+    [16.0, 30.0]
+    >>> batch[0]
+    ('r1', b'ACGT', [30, 30, 2, 2])
+    """
+
+    def __init__(self, titles, sequences, qualities, offsets):
+        """Create a batch from the titles and concatenated reads."""
+        if len(offsets) != len(titles) + 1:
+            raise ValueError("Expected one more offset than the number of titles")
+        if len(sequences) != len(qualities) or len(sequences) != offsets[-1]:
+            raise ValueError("Sequence, quality and offsets lengths do not match")
+        self.titles = titles
+        self.sequences = sequences
+        self.qualities = qualities
+        self.offsets = offsets
+
+    def __len__(self):
+        """Return the number of reads in the batch."""
+        return len(self.titles)
+
+    def __getitem__(self, index):
+        """Return the title, sequence (bytes) and PHRED scores (list) of a read."""
+        index = range(len(self.titles))[index]
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return (
+            self.titles[index],
+            self.sequences[start:end].tobytes(),
+            self.qualities[start:end].tolist(),
+        )
+
+    def __repr__(self):
+        """Return a concise summary of the batch."""
+        return f"<{self.__class__.__name__} with {len(self)} reads>"
+
+    def lengths(self):
+        """Return the read lengths as a NumPy array."""
+        import numpy as np
+
+        return np.diff(self.offsets)
+
+    def mean_quality(self):
+        """Return the mean PHRED quality of each read as a NumPy array.
+
+        Zero length reads get a mean quality of NaN.
+        """
+        import numpy as np
+
+        totals = np.concatenate(([0], np.cumsum(self.qualities, dtype=np.int64)))
+        totals = totals[self.offsets[1:]] - totals[self.offsets[:-1]]
+        lengths = self.lengths()
+        means = np.full(len(lengths), np.nan)
+        np.divide(totals, lengths, out=means, where=lengths > 0)
+        return means
+
+    def select(self, mask):
+        """Return a new batch containing only the reads where mask is true.
+
+        The mask can be a boolean NumPy array with an entry per read, or an
+        array of read indices. For example, to keep the reads of length 50
+        or more with a mean quality of at least 20:
+
+        >>> from Bio.SeqIO.QualityIO import FastqBatchReader
+        >>> batch = next(FastqBatchReader("Quality/example.fastq"))
+        >>> batch = batch.select((batch.lengths() >= 20) & (batch.mean_quality() >= 24))
+        >>> batch.titles
+        ['EAS54_6_R1_2_1_413_324', 'EAS54_6_R1_2_1_540_792']
+        """
+        import numpy as np
+
+        indices = np.arange(len(self))[mask]
+        starts = self.offsets[indices]
+        return self._subset(indices, starts, self.offsets[indices + 1] - starts)
+
+    def trim_quality(self, threshold):
+        """Return a new batch with low quality ends of each read removed.
+
+        Bases with a PHRED quality below the threshold are removed from the
+        start and end of each read (as with the LEADING and TRAILING steps of
+        Trimmomatic). Reads without any base passing the threshold are kept,
+        with length zero, so that the batch keeps the same reads.
+
+        >>> from Bio.SeqIO.QualityIO import FastqBatchReader
+        >>> batch = next(FastqBatchReader("Quality/example.fastq"))
+        >>> batch.trim_quality(25).lengths().tolist()
+        [23, 23, 19]
+        """
+        import numpy as np
+
+        count = len(self)
+        positions = np.arange(len(self.qualities))
+        good = self.qualities >= threshold
+        # Append a neutral sentinel so that reduceat accepts trailing empty
+        # reads; the results for any empty read are discarded below.
+        first = np.append(np.where(good, positions, len(positions)), len(positions))
+        last = np.append(np.where(good, positions, -1), -1)
+        starts = self.offsets[:-1]
+        if count:
+            first = np.minimum.reduceat(first, starts)
+            last = np.maximum.reduceat(last, starts)
+        else:
+            first = last = starts
+        lengths = np.where(self.lengths() > 0, last - first + 1, 0).clip(0)
+        first = np.where(lengths > 0, first, starts)
+        return self._subset(np.arange(count), first, lengths)
+
+    def _subset(self, indices, starts, lengths):
+        """Return a new batch with the given slices of the given reads (PRIVATE)."""
+        import numpy as np
+
+        offsets = np.zeros(len(lengths) + 1, np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        # For each letter in the new batch, its position in the old batch:
+        take = np.arange(offsets[-1]) + np.repeat(starts - offsets[:-1], lengths)
+        return FastqBatch(
+            [self.titles[i] for i in indices],
+            self.sequences[take],
+            self.qualities[take],
+            offsets,
+        )
+
+
+def FastqBatchReader(
+    source: _IOSource, batch_size: int = 100000
+) -> Iterator[FastqBatch]:
+    """Iterate over a Sanger FASTQ file as batches of reads in NumPy arrays.
+
+    Arguments:
+     - source - input stream opened in binary mode, or a path to a file
+     - batch_size - maximum number of reads in each batch
+
+    Each FastqBatch holds the reads in columnar arrays, which is far more
+    efficient than creating a SeqRecord for each read when computing
+    per-base quality statistics, or trimming and filtering large numbers
+    of reads:
+
+    >>> for batch in FastqBatchReader("Quality/example.fastq", batch_size=2):
+    ...     print(batch.titles, batch.mean_quality().round(2).tolist())
+    ...
+    ['EAS54_6_R1_2_1_413_324', 'EAS54_6_R1_2_1_540_792'] [25.28, 24.52]
+    ['EAS54_6_R1_2_1_443_348'] [23.4]
+
+    This uses FastqBinaryIterator internally, so the file must use four
+    lines per record. The qualities are decoded as PHRED scores with an
+    offset of 33, as for the "fastq" format in Bio.SeqIO.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        from Bio import MissingPythonDependencyError
+
+        raise MissingPythonDependencyError(
+            "Please install NumPy if you want to use FastqBatchReader. "
+            "See http://www.numpy.org/"
+        ) from None
+
+    if batch_size < 1:
+        raise ValueError(f"batch_size should be positive, not {batch_size!r}")
+    views = FastqBinaryIterator(source)
+    while True:
+        titles = []
+        sequences = []
+        qualities = []
+        for view in views:
+            titles.append(bytes(view.title).decode())
+            sequences.append(view.seq)
+            qualities.append(view.qual)
+            if len(titles) == batch_size:
+                break
+        if not titles:
+            return
+        lengths = np.fromiter(map(len, sequences), np.int64, len(sequences))
+        offsets = np.zeros(len(titles) + 1, np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        sequences = np.frombuffer(b"".join(sequences), np.uint8)
+        qualities = np.frombuffer(b"".join(qualities), np.uint8)
+        if len(qualities) and (
+            qualities.min() < SANGER_SCORE_OFFSET or qualities.max() > 126
+        ):
+            raise ValueError("Invalid character in quality string")
+        yield FastqBatch(titles, sequences, qualities - SANGER_SCORE_OFFSET, offsets)
+
+
 class FastqPhredIterator(SequenceIterator[str]):
     """Parser for FASTQ files."""
 
@@ -2235,45 +2624,6 @@ def _fastq_illumina_convert_fastq_solexa(
     return _fastq_generic(in_file, out_file, mapping)
 
 
-def _fastq_convert_fasta(in_file: _TextIOSource, out_file: _TextIOSource) -> int:
-    """Fast FASTQ to FASTA conversion (PRIVATE).
-
-    Avoids dealing with the FASTQ quality encoding, and creating SeqRecord and
-    Seq objects in order to speed up this conversion.
-
-    NOTE - This does NOT check the characters used in the FASTQ quality string
-    are valid!
-    """
-    # For real speed, don't even make SeqRecord and Seq objects!
-    count = 0
-    with as_handle(out_file, "w") as out_handle:
-        for title, seq, qual in FastqGeneralIterator(in_file):
-            count += 1
-            out_handle.write(f">{title}\n")
-            # Do line wrapping
-            for i in range(0, len(seq), 60):
-                out_handle.write(seq[i : i + 60] + "\n")
-    return count
-
-
-def _fastq_convert_tab(in_file: _TextIOSource, out_file: _TextIOSource) -> int:
-    """Fast FASTQ to simple tabbed conversion (PRIVATE).
-
-    Avoids dealing with the FASTQ quality encoding, and creating SeqRecord and
-    Seq objects in order to speed up this conversion.
-
-    NOTE - This does NOT check the characters used in the FASTQ quality string
-    are valid!
-    """
-    # For real speed, don't even make SeqRecord and Seq objects!
-    count = 0
-    with as_handle(out_file, "w") as out_handle:
-        for title, seq, qual in FastqGeneralIterator(in_file):
-            count += 1
-            out_handle.write(f"{title.split(None, 1)[0]}\t{seq}\n")
-    return count
-
-
 def _fastq_convert_qual(
     in_file: _TextIOSource,
     out_file: _TextIOSource,
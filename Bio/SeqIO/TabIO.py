@@ -84,23 +84,29 @@ class TabIterator(SequenceIterator):
 
     def iterate(self, handle):
         """Parse the file and generate SeqRecord objects."""
-        for line in handle:
-            try:
-                title, seq = line.split("\t")  # will fail if more than one tab!
-            except ValueError:
-                if line.strip() == "":
-                    # It's a blank line, ignore it
-                    continue
-                raise ValueError(
-                    "Each line should have one tab separating the"
-                    + " title and sequence, this line has %i tabs: %r"
-                    % (line.count("\t"), line)
-                ) from None
-            title = title.strip()
-            seq = seq.strip()  # removes the trailing new line
+        for title, seq in _tab_lines(handle):
             yield SeqRecord(Seq(seq), id=title, name=title, description="")
 
 
+def _tab_lines(handle):
+    """Iterate over tab separated lines as (title, sequence) string tuples (PRIVATE)."""
+    for line in handle:
+        try:
+            title, seq = line.split("\t")  # will fail if more than one tab!
+        except ValueError:
+            if line.strip() == "":
+                # It's a blank line, ignore it
+                continue
+            raise ValueError(
+                "Each line should have one tab separating the"
+                + " title and sequence, this line has %i tabs: %r"
+                % (line.count("\t"), line)
+            ) from None
+        title = title.strip()
+        seq = seq.strip()  # removes the trailing new line
+        yield title, seq
+
+
 class TabWriter(SequenceWriter):
     """Class to write simple tab separated format files.
 
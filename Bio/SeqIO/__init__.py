@@ -403,6 +403,7 @@ from Bio.SeqIO import UniprotIO
 from Bio.SeqIO import XdnaIO
 from Bio.SeqRecord import SeqRecord
 
+from . import _convert
 from .Interfaces import _TextIOSource
 
 # Convention for format names is "mainname-subtype" in lower case.
@@ -568,7 +569,7 @@ def write(
     raise ValueError(f"Unknown format '{format}'")
 
 
-def parse(handle, format, alphabet=None):
+def parse(handle, format, alphabet=None, workers=None, **kwargs):
     r"""Turn a sequence file into an iterator returning SeqRecords.
 
     Arguments:
@@ -576,6 +577,12 @@ def parse(handle, format, alphabet=None):
        (note older versions of Biopython only took a handle).
      - format   - lower case string describing the file format.
      - alphabet - no longer used, should be None.
+     - workers  - optional number of worker processes to parse the file
+       with (see below).
+
+    Any other keyword arguments are passed to the parser for the file format,
+    for example lazy_features=True for the "genbank" and "embl" formats (see
+    Bio.SeqIO.InsdcIO.GenBankIterator for details).
 
     Typical usage, opening a file to read in, and looping over the record(s):
 
@@ -604,6 +611,19 @@ def parse(handle, format, alphabet=None):
 
     Use the Bio.SeqIO.read(...) function when you expect a single record
     only.
+
+    For large uncompressed FASTA and FASTQ files given by filename, you can
+    set the workers argument to split the file at record boundaries and
+    parse the pieces in a pool of worker processes. The records are still
+    returned in their original order:
+
+    >>> records = SeqIO.parse("Quality/example.fastq", "fastq", workers=2)
+    >>> print([record.id for record in records])
+    ['EAS54_6_R1_2_1_413_324', 'EAS54_6_R1_2_1_540_792', 'EAS54_6_R1_2_1_443_348']
+
+    This is supported for the "fasta", "fasta-2line" and "fastq" formats
+    (including the "fastq-solexa" and "fastq-illumina" variants). For FASTQ
+    the file must use four lines per record, without line wrapping.
     """
     # NOTE - The above docstring has some raw \n characters needed
     # for the StringIO example, hence the whole docstring is in raw
@@ -620,16 +640,25 @@ def parse(handle, format, alphabet=None):
     if alphabet is not None:
         raise ValueError("The alphabet argument is no longer supported")
 
+    if workers is not None:
+        if kwargs:
+            raise TypeError("Parser options are not supported with workers")
+        from ._parallel import _parallel_parse
+
+        return _parallel_parse(handle, format, workers)
+
     iterator_generator = _FormatToIterator.get(format)
     if iterator_generator:
-        return iterator_generator(handle)
+        return iterator_generator(handle, **kwargs)
+    if kwargs:
+        raise TypeError(f"Parser options are not supported for format '{format}'")
     if format in AlignIO._FormatToIterator:
         # Use Bio.AlignIO to read in the alignments
         return (r for alignment in AlignIO.parse(handle, format) for r in alignment)
     raise ValueError(f"Unknown format '{format}'")
 
 
-def read(handle, format, alphabet=None):
+def read(handle, format, alphabet=None, **kwargs):
     """Turn a sequence file into a single SeqRecord.
 
     Arguments:
@@ -638,6 +667,9 @@ def read(handle, format, alphabet=None):
      - format   - string describing the file format.
      - alphabet - no longer used, should be None.
 
+    Any other keyword arguments are passed to the parser for the file
+    format, as in the Bio.SeqIO.parse(...) function.
+
     This function is for use parsing sequence files containing
     exactly one record.  For example, reading a GenBank file:
 
@@ -669,7 +701,7 @@ def read(handle, format, alphabet=None):
     Use the Bio.SeqIO.parse(handle, format) function if you want
     to read multiple records from the handle.
     """
-    iterator = parse(handle, format, alphabet)
+    iterator = parse(handle, format, alphabet, **kwargs)
     try:
         record = next(iterator)
     except StopIteration:
@@ -756,7 +788,23 @@ def to_dict(sequences, key_function=None):
     return d
 
 
-def index(filename, format, alphabet=None, key_function=None):
+def _check_cache_size(cache_size):
+    """Check the cache_size argument of index and index_db (PRIVATE)."""
+    if not isinstance(cache_size, int):
+        raise TypeError("Need an integer for the cache size")
+    if cache_size < 0:
+        raise ValueError("The cache size should not be negative")
+
+
+def index(
+    filename,
+    format,
+    alphabet=None,
+    key_function=None,
+    index_filename=None,
+    cache_size=1,
+    **kwargs,
+):
     """Indexes a sequence file and returns a dictionary like object.
 
     Arguments:
@@ -766,6 +814,15 @@ def index(filename, format, alphabet=None, key_function=None):
      - key_function - Optional callback function which when given a
        SeqRecord identifier string should return a unique key for the
        dictionary.
+     - index_filename - Optional name of a sidecar file in which to save
+       the record offsets, or True to use the filename plus ".bpi".
+     - cache_size - Maximum number of recently used records to keep in
+       memory (default 1, zero for none), useful when the same records
+       are looked up repeatedly.
+
+    Any other keyword arguments are passed to the parser when loading each
+    record, for example lazy_features=True for the "genbank" and "embl"
+    formats.
 
     This indexing function will return a dictionary like object, giving the
     SeqRecord objects as values.
@@ -805,6 +862,23 @@ def index(filename, format, alphabet=None, key_function=None):
     dictionary methods, the code will jump to the appropriate part of the
     file and then parse that section into a SeqRecord.
 
+    The most recently used records are cached, so looking them up again does
+    not parse the file again. Several records can be looked up at once with
+    the get_many method, which reads them in the order they appear in the
+    file:
+
+    >>> records = SeqIO.index("Quality/example.fastq", "fastq", cache_size=2)
+    >>> keys = ["EAS54_6_R1_2_1_443_348", "EAS54_6_R1_2_1_413_324"]
+    >>> for record in records.get_many(keys):
+    ...     print(record.id)
+    EAS54_6_R1_2_1_443_348
+    EAS54_6_R1_2_1_413_324
+    >>> print(records["EAS54_6_R1_2_1_413_324"].seq)
+    CCCTTCTTGTCTTCAGCGTTTCTCC
+    >>> records.cache_info()
+    RecordCacheInfo(hits=1, misses=2, max_cache=2, current_size=2)
+    >>> records.close()
+
     Note that not all the input formats supported by Bio.SeqIO can be used
     with this index function. It is designed to work only with sequential
     file formats (e.g. "fasta", "gb", "fastq") and is not suitable for any
@@ -860,6 +934,31 @@ def index(filename, format, alphabet=None, key_function=None):
     to be completely parsed while building the index. Right now this is
     usually avoided.
 
+    Scanning a large file to find the records can take a while. If you will
+    be indexing the same file repeatedly (e.g. in many short-lived jobs), you
+    can ask for the record identifiers and offsets to be saved in a small
+    sidecar file. The first call writes this file, and later calls load it
+    instead of scanning the file again:
+
+    >>> records = SeqIO.index("GenBank/NC_000932.faa", "fasta",
+    ...                       index_filename="NC_000932.faa.bpi")
+    >>> len(records)
+    85
+    >>> records.close()
+    >>> records = SeqIO.index("GenBank/NC_000932.faa", "fasta",
+    ...                       index_filename="NC_000932.faa.bpi")
+    >>> print(records["gi|7525076|ref|NP_051101.1|"].description)
+    gi|7525076|ref|NP_051101.1| Ycf2 [Arabidopsis thaliana]
+    >>> records.close()
+    >>> import os
+    >>> os.remove("NC_000932.faa.bpi")
+
+    The sidecar file records the size, modification time, and a checksum of
+    the start and end of the indexed file, and is rebuilt automatically if
+    these no longer match. Unlike the SQLite database used by index_db, it
+    does not hold the key_function results, so the same sidecar file can be
+    used with different key functions.
+
     See Also: Bio.SeqIO.index_db() and Bio.SeqIO.to_dict()
 
     """
@@ -872,9 +971,11 @@ def index(filename, format, alphabet=None, key_function=None):
         raise ValueError(f"Format string '{format}' should be lower case")
     if alphabet is not None:
         raise ValueError("The alphabet argument is no longer supported")
+    _check_cache_size(cache_size)
 
     # Map the file format to a sequence iterator:
     from Bio.File import _IndexedSeqFileDict
+    from Bio.File import _sidecar_offsets
 
     from ._index import _FormatToRandomAccess  # Lazy import
 
@@ -896,11 +997,51 @@ def index(filename, format, alphabet=None, key_function=None):
             "Need a string or path-like object for the filename (not a handle)"
         ) from None
 
-    return _IndexedSeqFileDict(random_access_proxy, key_function, repr, "SeqRecord")
+    if kwargs:
+        try:
+            random_access_proxy.set_parser_options(**kwargs)
+        except TypeError:
+            random_access_proxy._handle.close()
+            raise
+
+    def reopen_proxy():
+        # Used for a separate file handle in each thread
+        proxy = proxy_class(filename, format)
+        if kwargs:
+            proxy.set_parser_options(**kwargs)
+        return proxy
+
+    if index_filename is None:
+        offset_iter = None
+    else:
+        if index_filename is True:
+            from os import fspath
+
+            index_filename = fspath(filename) + ".bpi"
+        offset_iter = _sidecar_offsets(
+            random_access_proxy, filename, format, index_filename
+        )
+
+    return _IndexedSeqFileDict(
+        random_access_proxy,
+        key_function,
+        repr,
+        "SeqRecord",
+        offset_iter,
+        cache_size=cache_size,
+        reopen_proxy=reopen_proxy,
+    )
 
 
 def index_db(
-    index_filename, filenames=None, format=None, alphabet=None, key_function=None
+    index_filename,
+    filenames=None,
+    format=None,
+    alphabet=None,
+    key_function=None,
+    workers=None,
+    incremental=False,
+    cache_size=1,
 ):
     """Index several sequence files and return a dictionary like object.
 
@@ -918,6 +1059,12 @@ def index_db(
      - key_function - Optional callback function which when given a
        SeqRecord identifier string should return a unique
        key for the dictionary.
+     - workers - Optional number of worker processes used to scan the files
+       when building a new index (e.g. for thousands of sharded files).
+     - incremental - When reusing an existing index, rescan any of the files
+       whose size or modification time has changed (default False).
+     - cache_size - Maximum number of recently used records to keep in
+       memory (default 1, zero for none).
 
     This indexing function will return a dictionary like object, giving the
     SeqRecord objects as values:
@@ -944,6 +1091,11 @@ def index_db(
     BGZF compressed files are supported, and detected automatically. Ordinary
     GZIP compressed files are not supported.
 
+    The dictionary can be used from several threads at once, each thread has
+    its own SQLite connection and file handles. It can also be used in child
+    processes after a fork (e.g. in a pool of web server workers), which open
+    their own connection and file handles.
+
     See Also: Bio.SeqIO.index() and Bio.SeqIO.to_dict(), and the Python module
     glob which is useful for building lists of files.
 
@@ -976,11 +1128,17 @@ def index_db(
         raise ValueError(f"Format string '{format}' should be lower case")
     if alphabet is not None:
         raise ValueError("The alphabet argument is no longer supported")
+    if workers is not None:
+        if not isinstance(workers, int):
+            raise TypeError("Need an integer for the number of workers")
+        if workers < 1:
+            raise ValueError("The number of workers should be at least one")
+    _check_cache_size(cache_size)
 
     # Map the file format to a sequence iterator:
     from Bio.File import _SQLiteManySeqFilesDict
 
-    from ._index import _FormatToRandomAccess  # Lazy import
+    from ._index import _proxy_factory  # Lazy import
 
     repr = "SeqIO.index_db(%r, filenames=%r, format=%r, key_function=%r)" % (
         index_filename,
@@ -989,31 +1147,21 @@ def index_db(
         key_function,
     )
 
-    def proxy_factory(format, filename=None):
-        """Given a filename returns proxy object, else boolean if format OK."""
-        if filename:
-            return _FormatToRandomAccess[format](filename, format)
-        else:
-            return format in _FormatToRandomAccess
-
     return _SQLiteManySeqFilesDict(
-        index_filename, filenames, proxy_factory, format, key_function, repr
+        index_filename,
+        filenames,
+        _proxy_factory,
+        format,
+        key_function,
+        repr,
+        workers=workers,
+        incremental=incremental,
+        cache_size=cache_size,
     )
 
 
 # TODO? - Handling aliases explicitly would let us shorten this list:
 _converter = {
-    ("genbank", "fasta"): InsdcIO._genbank_convert_fasta,
-    ("gb", "fasta"): InsdcIO._genbank_convert_fasta,
-    ("embl", "fasta"): InsdcIO._embl_convert_fasta,
-    ("fastq", "fasta"): QualityIO._fastq_convert_fasta,
-    ("fastq-sanger", "fasta"): QualityIO._fastq_convert_fasta,
-    ("fastq-solexa", "fasta"): QualityIO._fastq_convert_fasta,
-    ("fastq-illumina", "fasta"): QualityIO._fastq_convert_fasta,
-    ("fastq", "tab"): QualityIO._fastq_convert_tab,
-    ("fastq-sanger", "tab"): QualityIO._fastq_convert_tab,
-    ("fastq-solexa", "tab"): QualityIO._fastq_convert_tab,
-    ("fastq-illumina", "tab"): QualityIO._fastq_convert_tab,
     ("fastq", "fastq"): QualityIO._fastq_sanger_convert_fastq_sanger,
     ("fastq-sanger", "fastq"): QualityIO._fastq_sanger_convert_fastq_sanger,
     ("fastq-solexa", "fastq"): QualityIO._fastq_solexa_convert_fastq_sanger,
@@ -1038,6 +1186,9 @@ _converter = {
     ("fastq-solexa", "qual"): QualityIO._fastq_solexa_convert_qual,
     ("fastq-illumina", "qual"): QualityIO._fastq_illumina_convert_qual,
 }
+# Streaming conversions between the simple formats (FASTA, tab, and from
+# FASTQ, GenBank and EMBL), see Bio/SeqIO/_convert.py
+_converter.update(_convert._converter)
 
 
 def convert(in_file, in_format, out_file, out_format, molecule_type=None):
@@ -1066,7 +1217,10 @@ def convert(in_file, in_format, out_file, out_format, molecule_type=None):
         count = SeqIO.convert(in_handle, in_format, out_handle, out_format)
 
     Also, Bio.SeqIO.convert is faster for some conversions as it can make some
-    optimisations.
+    optimisations. In particular, conversion to "fasta", "fasta-2line" or "tab"
+    from any of these formats, or from "fastq" (and its variants), "genbank" or
+    "embl", works directly on the identifier, title and sequence strings of
+    each record, and writes the output in large blocks.
 
     For example, going from a filename to a handle:
 
@@ -0,0 +1,190 @@
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+"""Streaming conversion between simple sequence file formats (PRIVATE).
+
+You are not expected to access this module, or any of its code, directly. This
+is all handled internally by the Bio.SeqIO.convert(...) function which is the
+public interface for this functionality.
+
+Many conversions only need the identifier, the title line and the sequence of
+each record as plain strings. Here each input format which can supply these
+cheaply has a "raw reader" returning (id, title, sequence) string tuples, and
+each output format which needs nothing more has a "raw writer" turning such a
+tuple into text. Any raw reader can be combined with any raw writer, giving a
+conversion which never creates SeqRecord or Seq objects (except for GenBank
+and EMBL input, where the scanner is still used but the features are skipped).
+The output is collected in memory and written in large blocks, while the
+input is read one record at a time, so memory use does not depend on the size
+of the file.
+
+The output is identical to using Bio.SeqIO.parse(...) with Bio.SeqIO.write(...).
+"""
+
+from Bio.File import as_handle
+from Bio.GenBank.Scanner import EmblScanner
+from Bio.GenBank.Scanner import GenBankScanner
+
+from .FastaIO import FastaTwoLineParser
+from .FastaIO import SimpleFastaParser
+from .Interfaces import _clean
+from .Interfaces import _get_seq_string
+from .QualityIO import FastqGeneralIterator
+from .TabIO import _tab_lines
+
+# Output is passed to the handle's write method in blocks of about this size
+_WRITE_BUFFER_SIZE = 1048576
+
+
+def _first_word(title):
+    """Return the first word of a title line, as used for the record id (PRIVATE)."""
+    try:
+        return title.split(None, 1)[0]
+    except IndexError:
+        return ""
+
+
+def _fasta_raw(handle):
+    """Return (id, title, sequence) tuples from a FASTA file (PRIVATE)."""
+    for title, seq in SimpleFastaParser(handle):
+        yield _first_word(title), title, seq
+
+
+def _fasta_2line_raw(handle):
+    """Return (id, title, sequence) tuples from a two-line FASTA file (PRIVATE)."""
+    for title, seq in FastaTwoLineParser(handle):
+        yield _first_word(title), title, seq
+
+
+def _fastq_raw(handle):
+    """Return (id, title, sequence) tuples from a FASTQ file (PRIVATE).
+
+    NOTE - This does NOT check the characters used in the FASTQ quality string
+    are valid!
+    """
+    for title, seq, qual in FastqGeneralIterator(handle):
+        yield _first_word(title), title, seq
+
+
+def _tab_raw(handle):
+    """Return (id, title, sequence) tuples from a tab separated file (PRIVATE)."""
+    for title, seq in _tab_lines(handle):
+        yield title, title, seq
+
+
+def _insdc_raw(records):
+    """Return (id, title, sequence) tuples from GenBank or EMBL records (PRIVATE)."""
+    for record in records:
+        id = _clean(record.id)
+        description = _clean(record.description)
+        if description and description.split(None, 1)[0] == id:
+            # The description includes the id at the start
+            title = description
+        elif description:
+            title = f"{id} {description}"
+        else:
+            title = id
+        yield id, title, _get_seq_string(record)
+
+
+def _genbank_raw(handle):
+    """Return (id, title, sequence) tuples from a GenBank file (PRIVATE)."""
+    # We don't need to parse the features...
+    return _insdc_raw(GenBankScanner().parse_records(handle, do_features=False))
+
+
+def _embl_raw(handle):
+    """Return (id, title, sequence) tuples from an EMBL file (PRIVATE)."""
+    # We don't need to parse the features...
+    return _insdc_raw(EmblScanner().parse_records(handle, do_features=False))
+
+
+def _fasta_text(id, title, seq):
+    """Return the record as FASTA text, wrapped at 60 letters (PRIVATE)."""
+    assert "\n" not in title
+    assert "\r" not in title
+    assert "\n" not in seq
+    assert "\r" not in seq
+    lines = [f">{title}\n"]
+    for i in range(0, len(seq), 60):
+        lines.append(seq[i : i + 60] + "\n")
+    return "".join(lines)
+
+
+def _fasta_2line_text(id, title, seq):
+    """Return the record as two-line FASTA text (PRIVATE)."""
+    assert "\n" not in title
+    assert "\r" not in title
+    assert "\n" not in seq
+    assert "\r" not in seq
+    return f">{title}\n{seq}\n"
+
+
+def _tab_text(id, title, seq):
+    """Return the record as a tab separated line (PRIVATE)."""
+    assert "\t" not in id
+    assert "\n" not in id
+    assert "\r" not in id
+    assert "\t" not in seq
+    assert "\n" not in seq
+    assert "\r" not in seq
+    return f"{id}\t{seq}\n"
+
+
+_raw_readers = {
+    "embl": _embl_raw,
+    "fasta": _fasta_raw,
+    "fasta-2line": _fasta_2line_raw,
+    "fastq": _fastq_raw,
+    "fastq-sanger": _fastq_raw,
+    "fastq-solexa": _fastq_raw,
+    "fastq-illumina": _fastq_raw,
+    "gb": _genbank_raw,
+    "genbank": _genbank_raw,
+    "tab": _tab_raw,
+}
+
+_raw_writers = {
+    "fasta": _fasta_text,
+    "fasta-2line": _fasta_2line_text,
+    "tab": _tab_text,
+}
+
+
+def _stream_convert(in_file, out_file, reader, writer):
+    """Convert records with the given raw reader and writer, return the count (PRIVATE)."""
+    count = 0
+    with as_handle(in_file) as in_handle, as_handle(out_file, "w") as out_handle:
+        chunks = []
+        size = 0
+        for id, title, seq in reader(in_handle):
+            text = writer(id, title, seq)
+            count += 1
+            chunks.append(text)
+            size += len(text)
+            if size >= _WRITE_BUFFER_SIZE:
+                out_handle.write("".join(chunks))
+                chunks = []
+                size = 0
+        if chunks:
+            out_handle.write("".join(chunks))
+    return count
+
+
+def _make_converter(reader, writer):
+    """Return a function converting from in_file to out_file (PRIVATE)."""
+
+    def converter(in_file, out_file):
+        return _stream_convert(in_file, out_file, reader, writer)
+
+    return converter
+
+
+_converter = {
+    (in_format, out_format): _make_converter(reader, writer)
+    for in_format, reader in _raw_readers.items()
+    for out_format, writer in _raw_writers.items()
+}
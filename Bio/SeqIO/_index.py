@@ -26,6 +26,8 @@ keys and offsets in an SQLite database - which can be re-used to avoid
 re-indexing the file for use another time.
 """
 
+import functools
+import inspect
 import re
 from io import BytesIO
 from io import StringIO
@@ -51,6 +53,17 @@ class SeqFileRandomAccess(_IndexedSeqFileProxy):
         # Should be overridden for binary file formats etc:
         return next(self._iterator(StringIO(self.get_raw(offset).decode())))
 
+    def set_parser_options(self, **kwargs):
+        """Set keyword arguments to pass to the parser for each record."""
+        if type(self).get is not SeqFileRandomAccess.get:
+            raise TypeError(
+                f"Parser options are not supported for format '{self._format}'"
+            )
+        iterator = SeqIO._FormatToIterator[self._format]
+        # Check the arguments now, rather than when loading a record
+        inspect.signature(iterator).bind(None, **kwargs)
+        self._iterator = functools.partial(iterator, **kwargs)
+
 
 ####################
 # Special indexers #
@@ -711,3 +724,15 @@ _FormatToRandomAccess = {
     "qual": SequentialSeqFileRandomAccess,
     "uniprot-xml": UniprotRandomAccess,
 }
+
+
+def _proxy_factory(format, filename=None):
+    """Given a filename returns proxy object, else boolean if format OK.
+
+    Used by Bio.SeqIO.index_db(...), and defined at module level so that it
+    can be passed to worker processes.
+    """
+    if filename:
+        return _FormatToRandomAccess[format](filename, format)
+    else:
+        return format in _FormatToRandomAccess
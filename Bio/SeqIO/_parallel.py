@@ -0,0 +1,187 @@
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+"""Multi-process parsing of large sequence files (PRIVATE).
+
+You are not expected to access this module, or any of its code, directly. This
+is all handled internally by the Bio.SeqIO.parse(...) function when called
+with the workers argument.
+
+The basic idea is that we split an uncompressed FASTA or FASTQ file into
+chunks of roughly equal size, moving each split point forward to the start of
+the next record. Each chunk is then parsed in a worker process, using the
+same iterator as Bio.SeqIO.parse would use, and the resulting SeqRecord
+objects are passed back to the main process as compact tuples (pickling
+SeqRecord objects directly is slower than parsing them). Only a small number
+of chunks are in flight at any time, so memory usage is bounded regardless of
+the size of the file, and the records are returned in their original order.
+
+For FASTQ files the split points are found by looking for a line starting
+with "@" followed two lines later by a line starting with "+". This is only
+reliable for the common four-lines-per-record layout (i.e. no line wrapping
+of the sequence and quality strings).
+"""
+
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
+
+from Bio.Seq import Seq
+from Bio.SeqRecord import SeqRecord
+
+# Default chunk size in bytes; each worker parses one chunk at a time.
+_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Maps the supported formats to the function used to find record starts.
+_RECORD_START = {}
+
+
+def _next_fasta_start(handle):
+    """Return offset of the next line starting with ">", or None at EOF."""
+    while True:
+        offset = handle.tell()
+        line = handle.readline()
+        if not line:
+            return None
+        if line[:1] == b">":
+            return offset
+
+
+def _next_fastq_start(handle):
+    """Return offset of the next FASTQ record, or None at EOF.
+
+    A line is taken to be the start of a record if it starts with "@" and
+    the line two after it starts with "+". With four-line records this is
+    not ambiguous, as a quality line starting with "@" would be followed by
+    a title line and then a sequence line.
+    """
+    lines = deque()
+    while True:
+        offset = handle.tell()
+        line = handle.readline()
+        if not line:
+            return None
+        lines.append((offset, line[:1]))
+        if len(lines) == 3:
+            if lines[0][1] == b"@" and lines[2][1] == b"+":
+                return lines[0][0]
+            lines.popleft()
+
+
+for _format in ("fasta", "fasta-2line"):
+    _RECORD_START[_format] = _next_fasta_start
+for _format in ("fastq", "fastq-sanger", "fastq-solexa", "fastq-illumina"):
+    _RECORD_START[_format] = _next_fastq_start
+del _format
+
+
+def _chunk_offsets(filename, format, chunk_size):
+    """Return a list of file offsets splitting the file at record boundaries.
+
+    The first offset is zero and the last offset is the file size, so that
+    consecutive pairs give the start and end of each chunk.
+    """
+    next_record_start = _RECORD_START[format]
+    with open(filename, "rb") as handle:
+        size = handle.seek(0, os.SEEK_END)
+        offsets = [0]
+        position = chunk_size
+        while position < size:
+            handle.seek(position)
+            handle.readline()  # skip the rest of the (partial) line
+            start = next_record_start(handle)
+            if start is None:
+                break
+            offsets.append(start)
+            position = start + chunk_size
+        if size > 0:
+            offsets.append(size)
+    return offsets
+
+
+def _parse_chunk(filename, format, start, end):
+    """Parse the records between two file offsets (in a worker process).
+
+    Returns a list of (id, name, description, sequence, letter annotations)
+    tuples, with the per-letter annotations (the quality scores) packed into
+    bytes objects as signed chars, which are much cheaper to pickle than
+    lists of integers.
+    """
+    from Bio import SeqIO
+
+    with open(filename, "rb") as handle:
+        handle.seek(start)
+        data = handle.read(end - start)
+    return [
+        (
+            record.id,
+            record.name,
+            record.description,
+            str(record.seq),
+            {
+                key: array("b", values).tobytes()
+                for key, values in record.letter_annotations.items()
+            },
+        )
+        for record in SeqIO.parse(StringIO(data.decode()), format)
+    ]
+
+
+def _build_records(values):
+    """Turn the tuples from _parse_chunk back into SeqRecord objects."""
+    for id, name, description, sequence, letter_annotations in values:
+        record = SeqRecord(Seq(sequence), id=id, name=name, description=description)
+        for key, scores in letter_annotations.items():
+            # Bypass the length check, as the parser has already checked this
+            scores = array("b", scores).tolist()
+            dict.__setitem__(record._per_letter_annotations, key, scores)
+        yield record
+
+
+def _parallel_parse(filename, format, workers, chunk_size=_CHUNK_SIZE):
+    """Parse a file using a pool of worker processes, returns a generator.
+
+    Arguments:
+     - filename - name of the (uncompressed) file to parse.
+     - format - lower case string describing the file format.
+     - workers - number of worker processes to use.
+     - chunk_size - approximate number of bytes parsed per task.
+
+    At most two chunks per worker are submitted ahead of the chunk whose
+    records are currently being returned.
+    """
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError(f"workers should be a positive integer, not {workers!r}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size should be positive, not {chunk_size!r}")
+    if format not in _RECORD_START:
+        raise ValueError(f"Parallel parsing is not supported for format '{format}'")
+    if not isinstance(filename, (str, os.PathLike)):
+        raise TypeError("Parallel parsing requires a filename, not a handle")
+    offsets = _chunk_offsets(filename, format, chunk_size)
+    return _parallel_records(filename, format, workers, offsets)
+
+
+def _parallel_records(filename, format, workers, offsets):
+    """Yield the records from each chunk in order (PRIVATE)."""
+    chunks = iter(zip(offsets[:-1], offsets[1:]))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        try:
+            for start, end in chunks:
+                pending.append(
+                    executor.submit(_parse_chunk, filename, format, start, end)
+                )
+                if len(pending) < 2 * workers:
+                    continue
+                yield from _build_records(pending.popleft().result())
+            while pending:
+                yield from _build_records(pending.popleft().result())
+        finally:
+            for future in pending:
+                future.cancel()
@@ -12,7 +12,9 @@
 # NEEDS TO BE SYNCH WITH THE REST OF BIOPYTHON AND BIOPERL
 # In particular, the SeqRecord and BioSQL.BioSeq.DBSeqRecord classes
 # need to be in sync (this is the BioSQL "Database SeqRecord").
+import bisect
 import numbers
+import operator
 import warnings
 from io import StringIO
 from typing import Any
@@ -115,6 +117,152 @@ class _RestrictedDict(dict[str, Sequence[Any]]):
             self[key] = value
 
 
+class _FeatureIndex:
+    """Interval index over the features of a SeqRecord (PRIVATE).
+
+    This is built on demand by the SeqRecord region queries and slicing, and
+    holds two sorted tables: one of the overall span (start and end) of each
+    feature, used to find features falling within a region, and one with
+    the span of each part of each feature (so a CompoundLocation contributes
+    one entry per exon), used to find features overlapping a region.
+
+    The overlap table is an implicit augmented interval tree over the parts
+    sorted by start, where each element also records the largest end of its
+    subtree, following the layout used by cgranges. Queries cost O(log n)
+    plus the number of parts reported.
+
+    Features whose location refers to another sequence (via ref or ref_db),
+    features without a location, and features with unknown positions are not
+    indexed. The first of these are recorded separately so that SeqRecord
+    slicing can warn about them.
+
+    The index keeps a copy of the features list it was built from, and is
+    only valid while the list still holds the same feature objects with the
+    same location objects (compared by identity). Changing a location object
+    in place (e.g. appending to the parts of a CompoundLocation) is not
+    detected.
+    """
+
+    def __init__(self, features):
+        """Build the index for the given list of SeqFeature objects."""
+        self.source = features
+        self.features = list(features)
+        self.locations = [feature.location for feature in features]
+        self.referencing = []
+        spans = []
+        parts = []
+        for i, feature in enumerate(self.features):
+            location = feature.location
+            if location is None:
+                continue
+            if location.ref or location.ref_db:
+                self.referencing.append(feature)
+                continue
+            try:
+                spans.append((int(location.start), int(location.end), i))
+                for part in location.parts:
+                    parts.append((int(part.start), int(part.end), part.strand, i))
+            except TypeError:
+                # Will fail on UnknownPosition
+                continue
+        spans.sort()
+        self.span_starts = [span[0] for span in spans]
+        self.span_ends = [span[1] for span in spans]
+        self.span_indices = [span[2] for span in spans]
+        parts.sort(key=lambda part: (part[0], part[1]))
+        self.starts = [part[0] for part in parts]
+        self.ends = [part[1] for part in parts]
+        self.strands = [part[2] for part in parts]
+        self.indices = [part[3] for part in parts]
+        self.max_ends, self.max_level = self._augment(self.ends)
+
+    @staticmethod
+    def _augment(ends):
+        """Return the subtree maximum end of each node, and the tree height."""
+        n = len(ends)
+        max_ends = list(ends)
+        if n == 0:
+            return max_ends, -1
+        last_i = 0
+        last = 0
+        for i in range(0, n, 2):
+            last_i = i
+            last = ends[i]
+        k = 1
+        while 1 << k <= n:
+            x = 1 << (k - 1)
+            step = x << 2
+            for i in range((x << 1) - 1, n, step):
+                right = max_ends[i + x] if i + x < n else last
+                max_ends[i] = max(ends[i], max_ends[i - x], right)
+            last_i = last_i - x if last_i >> k & 1 else last_i + x
+            if last_i < n and max_ends[last_i] > last:
+                last = max_ends[last_i]
+            k += 1
+        return max_ends, k - 1
+
+    def is_valid(self, features):
+        """Check if the index is still valid for the given features list."""
+        return (
+            features is self.source
+            and len(features) == len(self.features)
+            and all(map(operator.is_, features, self.features))
+            and all(
+                feature.location is location
+                for feature, location in zip(features, self.locations)
+            )
+        )
+
+    def overlapping(self, start, end, strand=None):
+        """Return sorted indices of features with a part overlapping start:end."""
+        starts = self.starts
+        ends = self.ends
+        max_ends = self.max_ends
+        n = len(starts)
+        found = set()
+        if n == 0 or start >= end:
+            return []
+        stack = [((1 << self.max_level) - 1, self.max_level, False)]
+        while stack:
+            x, k, visited = stack.pop()
+            if k <= 3:
+                # Small subtree, just scan it
+                first = x >> k << k
+                for i in range(first, min(first + (1 << (k + 1)) - 1, n)):
+                    if starts[i] >= end:
+                        break
+                    if start < ends[i]:
+                        found.add(i)
+            elif not visited:
+                # Revisit this node after the left subtree
+                stack.append((x, k, True))
+                y = x - (1 << (k - 1))
+                if y >= n or max_ends[y] > start:
+                    stack.append((y, k - 1, False))
+            elif x < n and starts[x] < end:
+                if start < ends[x]:
+                    found.add(x)
+                stack.append((x + (1 << (k - 1)), k - 1, False))
+        if strand is None:
+            return sorted({self.indices[i] for i in found})
+        strands = self.strands
+        return sorted({self.indices[i] for i in found if strands[i] == strand})
+
+    def within(self, start, end, strand=None):
+        """Return sorted indices of features lying entirely within start:end."""
+        low = bisect.bisect_left(self.span_starts, start)
+        high = bisect.bisect_right(self.span_starts, end)
+        span_ends = self.span_ends
+        span_indices = self.span_indices
+        indices = sorted(
+            span_indices[i] for i in range(low, high) if span_ends[i] <= end
+        )
+        if strand is None:
+            return indices
+        features = self.features
+        return [i for i in indices if features[i].location.strand == strand]
+
+
 class SeqRecord:
     """A SeqRecord object holds a sequence and information about it.
 
@@ -545,23 +693,17 @@ class SeqRecord:
             if step == 1:
                 # Select relevant features, add them with shifted locations
                 # assert str(self.seq)[index] == str(self.seq)[start:stop]
-                for f in self.features:
-                    if f.location.ref or f.location.ref_db:
-                        # TODO - Implement this (with lots of tests)?
-                        import warnings
-
-                        warnings.warn(
-                            "When slicing SeqRecord objects, any "
-                            "SeqFeature referencing other sequences (e.g. "
-                            "from segmented GenBank records) are ignored."
-                        )
-                        continue
-                    try:
-                        if start <= f.location.start and f.location.end <= stop:
-                            answer.features.append(f._shift(-start))
-                    except TypeError:
-                        # Will fail on UnknownPosition
-                        pass
+                feature_index = self._get_feature_index()
+                for f in feature_index.referencing:
+                    # TODO - Implement this (with lots of tests)?
+                    warnings.warn(
+                        "When slicing SeqRecord objects, any "
+                        "SeqFeature referencing other sequences (e.g. "
+                        "from segmented GenBank records) are ignored."
+                    )
+                features = feature_index.features
+                for i in feature_index.within(start, stop):
+                    answer.features.append(features[i]._shift(-start))
 
             # Slice all the values to match the sliced sequence
             # (this should also work with strides, even negative strides):
@@ -571,6 +713,88 @@ class SeqRecord:
             return answer
         raise ValueError("Invalid index")
 
+    def _get_feature_index(self) -> _FeatureIndex:
+        """Return the interval index of the features, building it if needed."""
+        feature_index = getattr(self, "_feature_index", None)
+        if feature_index is None or not feature_index.is_valid(self.features):
+            feature_index = _FeatureIndex(self.features)
+            self._feature_index = feature_index
+        return feature_index
+
+    def features_overlapping(
+        self, start: int, end: int, strand: Optional[int] = None
+    ) -> list["SeqFeature"]:
+        """Return the features overlapping the region start:end.
+
+        Arguments:
+         - start - start of the region (zero-based, Python counting).
+         - end - end of the region (exclusive, Python counting).
+         - strand - optional, only consider feature parts on this strand.
+
+        A feature is included if any part of its location overlaps the
+        region, so a spliced gene (with a CompoundLocation) is not returned
+        for a region falling entirely within one of its introns. The features
+        are returned in the order they appear in the features list.
+
+        >>> from Bio.Seq import Seq
+        >>> from Bio.SeqFeature import SeqFeature, SimpleLocation
+        >>> rec = SeqRecord(Seq("ACGT" * 25), id="example")
+        >>> rec.features.append(SeqFeature(SimpleLocation(0, 100), type="source"))
+        >>> rec.features.append(SeqFeature(
+        ...     SimpleLocation(10, 20, 1) + SimpleLocation(50, 60, 1), type="CDS"))
+        >>> rec.features.append(SeqFeature(SimpleLocation(30, 40, -1), type="gene"))
+        >>> [f.type for f in rec.features_overlapping(15, 35)]
+        ['source', 'CDS', 'gene']
+        >>> [f.type for f in rec.features_overlapping(25, 45)]
+        ['source', 'gene']
+        >>> [f.type for f in rec.features_overlapping(25, 45, strand=-1)]
+        ['gene']
+
+        Features referencing other sequences (via the location's ref or ref_db
+        attributes) and features with unknown positions are ignored.
+
+        The search uses an interval index which is built on first use, and
+        rebuilt automatically if the features list is modified or a feature is
+        given a new location object. If you change a location object in place
+        after a query (e.g. its strand), assign a new features list to the
+        record.
+        """
+        feature_index = self._get_feature_index()
+        features = feature_index.features
+        return [features[i] for i in feature_index.overlapping(start, end, strand)]
+
+    def features_within(
+        self, start: int, end: int, strand: Optional[int] = None
+    ) -> list["SeqFeature"]:
+        """Return the features lying entirely within the region start:end.
+
+        Arguments:
+         - start - start of the region (zero-based, Python counting).
+         - end - end of the region (exclusive, Python counting).
+         - strand - optional, only consider features on this strand.
+
+        These are the features which would be kept when slicing the record
+        as record[start:end], in the order they appear in the features list.
+        Using the example from the features_overlapping method:
+
+        >>> from Bio.Seq import Seq
+        >>> from Bio.SeqFeature import SeqFeature, SimpleLocation
+        >>> rec = SeqRecord(Seq("ACGT" * 25), id="example")
+        >>> rec.features.append(SeqFeature(SimpleLocation(0, 100), type="source"))
+        >>> rec.features.append(SeqFeature(
+        ...     SimpleLocation(10, 20, 1) + SimpleLocation(50, 60, 1), type="CDS"))
+        >>> rec.features.append(SeqFeature(SimpleLocation(30, 40, -1), type="gene"))
+        >>> [f.type for f in rec.features_within(5, 65)]
+        ['CDS', 'gene']
+        >>> [f.type for f in rec.features_within(5, 65, strand=+1)]
+        ['CDS']
+        >>> [f.type for f in rec.features_within(15, 65)]
+        ['gene']
+        """
+        feature_index = self._get_feature_index()
+        features = feature_index.features
+        return [features[i] for i in feature_index.within(start, end, strand)]
+
     def __iter__(self) -> Iterable[Union["Seq", "MutableSeq"]]:
         """Iterate over the letters in the sequence.
 
@@ -0,0 +1,129 @@
+/* Copyright 2026 by the Biopython developers.  All rights reserved.
+ *
+ * This file is part of the Biopython distribution and governed by your
+ * choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+ * Please see the LICENSE file that should have been included as part of this
+ * package.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include "Python.h"
+
+
+static char scan__doc__[] =
+"scan(table, nsymbols, symbols, accept, data, state)\n"
+"\n"
+"Run the pattern automaton of a PatternSet over the sequence data.\n"
+"\n"
+"Arguments:\n"
+" - table    - transition table of the automaton, as an array of C ints\n"
+"              with nsymbols entries for each state.\n"
+" - nsymbols - number of symbols used by the automaton.\n"
+" - symbols  - bytes object of length 256 mapping each byte to a symbol.\n"
+" - accept   - bytes object with a nonzero value for each state for which\n"
+"              one or more patterns end.\n"
+" - data     - sequence data as a bytes-like object.\n"
+" - state    - state of the automaton at the start of the data.\n"
+"\n"
+"Returns a list of (index, state) tuples for each position in the data at\n"
+"which the automaton is in an accepting state, and the final state.\n";
+
+static PyObject*
+scan(PyObject* self, PyObject* args)
+{
+    Py_buffer table;
+    Py_buffer symbols;
+    Py_buffer accept;
+    Py_buffer data;
+    Py_ssize_t nsymbols;
+    Py_ssize_t nstates;
+    Py_ssize_t i;
+    int state;
+    const int* transitions;
+    const unsigned char* symbol;
+    const unsigned char* accepting;
+    const unsigned char* letters;
+    PyObject* hits = NULL;
+    PyObject* hit;
+    PyObject* result = NULL;
+
+    if (!PyArg_ParseTuple(args, "y*ny*y*y*i:scan",
+                          &table, &nsymbols, &symbols, &accept, &data, &state))
+        return NULL;
+
+    nstates = accept.len;
+    if (nsymbols <= 0 || table.len != nstates * nsymbols * (Py_ssize_t)sizeof(int)) {
+        PyErr_SetString(PyExc_ValueError, "inconsistent size of transition table");
+        goto exit;
+    }
+    if (symbols.len != 256) {
+        PyErr_SetString(PyExc_ValueError, "symbols should have length 256");
+        goto exit;
+    }
+    symbol = symbols.buf;
+    for (i = 0; i < 256; i++) {
+        if (symbol[i] >= nsymbols) {
+            PyErr_SetString(PyExc_ValueError, "symbol out of range");
+            goto exit;
+        }
+    }
+    if (state < 0 || state >= nstates) {
+        PyErr_SetString(PyExc_ValueError, "state out of range");
+        goto exit;
+    }
+    hits = PyList_New(0);
+    if (!hits) goto exit;
+    transitions = table.buf;
+    accepting = accept.buf;
+    letters = data.buf;
+    for (i = 0; i < data.len; i++) {
+        state = transitions[state * nsymbols + symbol[letters[i]]];
+        if (state < 0 || state >= nstates) {
+            PyErr_SetString(PyExc_ValueError, "state out of range");
+            goto exit;
+        }
+        if (accepting[state]) {
+            hit = Py_BuildValue("ni", i, state);
+            if (!hit) goto exit;
+            if (PyList_Append(hits, hit) == -1) {
+                Py_DECREF(hit);
+                goto exit;
+            }
+            Py_DECREF(hit);
+        }
+    }
+    result = Py_BuildValue("Oi", hits, state);
+
+exit:
+    Py_XDECREF(hits);
+    PyBuffer_Release(&table);
+    PyBuffer_Release(&symbols);
+    PyBuffer_Release(&accept);
+    PyBuffer_Release(&data);
+    return result;
+}
+
+
+static struct PyMethodDef _ahocorasick_methods[] = {
+    {"scan", (PyCFunction)scan, METH_VARARGS, scan__doc__},
+    {NULL, NULL, 0, NULL} /* sentinel */
+};
+
+
+static struct PyModuleDef moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "_ahocorasick",
+    "Fast scanning of sequences using the automaton of a PatternSet",
+    -1,
+    _ahocorasick_methods,
+    NULL,
+    NULL,
+    NULL,
+    NULL
+};
+
+PyObject *
+PyInit__ahocorasick(void)
+{
+    return PyModule_Create(&moduledef);
+}
@@ -252,14 +252,22 @@ import struct
 import sys
 import zlib
 from builtins import open as _open
+from collections import deque
+from collections import namedtuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 _bgzf_magic = b"\x1f\x8b\x08\x04"
 _bgzf_header = b"\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff\x06\x00\x42\x43\x02\x00"
 _bgzf_eof = b"\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff\x06\x00BC\x02\x00\x1b\x00\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00"
 _bytes_BC = b"BC"
 
+BgzfCacheInfo = namedtuple(
+    "BgzfCacheInfo", ["hits", "misses", "max_cache", "current_size"]
+)
 
-def open(filename, mode="rb"):
+
+def open(filename, mode="rb", threads=None):
     r"""Open a BGZF file for reading, writing or appending.
 
     If text mode is requested, in order to avoid multi-byte characters, this is
@@ -268,11 +276,15 @@ def open(filename, mode="rb"):
 
     If your data is in UTF-8 or any other incompatible encoding, you must use
     binary mode, and decode the appropriate fragments yourself.
+
+    The optional ``threads`` argument gives the number of threads used to
+    compress or decompress the BGZF blocks, see the BgzfReader and BgzfWriter
+    classes.
     """
     if "r" in mode.lower():
-        return BgzfReader(filename, mode)
+        return BgzfReader(filename, mode, threads=threads)
     elif "w" in mode.lower() or "a" in mode.lower():
-        return BgzfWriter(filename, mode)
+        return BgzfWriter(filename, mode, threads=threads)
     else:
         raise ValueError(f"Bad mode {mode!r}")
 
@@ -429,11 +441,12 @@ def BgzfBlocks(handle):
         data_start += data_len
 
 
-def _load_bgzf_block(handle, text_mode=False):
-    """Load the next BGZF block of compressed data (PRIVATE).
+def _read_bgzf_block(handle):
+    """Read the next BGZF block without decompressing it (PRIVATE).
 
-    Returns a tuple (block size and data), or at end of file
-    will raise StopIteration.
+    Returns a tuple (block size, deflated data, expected CRC, and expected
+    length of the uncompressed data), or at end of file will raise
+    StopIteration.
     """
     magic = handle.read(4)
     if not magic:
@@ -469,10 +482,20 @@ def _load_bgzf_block(handle, text_mode=False):
         raise ValueError("Missing BC, this isn't a BGZF file!")
     # Now comes the compressed data, CRC, and length of uncompressed data.
     deflate_size = block_size - 1 - extra_len - 19
-    d = zlib.decompressobj(-15)  # Negative window size means no headers
-    data = d.decompress(handle.read(deflate_size)) + d.flush()
+    deflated = handle.read(deflate_size)
     expected_crc = handle.read(4)
     expected_size = struct.unpack("<I", handle.read(4))[0]
+    return block_size, deflated, expected_crc, expected_size
+
+
+def _inflate_bgzf_block(deflated, expected_crc, expected_size, text_mode=False):
+    """Decompress and check the data of a BGZF block (PRIVATE).
+
+    This does not depend on any shared state, and zlib releases the GIL,
+    so it can be called from a pool of threads.
+    """
+    d = zlib.decompressobj(-15)  # Negative window size means no headers
+    data = d.decompress(deflated) + d.flush()
     if expected_size != len(data):
         raise RuntimeError("Decompressed to %i, not %i" % (len(data), expected_size))
     # Should cope with a mix of Python platforms...
@@ -486,9 +509,58 @@ def _load_bgzf_block(handle, text_mode=False):
     if text_mode:
         # Note ISO-8859-1 aka Latin-1 preserves first 256 chars
         # (i.e. ASCII), but critically is a single byte encoding
-        return block_size, data.decode("latin-1")
+        return data.decode("latin-1")
     else:
-        return block_size, data
+        return data
+
+
+def _load_bgzf_block(handle, text_mode=False):
+    """Load the next BGZF block of compressed data (PRIVATE).
+
+    Returns a tuple (block size and data), or at end of file
+    will raise StopIteration.
+    """
+    block_size, deflated, expected_crc, expected_size = _read_bgzf_block(handle)
+    data = _inflate_bgzf_block(deflated, expected_crc, expected_size, text_mode)
+    return block_size, data
+
+
+def _deflate_bgzf_block(block, compresslevel=6):
+    """Compress data as a single BGZF block, returns bytes (PRIVATE).
+
+    This does not depend on any shared state, and zlib releases the GIL,
+    so it can be called from a pool of threads.
+    """
+    if len(block) > 65536:
+        raise ValueError(f"{len(block)} Block length > 65536")
+    # Giving a negative window bits means no gzip/zlib headers,
+    # -15 used in samtools
+    c = zlib.compressobj(compresslevel, zlib.DEFLATED, -15, zlib.DEF_MEM_LEVEL, 0)
+    compressed = c.compress(block) + c.flush()
+    del c
+    if len(compressed) > 65536:
+        raise RuntimeError("TODO - Didn't compress enough, try less data in this block")
+    bsize = struct.pack("<H", len(compressed) + 25)  # includes -1
+    crc = struct.pack("<I", zlib.crc32(block) & 0xFFFFFFFF)
+    uncompressed_length = struct.pack("<I", len(block))
+    # Fixed 16 bytes,
+    # gzip magic bytes (4) mod time (4),
+    # gzip flag (1), os (1), extra length which is six (2),
+    # sub field which is BC (2), sub field length of two (2),
+    # Variable data,
+    # 2 bytes: block length as BC sub field (2)
+    # X bytes: the data
+    # 8 bytes: crc (4), uncompressed data length (4)
+    return _bgzf_header + bsize + compressed + crc + uncompressed_length
+
+
+def _check_threads(threads):
+    """Validate the threads argument, returns a thread pool or None (PRIVATE)."""
+    if threads is None or threads == 1:
+        return None
+    if not isinstance(threads, int) or threads < 1:
+        raise ValueError(f"threads should be a positive integer, not {threads!r}")
+    return ThreadPoolExecutor(max_workers=threads)
 
 
 class BgzfReader:
@@ -554,9 +626,26 @@ class BgzfReader:
     block can be up to 64kb, the default cache could take up to 6MB of
     RAM. The cache is not important for reading through the file in one
     pass, but is important for improving performance of random access.
+    The least recently used block is removed when the cache is full, and
+    you can check how well the cache is working for your access pattern:
+
+    >>> handle = BgzfReader("SamBam/ex1.bam", "rb", max_cache=2)
+    >>> for start in (18239, 0, 36462, 0, 18239):
+    ...     virtual_offset = handle.seek(make_virtual_offset(start, 4))
+    >>> handle.cache_info()
+    BgzfCacheInfo(hits=2, misses=4, max_cache=2, current_size=2)
+    >>> handle.close()
     """
 
-    def __init__(self, filename=None, mode="r", fileobj=None, max_cache=100):
+    def __init__(
+        self,
+        filename=None,
+        mode="r",
+        fileobj=None,
+        max_cache=100,
+        threads=None,
+        read_ahead=None,
+    ):
         r"""Initialize the class for reading a BGZF file.
 
         You would typically use the top level ``bgzf.open(...)`` function
@@ -582,11 +671,35 @@ class BgzfReader:
         cache in memory. Each can be up to 64kb thus the default of 100 blocks
         could take up to 6MB of RAM. This is important for efficient random
         access, a small value is fine for reading the file in one pass.
+
+        Argument ``threads`` gives the number of threads used to decompress
+        the BGZF blocks (default None, meaning decompress each block when it
+        is needed in the calling thread). Random access via ``seek()`` is not
+        affected, and the virtual offsets are the same as without threads.
+
+        Argument ``read_ahead`` gives the number of blocks following the
+        current block to load when the file is being read sequentially. With
+        threads, these are queued for decompression in the thread pool (the
+        default is two blocks per thread). Without threads, when a block is
+        not in the cache the following blocks are loaded into the cache too
+        (the default is none), which helps when jumping back and forth over
+        a small region of the file. This is limited by the cache size.
+
+        The number of blocks found in the cache (or read ahead) and the number
+        read from the file are kept in the ``cache_hits`` and ``cache_misses``
+        attributes, see also the ``cache_info()`` method.
         """
         # TODO - Assuming we can seek, check for 28 bytes EOF empty block
         # and if missing warn about possible truncation (as in samtools)?
         if max_cache < 1:
             raise ValueError("Use max_cache with a minimum of 1")
+        if read_ahead is None:
+            read_ahead = 0 if threads is None else 2 * threads
+        elif not isinstance(read_ahead, int) or read_ahead < 0:
+            raise ValueError(
+                f"read_ahead should be a non-negative integer, not {read_ahead!r}"
+            )
+        executor = _check_threads(threads)
         # Must open the BGZF file in binary mode, but we may want to
         # treat the contents as either text or binary (unicode or
         # bytes under Python 3)
@@ -611,12 +724,24 @@ class BgzfReader:
             self._newline = b"\n"
         self._handle = handle
         self.max_cache = max_cache
-        self._buffers = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._buffers = OrderedDict()
         self._block_start_offset = None
         self._block_raw_length = None
+        self._executor = executor
+        self._ahead = OrderedDict()
+        self._ahead_offset = None
+        if executor is None:
+            # Read ahead blocks go into the cache, leave room for the current one
+            read_ahead = min(read_ahead, max_cache - 1)
+        self._read_ahead_blocks = read_ahead
         self._load_block(handle.tell())
+        if read_ahead:
+            self._read_ahead()
 
     def _load_block(self, start_offset=None):
+        sequential = start_offset is None
         if start_offset is None:
             # If the file is being read sequentially, then _handle.tell()
             # should be pointing at the start of the next block.
@@ -626,16 +751,31 @@ class BgzfReader:
             self._within_block_offset = 0
             return
         elif start_offset in self._buffers:
-            # Already in cache
+            # Already in cache, mark as most recently used
+            self._buffers.move_to_end(start_offset)
+            self.cache_hits += 1
             self._buffer, self._block_raw_length = self._buffers[start_offset]
             self._within_block_offset = 0
             self._block_start_offset = start_offset
             return
-        # Must hit the disk... first check cache limits,
-        while len(self._buffers) >= self.max_cache:
-            # TODO - Implement LRU cache removal?
-            self._buffers.popitem()
-        # Now load the block
+        elif start_offset in self._ahead:
+            # Already read, and queued for decompression in the thread pool
+            self.cache_hits += 1
+            ahead = self._ahead
+            while True:
+                offset, (block_size, future) = ahead.popitem(last=False)
+                if offset == start_offset:
+                    break
+                future.cancel()
+            self._block_start_offset = start_offset
+            self._buffer = future.result()
+            self._within_block_offset = 0
+            self._block_raw_length = block_size
+            self._cache_block(start_offset, self._buffer, block_size)
+            self._read_ahead()
+            return
+        # Must hit the disk...
+        self.cache_misses += 1
         handle = self._handle
         if start_offset is not None:
             handle.seek(start_offset)
@@ -652,7 +792,77 @@ class BgzfReader:
         self._within_block_offset = 0
         self._block_raw_length = block_size
         # Finally save the block in our cache,
-        self._buffers[self._block_start_offset] = self._buffer, block_size
+        self._cache_block(self._block_start_offset, self._buffer, block_size)
+        if self._read_ahead_blocks:
+            # Anything queued is for a different part of the file
+            self._cancel_read_ahead()
+            self._ahead_offset = self._block_start_offset + block_size
+            if sequential:
+                self._read_ahead()
+
+    def _cache_block(self, start_offset, data, block_size):
+        """Add a block to the cache, removing the least recently used (PRIVATE)."""
+        buffers = self._buffers
+        while len(buffers) >= self.max_cache:
+            buffers.popitem(last=False)
+        buffers[start_offset] = data, block_size
+
+    def _read_ahead(self):
+        """Load or queue the blocks following the current block (PRIVATE).
+
+        Reading the compressed data is done in the calling thread, so that
+        the file handle is not shared with the worker threads. Without a
+        thread pool, the blocks are decompressed and added to the cache.
+        """
+        executor = self._executor
+        ahead = self._ahead
+        if executor is None:
+            count = self._read_ahead_blocks
+        else:
+            count = self._read_ahead_blocks - len(ahead)
+        if count <= 0:
+            return
+        handle = self._handle
+        offset = self._ahead_offset
+        handle.seek(offset)
+        for i in range(count):
+            try:
+                block_size, deflated, crc, size = _read_bgzf_block(handle)
+                if executor is None:
+                    data = _inflate_bgzf_block(deflated, crc, size, self._text)
+            except StopIteration:
+                break
+            except (ValueError, RuntimeError, struct.error, zlib.error):
+                # Leave this for _load_block to report if the block is needed
+                break
+            if executor is None:
+                if offset not in self._buffers:
+                    self._cache_block(offset, data, block_size)
+            else:
+                future = executor.submit(
+                    _inflate_bgzf_block, deflated, crc, size, self._text
+                )
+                ahead[offset] = block_size, future
+            offset += block_size
+        self._ahead_offset = offset
+
+    def _cancel_read_ahead(self):
+        """Discard any blocks queued for decompression (PRIVATE)."""
+        for block_size, future in self._ahead.values():
+            future.cancel()
+        self._ahead.clear()
+
+    def cache_info(self):
+        """Return the block cache statistics as a named tuple.
+
+        This gives the number of cache hits and misses since the file was
+        opened (you can reset these by setting the ``cache_hits`` and
+        ``cache_misses`` attributes to zero), the maximum number of blocks
+        cached, and the number of blocks currently cached.
+        """
+        return BgzfCacheInfo(
+            self.cache_hits, self.cache_misses, self.max_cache, len(self._buffers)
+        )
 
     def tell(self):
         """Return a 64-bit unsigned BGZF virtual offset."""
@@ -766,6 +976,9 @@ class BgzfReader:
 
     def close(self):
         """Close BGZF file."""
+        if self._executor is not None:
+            self._cancel_read_ahead()
+            self._executor.shutdown()
         self._handle.close()
         self._buffer = None
         self._block_start_offset = None
@@ -795,8 +1008,19 @@ class BgzfReader:
 class BgzfWriter:
     """Define a BGZFWriter object."""
 
-    def __init__(self, filename=None, mode="w", fileobj=None, compresslevel=6):
-        """Initialize the class."""
+    def __init__(
+        self, filename=None, mode="w", fileobj=None, compresslevel=6, threads=None
+    ):
+        """Initialize the class.
+
+        Argument ``threads`` gives the number of threads used to compress
+        the BGZF blocks (default None, meaning compress each block in the
+        calling thread). The blocks are still written in order, so the output
+        and the virtual offsets from ``tell()`` are identical. Note that
+        ``tell()`` and ``flush()`` must wait for any queued blocks to be
+        compressed and written.
+        """
+        executor = _check_threads(threads)
         if filename and fileobj:
             raise ValueError("Supply either filename or fileobj, not both")
         if fileobj:
@@ -819,42 +1043,35 @@ class BgzfWriter:
         self._handle = handle
         self._buffer = b""
         self.compresslevel = compresslevel
+        self._executor = executor
+        self._pending = deque()
+        self._max_pending = 2 * threads if executor else 0
 
     def _write_block(self, block):
-        """Write provided data to file as a single BGZF compressed block (PRIVATE)."""
+        """Write provided data to file as a single BGZF compressed block (PRIVATE).
+
+        When using a thread pool, the block is queued for compression and
+        the compressed blocks are written out in order as they complete.
+        """
         # print("Saving %i bytes" % len(block))
+        if self._executor is None:
+            self._handle.write(_deflate_bgzf_block(block, self.compresslevel))
+            return
         if len(block) > 65536:
             raise ValueError(f"{len(block)} Block length > 65536")
-        # Giving a negative window bits means no gzip/zlib headers,
-        # -15 used in samtools
-        c = zlib.compressobj(
-            self.compresslevel, zlib.DEFLATED, -15, zlib.DEF_MEM_LEVEL, 0
+        pending = self._pending
+        pending.append(
+            self._executor.submit(_deflate_bgzf_block, block, self.compresslevel)
         )
-        compressed = c.compress(block) + c.flush()
-        del c
-        if len(compressed) > 65536:
-            raise RuntimeError(
-                "TODO - Didn't compress enough, try less data in this block"
-            )
-        crc = zlib.crc32(block)
-        # Should cope with a mix of Python platforms...
-        if crc < 0:
-            crc = struct.pack("<i", crc)
-        else:
-            crc = struct.pack("<I", crc)
-        bsize = struct.pack("<H", len(compressed) + 25)  # includes -1
-        crc = struct.pack("<I", zlib.crc32(block) & 0xFFFFFFFF)
-        uncompressed_length = struct.pack("<I", len(block))
-        # Fixed 16 bytes,
-        # gzip magic bytes (4) mod time (4),
-        # gzip flag (1), os (1), extra length which is six (2),
-        # sub field which is BC (2), sub field length of two (2),
-        # Variable data,
-        # 2 bytes: block length as BC sub field (2)
-        # X bytes: the data
-        # 8 bytes: crc (4), uncompressed data length (4)
-        data = _bgzf_header + bsize + compressed + crc + uncompressed_length
-        self._handle.write(data)
+        # Limit how many uncompressed blocks we hold in memory
+        while len(pending) > self._max_pending:
+            self._handle.write(pending.popleft().result())
+
+    def _write_pending(self):
+        """Wait for any queued blocks and write them to the file (PRIVATE)."""
+        pending = self._pending
+        while pending:
+            self._handle.write(pending.popleft().result())
 
     def write(self, data):
         """Write method for the class."""
@@ -885,6 +1102,7 @@ class BgzfWriter:
             self._buffer = self._buffer[65535:]
         self._write_block(self._buffer)
         self._buffer = b""
+        self._write_pending()
         self._handle.flush()
 
     def close(self):
@@ -897,12 +1115,16 @@ class BgzfWriter:
         """
         if self._buffer:
             self.flush()
+        self._write_pending()
+        if self._executor is not None:
+            self._executor.shutdown()
         self._handle.write(_bgzf_eof)
         self._handle.flush()
         self._handle.close()
 
     def tell(self):
         """Return a BGZF 64-bit virtual offset."""
+        self._write_pending()
         return make_virtual_offset(self._handle.tell(), len(self._buffer))
 
     def seekable(self):
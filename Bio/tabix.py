@@ -0,0 +1,732 @@
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+#
+# This file is part of the Biopython distribution and governed by your
+# choice of the "Biopython License Agreement" or the "BSD 3-Clause License".
+# Please see the LICENSE file that should have been included as part of this
+# package.
+r"""Read and write tabix indexes of BGZF compressed tab-separated files.
+
+Tab-separated files such as BED, GFF and VCF which are sorted by position and
+compressed with BGZF (see Bio.bgzf) can be indexed with the tabix tool from
+htslib, giving an index file with the extension ``.tbi`` (the original tabix
+index format) or ``.csi`` (the coordinate-sorted index format, which allows
+for longer chromosomes). This module can read and write both index formats
+in pure Python, and use them to find the lines of the file overlapping a
+region without reading through the whole file.
+
+To index a BGZF compressed BED file, use the ``build_index`` function, which
+writes the index file next to the data file (here ``regions.bed.gz.tbi``)::
+
+    from Bio import tabix
+    tabix.build_index("regions.bed.gz", preset="bed")
+
+The ``TabixReader`` class then gives access to the lines overlapping a region,
+where the start and end are given as Python style zero-based half-open
+coordinates (regardless of the coordinate convention of the file)::
+
+    with tabix.TabixReader("regions.bed.gz") as reader:
+        for line in reader.query("chr1", 10000, 20000):
+            print(line)
+
+This will only read the BGZF blocks containing the relevant lines.
+
+The binning scheme used by both index formats is the same as in the BAM
+index. Each region is assigned to the smallest bin containing it, with the
+bins at the lowest level each covering 16kb (with the default minimum shift
+of 14 bits):
+
+>>> _reg2bin(0, 100, 14, 5)
+4681
+>>> _reg2bin(16383, 16385, 14, 5)
+585
+>>> list(_reg2bins(0, 100, 14, 5))
+[0, 1, 9, 73, 585, 4681]
+"""
+
+import gzip
+import os
+import struct
+
+from Bio import bgzf
+
+# The format codes used in the index (lower 16 bits), plus the flag marking
+# zero-based half-open coordinates (as used in BED files).
+_TBX_GENERIC = 0
+_TBX_SAM = 1
+_TBX_VCF = 2
+_TBX_UCSC = 0x10000
+
+# Maps the preset names to the format, the (one-based) sequence name, begin
+# and end columns, the meta character marking header lines, and the number
+# of lines to skip at the start of the file.
+_PRESETS = {
+    "bed": (_TBX_GENERIC | _TBX_UCSC, 1, 2, 3, "#", 0),
+    "gff": (_TBX_GENERIC, 1, 4, 5, "#", 0),
+    "vcf": (_TBX_VCF, 1, 2, 0, "#", 0),
+    "sam": (_TBX_SAM, 3, 4, 0, "@", 0),
+}
+
+# File extensions (after removing .gz or .bgz) used to guess the preset.
+_EXTENSIONS = {
+    ".bed": "bed",
+    ".gff": "gff",
+    ".gff3": "gff",
+    ".gtf": "gff",
+    ".vcf": "vcf",
+    ".sam": "sam",
+}
+
+# Size of the lowest level bins is 2**_MIN_SHIFT; the tbi format has a fixed
+# minimum shift and depth, while for csi the depth is chosen as by htslib,
+# allowing for positions up to about 2**_MAX_SHIFT.
+_MIN_SHIFT = 14
+_TBI_DEPTH = 5
+_MAX_SHIFT = 37
+
+
+def _reg2bin(beg, end, min_shift, depth):
+    """Return the bin for the zero-based half-open region (PRIVATE)."""
+    shift = min_shift
+    t = ((1 << (depth * 3)) - 1) // 7
+    end -= 1
+    for level in range(depth, 0, -1):
+        if beg >> shift == end >> shift:
+            return t + (beg >> shift)
+        shift += 3
+        t -= 1 << (level * 3 - 3)
+    return 0
+
+
+def _reg2bins(beg, end, min_shift, depth):
+    """Yield the bins which may overlap the zero-based half-open region (PRIVATE)."""
+    shift = min_shift + depth * 3
+    t = 0
+    end -= 1
+    for level in range(depth + 1):
+        yield from range(t + (beg >> shift), t + (end >> shift) + 1)
+        shift -= 3
+        t += 1 << (level * 3)
+
+
+def _bin_first(level):
+    """Return the number of the first bin at the given level (PRIVATE)."""
+    return ((1 << (level * 3)) - 1) // 7
+
+
+def _bin_parent(bin):
+    """Return the number of the parent bin (PRIVATE)."""
+    return (bin - 1) >> 3
+
+
+def _bin_level(bin):
+    """Return the level of the bin, where the root bin 0 is level 0 (PRIVATE)."""
+    level = 0
+    while bin:
+        bin = _bin_parent(bin)
+        level += 1
+    return level
+
+
+def _bin_bottom(bin, depth):
+    """Return the first linear index window covered by the bin (PRIVATE)."""
+    level = _bin_level(bin)
+    return (bin - _bin_first(level)) << ((depth - level) * 3)
+
+
+def _meta_bin(depth):
+    """Return the pseudo-bin used to store per-sequence statistics (PRIVATE)."""
+    return _bin_first(depth + 1) + 1
+
+
+class TabixIndex:
+    """Tabix index (.tbi or .csi) of a BGZF compressed tab-separated file.
+
+    You would normally create this by reading an index file with the
+    ``read_index`` function, or by indexing a file with ``build_index``, but
+    you can also use it directly with your own BgzfReader to find the parts
+    of the file overlapping a region with the ``chunks`` method.
+
+    Attributes:
+     - names - list of the sequence names, in the order used in the file.
+     - format - file format code (0 generic, 1 SAM, 2 VCF) including the
+       flag 0x10000 for zero-based half-open coordinates (as in BED).
+     - sequence_column, begin_column, end_column - column numbers (starting
+       from one) giving the sequence name, and start and end positions. An
+       end column of zero means the end is worked out from the record.
+     - meta_char - lines starting with this character are header lines.
+     - skip - number of lines to skip at the start of the file.
+     - csi - True for the csi index format, False for tbi.
+     - min_shift - the lowest level bins and linear index windows each
+       cover 2**min_shift positions.
+     - depth - the number of levels in the binning scheme (excluding the
+       root level).
+
+    """
+
+    def __init__(
+        self,
+        format,
+        sequence_column,
+        begin_column,
+        end_column,
+        meta_char="#",
+        skip=0,
+        csi=False,
+        min_shift=_MIN_SHIFT,
+        depth=None,
+    ):
+        """Create an empty index with the given settings."""
+        if not csi and min_shift != _MIN_SHIFT:
+            raise ValueError("The tbi index format requires min_shift=14")
+        if depth is None:
+            if csi:
+                depth = (_MAX_SHIFT - min_shift + 2) // 3
+            else:
+                depth = _TBI_DEPTH
+        self.format = format
+        self.sequence_column = sequence_column
+        self.begin_column = begin_column
+        self.end_column = end_column
+        self.meta_char = meta_char
+        self.skip = skip
+        self.csi = csi
+        self.min_shift = min_shift
+        self.depth = depth
+        self.names = []
+        # For each sequence, a dictionary mapping bin numbers to a tuple of
+        # the linear offset (csi only) and a list of chunks, each a list of
+        # the start and end virtual offsets, plus the linear index (tbi only).
+        self._bins = []
+        self._linear = []
+        self._name_to_index = {}
+
+    def __repr__(self):
+        """Return a short summary of the index."""
+        return "<%s %s index of %i sequences>" % (
+            self.__class__.__name__,
+            "csi" if self.csi else "tbi",
+            len(self.names),
+        )
+
+    def _add_sequence(self, name, bins, linear):
+        """Add the index of a sequence (PRIVATE)."""
+        self._name_to_index[name] = len(self.names)
+        self.names.append(name)
+        self._bins.append(bins)
+        self._linear.append(linear)
+
+    def _interval(self, line):
+        """Return the sequence name, start and end of a line (PRIVATE).
+
+        The line should be bytes, and the start and end are returned as
+        zero-based half-open coordinates.
+        """
+        fields = line.rstrip(b"\r\n").split(b"\t")
+        try:
+            name = fields[self.sequence_column - 1]
+            beg = int(fields[self.begin_column - 1])
+        except (IndexError, ValueError):
+            raise ValueError(f"Failed to parse line {line!r}") from None
+        if self.format & _TBX_UCSC:
+            end = beg + 1
+        else:
+            beg -= 1
+            end = beg + 1
+        if beg < 0:
+            beg = 0
+        format = self.format & 0xFFFF
+        try:
+            if format == _TBX_VCF:
+                end = beg + len(fields[3])
+                if len(fields) > 7:
+                    for item in fields[7].split(b";"):
+                        if item.startswith(b"END="):
+                            end = int(item[4:])
+                            break
+            elif format == _TBX_SAM:
+                length = 0
+                number = 0
+                for c in fields[5]:
+                    if 48 <= c <= 57:  # digit
+                        number = number * 10 + c - 48
+                    else:
+                        if c in b"MDN=X":
+                            length += number
+                        number = 0
+                if length:
+                    end = beg + length
+            elif self.end_column:
+                end = int(fields[self.end_column - 1])
+        except (IndexError, ValueError):
+            raise ValueError(f"Failed to parse line {line!r}") from None
+        if end < 1:
+            end = 1
+        return name.decode(), beg, end
+
+    def chunks(self, name, start=0, end=None):
+        """Return a list of chunks of the file which may overlap a region.
+
+        Each chunk is given as a tuple of the start and end BGZF virtual
+        offsets, in the order they occur in the file. The region is given
+        using zero-based half-open coordinates; all lines in the file which
+        overlap the region are in these chunks, but the chunks may also
+        contain lines which do not overlap the region.
+        """
+        try:
+            index = self._name_to_index[name]
+        except KeyError:
+            return []
+        max_end = 1 << (self.min_shift + self.depth * 3)
+        if start < 0:
+            start = 0
+        if end is None or end > max_end:
+            end = max_end
+        if start >= end:
+            return []
+        bins = self._bins[index]
+        min_offset = self._min_offset(index, start)
+        chunks = []
+        for bin in _reg2bins(start, end, self.min_shift, self.depth):
+            try:
+                loffset, bin_chunks = bins[bin]
+            except KeyError:
+                continue
+            chunks.extend(chunk for chunk in bin_chunks if chunk[1] > min_offset)
+        chunks.sort()
+        # Merge overlapping chunks, so that no line is returned twice
+        merged = []
+        for chunk_start, chunk_end in chunks:
+            if merged and chunk_start <= merged[-1][1]:
+                if chunk_end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], chunk_end)
+            else:
+                merged.append((chunk_start, chunk_end))
+        return merged
+
+    def _min_offset(self, index, start):
+        """Return the virtual offset before which no line can overlap (PRIVATE)."""
+        if not self.csi:
+            linear = self._linear[index]
+            if not linear:
+                return 0
+            window = start >> self.min_shift
+            if window >= len(linear):
+                window = len(linear) - 1
+            return linear[window]
+        # The csi format stores the linear offset in each bin instead; use
+        # the lowest level bin at or to the left of the start position.
+        bins = self._bins[index]
+        bin = _bin_first(self.depth) + (start >> self.min_shift)
+        while bin:
+            if bin in bins:
+                return bins[bin][0]
+            first = (_bin_parent(bin) << 3) + 1
+            if bin > first:
+                bin -= 1
+            else:
+                bin = _bin_parent(bin)
+        if 0 in bins:
+            return bins[0][0]
+        return 0
+
+    def _aux(self):
+        """Return the tabix header fields and sequence names as bytes (PRIVATE)."""
+        names = b"".join(name.encode() + b"\0" for name in self.names)
+        return (
+            struct.pack(
+                "<7i",
+                self.format,
+                self.sequence_column,
+                self.begin_column,
+                self.end_column,
+                ord(self.meta_char),
+                self.skip,
+                len(names),
+            )
+            + names
+        )
+
+    def write(self, filename):
+        """Write the index to a BGZF compressed .tbi or .csi file."""
+        aux = self._aux()
+        if self.csi:
+            data = [b"CSI\1", struct.pack("<3i", self.min_shift, self.depth, len(aux))]
+            data.extend([aux, struct.pack("<i", len(self.names))])
+        else:
+            data = [b"TBI\1", struct.pack("<i", len(self.names)), aux]
+        for bins, linear in zip(self._bins, self._linear):
+            data.append(struct.pack("<i", len(bins)))
+            for bin in sorted(bins):
+                loffset, chunks = bins[bin]
+                if self.csi:
+                    data.append(struct.pack("<IQi", bin, loffset, len(chunks)))
+                else:
+                    data.append(struct.pack("<Ii", bin, len(chunks)))
+                for chunk in chunks:
+                    data.append(struct.pack("<QQ", *chunk))
+            if not self.csi:
+                data.append(struct.pack("<i%iQ" % len(linear), len(linear), *linear))
+        # Number of unplaced records, always zero for tabix
+        data.append(struct.pack("<Q", 0))
+        with bgzf.BgzfWriter(filename, "wb") as handle:
+            handle.write(b"".join(data))
+
+
+def read_index(filename):
+    """Read a tabix index (.tbi or .csi file), returns a TabixIndex object."""
+    with gzip.open(filename, "rb") as handle:
+        data = handle.read()
+    magic = data[:4]
+    if magic == b"TBI\1":
+        csi = False
+        min_shift = _MIN_SHIFT
+        depth = _TBI_DEPTH
+        (n_ref,) = struct.unpack_from("<i", data, 4)
+        offset = 8
+    elif magic == b"CSI\1":
+        csi = True
+        min_shift, depth, l_aux = struct.unpack_from("<3i", data, 4)
+        offset = 16
+        if l_aux < 28:
+            raise ValueError("This csi index does not have the tabix header fields")
+    else:
+        raise ValueError(f"Not a tabix index file, magic bytes {magic!r}")
+    values = struct.unpack_from("<7i", data, offset)
+    format, sequence_column, begin_column, end_column, meta, skip, l_nm = values
+    offset += 28
+    names = data[offset : offset + l_nm].split(b"\0")[:-1]
+    offset += l_nm
+    if csi:
+        offset = 16 + l_aux
+        (n_ref,) = struct.unpack_from("<i", data, offset)
+        offset += 4
+    if len(names) != n_ref:
+        raise ValueError(f"Index has {len(names)} sequence names but {n_ref} indexes")
+    index = TabixIndex(
+        format,
+        sequence_column,
+        begin_column,
+        end_column,
+        chr(meta),
+        skip,
+        csi,
+        min_shift,
+        depth,
+    )
+    for name in names:
+        (n_bin,) = struct.unpack_from("<i", data, offset)
+        offset += 4
+        bins = {}
+        for i in range(n_bin):
+            if csi:
+                bin, loffset, n_chunk = struct.unpack_from("<IQi", data, offset)
+                offset += 16
+            else:
+                bin, n_chunk = struct.unpack_from("<Ii", data, offset)
+                loffset = 0
+                offset += 8
+            values = struct.unpack_from("<%iQ" % (2 * n_chunk), data, offset)
+            offset += 16 * n_chunk
+            chunks = [list(values[j : j + 2]) for j in range(0, 2 * n_chunk, 2)]
+            bins[bin] = loffset, chunks
+        if csi:
+            linear = []
+        else:
+            (n_intv,) = struct.unpack_from("<i", data, offset)
+            offset += 4
+            linear = list(struct.unpack_from("<%iQ" % n_intv, data, offset))
+            offset += 8 * n_intv
+        index._add_sequence(name.decode(), bins, linear)
+    return index
+
+
+def _guess_preset(filename):
+    """Guess the preset from the file extension (PRIVATE)."""
+    root, extension = os.path.splitext(filename)
+    if extension.lower() in (".gz", ".bgz"):
+        root, extension = os.path.splitext(root)
+    try:
+        return _EXTENSIONS[extension.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Cannot guess the file format from the name {filename!r}, "
+            "please give the preset or columns"
+        ) from None
+
+
+def build_index(
+    filename,
+    preset=None,
+    sequence_column=None,
+    begin_column=None,
+    end_column=None,
+    meta_char=None,
+    skip=None,
+    zero_based=None,
+    csi=False,
+    min_shift=_MIN_SHIFT,
+    index_filename=None,
+):
+    """Index a BGZF compressed file sorted by position, returns a TabixIndex.
+
+    Arguments:
+     - filename - the BGZF compressed file to index.
+     - preset - one of "bed", "gff", "vcf" or "sam", giving the default
+       settings for these file formats. If neither the preset nor the
+       columns are given, the preset is guessed from the file extension.
+     - sequence_column, begin_column, end_column - column numbers, starting
+       from one as in the tabix command line tool, giving the sequence name
+       and the start and end positions (overriding the preset). If there is
+       no end column use zero, and each line is taken to be a single
+       position.
+     - meta_char - lines starting with this character are header lines
+       (default "#").
+     - skip - number of lines to skip at the start of the file (default 0).
+     - zero_based - if True, the start positions are zero-based and the end
+       positions exclusive (as in BED files), rather than one-based with
+       inclusive end positions (as in GFF files).
+     - csi - if True, write the csi index format, rather than tbi.
+     - min_shift - for the csi index format, the size in bits of the lowest
+       level bins (default 14, i.e. 16kb).
+     - index_filename - name of the index file to write, by default the
+       filename with the extension ".tbi" or ".csi" added. Use False to
+       return the index without writing it to a file.
+
+    The lines must be sorted by sequence name (in any order, but with all
+    lines for each sequence together) and then by start position, otherwise
+    a ValueError is raised.
+    """
+    if preset is None and sequence_column is None and begin_column is None:
+        preset = _guess_preset(filename)
+    if preset is None:
+        values = (_TBX_GENERIC, 1, 2, 0, "#", 0)
+    else:
+        try:
+            values = _PRESETS[preset.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown preset {preset!r}") from None
+    format, seq_col, beg_col, end_col, meta, skip_lines = values
+    if sequence_column is not None:
+        seq_col = sequence_column
+    if begin_column is not None:
+        beg_col = begin_column
+    if end_column is not None:
+        end_col = end_column
+    if meta_char is not None:
+        meta = meta_char
+    if skip is not None:
+        skip_lines = skip
+    if zero_based is not None:
+        format = (format & 0xFFFF) | (_TBX_UCSC if zero_based else 0)
+    if len(meta) != 1:
+        raise ValueError(f"meta_char should be a single character, not {meta!r}")
+    index = TabixIndex(
+        format, seq_col, beg_col, end_col, meta, skip_lines, csi, min_shift
+    )
+    min_shift = index.min_shift
+    depth = index.depth
+    max_end = 1 << (min_shift + depth * 3)
+    meta_bin = _meta_bin(depth)
+    meta_byte = meta.encode()
+    current = None
+    bins = linear = None
+    first_offset = last_offset = last_beg = count = 0
+    with bgzf.BgzfReader(filename, "rb") as handle:
+        line_number = 0
+        offset = handle.tell()
+        while True:
+            line = handle.readline()
+            if not line:
+                break
+            end_offset = handle.tell()
+            line_number += 1
+            if (
+                line_number <= skip_lines
+                or line.startswith(meta_byte)
+                or not line.strip()
+            ):
+                offset = end_offset
+                continue
+            name, beg, end = index._interval(line)
+            if end > max_end:
+                raise ValueError(
+                    f"Position {end} on line {line_number} is too large for "
+                    "this index format, try using csi with a larger min_shift"
+                )
+            if name != current:
+                if name in index._name_to_index:
+                    raise ValueError(
+                        f"Lines for sequence {name!r} are not together "
+                        f"(line {line_number}), please sort the file"
+                    )
+                if current is not None:
+                    bins[meta_bin] = 0, [[first_offset, last_offset], [count, 0]]
+                    _finish_sequence(index, current, bins, linear, first_offset)
+                current = name
+                bins = {}
+                linear = []
+                first_offset = offset
+                last_beg = 0
+                count = 0
+            elif beg < last_beg:
+                raise ValueError(
+                    f"Line {line_number} is not sorted by position, please sort "
+                    "the file"
+                )
+            last_beg = beg
+            count += 1
+            bin = _reg2bin(beg, end, min_shift, depth)
+            try:
+                chunks = bins[bin][1]
+            except KeyError:
+                bins[bin] = 0, [[offset, end_offset]]
+            else:
+                if chunks[-1][1] == offset:
+                    chunks[-1][1] = end_offset
+                else:
+                    chunks.append([offset, end_offset])
+            last_window = (end - 1) >> min_shift
+            if last_window >= len(linear):
+                linear.extend([None] * (last_window + 1 - len(linear)))
+            for window in range(beg >> min_shift, last_window + 1):
+                if linear[window] is None:
+                    linear[window] = offset
+            last_offset = offset = end_offset
+    if current is not None:
+        bins[meta_bin] = 0, [[first_offset, last_offset], [count, 0]]
+        _finish_sequence(index, current, bins, linear, first_offset)
+    if index_filename is None:
+        index_filename = os.fspath(filename) + (".csi" if csi else ".tbi")
+    if index_filename is not False:
+        index.write(index_filename)
+    return index
+
+
+def _finish_sequence(index, name, bins, linear, first_offset):
+    """Fill in the linear index and add the sequence to the index (PRIVATE)."""
+    # Windows with no lines use the offset of the following lines, or the
+    # first line of the sequence for windows before the first line.
+    previous = first_offset
+    for i, value in enumerate(linear):
+        if value is None:
+            linear[i] = previous
+        else:
+            previous = value
+    if index.csi:
+        n_bins = _bin_first(index.depth + 1)
+        for bin, (loffset, chunks) in bins.items():
+            if bin < n_bins:
+                bottom = _bin_bottom(bin, index.depth)
+                loffset = linear[bottom] if bottom < len(linear) else 0
+            bins[bin] = loffset, chunks
+        linear = []
+    _compress_bins(bins, index.depth)
+    index._add_sequence(name, bins, linear)
+
+
+def _compress_bins(bins, depth):
+    """Merge small bins into their parent and join nearby chunks (PRIVATE).
+
+    This follows compress_binning in htslib, so that the index is the same as
+    made by the tabix tool. Starting from the lowest level, a bin whose chunks
+    span less than 64kb of compressed data is merged into its parent bin, if
+    the parent exists. Chunks in each bin starting in the BGZF block where
+    the previous chunk ends are then joined.
+    """
+    n_bins = _bin_first(depth + 1)
+    for level in range(depth, 0, -1):
+        first = _bin_first(level)
+        last = _bin_first(level + 1)
+        for bin in [bin for bin in bins if first <= bin < last]:
+            chunks = bins[bin][1]
+            chunks.sort()
+            if (chunks[-1][1] >> 16) - (chunks[0][0] >> 16) < 0x10000:
+                parent = _bin_parent(bin)
+                if parent in bins:
+                    bins[parent][1].extend(chunks)
+                    del bins[bin]
+    for bin, (loffset, chunks) in bins.items():
+        if bin >= n_bins:
+            continue
+        chunks.sort()
+        joined = [chunks[0]]
+        for chunk in chunks[1:]:
+            previous = joined[-1]
+            if previous[1] >> 16 >= chunk[0] >> 16:
+                previous[1] = max(previous[1], chunk[1])
+            else:
+                joined.append(chunk)
+        chunks[:] = joined
+
+
+class TabixReader:
+    """Random access to a BGZF compressed file using a tabix index.
+
+    Arguments:
+     - filename - the BGZF compressed file.
+     - index_filename - the tabix index file, by default the filename with
+       ".tbi" added (or if that does not exist, ".csi").
+
+    Use the query method to find the lines overlapping a region.
+    """
+
+    def __init__(self, filename, index_filename=None):
+        """Open the file and load its index."""
+        if index_filename is None:
+            filename = os.fspath(filename)
+            for extension in (".tbi", ".csi"):
+                if os.path.isfile(filename + extension):
+                    index_filename = filename + extension
+                    break
+            else:
+                raise ValueError(f"No tabix index (.tbi or .csi) found for {filename}")
+        self.index = read_index(index_filename)
+        self._handle = bgzf.BgzfReader(filename, "rb")
+
+    @property
+    def contigs(self):
+        """List of the sequence names in the file."""
+        return list(self.index.names)
+
+    def query(self, name, start=0, end=None):
+        """Yield the lines overlapping a region as strings.
+
+        Arguments:
+         - name - the sequence name (chromosome).
+         - start, end - the region, as zero-based half-open coordinates
+           (i.e. as in Python slicing). By default, the whole sequence.
+
+        The lines are returned without their trailing newline. Nothing is
+        returned if the sequence name is not in the index.
+        """
+        index = self.index
+        handle = self._handle
+        if end is None:
+            end = 1 << (index.min_shift + index.depth * 3)
+        meta_byte = index.meta_char.encode()
+        for chunk_start, chunk_end in index.chunks(name, start, end):
+            handle.seek(chunk_start)
+            while handle.tell() < chunk_end:
+                line = handle.readline()
+                if not line:
+                    break
+                if line.startswith(meta_byte):
+                    continue
+                line_name, line_start, line_end = index._interval(line)
+                if line_name != name or line_start >= end:
+                    # The lines are sorted, so nothing else can overlap
+                    return
+                if line_end > start:
+                    yield line.rstrip(b"\r\n").decode()
+
+    def close(self):
+        """Close the file."""
+        self._handle.close()
+
+    def __enter__(self):
+        """Open a file operable with WITH statement."""
+        return self
+
+    def __exit__(self, type, value, traceback):
+        """Close a file with WITH statement."""
+        self.close()
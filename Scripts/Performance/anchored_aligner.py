@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Time mapping simulated reads to a reference with the AnchoredAligner.
+
+Usage: anchored_aligner.py REFERENCE_LENGTH READS READ_LENGTH ERROR_RATE
+
+e.g. anchored_aligner.py 1000000 1000 1000 0.05
+
+Reads of the given length are sampled from both strands of a random reference
+sequence, with substitutions, insertions, and deletions at the given rate.
+The script reports the time to index the reference, the time to map the reads,
+and the number of reads whose best alignment is at the correct position. For
+comparison, the time to calculate the local alignment score of a single read
+against the complete reference with a PairwiseAligner is shown.
+"""
+
+import random
+import resource
+import sys
+import time
+
+from Bio import Align
+from Bio.Seq import reverse_complement
+from Bio.Seq import Seq
+from Bio.SeqRecord import SeqRecord
+
+if len(sys.argv) != 5:
+    sys.exit(__doc__)
+
+reference_length = int(sys.argv[1])
+number = int(sys.argv[2])
+read_length = int(sys.argv[3])
+error_rate = float(sys.argv[4])
+
+random.seed(0)
+reference = "".join(random.choice("ACGT") for i in range(reference_length))
+reads = []
+positions = []
+for i in range(number):
+    position = random.randrange(reference_length - read_length)
+    read = []
+    for letter in reference[position : position + read_length]:
+        edit = random.random()
+        if edit < error_rate / 3:
+            continue  # deletion
+        elif edit < 2 * error_rate / 3:
+            read.append(random.choice("ACGT"))  # insertion
+            read.append(letter)
+        elif edit < error_rate:
+            read.append(random.choice("ACGT"))  # substitution
+        else:
+            read.append(letter)
+    read = "".join(read)
+    if random.random() < 0.5:
+        read = reverse_complement(read)
+    reads.append(SeqRecord(Seq(read), id="read%d" % i))
+    positions.append(position)
+
+start_time = time.time()
+aligner = Align.AnchoredAligner(SeqRecord(Seq(reference), id="reference"))
+print("Indexing the reference: %0.2f seconds" % (time.time() - start_time))
+
+start_time = time.time()
+alignments = aligner.map(reads)
+seconds = time.time() - start_time
+print(
+    "Mapping %d reads: %0.2f seconds (%0.1f ms per read)"
+    % (number, seconds, 1000 * seconds / number)
+)
+correct = 0
+for alignment in alignments:
+    if alignment.flag & 0x900:  # secondary or supplementary
+        continue
+    i = int(alignment.query.id[4:])
+    if abs(alignment.coordinates[0, 0] - positions[i]) < 50:
+        correct += 1
+print("Reads mapped to the correct position: %d of %d" % (correct, number))
+print(
+    "Maximum resident set size: %d MB"
+    % (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024)
+)
+
+pairwise_aligner = Align.PairwiseAligner(
+    mode="local",
+    match_score=2,
+    mismatch_score=-4,
+    open_gap_score=-6,
+    extend_gap_score=-2,
+)
+start_time = time.time()
+score = pairwise_aligner.score(reference, reads[0].seq)
+print(
+    "Local alignment score of one read to the full reference: %0.2f seconds"
+    % (time.time() - start_time)
+)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Compare serial and threaded BGZF compression and decompression.
+
+Usage: bgzf_threads.py FILENAME [THREADS ...]
+
+e.g. bgzf_threads.py reads.fastq 2 4 8
+
+The (uncompressed) input file is written to a temporary BGZF file, which is
+then read back in, using Bio.bgzf with each number of threads in turn.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from Bio import bgzf
+
+if len(sys.argv) < 2:
+    sys.exit(__doc__)
+
+filename = sys.argv[1]
+thread_counts = [int(value) for value in sys.argv[2:]] or [2, 4]
+
+with open(filename, "rb") as handle:
+    data = handle.read()
+
+fd, bgzf_filename = tempfile.mkstemp(suffix=".bgz")
+os.close(fd)
+try:
+    for threads in [None] + thread_counts:
+        print("Serial" if threads is None else "%i threads" % threads)
+
+        start_time = time.time()
+        with bgzf.BgzfWriter(bgzf_filename, "wb", threads=threads) as handle:
+            for start in range(0, len(data), 1000000):
+                handle.write(data[start : start + 1000000])
+        elapsed_time = time.time() - start_time
+        print(
+            "\tCompressed %i bytes in %0.2f seconds, %0.1f MB per second"
+            % (len(data), elapsed_time, len(data) / elapsed_time / 1e6)
+        )
+
+        start_time = time.time()
+        size = 0
+        with bgzf.BgzfReader(bgzf_filename, "rb", threads=threads) as handle:
+            while True:
+                block = handle.read(1000000)
+                if not block:
+                    break
+                size += len(block)
+        elapsed_time = time.time() - start_time
+        assert size == len(data)
+        print(
+            "\tDecompressed %i bytes in %0.2f seconds, %0.1f MB per second"
+            % (size, elapsed_time, size / elapsed_time / 1e6)
+        )
+finally:
+    os.remove(bgzf_filename)
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Compare parsing whole GenBank or EMBL records with only their headers.
+
+Usage: genbank_header_only.py FILENAME [FORMAT]
+
+e.g. genbank_header_only.py refseq.genomic.gbff genbank
+"""
+
+import sys
+import time
+
+from Bio import SeqIO
+
+if len(sys.argv) < 2:
+    sys.exit(__doc__)
+
+filename = sys.argv[1]
+fmt = sys.argv[2] if len(sys.argv) > 2 else "genbank"
+
+for name, kwargs in (
+    ("Whole records", {}),
+    ("Whole records, lazy features", {"lazy_features": True}),
+    ("Headers only", {"header_only": True}),
+):
+    start_time = time.time()
+    num_records = 0
+    num_bases = 0
+    for record in SeqIO.parse(filename, fmt, **kwargs):
+        num_records += 1
+        num_bases += len(record)
+    elapsed_time = time.time() - start_time
+    print(name)
+    print(
+        "\tDid %i records (%i bases) in %0.2f seconds for\n\t%f records per second"
+        % (num_records, num_bases, elapsed_time, num_records / elapsed_time)
+    )
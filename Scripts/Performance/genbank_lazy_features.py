@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Compare parsing GenBank or EMBL files with and without lazy features.
+
+Usage: genbank_lazy_features.py FILENAME [FORMAT]
+
+e.g. genbank_lazy_features.py NC_000913.gbk genbank
+"""
+
+import sys
+import time
+import tracemalloc
+
+from Bio import SeqIO
+
+if len(sys.argv) < 2:
+    sys.exit(__doc__)
+
+filename = sys.argv[1]
+fmt = sys.argv[2] if len(sys.argv) > 2 else "genbank"
+
+# Parse the first record once, so the timings below exclude any imports
+next(SeqIO.parse(filename, fmt))
+
+for name, lazy, get_features in (
+    ("All features", False, lambda record: record.features),
+    ("Lazy, no features", True, lambda record: []),
+    ("Lazy, CDS features", True, lambda record: record.features.of_type("CDS")),
+    ("Lazy, all features", True, lambda record: record.features),
+):
+    tracemalloc.start()
+    start_time = time.time()
+    records = list(SeqIO.parse(filename, fmt, lazy_features=lazy))
+    num_features = sum(len(get_features(record)) for record in records)
+    elapsed_time = time.time() - start_time
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(name)
+    print(
+        "\t%i records, %i features in %0.2f seconds, %0.1f MB in use"
+        % (len(records), num_features, elapsed_time, current / 1e6)
+    )
+    del records
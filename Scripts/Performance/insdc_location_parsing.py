@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Time parsing the feature locations of a GenBank or EMBL file.
+
+Usage: insdc_location_parsing.py FILENAME [FORMAT] [REPEATS]
+
+e.g. insdc_location_parsing.py GCF_000005845.2_ASM584v2_genomic.gbff genbank
+
+The location strings are collected by parsing the file once, then parsed
+again with the general regular expression based parser, and with
+Location.fromstring which has a fast path for plain ranges and joins and
+remembers the other location strings it has seen.
+"""
+
+import sys
+import time
+import warnings
+
+from Bio import BiopythonParserWarning
+from Bio import SeqIO
+from Bio.SeqFeature import Location
+
+if len(sys.argv) < 2:
+    sys.exit(__doc__)
+
+filename = sys.argv[1]
+fmt = sys.argv[2] if len(sys.argv) > 2 else "genbank"
+repeats = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+
+locations = []
+fromstring = Location.fromstring
+
+
+def record_location(text, length=None, circular=False, stranded=True):
+    """Remember the arguments, then parse the location as usual."""
+    locations.append((text, length, circular, stranded))
+    return fromstring(text, length, circular, stranded)
+
+
+Location.fromstring = record_location
+try:
+    for record in SeqIO.parse(filename, fmt):
+        pass
+finally:
+    Location.fromstring = fromstring
+
+print(
+    "%i location strings, %i distinct"
+    % (len(locations), len({text for text, _, _, _ in locations}))
+)
+warnings.simplefilter("ignore", BiopythonParserWarning)
+for name, parser in (
+    ("General parser", Location._fromstring),
+    ("Location.fromstring", Location.fromstring),
+):
+    start_time = time.time()
+    for _ in range(repeats):
+        for args in locations:
+            parser(*args)
+    elapsed_time = time.time() - start_time
+    print(name)
+    print(
+        "\tParsed %i locations in %0.2f seconds for\n\t%f locations per second"
+        % (
+            repeats * len(locations),
+            elapsed_time,
+            repeats * len(locations) / elapsed_time,
+        )
+    )
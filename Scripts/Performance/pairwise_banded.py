@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Time banded and X-drop alignments of two long, similar sequences.
+
+Usage: pairwise_banded.py LENGTH BAND_WIDTH XDROP
+
+e.g. pairwise_banded.py 100000 100 50
+
+A random DNA sequence of the given length is aligned to a copy with about
+one edit per 300 letters, globally within a band of the given width, and
+locally with the given X-drop threshold. The full dynamic programming matrix
+would be LENGTH x LENGTH cells.
+"""
+
+import random
+import resource
+import sys
+import time
+
+from Bio import Align
+
+if len(sys.argv) != 4:
+    sys.exit(__doc__)
+
+length = int(sys.argv[1])
+band_width = int(sys.argv[2])
+xdrop = float(sys.argv[3])
+
+random.seed(0)
+target = "".join(random.choice("ACGT") for i in range(length))
+query = list(target)
+for i in range(length // 300):
+    position = random.randrange(len(query))
+    edit = random.random()
+    if edit < 1 / 3:
+        del query[position]
+    elif edit < 2 / 3:
+        query.insert(position, random.choice("ACGT"))
+    else:
+        query[position] = random.choice("ACGT")
+query = "".join(query)
+
+aligner = Align.PairwiseAligner(
+    match_score=1, mismatch_score=-2, open_gap_score=-3, extend_gap_score=-1
+)
+
+aligner.band_width = band_width
+start_time = time.time()
+score = aligner.score(target, query)
+print("Banded score %.1f: %0.2f seconds" % (score, time.time() - start_time))
+start_time = time.time()
+alignment = aligner.align(target, query)[0]
+print("Banded alignment: %0.2f seconds" % (time.time() - start_time))
+
+aligner.band_width = None
+aligner.mode = "local"
+aligner.xdrop = xdrop
+start_time = time.time()
+alignment = aligner.align(target, query)[0]
+print(
+    "X-drop alignment with score %.1f: %0.2f seconds"
+    % (alignment.score, time.time() - start_time)
+)
+print(
+    "Maximum resident set size: %d MB"
+    % (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024)
+)
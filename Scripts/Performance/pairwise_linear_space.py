@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Time global alignments in linear space for increasing sequence lengths.
+
+Usage: pairwise_linear_space.py LENGTH [LENGTH ...]
+
+e.g. pairwise_linear_space.py 1000 2000 5000 10000 20000
+
+For each length, a random DNA sequence is aligned to a copy with about one
+edit per 20 letters, with and without linear_space. Each alignment is run in
+a separate process, so that the peak memory use of each can be reported.
+Without linear_space, the memory needed grows with the square of the length,
+so only use lengths for which this fits in memory.
+"""
+
+import multiprocessing
+import random
+import resource
+import sys
+import time
+
+from Bio import Align
+
+
+def make_sequences(length):
+    """Return a random sequence and a copy with random edits."""
+    random.seed(length)
+    target = "".join(random.choice("ACGT") for i in range(length))
+    query = list(target)
+    for i in range(length // 20):
+        position = random.randrange(len(query))
+        edit = random.random()
+        if edit < 1 / 3:
+            del query[position]
+        elif edit < 2 / 3:
+            query.insert(position, random.choice("ACGT"))
+        else:
+            query[position] = random.choice("ACGT")
+    return target, "".join(query)
+
+
+def run(length, linear_space, queue):
+    """Align two sequences of about the given length, report to the queue."""
+    target, query = make_sequences(length)
+    aligner = Align.PairwiseAligner(
+        match_score=1, mismatch_score=-2, open_gap_score=-3, extend_gap_score=-1
+    )
+    aligner.linear_space = linear_space
+    start_time = time.time()
+    alignment = aligner.align(target, query)[0]
+    seconds = time.time() - start_time
+    megabytes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024
+    queue.put((alignment.score, seconds, megabytes))
+
+
+if len(sys.argv) < 2:
+    sys.exit(__doc__)
+
+print("length   linear_space  score     seconds  max RSS (MB)")
+queue = multiprocessing.Queue()
+for length in map(int, sys.argv[1:]):
+    for linear_space in (False, True):
+        process = multiprocessing.Process(
+            target=run, args=(length, linear_space, queue)
+        )
+        process.start()
+        score, seconds, megabytes = queue.get()
+        process.join()
+        print(
+            "%-8d %-13s %-9.1f %-8.2f %d"
+            % (length, linear_space, score, seconds, megabytes)
+        )
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Time scoring one protein against many with PairwiseAligner.score_many.
+
+Usage: pairwise_score_many.py THREADS FASTA_FILENAME
+
+e.g. pairwise_score_many.py 8 uniprot_sprot.fasta
+
+The first record in the file is used as the query, and scored against all
+the records (using BLASTP scoring in local mode), first calling the score
+method for each target, then using score_many with and without threads.
+"""
+
+import sys
+import time
+
+from Bio import Align
+from Bio import SeqIO
+
+if len(sys.argv) != 3:
+    sys.exit(__doc__)
+
+threads = int(sys.argv[1])
+targets = [str(record.seq) for record in SeqIO.parse(sys.argv[2], "fasta")]
+query = targets[0]
+
+aligner = Align.PairwiseAligner(scoring="blastp", mode="local")
+
+start_time = time.time()
+expected = [aligner.score(target, query) for target in targets]
+print("Calling score: %0.2f seconds" % (time.time() - start_time))
+
+for count in sorted({1, threads}):
+    start_time = time.time()
+    scores = aligner.score_many(query, targets, threads=count)
+    print(
+        "Calling score_many with %i threads: %0.2f seconds"
+        % (count, time.time() - start_time)
+    )
+    assert list(scores) == expected
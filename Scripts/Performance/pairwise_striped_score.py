@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Time the vectorized PairwiseAligner score calculation.
+
+Usage: pairwise_striped_score.py MODE FASTA_FILENAME
+
+e.g. pairwise_striped_score.py local uniprot_sprot.fasta
+
+The first record in the file is used as the query, and scored against all
+the records with BLOSUM62 and affine gap scores, once with the integer matrix
+(using the vectorized code) and once with the matrix shifted by a tiny amount
+(which forces the scalar code to be used).
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from Bio import Align
+from Bio import SeqIO
+from Bio.Align import substitution_matrices
+
+if len(sys.argv) != 3:
+    sys.exit(__doc__)
+
+mode = sys.argv[1]
+targets = [str(record.seq) for record in SeqIO.parse(sys.argv[2], "fasta")]
+query = targets[0]
+
+blosum62 = substitution_matrices.load("BLOSUM62")
+shifted = substitution_matrices.Array(
+    alphabet=blosum62.alphabet, dims=2, data=np.array(blosum62) + 1e-9
+)
+
+results = {}
+for name, matrix in (("vectorized", blosum62), ("scalar", shifted)):
+    aligner = Align.PairwiseAligner(
+        mode=mode,
+        substitution_matrix=matrix,
+        open_gap_score=-11,
+        extend_gap_score=-1,
+    )
+    start_time = time.time()
+    results[name] = aligner.score_many(query, targets)
+    print("Using the %s code: %0.2f seconds" % (name, time.time() - start_time))
+
+assert np.allclose(results["vectorized"], results["scalar"])
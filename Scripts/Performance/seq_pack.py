@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Compare the memory use and speed of packed and unpacked Seq objects.
+
+Usage: seq_pack.py FILENAME [FORMAT]
+
+e.g. seq_pack.py chr21.fa fasta
+"""
+
+import sys
+import time
+
+from Bio import SeqIO
+
+if len(sys.argv) < 2:
+    sys.exit(__doc__)
+
+filename = sys.argv[1]
+fmt = sys.argv[2] if len(sys.argv) > 2 else "fasta"
+
+for record in SeqIO.parse(filename, fmt):
+    seq = record.seq
+    start_time = time.time()
+    packed = seq.pack()
+    elapsed_time = time.time() - start_time
+    print(f"{record.id}: {len(seq)} letters")
+    if packed is seq:
+        print("\tNot packed")
+        continue
+    print(
+        "\tPacked into %i bytes in %0.2f seconds" % (packed._data._nbytes, elapsed_time)
+    )
+    for name, function in (
+        ("count('G')", lambda s: s.count("G")),
+        ("count('GAATTC')", lambda s: s.count("GAATTC")),
+        ("find('TTAGGGTTAGGG')", lambda s: s.find("TTAGGGTTAGGG")),
+        ("reverse_complement()", lambda s: s.reverse_complement()),
+    ):
+        timings = []
+        for s in (seq, packed):
+            start_time = time.time()
+            function(s)
+            timings.append(time.time() - start_time)
+        print("\t%s: %0.3f seconds unpacked, %0.3f seconds packed" % (name, *timings))
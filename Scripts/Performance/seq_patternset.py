@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Time searching a random sequence for many random patterns with PatternSet.
+
+Usage: seq_patternset.py [LENGTH [PATTERNS [PATTERN_LENGTH [MISMATCHES]]]]
+
+e.g. seq_patternset.py 10000000 5000 20 0
+"""
+
+import random
+import sys
+import time
+
+from Bio.Seq import PatternSet
+from Bio.Seq import Seq
+
+length = int(sys.argv[1]) if len(sys.argv) > 1 else 10000000
+number = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+pattern_length = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+mismatches = int(sys.argv[4]) if len(sys.argv) > 4 else 0
+
+rng = random.Random(0)
+sequence = Seq("".join(rng.choices("ACGT", k=length)))
+patterns = ["".join(rng.choices("ACGT", k=pattern_length)) for i in range(number)]
+
+start_time = time.time()
+patternset = PatternSet(patterns, mismatches=mismatches)
+elapsed_time = time.time() - start_time
+print("Compiled %i patterns in %0.2f seconds" % (number, elapsed_time))
+
+start_time = time.time()
+count = sum(1 for match in patternset.search(sequence))
+elapsed_time = time.time() - start_time
+print("Found %i matches in %i letters in %0.2f seconds" % (count, length, elapsed_time))
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Compare translate_many and reverse_complement_many with per-sequence calls.
+
+Usage: seq_translate_many.py [NUMBER [LENGTH]]
+
+e.g. seq_translate_many.py 100000 300
+"""
+
+import random
+import sys
+import time
+
+from Bio.Seq import reverse_complement
+from Bio.Seq import reverse_complement_many
+from Bio.Seq import translate
+from Bio.Seq import translate_many
+
+number = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+length = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+
+rng = random.Random(0)
+sequences = ["".join(rng.choices("ACGT", k=length)) for i in range(number)]
+
+for name, function in (
+    ("translate", lambda: [translate(s) for s in sequences]),
+    ("translate_many", lambda: translate_many(sequences)),
+    ("reverse_complement", lambda: [reverse_complement(s) for s in sequences]),
+    ("reverse_complement_many", lambda: reverse_complement_many(sequences)),
+):
+    start_time = time.time()
+    function()
+    elapsed_time = time.time() - start_time
+    print(name)
+    print(
+        "\tDid %i sequences of length %i in %0.2f seconds"
+        % (number, length, elapsed_time)
+    )
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Compare the memory used by the features of a GenBank or EMBL file.
+
+Usage: seqfeature_memory.py FILENAME [FORMAT]
+
+e.g. seqfeature_memory.py refseq.genomic.gbff genbank
+"""
+
+import sys
+import time
+import tracemalloc
+
+from Bio import SeqIO
+from Bio.SeqFeature import FeatureTable
+
+if len(sys.argv) < 2:
+    sys.exit(__doc__)
+
+filename = sys.argv[1]
+fmt = sys.argv[2] if len(sys.argv) > 2 else "genbank"
+
+tracemalloc.start()
+start_time = time.time()
+features = []
+for record in SeqIO.parse(filename, fmt):
+    features.extend(record.features)
+    record.features = []
+elapsed_time = time.time() - start_time
+current, peak = tracemalloc.get_traced_memory()
+print("List of SeqFeature objects")
+print(
+    "\tParsed %i features in %0.2f seconds using %0.1f MB"
+    % (len(features), elapsed_time, current / 1024**2)
+)
+
+start_time = time.time()
+table = FeatureTable(features)
+del features
+elapsed_time = time.time() - start_time
+current, peak = tracemalloc.get_traced_memory()
+print("FeatureTable")
+print(
+    "\tConverted %i features in %0.2f seconds using %0.1f MB"
+    % (len(table), elapsed_time, current / 1024**2)
+)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Compare SeqIO.convert with SeqIO.parse and SeqIO.write for format pairs.
+
+Usage: seqio_convert.py FILENAME FORMAT [FILENAME FORMAT ...]
+
+e.g. seqio_convert.py reads.fastq fastq genome.gbk genbank proteins.fasta fasta
+
+Each input file is converted to every output format SeqIO.convert can handle
+from it, and a table of the times taken is printed.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from Bio import SeqIO
+
+if len(sys.argv) < 3 or len(sys.argv) % 2 == 0:
+    sys.exit(__doc__)
+
+inputs = list(zip(sys.argv[1::2], sys.argv[2::2]))
+
+print(
+    "%-30s %-15s %-12s %10s %10s %8s"
+    % ("Input file", "From", "To", "Write (s)", "Convert (s)", "Speedup")
+)
+with tempfile.TemporaryDirectory() as directory:
+    output = os.path.join(directory, "output")
+    for filename, in_format in inputs:
+        for pair in sorted(SeqIO._converter):
+            if pair[0] != in_format:
+                continue
+            out_format = pair[1]
+            start_time = time.time()
+            SeqIO.write(SeqIO.parse(filename, in_format), output, out_format)
+            write_time = time.time() - start_time
+            start_time = time.time()
+            SeqIO.convert(filename, in_format, output, out_format)
+            convert_time = time.time() - start_time
+            print(
+                "%-30s %-15s %-12s %10.2f %10.2f %7.1fx"
+                % (
+                    os.path.basename(filename)[:30],
+                    in_format,
+                    out_format,
+                    write_time,
+                    convert_time,
+                    write_time / convert_time,
+                )
+            )
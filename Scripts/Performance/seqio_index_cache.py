@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Time repeated look ups in a SeqIO.index dictionary with a record cache.
+
+Usage: seqio_index_cache.py FORMAT FILENAME [CACHE_SIZE [LOOKUPS]]
+
+e.g. seqio_index_cache.py fasta uniprot_sprot.fasta 10000 100000
+
+The keys looked up are drawn at random from the first CACHE_SIZE records,
+imitating repeated queries for a set of frequently used records.
+"""
+
+import random
+import sys
+import time
+
+from Bio import SeqIO
+
+if len(sys.argv) < 3:
+    sys.exit(__doc__)
+
+fmt = sys.argv[1]
+filename = sys.argv[2]
+cache_size = int(sys.argv[3]) if len(sys.argv) > 3 else 10000
+lookups = int(sys.argv[4]) if len(sys.argv) > 4 else 100000
+
+records = SeqIO.index(filename, fmt)
+hot_keys = list(records)[:cache_size]
+records.close()
+random.seed(0)
+keys = [random.choice(hot_keys) for i in range(lookups)]
+
+for name, size in (("Default cache", 1), (f"Cache of {cache_size}", cache_size)):
+    records = SeqIO.index(filename, fmt, cache_size=size)
+    start_time = time.time()
+    for key in keys:
+        records[key]
+    elapsed_time = time.time() - start_time
+    print(name)
+    print("\t%i look ups in %0.2f seconds" % (lookups, elapsed_time))
+    print("\t%r" % (records.cache_info(),))
+    records.close()
+
+records = SeqIO.index(filename, fmt, cache_size=0)
+for name, method in (
+    ("One at a time", lambda keys: [records[key] for key in keys]),
+    ("Using get_many", records.get_many),
+):
+    start_time = time.time()
+    method(hot_keys[::-1])
+    elapsed_time = time.time() - start_time
+    print(name)
+    print("\t%i records in %0.2f seconds" % (len(hot_keys), elapsed_time))
+records.close()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Time building a SeqIO.index_db database with and without worker processes.
+
+Usage: seqio_index_db.py FORMAT WORKERS FILENAME [FILENAME ...]
+
+e.g. seqio_index_db.py fastq 8 shards/*.fastq
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from Bio import SeqIO
+
+if len(sys.argv) < 4:
+    sys.exit(__doc__)
+
+fmt = sys.argv[1]
+workers = int(sys.argv[2])
+filenames = sys.argv[3:]
+
+with tempfile.TemporaryDirectory() as directory:
+    for name, kwargs in (("Serial", {}), (f"{workers} workers", {"workers": workers})):
+        index_filename = os.path.join(directory, name.replace(" ", "_") + ".idx")
+        start_time = time.time()
+        records = SeqIO.index_db(index_filename, filenames, fmt, **kwargs)
+        count = len(records)
+        records.close()
+        elapsed_time = time.time() - start_time
+        print(name)
+        print(
+            "\tIndexed %i records in %i files in %0.2f seconds"
+            % (count, len(filenames), elapsed_time)
+        )
+    # Touch one file, and update the index
+    os.utime(filenames[0])
+    start_time = time.time()
+    records = SeqIO.index_db(index_filename, incremental=True)
+    records.close()
+    print("Incremental update after changing one file")
+    print("\tTook %0.2f seconds" % (time.time() - start_time))
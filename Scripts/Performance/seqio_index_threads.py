@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Time concurrent look ups in a SeqIO.index_db dictionary from several threads.
+
+Usage: seqio_index_threads.py FORMAT THREADS FILENAME [FILENAME ...]
+
+e.g. seqio_index_threads.py fasta 8 uniprot_sprot.fasta
+
+Every record is looked up once (as a SeqRecord and using get_raw), spread
+over the given number of threads, which all share one index_db dictionary.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from Bio import SeqIO
+
+if len(sys.argv) < 4:
+    sys.exit(__doc__)
+
+fmt = sys.argv[1]
+threads = int(sys.argv[2])
+filenames = sys.argv[3:]
+
+with tempfile.TemporaryDirectory() as directory:
+    index_filename = os.path.join(directory, "test.idx")
+    records = SeqIO.index_db(index_filename, filenames, fmt, cache_size=0)
+    keys = list(records)
+    for name, method in (("SeqRecord", records.__getitem__), ("Raw", records.get_raw)):
+        for count in sorted({1, threads}):
+            start_time = time.time()
+            with ThreadPoolExecutor(count) as executor:
+                for result in executor.map(method, keys, chunksize=1000):
+                    pass
+            elapsed_time = time.time() - start_time
+            print(
+                "%s look ups of %i records with %i threads took %0.2f seconds"
+                % (name, len(keys), count, elapsed_time)
+            )
+    records.close()
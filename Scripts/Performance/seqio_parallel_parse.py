@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Compare serial and multi-process parsing with Bio.SeqIO.parse.
+
+Usage: seqio_parallel_parse.py FILENAME FORMAT [WORKERS ...]
+
+e.g. seqio_parallel_parse.py reads.fastq fastq 2 4 8
+"""
+
+import sys
+import time
+
+from Bio import SeqIO
+
+if len(sys.argv) < 3:
+    sys.exit(__doc__)
+
+filename = sys.argv[1]
+fmt = sys.argv[2]
+worker_counts = [int(value) for value in sys.argv[3:]] or [2, 4]
+
+for workers in [None] + worker_counts:
+    start_time = time.time()
+    num_records = 0
+    num_bases = 0
+    for record in SeqIO.parse(filename, fmt, workers=workers):
+        num_records += 1
+        num_bases += len(record)
+    elapsed_time = time.time() - start_time
+    print("Serial" if workers is None else "%i workers" % workers)
+    print(
+        "\tDid %i records (%i bases) in %0.2f seconds for\n\t%f records per second"
+        % (num_records, num_bases, elapsed_time, num_records / elapsed_time)
+    )
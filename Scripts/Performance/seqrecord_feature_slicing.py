@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+#
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+
+"""Time region queries and slicing of an annotated SeqRecord.
+
+Usage: seqrecord_feature_slicing.py FILENAME [FORMAT] [WINDOW]
+
+e.g. seqrecord_feature_slicing.py NC_000913.gbk genbank 10000
+"""
+
+import sys
+import time
+
+from Bio import SeqIO
+
+if len(sys.argv) < 2:
+    sys.exit(__doc__)
+
+filename = sys.argv[1]
+fmt = sys.argv[2] if len(sys.argv) > 2 else "genbank"
+window = int(sys.argv[3]) if len(sys.argv) > 3 else 10000
+
+for record in SeqIO.parse(filename, fmt):
+    starts = range(0, len(record), window)
+    print(f"{record.id}: {len(record)} letters, {len(record.features)} features")
+    start_time = time.time()
+    count = 0
+    for start in starts:
+        count += len(record.features_overlapping(start, start + window))
+    elapsed_time = time.time() - start_time
+    print(
+        "\t%i overlap queries found %i features in %0.2f seconds"
+        % (len(starts), count, elapsed_time)
+    )
+    start_time = time.time()
+    count = 0
+    for start in starts:
+        count += len(record[start : start + window].features)
+    elapsed_time = time.time() - start_time
+    print(
+        "\t%i slices kept %i features in %0.2f seconds"
+        % (len(starts), count, elapsed_time)
+    )
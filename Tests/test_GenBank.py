@@ -9,7 +9,9 @@
 
 """Tests for the GenBank module."""
 
+import copy
 import os
+import pickle
 import sys
 import unittest
 import warnings
@@ -24,6 +26,8 @@ from Bio import GenBank
 from Bio import SeqIO
 from Bio.Seq import Seq
 from Bio.Seq import UndefinedSequenceError
+from Bio.SeqFeature import SeqFeature
+from Bio.SeqFeature import SimpleLocation
 from Bio.SeqRecord import SeqRecord
 
 
@@ -8482,6 +8486,188 @@ class GenBankScannerTests(unittest.TestCase):
         self.assertEqual(len(l_embl_r[0].features), 29)
 
 
+class LazyFeatureTests(unittest.TestCase):
+    """Compare parsing the features on demand with the usual parser."""
+
+    def check(self, filename, fmt):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", BiopythonParserWarning)
+            expected = list(SeqIO.parse(filename, fmt))
+            records = list(SeqIO.parse(filename, fmt, lazy_features=True))
+            self.assertEqual(len(records), len(expected))
+            for old, new in zip(expected, records):
+                self.assertEqual(old.id, new.id)
+                self.assertEqual(old.annotations, new.annotations)
+                self.assertIsInstance(new.features, list)
+                if old.features:
+                    self.assertIsNot(type(new.features), list)
+                types = {feature.type for feature in old.features}
+                for feature_type in sorted(types):
+                    self.assertEqual(
+                        [f for f in old.features if f.type == feature_type],
+                        new.features.of_type(feature_type),
+                    )
+                self.assertEqual(len(new.features), len(old.features))
+                self.assertEqual(new.features, old.features)
+
+    def test_genbank(self):
+        """Parse GenBank files with lazy features."""
+        for filename in (
+            "GenBank/NC_005816.gb",
+            "GenBank/cor6_6.gb",
+            "GenBank/one_of.gb",
+            "GenBank/protein_refseq2.gb",
+            "GenBank/bad_loc_wrap.gb",
+            "GenBank/negative_location.gb",
+        ):
+            with self.subTest(filename=filename):
+                self.check(filename, "genbank")
+
+    def test_embl(self):
+        """Parse EMBL files with lazy features."""
+        for filename in ("EMBL/TRBG361.embl", "EMBL/location_wrap.embl"):
+            with self.subTest(filename=filename):
+                self.check(filename, "embl")
+
+    def test_list(self):
+        """Check the lazy features list behaves like a list."""
+        record = SeqIO.read("GenBank/NC_005816.gb", "genbank", lazy_features=True)
+        cds = record.features.of_type("CDS", "gene")
+        self.assertEqual(len(cds), 20)
+        # Features parsed on request are reused for the full list
+        self.assertIn(cds[0], record.features)
+        self.assertTrue(any(feature is cds[0] for feature in record.features))
+        self.assertEqual(len(record.features.of_type("CDS")), 10)
+        copied = copy.copy(record.features)
+        self.assertIs(type(copied), list)
+        self.assertEqual(len(copied), 41)
+        record = SeqIO.read("GenBank/NC_005816.gb", "genbank", lazy_features=True)
+        record.features.append(SeqFeature(SimpleLocation(0, 10), type="misc"))
+        self.assertEqual(len(record.features), 42)
+        self.assertEqual(record.features[-1].type, "misc")
+        record = SeqIO.read("GenBank/NC_005816.gb", "genbank", lazy_features=True)
+        unpickled = pickle.loads(pickle.dumps(record))
+        self.assertIs(type(unpickled.features), list)
+        self.assertEqual(len(unpickled.features), 41)
+        expected = SeqIO.read("GenBank/NC_005816.gb", "genbank")
+        record = SeqIO.read("GenBank/NC_005816.gb", "genbank", lazy_features=True)
+        self.assertEqual(record[100:2000].features, expected[100:2000].features)
+        record = SeqIO.read("GenBank/NC_005816.gb", "genbank", lazy_features=True)
+        self.assertEqual(record.format("genbank"), expected.format("genbank"))
+
+    def test_index(self):
+        """Use lazy features with SeqIO.index."""
+        index = SeqIO.index("GenBank/cor6_6.gb", "genbank", lazy_features=True)
+        record = index["AF297471.1"]
+        self.assertEqual(len(record.features.of_type("CDS")), 1)
+        self.assertEqual(len(record.features), 4)
+        index.close()
+        with self.assertRaises(TypeError):
+            SeqIO.index("GenBank/cor6_6.gb", "genbank", lazy=True)
+        with self.assertRaises(TypeError):
+            SeqIO.index("Fasta/f002", "fasta", lazy_features=True)
+        with self.assertRaises(TypeError):
+            SeqIO.parse("Fasta/f002", "fasta", lazy_features=True)
+
+
+class SequenceLinesTests(unittest.TestCase):
+    """Check parsing the sequence lines after the ORIGIN line."""
+
+    header = (
+        "LOCUS       TEST                      26 bp    DNA     linear   UNK 01-JAN-1980\n"
+        "DEFINITION  Test.\n"
+        "ACCESSION   TEST\n"
+        "VERSION     TEST.1\n"
+        "FEATURES             Location/Qualifiers\n"
+        "ORIGIN\n"
+    )
+
+    def test_well_formed(self):
+        """Only the numbering and spaces are removed from well formed lines."""
+        text = (
+            self.header
+            + "        1 acgtacgtac gtacgtacgt\n"
+            + "       21 acg9ac\n"
+            + "//\n"
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            record = SeqIO.read(StringIO(text), "genbank")
+        self.assertEqual(record.seq, "ACGTACGTACGTACGTACGTACG9AC")
+
+    def test_blank_line(self):
+        """A blank line in the sequence gives a warning."""
+        text = (
+            self.header
+            + "        1 acgtacgtac gtacgtacgt\n"
+            + "           \n"
+            + "       21 acgtac\n"
+            + "//\n"
+        )
+        with self.assertWarnsRegex(BiopythonParserWarning, "Blank line"):
+            record = SeqIO.read(StringIO(text), "genbank")
+        self.assertEqual(record.seq, "ACGTACGTACGTACGTACGTACGTAC")
+
+
+class HeaderOnlyTests(unittest.TestCase):
+    """Compare parsing only the record headers with the usual parser."""
+
+    def check(self, filename, fmt):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", BiopythonParserWarning)
+            expected = list(SeqIO.parse(filename, fmt))
+            records = list(SeqIO.parse(filename, fmt, header_only=True))
+        self.assertEqual(len(records), len(expected))
+        for old, new in zip(expected, records):
+            self.assertEqual(old.id, new.id)
+            self.assertEqual(old.name, new.name)
+            self.assertEqual(old.description, new.description)
+            self.assertEqual(old.dbxrefs, new.dbxrefs)
+            annotations = dict(old.annotations)
+            # These come from the lines after the features, which are skipped
+            for key in ("contig", "tls", "tsa", "wgs", "wgs_scafld"):
+                annotations.pop(key, None)
+            self.assertEqual(annotations.keys(), new.annotations.keys())
+            for key, value in annotations.items():
+                if key == "references":
+                    self.assertEqual(
+                        [str(reference) for reference in value],
+                        [str(reference) for reference in new.annotations[key]],
+                    )
+                else:
+                    self.assertEqual(value, new.annotations[key], msg=key)
+            self.assertEqual(new.features, [])
+            if len(new):
+                self.assertEqual(len(old), len(new))
+                self.assertFalse(new.seq.defined)
+
+    def test_genbank(self):
+        """Parse only the headers of GenBank files."""
+        for filename in (
+            "GenBank/NC_005816.gb",
+            "GenBank/cor6_6.gb",
+            "GenBank/NT_019265.gb",
+            "GenBank/protein_refseq2.gb",
+            "GenBank/tls_KDHP01000000.gb",
+            "GenBank/tsa_acropora.gb",
+        ):
+            with self.subTest(filename=filename):
+                self.check(filename, "genbank")
+
+    def test_embl(self):
+        """Parse only the headers of EMBL files."""
+        for filename in ("EMBL/TRBG361.embl", "EMBL/epo_prt_selection.embl"):
+            with self.subTest(filename=filename):
+                self.check(filename, "embl")
+
+    def test_missing_end(self):
+        """Parse only the header of a record without a // line."""
+        with self.assertWarns(BiopythonParserWarning):
+            record = SeqIO.read("GenBank/no_end_marker.gb", "genbank", header_only=True)
+        self.assertEqual(record.id, "AB070938.1")
+        self.assertEqual(len(record), 6497)
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
@@ -6,6 +6,7 @@
 # as part of this package.
 """Tests Bio.SeqFeature."""
 
+import pickle
 import unittest
 import warnings
 from copy import deepcopy
@@ -22,6 +23,10 @@ from Bio.SeqFeature import BeforePosition
 from Bio.SeqFeature import BetweenPosition
 from Bio.SeqFeature import CompoundLocation
 from Bio.SeqFeature import ExactPosition
+from Bio.SeqFeature import FeatureTable
+from Bio.SeqFeature import intern_qualifiers
+from Bio.SeqFeature import Location
+from Bio.SeqFeature import LocationParserError
 from Bio.SeqFeature import OneOfPosition
 from Bio.SeqFeature import SeqFeature
 from Bio.SeqFeature import SimpleLocation
@@ -218,6 +223,104 @@ class TestSeqFeature(unittest.TestCase):
             self.assertEqual(None, f.ref_db)
 
 
+class TestCompactFeatures(unittest.TestCase):
+    """Tests for the memory saving features of Bio.SeqFeature."""
+
+    def setUp(self):
+        self.features = [
+            SeqFeature(
+                SimpleLocation(10, 40, strand=1),
+                type="gene",
+                qualifiers={"locus_tag": ["b0001"], "pseudo": [""]},
+            ),
+            SeqFeature(
+                SimpleLocation(BeforePosition(45), 90, strand=-1),
+                type="CDS",
+                id="b0002",
+                qualifiers={"product": ["hypothetical protein"]},
+            ),
+            SeqFeature(
+                CompoundLocation(
+                    [SimpleLocation(100, 120, 1), SimpleLocation(130, 150, 1)]
+                ),
+                type="CDS",
+                qualifiers={"product": ["hypothetical protein"], "note": "odd"},
+            ),
+            SeqFeature(SimpleLocation(200, 210, ref="X12345.1"), type="misc"),
+            SeqFeature(SimpleLocation(300, 310, strand=0), type="repeat_region"),
+            SeqFeature(None, type="source"),
+        ]
+
+    def test_slots(self):
+        location = SimpleLocation(5, 10, strand=1)
+        self.assertFalse(hasattr(location, "__dict__"))
+        self.assertFalse(hasattr(location.start, "__dict__"))
+        self.assertFalse(hasattr(self.features[2].location, "__dict__"))
+        with self.assertRaises(AttributeError):
+            location.color = "red"
+        # SeqFeature objects still accept additional attributes
+        feature = self.features[0]
+        feature.color = "red"
+        self.assertEqual(feature.color, "red")
+
+    def test_pickle(self):
+        """Test pickling with every protocol, including 0 and 1."""
+        self.features[0].color = "red"
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            for feature in self.features:
+                copy = pickle.loads(pickle.dumps(feature, protocol))
+                self.assertEqual(copy, feature)
+                self.assertEqual(repr(copy.location), repr(feature.location))
+            copy = pickle.loads(pickle.dumps(self.features[0], protocol))
+            self.assertEqual(copy.color, "red")
+
+    def test_intern_qualifiers(self):
+        features = [
+            SeqFeature(
+                SimpleLocation(i, i + 9),
+                qualifiers={"product": ["hypothetical " + "protein"]},
+            )
+            for i in range(3)
+        ]
+        pool = intern_qualifiers(features)
+        self.assertIn("hypothetical protein", pool)
+        first = features[0].qualifiers["product"][0]
+        for feature in features[1:]:
+            self.assertIs(feature.qualifiers["product"][0], first)
+        self.assertEqual(features[2].qualifiers, {"product": ["hypothetical protein"]})
+
+    def test_feature_table_round_trip(self):
+        table = FeatureTable(self.features)
+        self.assertEqual(len(table), 6)
+        self.assertEqual(list(table.starts), [10, 45, 100, 200, 300, 0])
+        self.assertEqual(list(table.ends), [40, 90, 150, 210, 310, 0])
+        self.assertEqual(list(table.strands), [1, -1, 1, 2, 0, 2])
+        self.assertEqual(table.types[:2], ["gene", "CDS"])
+        self.assertEqual(table.ids[1], "b0002")
+        self.assertEqual(table.to_features(), self.features)
+        self.assertEqual(list(table), self.features)
+        self.assertEqual(table[-1], self.features[-1])
+        self.assertIsNone(table[-1].location)
+        self.assertEqual(table[2].qualifiers["note"], "odd")
+        self.assertIs(
+            table[1].qualifiers["product"][0], table[2].qualifiers["product"][0]
+        )
+        # The features returned are new objects
+        table[0].qualifiers["locus_tag"].append("thrL")
+        self.assertEqual(table[0].qualifiers["locus_tag"], ["b0001"])
+        with self.assertRaises(IndexError):
+            table[6]
+        with self.assertRaises(TypeError):
+            table[1:2]
+
+    def test_feature_table_extend(self):
+        table = FeatureTable()
+        self.assertEqual(len(table), 0)
+        table.extend(self.features[:2])
+        table.append(self.features[2])
+        self.assertEqual(table.to_features(), self.features[:3])
+
+
 class TestLocations(unittest.TestCase):
     def test_fuzzy(self):
         """Test fuzzy representations."""
@@ -257,6 +360,49 @@ class TestLocations(unittest.TestCase):
         self.assertEqual(int(location3.start), 10)
         self.assertEqual(int(location3.end), 40)
 
+    def test_fromstring_fast_path(self):
+        """Check the fast and cached parsers agree with the general parser."""
+        for text in [
+            "123..456",
+            "complement(123..456)",
+            "join(1..5,8..10)",
+            "join(1..5)",
+            "complement(join(1..5,8..10))",
+            "join(complement(1..5),8..10)",
+            "order(1..3,5..6)",
+            "<1..>5",
+            "complement(<1..>5)",
+            "(9.10)..(20.25)",
+            "one-of(5,8)..20",
+            "1^2",
+            "5",
+            "J00194.1:100..202",
+            "join(1..5,J00194.1:100..202)",
+        ]:
+            for stranded in (True, False):
+                expected = Location._fromstring(text, 1000, False, stranded, [])
+                # The second call uses the cached description, if any
+                for _ in range(2):
+                    location = Location.fromstring(text, 1000, False, stranded)
+                    self.assertEqual(repr(location), repr(expected), text)
+                    self.assertIsNot(location, expected)
+
+    def test_fromstring_cached_warnings(self):
+        """Check warnings are repeated for cached location strings."""
+        for _ in range(2):
+            with self.assertWarns(BiopythonParserWarning):
+                location = Location.fromstring("8..2", 10, True)
+            self.assertEqual(str(location), "join{[7:10](+), [0:2](+)}")
+        # Errors are raised every time, and not cached
+        for _ in range(2):
+            with self.assertRaises(LocationParserError):
+                Location.fromstring("123^456", 1000)
+        # Warnings given before an error are not lost
+        for _ in range(2):
+            with self.assertWarnsRegex(BiopythonParserWarning, "origin wrapping"):
+                with self.assertRaises(LocationParserError):
+                    Location.fromstring("join(8..2,x..y)", 10, True)
+
 
 class TestPositions(unittest.TestCase):
     def test_pickle(self):
@@ -5,14 +5,21 @@
 # as part of this package.
 """Tests for Bio.SeqIO.FastaIO module."""
 
+import os
+import tempfile
 import unittest
 from io import StringIO
 
+from Bio import bgzf
+from Bio import BiopythonWarning
 from Bio import SeqIO
+from Bio.SeqIO.FastaIO import FaidxReader
 from Bio.SeqIO.FastaIO import FastaIterator
 from Bio.SeqIO.FastaIO import FastaTwoLineParser
 from Bio.SeqIO.FastaIO import SimpleFastaParser
 
+from test_SeqIO import SeqIOConverterTestBaseClass
+
 
 def title_to_ids(title):
     """Convert a FASTA title line into the id, name, and description.
@@ -192,6 +199,162 @@ class TestSimpleFastaParsers(unittest.TestCase):
                 list(FastaTwoLineParser(handle))
 
 
+class TestFaidxReader(unittest.TestCase):
+    """Tests for random access with a samtools style .fai index."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        for name in os.listdir(self.tmpdir):
+            os.remove(os.path.join(self.tmpdir, name))
+        os.rmdir(self.tmpdir)
+
+    def copy(self, data, name="test.fasta", compressed=False):
+        filename = os.path.join(self.tmpdir, name)
+        if compressed:
+            with bgzf.BgzfWriter(filename, "wb") as handle:
+                handle.write(data)
+        else:
+            with open(filename, "wb") as handle:
+                handle.write(data)
+        return filename
+
+    def check_file(self, filename, records):
+        with FaidxReader(filename) as reader:
+            self.assertEqual(list(reader), [record.id for record in records])
+            for record in records:
+                seq = reader[record.id].seq
+                self.assertEqual(len(seq), len(record))
+                self.assertEqual(seq, record.seq)
+                for start, end, step in (
+                    (None, None, None),
+                    (0, 1, None),
+                    (5, 70, None),
+                    (59, 61, None),
+                    (3, 140, 7),
+                    (None, None, -1),
+                    (100, 2, -3),
+                    (-10, None, None),
+                ):
+                    index = slice(start, end, step)
+                    self.assertEqual(seq[index], record.seq[index])
+                if len(record):
+                    self.assertEqual(seq[-1], record.seq[-1])
+                    self.assertEqual(
+                        seq[len(record) // 2], record.seq[len(record) // 2]
+                    )
+
+    def test_plain_and_bgzf(self):
+        for name in ("Fasta/f002", "Fasta/aster.pro", "GenBank/NC_005816.fna"):
+            with open(name, "rb") as handle:
+                data = handle.read()
+            records = list(SeqIO.parse(name, "fasta"))
+            for compressed in (False, True):
+                with self.subTest(name=name, compressed=compressed):
+                    filename = self.copy(data, compressed=compressed)
+                    self.check_file(filename, records)
+                    # Now reload the saved index files
+                    self.check_file(filename, records)
+                    for suffix in (".fai", ".gzi"):
+                        if os.path.exists(filename + suffix):
+                            os.remove(filename + suffix)
+
+    def test_multi_block_bgzf(self):
+        lines = [b">big description\n"]
+        lines.extend(b"ACGTTGCA" * 8 + b"\n" for i in range(3000))
+        lines.append(b"ACG\n")
+        lines.append(b">small\nAC\r\n")
+        data = b"".join(lines)
+        filename = self.copy(data, compressed=True)
+        self.check_file(filename, list(SeqIO.parse(StringIO(data.decode()), "fasta")))
+        with open(filename + ".gzi", "rb") as handle:
+            gzi = handle.read()
+        with open(filename, "rb") as handle:
+            blocks = list(bgzf.BgzfBlocks(handle))
+        # One entry for each non-empty block except the first
+        self.assertEqual(gzi[:8], (len(blocks) - 2).to_bytes(8, "little"))
+
+    def test_fai_contents(self):
+        data = b">one first\nACGTA\nCGTAC\nGT\n>two\r\nAAAA\r\nCC\r\n>empty\n"
+        filename = self.copy(data)
+        with FaidxReader(filename) as reader:
+            self.assertEqual(reader.fetch("one:2-8"), "CGTACGT")
+            self.assertEqual(reader.fetch("one:7"), "GTACGT")
+            self.assertEqual(reader.fetch("one:1,0-1,1"), "CG")
+            self.assertEqual(reader.fetch("two"), "AAAACC")
+            self.assertEqual(reader.fetch("empty"), "")
+            self.assertRaises(KeyError, reader.fetch, "three:1-5")
+        with open(filename + ".fai") as handle:
+            self.assertEqual(
+                handle.read(),
+                "one\t12\t11\t5\t6\ntwo\t6\t32\t4\t6\nempty\t0\t49\t0\t0\n",
+            )
+
+    def test_build_errors(self):
+        for data in (
+            b">one\nACGT\nACGTA\n",
+            b">one\nACGT\nAC\nAC\n",
+            b">one\nACGT\n\nACGT\n",
+            b">one\nACGT\n>one\nACGT\n",
+        ):
+            filename = self.copy(data)
+            self.assertRaises(ValueError, FaidxReader, filename)
+        filename = self.copy(b">one\nACGT\n", name="other.fasta")
+        self.assertRaises(FileNotFoundError, FaidxReader, filename, build=False)
+
+    def test_unsaved_index(self):
+        # The index files cannot be written in a directory that does not
+        # exist, as for a FASTA file in a read only directory
+        data = b">one\nACGT\nAC\n>two\nGGCC\n"
+        missing = os.path.join(self.tmpdir, "missing")
+        for compressed in (False, True):
+            filename = self.copy(data, compressed=compressed)
+            with self.assertWarns(BiopythonWarning):
+                reader = FaidxReader(
+                    filename,
+                    fai_filename=os.path.join(missing, "test.fai"),
+                    gzi_filename=os.path.join(missing, "test.gzi"),
+                )
+            with reader:
+                self.assertEqual(reader.fetch("one:3-5"), "GTA")
+                self.assertEqual(reader.fetch("two"), "GGCC")
+            self.assertFalse(os.path.exists(missing))
+
+
+class ConvertTestsFasta(SeqIOConverterTestBaseClass):
+    """Tests for the streaming SeqIO.convert between FASTA and tab files."""
+
+    def test_conversion(self):
+        """Test format conversion by SeqIO.write/SeqIO.parse and SeqIO.convert."""
+        tests = [
+            ("Fasta/dups.fasta", "fasta"),
+            ("Fasta/lupine.nu", "fasta"),
+            ("Fasta/aster.pro", "fasta"),
+            ("Fasta/aster_no_wrap.pro", "fasta-2line"),
+            ("GenBank/NC_005816.fna", "fasta"),
+            ("GenBank/NC_005816.tsv", "tab"),
+        ]
+        for filename, fmt in tests:
+            for in_format, out_format in self.formats:
+                if in_format != fmt:
+                    continue
+                self.check_conversion(filename, in_format, out_format)
+
+    def test_large_output(self):
+        """Test the output is complete when written in several blocks."""
+        records = "".join(f">seq{i} test\n{'ACGT' * 500}\n" for i in range(1000))
+        handle = StringIO()
+        count = SeqIO.convert(StringIO(records), "fasta", handle, "fasta-2line")
+        self.assertEqual(count, 1000)
+        self.assertEqual(handle.getvalue(), records)
+        handle = StringIO()
+        SeqIO.convert(StringIO(records), "fasta", handle, "tab")
+        lines = handle.getvalue().splitlines()
+        self.assertEqual(len(lines), 1000)
+        self.assertEqual(lines[-1], "seq999\t" + "ACGT" * 500)
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
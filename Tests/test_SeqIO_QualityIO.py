@@ -16,6 +16,7 @@ from test_SeqIO import SeqIOTestBaseClass
 from Bio import BiopythonParserWarning
 from Bio import BiopythonWarning
 from Bio import SeqIO
+from Bio import StreamModeError
 from Bio.Data.IUPACData import ambiguous_dna_letters
 from Bio.Data.IUPACData import ambiguous_rna_letters
 from Bio.Seq import MutableSeq
@@ -39,7 +40,7 @@ class QualityIOTestBaseClass(SeqIOTestBaseClass):
         elif fmt in ["fastq", "fastq-sanger"]:
             truncate = 93
         else:
-            assert fmt in ["fasta", "qual", "phd", "sff", "tab", None]
+            assert fmt in ["fasta", "fasta-2line", "qual", "phd", "sff", "tab", None]
             truncate = None
         for keyword in ("phred_quality", "solexa_quality"):
             q_old = old.letter_annotations.get(keyword)
@@ -1004,6 +1005,127 @@ class NonFastqTests(unittest.TestCase):
         self.check_wrong_format("Roche/greek.sff")
 
 
+class TestFastqBinaryIterator(unittest.TestCase):
+    """Tests for the FastqBinaryIterator and FastqRecordView."""
+
+    def test_matches_general_iterator(self):
+        for filename in (
+            "Quality/example.fastq",
+            "Quality/example_dos.fastq",
+            "Quality/sanger_93.fastq",
+            "Quality/solexa_faked.fastq",
+            "Quality/zero_length.fastq",
+        ):
+            expected = list(QualityIO.FastqGeneralIterator(filename))
+            for block_size in (1, 10, 1000000):
+                views = QualityIO.FastqBinaryIterator(filename, block_size)
+                values = [
+                    tuple(bytes(value).decode() for value in view) for view in views
+                ]
+                self.assertEqual(values, expected, msg=filename)
+
+    def test_to_seqrecord(self):
+        filename = "Quality/sanger_faked.fastq"
+        views = list(QualityIO.FastqBinaryIterator(filename))
+        records = list(SeqIO.parse(filename, "fastq"))
+        self.assertEqual(len(views), len(records))
+        for view, record in zip(views, records):
+            self.assertEqual(len(view), len(record))
+            new = view.to_seqrecord()
+            self.assertEqual(new.id, record.id)
+            self.assertEqual(new.description, record.description)
+            self.assertEqual(new.seq, record.seq)
+            self.assertEqual(new.letter_annotations, record.letter_annotations)
+
+    def test_missing_final_newline(self):
+        handle = BytesIO(b"@r1\nACGT\n+r1\nIIII\n@r2\nAC\n+\n!!")
+        views = list(QualityIO.FastqBinaryIterator(handle, 4))
+        self.assertEqual([bytes(view.title) for view in views], [b"r1", b"r2"])
+        self.assertEqual(views[1].phred_quality(), b"\x00\x00")
+
+    def test_errors(self):
+        for data in (
+            b"r1\nACGT\n+\nIIII\n",
+            b"@r1\nACGT\n+r2\nIIII\n",
+            b"@r1\nACGT\n+\nIII\n",
+            b"@r1\nACGT\n+\n",
+            b"@r1\nACGT\nACGT\n+\nIIIIIIII\n",
+        ):
+            with self.assertRaises(ValueError, msg=data):
+                list(QualityIO.FastqBinaryIterator(BytesIO(data)))
+        view = next(QualityIO.FastqBinaryIterator(BytesIO(b"@r1\nA\n+\n\x1f\n")))
+        self.assertRaises(ValueError, view.phred_quality)
+        with open("Quality/example.fastq") as handle:
+            self.assertRaises(
+                StreamModeError, next, QualityIO.FastqBinaryIterator(handle)
+            )
+
+
+class TestFastqBatchReader(unittest.TestCase):
+    """Tests for the FastqBatchReader and FastqBatch."""
+
+    def test_matches_records(self):
+        for filename in (
+            "Quality/example.fastq",
+            "Quality/sanger_faked.fastq",
+            "Quality/zero_length.fastq",
+        ):
+            records = list(SeqIO.parse(filename, "fastq"))
+            for batch_size in (1, 2, 1000):
+                batches = list(QualityIO.FastqBatchReader(filename, batch_size))
+                self.assertTrue(all(len(batch) <= batch_size for batch in batches))
+                reads = [read for batch in batches for read in batch]
+                self.assertEqual(len(reads), len(records))
+                for (title, seq, qualities), record in zip(reads, records):
+                    self.assertEqual(title, record.description)
+                    self.assertEqual(seq.decode(), record.seq)
+                    self.assertEqual(
+                        qualities, record.letter_annotations["phred_quality"]
+                    )
+
+    def test_mean_quality(self):
+        filename = "Quality/zero_length.fastq"
+        batch = next(QualityIO.FastqBatchReader(filename))
+        for mean, record in zip(batch.mean_quality(), SeqIO.parse(filename, "fastq")):
+            qualities = record.letter_annotations["phred_quality"]
+            if qualities:
+                self.assertAlmostEqual(mean, sum(qualities) / len(qualities))
+            else:
+                self.assertNotEqual(mean, mean)  # NaN
+
+    def test_trim_quality(self):
+        filename = "Quality/zero_length.fastq"
+        batch = next(QualityIO.FastqBatchReader(filename))
+        for threshold in (0, 10, 20, 30, 40, 100):
+            trimmed = batch.trim_quality(threshold)
+            self.assertEqual(len(trimmed), len(batch))
+            for old, new in zip(batch, trimmed):
+                title, seq, qualities = old
+                good = [i for i, q in enumerate(qualities) if q >= threshold]
+                if good:
+                    seq = seq[good[0] : good[-1] + 1]
+                    qualities = qualities[good[0] : good[-1] + 1]
+                else:
+                    seq = b""
+                    qualities = []
+                self.assertEqual(new, (title, seq, qualities))
+
+    def test_select(self):
+        batch = next(QualityIO.FastqBatchReader("Quality/zero_length.fastq"))
+        lengths = batch.lengths()
+        subset = batch.select(lengths > 0)
+        self.assertEqual(list(subset), [read for read in batch if read[1]])
+        subset = batch.select(lengths == 0)
+        self.assertEqual(list(subset), [read for read in batch if not read[1]])
+        subset = batch.select([2, 0])
+        self.assertEqual(list(subset), [batch[2], batch[0]])
+        self.assertEqual(len(batch.select(lengths < 0)), 0)
+
+    def test_invalid_quality(self):
+        handle = BytesIO(b"@r1\nACGT\n+\nII I\n")
+        self.assertRaises(ValueError, next, QualityIO.FastqBatchReader(handle))
+
+
 class TestsConverter(SeqIOConverterTestBaseClass, QualityIOTestBaseClass):
     def check_conversion(self, filename, in_format, out_format):
         msg = f"Convert {filename} from {in_format} to {out_format}"
@@ -1107,7 +1229,7 @@ class TestsConverter(SeqIOConverterTestBaseClass, QualityIOTestBaseClass):
                 if (
                     in_format
                     in ["fastq", "fastq-sanger", "fastq-solexa", "fastq-illumina"]
-                    and out_format in ["fasta", "tab"]
+                    and out_format in ["fasta", "fasta-2line", "tab"]
                     and filename.startswith("Quality/error_qual_")
                 ):
                     # TODO? These conversions don't check for bad characters in the quality,
@@ -768,6 +768,385 @@ class IndexDictTests(SeqRecordTestBaseClass, SeqIOTestBaseClass):
                 self.get_raw_check(Path(filename2), fmt, comp)
 
 
+class IndexSidecarTests(unittest.TestCase):
+    """Test the sidecar offsets index file used by SeqIO.index."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        for name in os.listdir(self.tmpdir):
+            os.remove(os.path.join(self.tmpdir, name))
+        os.rmdir(self.tmpdir)
+
+    def check(self, filename, fmt, key_function=None):
+        index_filename = os.path.join(self.tmpdir, "test.bpi")
+        expected = SeqIO.index(filename, fmt, key_function=key_function)
+        for attempt in range(2):
+            # First time writes the sidecar file, then it is reused
+            records = SeqIO.index(
+                filename, fmt, key_function=key_function, index_filename=index_filename
+            )
+            self.assertTrue(os.path.isfile(index_filename))
+            self.assertEqual(list(records), list(expected))
+            for key in expected:
+                self.assertEqual(records.get_raw(key), expected.get_raw(key))
+                self.assertEqual(records[key].id, expected[key].id)
+            records.close()
+        expected.close()
+
+    def test_formats(self):
+        for filename, fmt in (
+            ("GenBank/NC_000932.faa", "fasta"),
+            ("GenBank/cor6_6.gb", "gb"),
+            ("Quality/example.fastq.bgz", "fastq"),
+            ("Roche/greek.sff", "sff"),
+            ("Quality/zero_length.fastq", "fastq"),
+        ):
+            with self.subTest(filename=filename):
+                self.check(filename, fmt)
+
+    def test_key_function(self):
+        self.check("GenBank/NC_000932.faa", "fasta", lambda name: name.split("|")[1])
+
+    def test_default_name(self):
+        filename = os.path.join(self.tmpdir, "example.fastq")
+        with open("Quality/example.fastq", "rb") as handle:
+            data = handle.read()
+        with open(filename, "wb") as handle:
+            handle.write(data)
+        SeqIO.index(filename, "fastq", index_filename=True).close()
+        self.assertTrue(os.path.isfile(filename + ".bpi"))
+
+    def test_stale(self):
+        filename = os.path.join(self.tmpdir, "example.fasta")
+        index_filename = filename + ".bpi"
+        with open(filename, "w") as handle:
+            handle.write(">alpha\nACGT\n>beta\nGGCC\n")
+        records = SeqIO.index(filename, "fasta", index_filename=index_filename)
+        self.assertEqual(list(records), ["alpha", "beta"])
+        records.close()
+        with open(filename, "w") as handle:
+            handle.write(">gamma\nACGTTT\n>delta\nGGCC\n>epsilon\nA\n")
+        records = SeqIO.index(filename, "fasta", index_filename=index_filename)
+        self.assertEqual(list(records), ["gamma", "delta", "epsilon"])
+        self.assertEqual(records["epsilon"].seq, "A")
+        records.close()
+        # Same size (and possibly same modification time), different content
+        with open(filename, "w") as handle:
+            handle.write(">gamma\nACGTTT\n>delta\nGGCC\n>zeta\nACGA\n")
+        records = SeqIO.index(filename, "fasta", index_filename=index_filename)
+        self.assertEqual(list(records), ["gamma", "delta", "zeta"])
+        records.close()
+        # Corrupt index files are also ignored, and rebuilt
+        with open(index_filename, "wb") as handle:
+            handle.write(b"Not an index\n")
+        records = SeqIO.index(filename, "fasta", index_filename=index_filename)
+        self.assertEqual(list(records), ["gamma", "delta", "zeta"])
+        records.close()
+
+
+class IndexCacheTests(unittest.TestCase):
+    """Test the record cache and get_many method of SeqIO.index and index_db."""
+
+    filename = "GenBank/NC_000932.faa"
+
+    def check_cache(self, records):
+        keys = list(records)
+        self.assertEqual(records.cache_info(), (0, 0, 3, 0))
+        for key in keys[:3]:
+            records[key]
+        self.assertIs(records[keys[0]], records[keys[0]])
+        self.assertEqual(records.cache_info(), (2, 3, 3, 3))
+        # The least recently used record is removed from the cache
+        records[keys[3]]
+        self.assertEqual(records.cache_info(), (2, 4, 3, 3))
+        self.assertEqual(list(records._cache), [keys[2], keys[0], keys[3]])
+        records.cache_hits = records.cache_misses = 0
+        wanted = [keys[10], keys[0], keys[5], keys[10], keys[2]]
+        self.assertEqual(
+            [record.id for record in records.get_many(wanted)],
+            [records[key].id for key in wanted],
+        )
+        with self.assertRaises(KeyError):
+            records.get_many([keys[1], "missing"])
+        records.close()
+
+    def check_get_many(self, records):
+        keys = list(records)
+        wanted = keys[::-3] + keys[:5]
+        expected = [record.id for record in SeqIO.parse(self.filename, "fasta")]
+        self.assertEqual(
+            [record.id for record in records.get_many(wanted)],
+            [expected[keys.index(key)] for key in wanted],
+        )
+        self.assertEqual(records.get_many([]), [])
+        self.assertEqual(records.cache_info().current_size, 0)
+        records.close()
+
+    def test_index(self):
+        self.check_cache(SeqIO.index(self.filename, "fasta", cache_size=3))
+        self.check_get_many(SeqIO.index(self.filename, "fasta", cache_size=0))
+
+    def test_index_arguments(self):
+        with self.assertRaises(TypeError):
+            SeqIO.index(self.filename, "fasta", cache_size=2.5)
+        with self.assertRaises(ValueError):
+            SeqIO.index(self.filename, "fasta", cache_size=-1)
+
+    if sqlite3:
+
+        def test_index_db(self):
+            self.check_cache(
+                SeqIO.index_db(":memory:", self.filename, "fasta", cache_size=3)
+            )
+            self.check_get_many(
+                SeqIO.index_db(":memory:", self.filename, "fasta", cache_size=0)
+            )
+
+        def test_index_db_files(self):
+            files = ["GenBank/NC_005816.faa", "GenBank/NC_000932.faa"]
+            records = SeqIO.index_db(":memory:", files, "fasta")
+            keys = list(records)
+            wanted = keys[::-7]
+            self.assertEqual([record.id for record in records.get_many(wanted)], wanted)
+            self.assertEqual(records.cache_info().misses, len(wanted))
+            records.close()
+
+
+class IndexConcurrencyTests(unittest.TestCase):
+    """Test using SeqIO.index and index_db from several threads and processes."""
+
+    files = ["GenBank/NC_005816.faa", "GenBank/NC_000932.faa"]
+
+    def setUp(self):
+        self.expected = {}
+        for filename in self.files:
+            for record in SeqIO.parse(filename, "fasta"):
+                self.expected[record.id] = str(record.seq)
+
+    def check_threads(self, records):
+        keys = sorted(records) * 5
+        errors = []
+
+        def reader(start):
+            try:
+                for key in keys[start::8]:
+                    if str(records[key].seq) != self.expected[key]:
+                        errors.append(key)
+                    raw = records.get_raw(key).decode()
+                    if not raw.startswith(f">{key} "):
+                        errors.append(key)
+            except Exception as err:
+                errors.append(err)
+
+        threads = [threading.Thread(target=reader, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        records.close()
+
+    def check_thread_end(self, records):
+        """Check the handles of each thread are closed when it ends."""
+        key = list(records)[0]
+        used = []
+
+        def reader():
+            self.assertEqual(str(records[key].seq), self.expected[key])
+            used.append(records._resources)
+
+        for i in range(3):
+            thread = threading.Thread(target=reader)
+            thread.start()
+            thread.join()
+        for resources in used:
+            self.assertEqual(resources.proxies, {})
+            self.assertIsNone(resources.con)
+        # Closing the dictionary closes the handles of the running threads
+        self.assertEqual(str(records[key].seq), self.expected[key])
+        resources = records._resources
+        records.close()
+        self.assertEqual(resources.proxies, {})
+        self.assertIsNone(resources.con)
+
+    def check_fork(self, records):
+        keys = list(records)
+        # Open the file(s) in the parent process first
+        self.assertEqual(str(records[keys[0]].seq), self.expected[keys[0]])
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            # Child process
+            try:
+                os.close(read_fd)
+                count = 0
+                for key in keys[::-1]:
+                    if str(records[key].seq) == self.expected[key]:
+                        count += 1
+                os.write(write_fd, b"%i" % count)
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as handle:
+            count = int(handle.read() or -1)
+        os.waitpid(pid, 0)
+        self.assertEqual(count, len(keys))
+        for key in keys:
+            self.assertEqual(str(records[key].seq), self.expected[key])
+        records.close()
+
+    def test_index_threads(self):
+        self.check_threads(SeqIO.index(self.files[1], "fasta", cache_size=0))
+
+    def test_index_thread_end(self):
+        self.check_thread_end(SeqIO.index(self.files[1], "fasta", cache_size=0))
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_index_fork(self):
+        self.check_fork(SeqIO.index(self.files[1], "fasta", cache_size=0))
+
+    if sqlite3:
+
+        def test_index_db_threads(self):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                index_filename = os.path.join(tmpdir, "test.idx")
+                SeqIO.index_db(index_filename, self.files, "fasta").close()
+                self.check_threads(SeqIO.index_db(index_filename, cache_size=0))
+                self.check_threads(
+                    SeqIO.index_db(index_filename, self.files, "fasta", cache_size=7)
+                )
+
+        def test_index_db_thread_end(self):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                index_filename = os.path.join(tmpdir, "test.idx")
+                self.check_thread_end(
+                    SeqIO.index_db(index_filename, self.files, "fasta", cache_size=0)
+                )
+
+        def test_index_db_memory_threads(self):
+            self.check_threads(SeqIO.index_db(":memory:", self.files, "fasta"))
+
+        @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+        def test_index_db_fork(self):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                index_filename = os.path.join(tmpdir, "test.idx")
+                self.check_fork(
+                    SeqIO.index_db(index_filename, self.files, "fasta", cache_size=0)
+                )
+
+
+if sqlite3:
+
+    class IndexDbBuildTests(unittest.TestCase):
+        """Test building index_db databases in parallel, and updating them."""
+
+        def setUp(self):
+            self.tmpdir = tempfile.mkdtemp()
+            self.index_filename = os.path.join(self.tmpdir, "test.idx")
+
+        def tearDown(self):
+            for name in os.listdir(self.tmpdir):
+                os.remove(os.path.join(self.tmpdir, name))
+            os.rmdir(self.tmpdir)
+
+        def write_fasta(self, name, records):
+            filename = os.path.join(self.tmpdir, name)
+            with open(filename, "w") as handle:
+                for key, seq in records:
+                    handle.write(f">{key}\n{seq}\n")
+            return filename
+
+        def test_workers(self):
+            files = [
+                "GenBank/NC_000932.faa",
+                "GenBank/NC_005816.faa",
+                "Fasta/aster.pro",
+                "Fasta/loveliesbleeding.pro",
+            ]
+            expected = SeqIO.index_db(":memory:", files, "fasta")
+            records = SeqIO.index_db(self.index_filename, files, "fasta", workers=2)
+            self.assertEqual(len(records), len(expected))
+            self.assertEqual(list(records), list(expected))
+            for key in expected:
+                self.assertEqual(records.get_raw(key), expected.get_raw(key))
+            key = list(expected)[-1]
+            self.assertEqual(records[key].seq, expected[key].seq)
+            records.close()
+            expected.close()
+            # Reload the index
+            records = SeqIO.index_db(self.index_filename)
+            self.assertEqual(len(records), 97)
+            records.close()
+
+        def test_workers_duplicates(self):
+            files = ["GenBank/NC_005816.faa", "GenBank/NC_005816.faa"]
+            with self.assertRaises(ValueError):
+                SeqIO.index_db(":memory:", files, "fasta", workers=2)
+
+        def test_workers_arguments(self):
+            files = ["GenBank/NC_005816.faa"]
+            with self.assertRaises(TypeError):
+                SeqIO.index_db(":memory:", files, "fasta", workers="2")
+            with self.assertRaises(ValueError):
+                SeqIO.index_db(":memory:", files, "fasta", workers=0)
+
+        def test_incremental(self):
+            first = self.write_fasta("first.fasta", [("alpha", "ACGT"), ("beta", "GG")])
+            second = self.write_fasta("second.fasta", [("gamma", "TTTT")])
+            records = SeqIO.index_db(self.index_filename, [first, second], "fasta")
+            self.assertEqual(list(records), ["alpha", "beta", "gamma"])
+            records.close()
+            # Nothing has changed
+            records = SeqIO.index_db(self.index_filename, incremental=True)
+            self.assertEqual(list(records), ["alpha", "beta", "gamma"])
+            records.close()
+            # Modify the first file, without incremental the index is out of date
+            first = self.write_fasta(
+                "first.fasta", [("delta", "ACGTTT"), ("beta", "GG"), ("epsilon", "A")]
+            )
+            records = SeqIO.index_db(self.index_filename)
+            self.assertEqual(len(records), 3)
+            self.assertNotIn("delta", records)
+            records.close()
+            for workers in (None, 2):
+                records = SeqIO.index_db(
+                    self.index_filename, incremental=True, workers=workers
+                )
+                self.assertEqual(len(records), 4)
+                self.assertEqual(list(records), ["delta", "beta", "epsilon", "gamma"])
+                self.assertEqual(records["epsilon"].seq, "A")
+                self.assertEqual(records["gamma"].seq, "TTTT")
+                records.close()
+                # The updated index is valid
+                records = SeqIO.index_db(self.index_filename)
+                self.assertEqual(len(records), 4)
+                records.close()
+                os.utime(first, ns=(0, 0))
+            # A duplicate key
+            second = self.write_fasta(
+                "second.fasta", [("gamma", "TTTT"), ("beta", "C")]
+            )
+            for workers in (None, 2):
+                with self.assertRaises(ValueError):
+                    SeqIO.index_db(
+                        self.index_filename, incremental=True, workers=workers
+                    )
+                # The failed update left the index as it was
+                records = SeqIO.index_db(self.index_filename)
+                self.assertEqual(len(records), 4)
+                self.assertEqual(list(records), ["delta", "beta", "epsilon", "gamma"])
+                records.close()
+            # Once fixed, the index can be updated
+            self.write_fasta("second.fasta", [("gamma", "TTTT"), ("zeta", "C")])
+            os.utime(second, ns=(0, 0))
+            records = SeqIO.index_db(self.index_filename, incremental=True)
+            self.assertEqual(len(records), 5)
+            self.assertEqual(records["zeta"].seq, "C")
+            records.close()
+
+
 class IndexOrderingSingleFile(unittest.TestCase):
     f = "GenBank/NC_000932.faa"
     ids = [r.id for r in SeqIO.parse(f, "fasta")]
@@ -0,0 +1,100 @@
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+"""Tests for multi-process parsing in Bio.SeqIO."""
+
+import os
+import tempfile
+import unittest
+
+from Bio import SeqIO
+from Bio.SeqIO._parallel import _chunk_offsets
+from Bio.SeqIO._parallel import _parallel_parse
+
+
+class ParallelParseTests(unittest.TestCase):
+    """Compare multi-process parsing with the serial parsers."""
+
+    def check(self, filename, fmt):
+        expected = list(SeqIO.parse(filename, fmt))
+        for chunk_size in (1, 50, 300, 1000000):
+            records = list(_parallel_parse(filename, fmt, 2, chunk_size))
+            self.assertEqual(len(records), len(expected))
+            for old, new in zip(expected, records):
+                self.assertEqual(old.id, new.id)
+                self.assertEqual(old.description, new.description)
+                self.assertEqual(old.seq, new.seq)
+                self.assertEqual(old.letter_annotations, new.letter_annotations)
+
+    def test_fasta(self):
+        """Parse FASTA files in parallel."""
+        for filename in ("Fasta/f002", "Fasta/dups.fasta", "Fasta/aster.pro"):
+            with self.subTest(filename=filename):
+                self.check(filename, "fasta")
+        self.check("Fasta/aster_no_wrap.pro", "fasta-2line")
+
+    def test_fastq(self):
+        """Parse FASTQ files in parallel."""
+        for filename, fmt in (
+            ("Quality/example.fastq", "fastq"),
+            ("Quality/sanger_faked.fastq", "fastq-sanger"),
+            ("Quality/misc_dna_original_sanger.fastq", "fastq"),
+            ("Quality/solexa_example.fastq", "fastq-solexa"),
+            ("Quality/illumina_faked.fastq", "fastq-illumina"),
+            ("Quality/zero_length.fastq", "fastq"),
+        ):
+            with self.subTest(filename=filename):
+                self.check(filename, fmt)
+
+    def test_fastq_at_in_quality(self):
+        """Split FASTQ records with quality strings starting with @."""
+        data = "".join(
+            f"@read{i}\nACGT\n+\n{'@+@+' if i % 2 else 'IIII'}\n" for i in range(20)
+        )
+        fd, filename = tempfile.mkstemp(suffix=".fastq")
+        try:
+            with os.fdopen(fd, "w") as handle:
+                handle.write(data)
+            offsets = _chunk_offsets(filename, "fastq", 10)
+            starts = [data.index(f"@read{i}\n") for i in range(20)]
+            self.assertEqual(offsets, starts + [len(data)])
+            self.check(filename, "fastq")
+        finally:
+            os.remove(filename)
+
+    def test_empty(self):
+        """Parse an empty file in parallel."""
+        fd, filename = tempfile.mkstemp(suffix=".fasta")
+        os.close(fd)
+        try:
+            self.assertEqual(list(SeqIO.parse(filename, "fasta", workers=2)), [])
+        finally:
+            os.remove(filename)
+
+    def test_seqio_parse(self):
+        """Call Bio.SeqIO.parse with the workers argument."""
+        records = SeqIO.parse("Quality/example.fastq", "fastq", workers=3)
+        self.assertEqual(
+            [record.id for record in records],
+            [
+                "EAS54_6_R1_2_1_413_324",
+                "EAS54_6_R1_2_1_540_792",
+                "EAS54_6_R1_2_1_443_348",
+            ],
+        )
+
+    def test_errors(self):
+        """Check invalid arguments are rejected."""
+        with self.assertRaises(ValueError):
+            SeqIO.parse("GenBank/cor6_6.gb", "genbank", workers=2)
+        with self.assertRaises(ValueError):
+            SeqIO.parse("Fasta/f002", "fasta", workers=0)
+        with open("Fasta/f002") as handle:
+            with self.assertRaises(TypeError):
+                SeqIO.parse(handle, "fasta", workers=2)
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    unittest.main(testRunner=runner)
@@ -8,7 +8,9 @@ Initially this takes matched tests of GenBank and FASTA files from the NCBI
 and confirms they are consistent using our different parsers.
 """
 
+import random
 import unittest
+import warnings
 
 try:
     import numpy
@@ -21,10 +23,12 @@ from Bio.Seq import MutableSeq
 from Bio.Seq import Seq
 from Bio.SeqFeature import AfterPosition
 from Bio.SeqFeature import BeforePosition
+from Bio.SeqFeature import CompoundLocation
 from Bio.SeqFeature import ExactPosition
 from Bio.SeqFeature import OneOfPosition
 from Bio.SeqFeature import SeqFeature
 from Bio.SeqFeature import SimpleLocation
+from Bio.SeqFeature import UnknownPosition
 from Bio.SeqFeature import WithinPosition
 from Bio.SeqRecord import SeqRecord
 
@@ -627,6 +631,121 @@ class TestTranslation(unittest.TestCase):
         self.assertEqual(t.letter_annotations, {"aa": ["Met", "Val"]})
 
 
+class TestFeatureQueries(unittest.TestCase):
+    """Compare the feature region queries with a search of all features."""
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.record = SeqRecord(Seq(None, 100000), id="test")
+        for i in range(500):
+            start = rng.randrange(0, 99000)
+            if i % 50 == 0:
+                location = SimpleLocation(start, start + rng.randrange(1, 50000))
+            elif i % 3 == 0:
+                strand = rng.choice((1, -1))
+                parts = []
+                for j in range(rng.randrange(2, 5)):
+                    parts.append(SimpleLocation(start, start + 100, strand))
+                    start += rng.randrange(150, 2000)
+                location = CompoundLocation(parts)
+            else:
+                end = start + rng.randrange(0, 1000)
+                location = SimpleLocation(start, end, rng.choice((1, -1, None)))
+            self.record.features.append(SeqFeature(location, id=str(i)))
+        self.record.features.append(SeqFeature(SimpleLocation(5, 10, ref="X1")))
+        self.record.features.append(SeqFeature(SimpleLocation(UnknownPosition(), 10)))
+        self.regions = [(0, 100000), (5, 5), (1000, 1001), (99999, 100000)]
+        for i in range(100):
+            start = rng.randrange(0, 100000)
+            self.regions.append((start, start + rng.choice((1, 100, 5000))))
+
+    def check(self, record):
+        features = [
+            f
+            for f in record.features
+            if not f.location.ref and isinstance(f.location.start, int)
+        ]
+        for start, end in self.regions:
+            for strand in (None, 1, -1):
+                with self.subTest(start=start, end=end, strand=strand):
+                    overlapping = [
+                        f
+                        for f in features
+                        if any(
+                            part.start < end
+                            and start < part.end
+                            and strand in (None, part.strand)
+                            for part in f.location.parts
+                        )
+                    ]
+                    self.assertEqual(
+                        record.features_overlapping(start, end, strand), overlapping
+                    )
+                    within = [
+                        f
+                        for f in features
+                        if start <= f.location.start
+                        and f.location.end <= end
+                        and strand in (None, f.location.strand)
+                    ]
+                    self.assertEqual(record.features_within(start, end, strand), within)
+
+    def test_queries(self):
+        """Check region queries on random features."""
+        self.check(self.record)
+
+    def test_empty(self):
+        """Check region queries on a record without features."""
+        record = SeqRecord(Seq("ACGT"))
+        self.assertEqual(record.features_overlapping(0, 4), [])
+        self.assertEqual(record.features_within(0, 4), [])
+
+    def test_modified(self):
+        """Check the index notices changes to the features list."""
+        record = self.record
+        self.check(record)
+        del record.features[100:200]
+        self.check(record)
+        record.features.append(SeqFeature(SimpleLocation(20, 30)))
+        self.check(record)
+        record.features[0] = SeqFeature(SimpleLocation(1000, 1001))
+        self.check(record)
+        record.features = record.features[::-1]
+        self.check(record)
+        record.features[1].location = SimpleLocation(50, 60, -1)
+        self.check(record)
+
+    def test_new_location(self):
+        """Check slicing after giving a feature a new location."""
+        record = SeqRecord(Seq("ACGT" * 250), id="test")
+        record.features.append(SeqFeature(SimpleLocation(10, 20, 1), id="f0"))
+        self.assertEqual([f.id for f in record[0:100].features], ["f0"])
+        record.features[0].location = SimpleLocation(900, 905, 1)
+        self.assertEqual(record[0:100].features, [])
+        sliced = record[880:950]
+        self.assertEqual([f.id for f in sliced.features], ["f0"])
+        self.assertEqual(sliced.features[0].location, SimpleLocation(20, 25, 1))
+
+    def test_slicing(self):
+        """Check slicing keeps the features within the slice."""
+        record = self.record
+        for start, end in self.regions:
+            with self.subTest(start=start, end=end):
+                with warnings.catch_warnings(record=True) as caught:
+                    warnings.simplefilter("always")
+                    sliced = record[start:end]
+                self.assertEqual(len(caught), 1)
+                end = min(end, len(record))
+                self.assertEqual(
+                    [f.id for f in sliced.features],
+                    [f.id for f in record.features_within(start, end)],
+                )
+                for old, new in zip(
+                    record.features_within(start, end), sliced.features
+                ):
+                    self.assertEqual(new.location, old.location._shift(-start))
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
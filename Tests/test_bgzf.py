@@ -516,6 +516,96 @@ class BgzfTests(unittest.TestCase):
         with open(self.temp_file, "wb") as handle:
             bgzf.BgzfWriter(fileobj=handle)
 
+    def test_writer_threads(self):
+        """Check compressing with threads gives identical output and offsets."""
+        with gzip.open("GenBank/NC_000932.gb.bgz", "rb") as h:
+            data = h.read()
+        files = {}
+        for threads in (None, 3):
+            stream = io.BytesIO()
+            stream.close = lambda: None  # keep the contents after close
+            offsets = []
+            with bgzf.BgzfWriter(fileobj=stream, threads=threads) as h:
+                for start in range(0, len(data), 30000):
+                    h.write(data[start : start + 30000])
+                    offsets.append(h.tell())
+                h.flush()
+                offsets.append(h.tell())
+            files[threads] = stream.getvalue(), offsets
+        self.assertEqual(files[None], files[3])
+        with bgzf.BgzfReader(fileobj=io.BytesIO(files[3][0]), mode="rb") as h:
+            self.assertEqual(h.read(len(data) + 1), data)
+
+    def read_lines_with_offsets(self, handle):
+        lines = []
+        while True:
+            offset = handle.tell()
+            line = handle.readline()
+            if not line:
+                return lines
+            lines.append((offset, line))
+
+    def test_reader_threads(self):
+        """Check decompressing with threads gives identical data and offsets."""
+        for mode in ("rb", "r"):
+            with bgzf.BgzfReader("GenBank/NC_000932.gb.bgz", mode) as h:
+                old = self.read_lines_with_offsets(h)
+            with bgzf.BgzfReader("GenBank/NC_000932.gb.bgz", mode, threads=2) as h:
+                new = self.read_lines_with_offsets(h)
+                self.assertEqual(old, new)
+                # Random access must still work, including going backwards
+                for offset, line in old[::-97] + old[::89]:
+                    h.seek(offset)
+                    self.assertEqual(h.tell(), offset)
+                    self.assertEqual(h.readline(), line)
+            with bgzf.open("GenBank/NC_000932.gb.bgz", mode, threads=2) as h:
+                self.assertEqual(h.read(10), old[0][1][:10])
+
+    def test_cache_lru(self):
+        """Check the least recently used block is removed from the cache."""
+        with open("SamBam/ex1.bam", "rb") as h:
+            starts = [values[0] for values in bgzf.BgzfBlocks(h)]
+        with bgzf.BgzfReader("SamBam/ex1.bam", "rb", max_cache=3) as h:
+            self.assertEqual(h.cache_info(), (0, 1, 3, 1))
+            for start in starts[1:3] + starts[:1] + starts[3:4] + starts[:1]:
+                h.seek(bgzf.make_virtual_offset(start, 0))
+            # Only the first block was used often enough to stay cached
+            self.assertEqual(h.cache_info(), (2, 4, 3, 3))
+            self.assertEqual(list(h._buffers), [starts[2], starts[3], starts[0]])
+            h.cache_hits = h.cache_misses = 0
+            h.seek(bgzf.make_virtual_offset(starts[1], 0))
+            self.assertEqual(h.cache_info(), (0, 1, 3, 3))
+
+    def test_read_ahead(self):
+        """Check read ahead fills the cache when reading sequentially."""
+        with bgzf.BgzfReader("SamBam/ex1.bam", "rb") as h:
+            expected = [self.read_lines_with_offsets(h)]
+        for threads in (None, 2):
+            with bgzf.BgzfReader(
+                "SamBam/ex1.bam", "rb", threads=threads, read_ahead=3
+            ) as h:
+                self.assertEqual(self.read_lines_with_offsets(h), expected[0])
+                # With threads the queue is topped up as each block is used,
+                # so only the first block and the end of file are misses.
+                # Without threads, three more blocks are loaded on each miss.
+                self.assertEqual(h.cache_misses, 3 if threads is None else 2)
+                # Having read ahead, jumping backwards is found in the cache
+                h.cache_hits = h.cache_misses = 0
+                for offset, line in expected[0][::-50]:
+                    h.seek(offset)
+                    self.assertEqual(h.readline(), line)
+                self.assertEqual(h.cache_misses, 0)
+        with self.assertRaises(ValueError):
+            bgzf.BgzfReader("SamBam/ex1.bam", "rb", read_ahead=-1)
+
+    def test_threads_invalid(self):
+        """Check invalid values for threads are rejected."""
+        for threads in (0, -1, 2.5):
+            with self.assertRaises(ValueError):
+                bgzf.BgzfWriter(fileobj=io.BytesIO(), threads=threads)
+            with self.assertRaises(ValueError):
+                bgzf.BgzfReader(fileobj=io.BytesIO(), threads=threads)
+
 
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
@@ -8,6 +8,8 @@
 import array
 import os
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
 
 try:
     import numpy as np
@@ -4983,6 +4985,527 @@ query	16	target	1	255	6D17M5I	*	0	0	ACGATCGAGCNGCTACGCCCNC	*	AS:i:13
         )
 
 
+class TestScoreMany(unittest.TestCase):
+    """Check the batch scoring methods score_many and score_matrix."""
+
+    seqs = [
+        "GAACT",
+        "GAT",
+        "TTTGAACTTT",
+        "ACGTNACGT",
+        "CCCCC",
+        "GATTACA",
+        "AGCTAGCTAGGCTACGA",
+    ]
+
+    def check(self, aligner):
+        for strand in ("+", "-"):
+            for threads in (None, 3):
+                scores = aligner.score_many(
+                    "GAATTC", self.seqs, strand=strand, threads=threads
+                )
+                self.assertEqual(scores.shape, (len(self.seqs),))
+                for score, target in zip(scores, self.seqs):
+                    self.assertAlmostEqual(
+                        score, aligner.score(target, "GAATTC", strand=strand)
+                    )
+                scores = aligner.score_matrix(self.seqs, strand=strand, threads=threads)
+                self.assertEqual(scores.shape, (len(self.seqs), len(self.seqs)))
+                for i, target in enumerate(self.seqs):
+                    for j, query in enumerate(self.seqs):
+                        self.assertAlmostEqual(
+                            scores[i, j], aligner.score(target, query, strand=strand)
+                        )
+
+    def test_algorithms(self):
+        aligner = Align.PairwiseAligner(match_score=2, mismatch_score=-1)
+        for mode in ("global", "local"):
+            aligner.mode = mode
+            aligner.gap_score = -1
+            self.assertNotIn("Gotoh", aligner.algorithm)
+            self.check(aligner)
+            aligner.open_gap_score = -3
+            aligner.query_end_gap_score = 0
+            self.assertIn("Gotoh", aligner.algorithm)
+            self.check(aligner)
+
+    def test_substitution_matrix(self):
+        aligner = Align.PairwiseAligner(scoring="blastn")
+        aligner.wildcard = "N"
+        self.check(aligner)
+        aligner.mode = "local"
+        self.check(aligner)
+
+    def test_gap_function(self):
+        def gap_score(i, n):
+            return -2 - n
+
+        aligner = Align.PairwiseAligner(mismatch_score=-1, gap_score=gap_score)
+        self.assertIn("Waterman-Smith-Beyer", aligner.algorithm)
+        self.check(aligner)
+
+    def test_input(self):
+        aligner = Align.PairwiseAligner()
+        targets = [Seq("GAACT"), SeqRecord(Seq("GAT")), "GACT", b"GAAT"]
+        self.assertEqual(list(aligner.score_many(Seq("GAT"), targets)), [3, 3, 3, 3])
+        self.assertEqual(aligner.score_many("GAT", []).shape, (0,))
+        self.assertEqual(aligner.score_matrix([]).shape, (0, 0))
+        self.assertEqual(aligner.score_many("GAT", [], threads=2).shape, (0,))
+        self.assertEqual(aligner.score_matrix([], threads=2).shape, (0, 0))
+        with self.assertRaises(ValueError):
+            aligner.score_many("GAT", ["GAACT", ""])
+        with self.assertRaises(ValueError):
+            aligner.score_many("GAT", ["GAACT"], threads=0)
+        with self.assertRaises(ValueError):
+            aligner.score_many("GAT", ["GAACT"], strand="+-")
+
+
+class TestStripedScore(unittest.TestCase):
+    """Check the vectorized score calculation with a substitution matrix."""
+
+    letters = "ACDEFGHIKLMNPQRSTVWY"
+
+    def setUp(self):
+        from Bio.Align import substitution_matrices
+
+        self.blosum62 = substitution_matrices.load("BLOSUM62")
+        # Scores that are not integers are handled by the scalar code
+        self.shifted = substitution_matrices.Array(
+            alphabet=self.blosum62.alphabet,
+            dims=2,
+            data=np.array(self.blosum62) + 0.25,
+        )
+
+    def random_sequence(self, rng, length):
+        return "".join(rng.choice(list(self.letters), length))
+
+    def test_random(self):
+        rng = np.random.default_rng(seed=22)
+        aligner = Align.PairwiseAligner(substitution_matrix=self.blosum62)
+        gaps = [(0, 0), (-2, -2), (-11, -1), (-5, 0), (-10, -3)]
+        for mode in ("global", "local"):
+            aligner.mode = mode
+            for open_gap_score, extend_gap_score in gaps:
+                aligner.open_gap_score = open_gap_score
+                aligner.extend_gap_score = extend_gap_score
+                for i in range(20):
+                    target = self.random_sequence(rng, rng.integers(1, 70))
+                    query = self.random_sequence(rng, rng.integers(1, 70))
+                    score = aligner.score(target, query)
+                    alignments = aligner.align(target, query)
+                    self.assertEqual(score, alignments.score)
+
+    def test_end_gaps(self):
+        # End gap scores differing from the internal gap scores are handled
+        # by the scalar code, as are scores that are not integers.
+        aligner = Align.PairwiseAligner(
+            mode="global", substitution_matrix=self.blosum62
+        )
+        aligner.open_gap_score = -11
+        aligner.extend_gap_score = -1
+        aligner.end_gap_score = 0
+        target = "PAWHEAEKW"
+        query = "HEAGAWGHEE"
+        self.assertEqual(aligner.score(target, query), 25.0)
+        self.assertEqual(aligner.align(target, query).score, 25.0)
+        aligner.substitution_matrix = self.shifted
+        self.assertAlmostEqual(aligner.score(target, query), 26.5)
+
+    def test_saturation(self):
+        # These scores do not fit in 16 bits
+        aligner = Align.PairwiseAligner(substitution_matrix=self.blosum62)
+        aligner.open_gap_score = -11
+        aligner.extend_gap_score = -1
+        aligner.mode = "local"
+        self.assertEqual(aligner.score("W" * 4000, "W" * 4000), 44000.0)
+        self.assertEqual(aligner.score("WWAW" * 500, "WWAW" * 490), 18130.0)
+        aligner.mode = "global"
+        self.assertEqual(aligner.score("W" * 4000, "A" * 4000), -8020.0)
+        self.assertEqual(aligner.score("W" * 30000, "A" * 5), -30020.0)
+
+
+class TestBandedXdrop(unittest.TestCase):
+    """Check banded and X-drop alignments."""
+
+    def mutate(self, rng, sequence, n):
+        sequence = list(sequence)
+        for i in range(n):
+            position = rng.integers(len(sequence))
+            operation = rng.integers(3)
+            if operation == 0:
+                del sequence[position]
+            elif operation == 1:
+                sequence.insert(position, rng.choice(list("ACGT")))
+            else:
+                sequence[position] = rng.choice(list("ACGT"))
+        return "".join(sequence)
+
+    def test_wide_band(self):
+        # A band covering the whole matrix gives an optimal alignment
+        rng = np.random.default_rng(seed=23)
+        aligner = Align.PairwiseAligner(match_score=2, mismatch_score=-1)
+        settings = [(-2, -2), (-3, -1), (-5, -1)]
+        for mode in ("global", "local"):
+            aligner.mode = mode
+            for open_gap_score, extend_gap_score in settings:
+                aligner.open_gap_score = open_gap_score
+                aligner.extend_gap_score = extend_gap_score
+                aligner.query_end_gap_score = -1
+                for strand in ("+", "-"):
+                    for i in range(10):
+                        target = "".join(rng.choice(list("ACGT"), 15))
+                        query = self.mutate(rng, target, 4)
+                        aligner.band_width = None
+                        alignments = aligner.align(target, query, strand=strand)
+                        aligner.band_width = 20
+                        score = aligner.score(target, query, strand=strand)
+                        self.assertEqual(score, alignments.score)
+                        banded = aligner.align(target, query, strand=strand)
+                        self.assertEqual(banded.score, alignments.score)
+                        if len(alignments) == 0:
+                            self.assertEqual(len(banded), 0)
+                            continue
+                        self.assertEqual(len(banded), 1)
+                        coordinates = banded[0].coordinates
+                        self.assertTrue(
+                            any(
+                                np.array_equal(coordinates, alignment.coordinates)
+                                for alignment in alignments
+                            )
+                        )
+
+    def test_narrow_band(self):
+        aligner = Align.PairwiseAligner(match_score=2, mismatch_score=-1)
+        aligner.gap_score = -1
+        target = "AAAAAAAAAAAAAAAAGGGG"
+        query = "GGGGAAAAAAAAAAAAAAAA"
+        # The optimal alignment is on diagonal 4
+        expected = {
+            None: (24.0, [[0, 0, 16, 20], [0, 4, 20, 20]]),
+            0: (16.0, [[0, 20], [0, 20]]),
+            1: (18.0, [[0, 0, 16, 17, 20], [0, 1, 17, 17, 20]]),
+            3: (22.0, [[0, 0, 16, 19, 20], [0, 3, 19, 19, 20]]),
+            4: (24.0, [[0, 0, 16, 20], [0, 4, 20, 20]]),
+        }
+        for band_width, (score, coordinates) in expected.items():
+            aligner.band_width = band_width
+            self.assertEqual(aligner.score(target, query), score)
+            alignments = aligner.align(target, query)
+            self.assertEqual(alignments.score, score)
+            self.assertEqual(alignments[0].coordinates.tolist(), coordinates)
+        # The band always includes the diagonal of the end point
+        aligner.band_width = 0
+        self.assertEqual(aligner.score("GAACTTTAGCA", "GAACTTAGCA"), 19.0)
+
+    def test_long_sequences(self):
+        rng = np.random.default_rng(seed=24)
+        target = "".join(rng.choice(list("ACGT"), 20000))
+        query = self.mutate(rng, target, 30)
+        aligner = Align.PairwiseAligner(
+            match_score=1, mismatch_score=-2, open_gap_score=-3, extend_gap_score=-1
+        )
+        aligner.band_width = 50
+        alignments = aligner.align(target, query)
+        self.assertEqual(len(alignments), 1)
+        alignment = alignments[0]
+        self.assertEqual(alignment.score, aligner.score(target, query))
+        self.assertGreater(alignment.score, 19800)
+        self.assertEqual(alignment.coordinates[0, -1], len(target))
+        self.assertEqual(alignment.coordinates[1, -1], len(query))
+        aligner.band_width = None
+        aligner.mode = "local"
+        aligner.xdrop = 30
+        alignments = aligner.align(target, query)
+        self.assertEqual(alignments.score, aligner.score(target, query))
+        self.assertGreater(alignments.score, 19800)
+
+    def test_xdrop(self):
+        aligner = Align.PairwiseAligner(mode="local", match_score=2)
+        aligner.mismatch_score = -1
+        aligner.gap_score = -5
+        # two matching regions separated by five mismatches
+        target = "ACGTACGTAC" + "TTTTT" + "GGCAGGCAGG"
+        query = "ACGTACGTAC" + "AAAAA" + "GGCAGGCAGG"
+        self.assertEqual(aligner.score(target, query), 35.0)
+        aligner.xdrop = 100
+        self.assertEqual(aligner.score(target, query), 35.0)
+        aligner.xdrop = 3
+        # the extension is stopped in the middle region
+        self.assertEqual(aligner.score(target, query), 20.0)
+        alignments = aligner.align(target, query)
+        self.assertEqual(len(alignments), 1)
+        self.assertEqual(alignments.score, 20.0)
+        self.assertEqual(alignments[0].coordinates.tolist(), [[0, 10], [0, 10]])
+        self.assertEqual(len(aligner.align("AAAA", "CCCC")), 0)
+
+    def test_settings(self):
+        aligner = Align.PairwiseAligner()
+        self.assertIsNone(aligner.band_width)
+        self.assertIsNone(aligner.xdrop)
+        with self.assertRaises(ValueError):
+            aligner.band_width = -1
+        with self.assertRaises(TypeError):
+            aligner.band_width = 1.5
+        with self.assertRaises(ValueError):
+            aligner.xdrop = -1
+        aligner.xdrop = 5
+        with self.assertRaises(ValueError):
+            # only in local mode
+            aligner.score("ACGT", "ACGT")
+        aligner.xdrop = None
+        aligner.band_width = 3
+        aligner.target_gap_score = lambda i, n: -n
+        with self.assertRaises(ValueError):
+            aligner.align("ACGT", "ACGT")
+        aligner = Align.PairwiseAligner(mode="local", band_width=3, xdrop=10)
+        self.assertIn("band_width: 3", str(aligner))
+        self.assertIn("xdrop: 10", str(aligner))
+        import pickle
+
+        pickled_aligner = pickle.loads(pickle.dumps(aligner))
+        self.assertEqual(pickled_aligner.band_width, 3)
+        self.assertEqual(pickled_aligner.xdrop, 10)
+
+
+class TestLinearSpace(unittest.TestCase):
+    """Check global alignments calculated in linear space."""
+
+    def mutate(self, rng, sequence, n):
+        sequence = list(sequence)
+        for i in range(n):
+            position = rng.integers(len(sequence))
+            operation = rng.integers(3)
+            if operation == 0:
+                del sequence[position]
+            elif operation == 1:
+                sequence.insert(position, rng.choice(list("ACGT")))
+            else:
+                sequence[position] = rng.choice(list("ACGT"))
+        return "".join(sequence)
+
+    def test_random(self):
+        # The alignment is one of the optimal alignments
+        rng = np.random.default_rng(seed=25)
+        aligner = Align.PairwiseAligner(match_score=2, mismatch_score=-1)
+        settings = [(-2, -2, -2), (-3, -1, 0), (-5, -1, -1), (-1, -3, -2)]
+        for open_gap_score, extend_gap_score, end_gap_score in settings:
+            aligner.open_gap_score = open_gap_score
+            aligner.extend_gap_score = extend_gap_score
+            aligner.query_end_gap_score = end_gap_score
+            for strand in ("+", "-"):
+                for i in range(10):
+                    target = "".join(rng.choice(list("ACGT"), 12))
+                    query = self.mutate(rng, target, 4)
+                    aligner.linear_space = False
+                    alignments = aligner.align(target, query, strand=strand)
+                    aligner.linear_space = True
+                    alignment = aligner.align(target, query, strand=strand)[0]
+                    self.assertEqual(alignment.score, alignments.score)
+                    self.assertTrue(
+                        any(
+                            np.array_equal(alignment.coordinates, a.coordinates)
+                            for a in alignments
+                        )
+                    )
+
+    def test_long_sequences(self):
+        rng = np.random.default_rng(seed=26)
+        target = "".join(rng.choice(list("ACGT"), 3000))
+        query = self.mutate(rng, target, 300)
+        aligner = Align.PairwiseAligner("blastn")
+        aligner.target_end_gap_score = 0
+        aligner.linear_space = True
+        for strand in ("+", "-"):
+            if strand == "-":
+                query = reverse_complement(query)
+            alignments = aligner.align(target, query, strand=strand)
+            self.assertEqual(len(alignments), 1)
+            alignment = alignments[0]
+            score = aligner.score(target, query, strand=strand)
+            self.assertEqual(alignment.score, score)
+            self.assertEqual(alignment.coordinates[0, 0], 0)
+            self.assertEqual(alignment.coordinates[0, -1], len(target))
+            counts = alignment.counts()
+            self.assertGreater(counts.identities, 2500)
+
+    def test_settings(self):
+        aligner = Align.PairwiseAligner()
+        self.assertFalse(aligner.linear_space)
+        aligner.linear_space = True
+        self.assertIn("linear_space: True", str(aligner))
+        alignment = aligner.align("ACGT", "AGT")[0]
+        self.assertEqual(alignment.score, 3.0)
+        aligner.mode = "local"
+        with self.assertRaises(ValueError):
+            aligner.align("ACGT", "ACGT")
+        # scores are not affected
+        self.assertEqual(aligner.score("ACGT", "ACGT"), 4.0)
+        aligner.mode = "global"
+        aligner.band_width = 3
+        with self.assertRaises(ValueError):
+            aligner.align("ACGT", "ACGT")
+        aligner.band_width = None
+        aligner.target_gap_score = lambda i, n: -n
+        with self.assertRaises(ValueError):
+            aligner.align("ACGT", "ACGT")
+        import pickle
+
+        aligner = Align.PairwiseAligner(linear_space=True)
+        pickled_aligner = pickle.loads(pickle.dumps(aligner))
+        self.assertTrue(pickled_aligner.linear_space)
+
+
+class TestAnchoredAligner(unittest.TestCase):
+    """Check mapping reads with the seed-and-extend aligner."""
+
+    def setUp(self):
+        rng = np.random.default_rng(seed=27)
+        self.rng = rng
+        self.reference = "".join(rng.choice(list("ACGT"), 20000))
+
+    def mutate(self, sequence, n):
+        sequence = list(sequence)
+        for i in range(n):
+            position = self.rng.integers(len(sequence))
+            operation = self.rng.integers(3)
+            if operation == 0:
+                del sequence[position]
+            elif operation == 1:
+                sequence.insert(position, self.rng.choice(list("ACGT")))
+            else:
+                sequence[position] = self.rng.choice(list("ACGT"))
+        return "".join(sequence)
+
+    def test_mapping(self):
+        reference = self.reference
+        aligner = Align.AnchoredAligner(reference)
+        scorer = Align.PairwiseAligner(
+            mode="local",
+            match_score=2,
+            mismatch_score=-4,
+            open_gap_score=-6,
+            extend_gap_score=-2,
+        )
+        for start in (0, 3000, 12345, 19500):
+            read = self.mutate(reference[start : start + 500], 10)
+            for strand in ("+", "-"):
+                if strand == "-":
+                    read = reverse_complement(read)
+                alignments = aligner.align(read)
+                self.assertEqual(len(alignments), 1)
+                alignment = alignments[0]
+                self.assertEqual(alignment.flag, 0 if strand == "+" else 0x10)
+                self.assertEqual(alignment.mapq, 60)
+                self.assertIs(alignment.target, reference)
+                self.assertIs(alignment.query, read)
+                self.assertLess(abs(alignment.coordinates[0, 0] - start), 20)
+                if strand == "+":
+                    self.assertLess(alignment.coordinates[1, 0], 20)
+                else:
+                    self.assertGreater(alignment.coordinates[1, 0], len(read) - 20)
+                window = reference[max(start - 100, 0) : start + 600]
+                score = scorer.score(window, read, strand)
+                self.assertEqual(alignment.score, score)
+        self.assertEqual(len(aligner.align("ACGT" * 10)), 0)
+        self.assertEqual(len(aligner.align("ACG")), 0)
+
+    def test_secondary_supplementary(self):
+        reference = self.reference
+        # a second target containing a copy of part of the first target
+        other = "".join(self.rng.choice(list("ACGT"), 2000))
+        other = other[:1000] + reference[5000:5400] + other[1000:]
+        targets = [
+            SeqRecord(Seq(reference), id="chromosome"),
+            SeqRecord(Seq(other), id="plasmid"),
+        ]
+        aligner = Align.AnchoredAligner(targets)
+        read = reference[5050:5350]
+        alignments = aligner.align(read)
+        self.assertEqual(len(alignments), 2)
+        self.assertEqual(alignments[0].flag, 0)
+        self.assertEqual(alignments[0].mapq, 0)
+        self.assertEqual(alignments[1].flag, 0x100)
+        self.assertEqual(alignments[1].score, alignments[0].score)
+        # a chimeric read
+        read = reference[2000:2300] + reverse_complement(reference[15000:15200])
+        alignments = aligner.align(read)
+        self.assertEqual(len(alignments), 2)
+        self.assertEqual(alignments[0].flag, 0)
+        self.assertEqual(alignments[0].mapq, 60)
+        self.assertEqual(alignments[0].coordinates[0, 0], 2000)
+        self.assertEqual(alignments[1].flag, 0x800 | 0x10)
+        self.assertEqual(alignments[1].coordinates[0, 0], 15000)
+        self.assertEqual(alignments[1].coordinates[1, 0], 500)
+
+    def test_sam(self):
+        reference = SeqRecord(Seq(self.reference), id="reference")
+        aligner = Align.AnchoredAligner(reference, k=11, w=5)
+        reads = []
+        for i, start in enumerate((100, 7000, 16000)):
+            sequence = self.mutate(self.reference[start : start + 300], 5)
+            if i == 1:
+                sequence = reverse_complement(sequence)
+            reads.append(SeqRecord(Seq(sequence), id="read%d" % i))
+        alignments = aligner.map(reads)
+        self.assertEqual(len(alignments), 3)
+        stream = StringIO()
+        self.assertEqual(Align.write(alignments, stream, "sam"), 3)
+        stream.seek(0)
+        self.assertEqual(stream.readline(), "@SQ\tSN:reference\tLN:20000\n")
+        stream.seek(0)
+        for alignment, parsed in zip(alignments, Align.parse(stream, "sam")):
+            self.assertEqual(parsed.query.id, alignment.query.id)
+            self.assertEqual(parsed.target.id, "reference")
+            self.assertEqual(parsed.score, alignment.score)
+            self.assertEqual(parsed.flag, alignment.flag)
+            self.assertEqual(parsed.mapq, alignment.mapq)
+            self.assertTrue(np.array_equal(parsed.coordinates, alignment.coordinates))
+
+    def test_settings(self):
+        with self.assertRaises(ValueError):
+            Align.AnchoredAligner("ACGT", k=32)
+        with self.assertRaises(ValueError):
+            Align.AnchoredAligner("ACGT", w=0)
+        scorer = Align.PairwiseAligner(match_score=1, mismatch_score=-1)
+        scorer.gap_score = -2
+        aligner = Align.AnchoredAligner(self.reference, aligner=scorer)
+        self.assertEqual(aligner.k, 15)
+        self.assertEqual(aligner.w, 10)
+        # the aligner is copied
+        self.assertEqual(scorer.mode, "global")
+        self.assertEqual(aligner.aligner.mode, "local")
+        self.assertEqual(aligner.aligner.match_score, 1)
+        read = self.reference[1000:1300]
+        self.assertEqual(aligner.align(read)[0].score, 300)
+        # the band width is set on a copy used by each thread
+        self.assertIsNone(aligner.aligner.band_width)
+        import pickle
+
+        aligner = pickle.loads(pickle.dumps(aligner))
+        self.assertEqual(aligner.align(read)[0].score, 300)
+
+    def test_threads(self):
+        reference = self.reference
+        aligner = Align.AnchoredAligner(reference)
+        reads = []
+        for start in range(0, 19000, 500):
+            read = self.mutate(reference[start : start + 400 + start % 300], 10)
+            if start % 1000:
+                read = reverse_complement(read)
+            reads.append(read)
+        expected = [
+            [(a.score, a.coordinates.tolist()) for a in aligner.align(read)]
+            for read in reads
+        ]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for i in range(3):
+                results = executor.map(aligner.align, reads)
+                self.assertEqual(
+                    [[(a.score, a.coordinates.tolist()) for a in r] for r in results],
+                    expected,
+                )
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
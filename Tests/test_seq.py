@@ -1242,6 +1242,160 @@ class TestStopCodons(unittest.TestCase):
         self.assertEqual(Seq.translate("nnn"), "X")
 
 
+class TestTranslateMany(unittest.TestCase):
+    """Compare the batch translation functions with the scalar versions."""
+
+    def scalar(self, sequences, **kwargs):
+        """Translate each sequence in turn, returns results or the error."""
+        gap = kwargs.pop("gap", None)
+        results = []
+        try:
+            for sequence in sequences:
+                if isinstance(sequence, str):
+                    results.append(Seq.translate(sequence, gap=gap, **kwargs))
+                else:
+                    sequence = Seq.Seq(sequence)
+                    results.append(sequence.translate(gap=gap or "-", **kwargs))
+        except (TranslationError, ValueError) as error:
+            return type(error), str(error)
+        return results
+
+    def batch(self, sequences, **kwargs):
+        try:
+            return Seq.translate_many(sequences, **kwargs)
+        except (TranslationError, ValueError) as error:
+            return type(error), str(error)
+
+    @unittest.skipIf(numpy is None, "NumPy is required")
+    def test_random(self):
+        """Translate random sequences with all tables and options."""
+        import random
+
+        rng = random.Random(0)
+        letters = "ACGT" * 20 + "acgtuRYSWKMBDHVN-" + "??"
+        options = [
+            {},
+            {"stop_symbol": "@"},
+            {"stop_symbol": "STOP"},
+            {"to_stop": True},
+            {"gap": "-"},
+            {"gap": "-", "to_stop": True},
+        ]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", BiopythonWarning)
+            for table in list(range(1, 7)) + [9, 10, 11, 12, 13, 14, 15, 16, 21]:
+                for kwargs in options:
+                    sequences = []
+                    for i in range(rng.randrange(1, 8)):
+                        length = rng.choice((0, 1, 2, 3, 12, 30, 31, 97))
+                        sequence = "".join(rng.choices(letters, k=length))
+                        if "?" in sequence and rng.random() < 0.8:
+                            sequence = sequence.replace("?", "A")
+                        sequences.append(sequence)
+                    sequences.append(Seq.Seq(sequences[0]))
+                    sequences.append(Seq.MutableSeq(sequences[-1]))
+                    with self.subTest(table=table, sequences=sequences, **kwargs):
+                        self.assertEqual(
+                            self.batch(sequences, table=table, **kwargs),
+                            self.scalar(sequences, table=table, **kwargs),
+                        )
+
+    @unittest.skipIf(numpy is None, "NumPy is required")
+    def test_cds(self):
+        """Check the CDS checks give the same errors."""
+        cases = [
+            ["ATGGCCTAA", "GTGAAATAG", "ATGTAA"],
+            ["ATGGCCTAA", "AAAGCCTAA"],
+            ["ATGGCCTA"],
+            ["ATGGCCTAC"],
+            ["ATGTAAGCCTAG"],
+            ["ATGGC?TAG", "AAAGCCTAA"],
+            ["ATGTAA"],
+            ["ATG"],
+            ["ATGgcNTAG", Seq.Seq("atgtga")],
+        ]
+        for sequences in cases:
+            for table in (1, 2, 11):
+                with self.subTest(sequences=sequences, table=table):
+                    self.assertEqual(
+                        self.batch(sequences, table=table, cds=True),
+                        self.scalar(sequences, table=table, cds=True),
+                    )
+
+    @unittest.skipIf(numpy is None, "NumPy is required")
+    def test_cds_short(self):
+        """Check the CDS errors for sequences shorter than two codons."""
+        for length in range(6):
+            for sequences in (["ATGTAA"[:length]], ["ATGTAA", "ATGTAA"[:length]]):
+                with self.subTest(sequences=sequences):
+                    self.assertEqual(
+                        self.batch(sequences, cds=True),
+                        self.scalar(sequences, cds=True),
+                    )
+        self.assertEqual(
+            self.batch(["AT", "ATGTAA"], cds=True),
+            (TranslationError, "First codon 'AT' is not a start codon"),
+        )
+
+    @unittest.skipIf(numpy is None, "NumPy is required")
+    def test_other_letters(self):
+        """Check codons using letters accepted by the ambiguous tables."""
+        sequences = ["XAC", "ATGXXXTAA", "AXG", "TG?"]
+        for table in (1, 2, 11):
+            for sequence in sequences:
+                for kwargs in ({}, {"cds": True}, {"to_stop": True}):
+                    kwargs["table"] = table
+                    with self.subTest(sequence=sequence, **kwargs):
+                        self.assertEqual(
+                            self.batch([sequence, Seq.Seq(sequence)], **kwargs),
+                            self.scalar([sequence, Seq.Seq(sequence)], **kwargs),
+                        )
+
+    @unittest.skipIf(numpy is None, "NumPy is required")
+    def test_special_cases(self):
+        """Check the fallbacks and dual coding tables."""
+        self.assertEqual(Seq.translate_many([]), [])
+        sequences = [Seq.Seq(None, 6), "ATGAAA", "ATGÄAA"[:3], Seq.MutableSeq("TAA")]
+        results = Seq.translate_many(sequences[:2] + sequences[3:])
+        self.assertEqual(len(results[0]), 2)
+        self.assertFalse(results[0].defined)
+        self.assertEqual(results[1:], ["MK", Seq.Seq("*")])
+        self.assertEqual(Seq.translate_many(sequences[2:3]), ["M"])
+        with self.assertRaises(ValueError):
+            Seq.translate_many(["ATGGGCTGA"], table=28, to_stop=True)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            self.assertEqual(
+                Seq.translate_many(["ATGGGCTGA"] * 3, table=28), ["MGW"] * 3
+            )
+            self.assertTrue(str(w[0].message).startswith("This table contains"))
+            self.assertEqual(len(w), 1)
+        with self.assertRaises(TypeError):
+            Seq.translate_many(["ATG"], gap=1)
+
+    def test_reverse_complement_many(self):
+        """Compare reverse_complement_many with reverse_complement."""
+        from Bio.SeqRecord import SeqRecord
+
+        sequences = test_seqs + [
+            "",
+            "ACGTUacgtuXYZxyz",
+            Seq.Seq(None, 5),
+            SeqRecord(Seq.Seq("ACGT"), id="x"),
+        ]
+        results = Seq.reverse_complement_many(sequences)
+        self.assertEqual(len(results), len(sequences))
+        for sequence, result in zip(sequences, results):
+            expected = Seq.reverse_complement(sequence)
+            self.assertIs(type(result), type(expected))
+            if isinstance(sequence, SeqRecord):
+                self.assertEqual(result.seq, expected.seq)
+            elif isinstance(sequence, Seq.Seq) and not sequence.defined:
+                self.assertEqual(len(result), len(expected))
+            else:
+                self.assertEqual(result, expected)
+
+
 class TestAttributes(unittest.TestCase):
     def test_seq(self):
         s = Seq.Seq("ACGT")
@@ -1353,6 +1507,251 @@ class TestSeqDefined(unittest.TestCase):
             self.assertEqual(seq.defined_ranges, ((0, len(seq)),), msg=repr(seq))
 
 
+@unittest.skipIf(numpy is None, "NumPy is required")
+class TestPackedSeq(unittest.TestCase):
+    """Compare packed sequences with the same sequence stored as bytes."""
+
+    def setUp(self):
+        # Use small blocks to test the code joining the blocks together
+        self.block_size = Seq._PACKED_BLOCK_SIZE
+        self.min_size = Seq._PACKED_MIN_SIZE
+        Seq._PACKED_BLOCK_SIZE = 64
+        Seq._PACKED_MIN_SIZE = 8
+
+    def tearDown(self):
+        Seq._PACKED_BLOCK_SIZE = self.block_size
+        Seq._PACKED_MIN_SIZE = self.min_size
+
+    def random_sequences(self):
+        import random
+
+        rng = random.Random(0)
+        for letters in (
+            "ACGT" * 10 + "N",
+            "ACGTacgtNNNNnRYKMSWBDHV-U",
+            "ACGTAAAAAAAAAAaaaaaNNNN",
+        ):
+            for length in (1, 7, 8, 63, 64, 65, 500):
+                for bits in (2, 4):
+                    sequence = "".join(rng.choices(letters, k=length))
+                    yield Seq.Seq(sequence), bits
+
+    def test_slicing(self):
+        """Check slices of packed sequences."""
+        indices = (None, 0, 1, 5, 9, 64, 100, -1, -9, -70)
+        for seq, bits in self.random_sequences():
+            packed = seq.pack(bits)
+            self.assertIsInstance(packed._data, Seq._PackedSequenceData)
+            self.assertEqual(packed, seq)
+            self.assertEqual(packed[-1], seq[-1])
+            self.assertEqual(packed.upper(), seq.upper())
+            self.assertEqual(packed.lower(), seq.lower())
+            for start in indices:
+                for end in indices:
+                    for step in (1, -1, 3, -2):
+                        self.assertEqual(
+                            packed[start:end:step],
+                            seq[start:end:step],
+                            msg=(seq, bits, start, end, step),
+                        )
+
+    def test_complement(self):
+        """Check the (reverse) complement of packed sequences."""
+        for seq, bits in self.random_sequences():
+            packed = seq.pack(bits)
+            self.assertEqual(packed.complement(), seq.complement())
+            self.assertEqual(packed.complement_rna(), seq.complement_rna())
+            self.assertEqual(packed.reverse_complement(), seq.reverse_complement())
+            self.assertEqual(
+                packed[5:-5].reverse_complement(), seq[5:-5].reverse_complement()
+            )
+        packed = Seq.Seq("ACGT" * 100).pack()
+        self.assertIsInstance(packed.reverse_complement()._data, type(packed._data))
+
+    def test_search(self):
+        """Check count, find and rfind on packed sequences."""
+        indices = (None, 3, 70, -2, -80)
+        for seq, bits in self.random_sequences():
+            packed = seq.pack(bits)
+            for sub in ("A", "a", "N", "-", "AA", "AAA", "ACG", "Nn", ""):
+                for start in indices:
+                    for end in indices:
+                        msg = (seq, bits, sub, start, end)
+                        self.assertEqual(
+                            packed.count(sub, start, end),
+                            seq.count(sub, start, end),
+                            msg=msg,
+                        )
+                        self.assertEqual(
+                            packed.find(sub, start, end),
+                            seq.find(sub, start, end),
+                            msg=msg,
+                        )
+                        self.assertEqual(
+                            packed.rfind(sub, start, end),
+                            seq.rfind(sub, start, end),
+                            msg=msg,
+                        )
+                self.assertEqual(packed.count_overlap(sub), seq.count_overlap(sub))
+                self.assertEqual(sub in packed, sub in seq)
+
+    def test_pack(self):
+        """Check choosing the number of bits per letter."""
+        seq = Seq.Seq(("ACGT" * 50 + "N" * 100 + "acgt" * 50) * 10)
+        self.assertEqual(seq.pack()._data._bits, 2)
+        self.assertEqual(seq.pack(4)._data._bits, 4)
+        packed = seq.pack(4)
+        self.assertIs(packed.pack(4), packed)
+        self.assertIs(packed.pack(), packed)
+        self.assertEqual(packed.pack(2)._data._bits, 2)
+        seq = Seq.Seq("ACGTRYKMSWBDHVN-" * 100)
+        self.assertEqual(seq.pack()._data._bits, 4)
+        self.assertEqual(seq.pack(2), seq)
+        seq = Seq.Seq("MKQHKAMIVALIVICITAVVAALVTRKDLCEVHIRT" * 100)
+        self.assertIs(seq.pack(), seq)
+        self.assertEqual(seq.pack(4), seq)
+        seq = Seq.Seq(None, 100)
+        self.assertIs(seq.pack(), seq)
+        with self.assertRaises(ValueError):
+            seq.pack(8)
+
+
+class TestPatternSet(unittest.TestCase):
+    """Compare PatternSet searches with a brute force search."""
+
+    def brute_force(self, sequence, patterns, degenerate, both_strands, mismatches):
+        values = dict(ambiguous_dna_values)
+        values["U"] = "T"
+        sequence = str(sequence)
+        if degenerate:
+            sequence = sequence.upper().replace("U", "T")
+        matches = []
+        for index, pattern in enumerate(patterns):
+            queries = [(1, pattern)]
+            other = Seq.reverse_complement(pattern)
+            if degenerate:
+                same = other.upper() == pattern.upper()
+            else:
+                same = other == pattern
+            if both_strands and not same:
+                queries.append((-1, other))
+            for strand, query in queries:
+                size = len(query)
+                for start in range(len(sequence) - size + 1):
+                    count = 0
+                    for letter, target in zip(query, sequence[start : start + size]):
+                        if degenerate:
+                            count += target not in values[letter.upper()]
+                        else:
+                            count += target != letter
+                    if count <= mismatches:
+                        matches.append((start, pattern, strand, count))
+        return sorted(matches)
+
+    def check(self, scan):
+        import random
+
+        rng = random.Random(0)
+        block_size = Seq._PATTERN_SCAN_SIZE
+        Seq._PATTERN_SCAN_SIZE = 50
+        try:
+            for trial in range(100):
+                degenerate = rng.random() < 0.5
+                both_strands = rng.random() < 0.5
+                mismatches = rng.choice((0, 0, 1, 2))
+                if degenerate:
+                    letters = "ACGTacgtNRY"
+                else:
+                    letters = "ACGTXacgt"
+                patterns = [
+                    "".join(rng.choices(letters, k=rng.randrange(1, 6)))
+                    for i in range(rng.randrange(1, 6))
+                ]
+                sequence = "".join(rng.choices("ACGTUacgtN-", k=rng.randrange(200)))
+                patternset = Seq.PatternSet(
+                    patterns, degenerate, both_strands, mismatches
+                )
+                expected = self.brute_force(
+                    sequence, patterns, degenerate, both_strands, mismatches
+                )
+                for target in (sequence, Seq.Seq(sequence), Seq.MutableSeq(sequence)):
+                    matches = [tuple(match) for match in patternset.search(target)]
+                    self.assertEqual(sorted(matches), expected)
+                    # matches are returned in order of the end position
+                    ends = [start + len(pattern) for start, pattern, s, c in matches]
+                    self.assertEqual(ends, sorted(ends))
+        finally:
+            Seq._PATTERN_SCAN_SIZE = block_size
+
+    def test_search(self):
+        """Search random sequences for random patterns."""
+        self.check(Seq._scan)
+
+    def test_search_python(self):
+        """Search using the pure Python version of the scan function."""
+        scan = Seq._scan
+        Seq._scan = Seq._python_scan
+        try:
+            self.check(Seq._python_scan)
+        finally:
+            Seq._scan = scan
+
+    def test_seq_search(self):
+        """Compare the Seq search method with a brute force search."""
+        import random
+
+        rng = random.Random(1)
+        for trial in range(50):
+            subs = [
+                "".join(rng.choices("ACGT", k=rng.randrange(0, 4)))
+                for i in range(rng.randrange(1, 5))
+            ]
+            sequence = Seq.Seq("".join(rng.choices("ACGT", k=rng.randrange(50))))
+            lengths = list(dict.fromkeys(len(sub) for sub in subs))
+            expected = []
+            for start in range(len(sequence)):
+                for length in lengths:
+                    sub = str(sequence[start : start + length])
+                    if len(sub) == length and sub in subs:
+                        expected.append((start, sub))
+            self.assertEqual(list(sequence.search(subs)), expected)
+        matches = Seq.Seq("ACGT" * 100000).search(["", "GT"])
+        self.assertEqual(next(matches), (0, ""))
+        self.assertEqual(next(matches), (1, ""))
+        self.assertEqual(next(matches), (2, ""))
+        self.assertEqual(next(matches), (2, "GT"))
+
+    @unittest.skipIf(numpy is None, "NumPy is required")
+    def test_packed(self):
+        """Search a packed sequence."""
+        sequence = Seq.Seq("ACGTNNNNacgtGAATTC" * 1000)
+        packed = sequence.pack()
+        patternset = Seq.PatternSet(["GAATTC", "NACG", "CGTN"], mismatches=1)
+        self.assertEqual(
+            list(patternset.search(packed)), list(patternset.search(sequence))
+        )
+
+    def test_errors(self):
+        """Check invalid patterns are rejected."""
+        with self.assertRaises(ValueError):
+            Seq.PatternSet(["ACGT", ""])
+        with self.assertRaises(ValueError):
+            Seq.PatternSet(["ACG-T"])
+        with self.assertRaises(ValueError):
+            Seq.PatternSet(["ACGT"], mismatches=-1)
+        with self.assertRaises(TypeError):
+            Seq.PatternSet(["ACGT", 3])
+        with self.assertRaises(TypeError):
+            list(Seq.PatternSet(["ACGT"]).search(3))
+        max_states = Seq._PATTERN_MAX_STATES
+        Seq._PATTERN_MAX_STATES = 1000
+        try:
+            with self.assertRaises(ValueError):
+                Seq.PatternSet(["N" * 20], mismatches=3)
+        finally:
+            Seq._PATTERN_MAX_STATES = max_states
+
+
 if __name__ == "__main__":
     runner = unittest.TextTestRunner(verbosity=2)
     unittest.main(testRunner=runner)
@@ -0,0 +1,256 @@
+# Copyright 2026 by the Biopython developers.  All rights reserved.
+# This code is part of the Biopython distribution and governed by its
+# license.  Please see the LICENSE file that should have been included
+# as part of this package.
+"""Tests for the tabix index support in Bio.tabix."""
+
+import gzip
+import os
+import pathlib
+import random
+import struct
+import tempfile
+import unittest
+
+from Bio import bgzf
+from Bio import tabix
+
+
+class TabixTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_bgzf(self, name, lines, lines_per_block=7):
+        """Write lines to a BGZF file, using many small blocks."""
+        filename = os.path.join(self.temp_dir.name, name)
+        with bgzf.BgzfWriter(filename, "wb") as handle:
+            for i, line in enumerate(lines):
+                handle.write(line.encode() + b"\n")
+                if i % lines_per_block == 0:
+                    handle.flush()
+        return filename
+
+    def random_bed(self):
+        """Return sorted BED lines with a mix of short and long features."""
+        rng = random.Random(42)
+        lines = ["# header line", "#chrom\tstart\tend"]
+        for name in ("chr2", "chr1", "chrM"):
+            starts = sorted(rng.randrange(0, 500000) for i in range(300))
+            for i, start in enumerate(starts):
+                if i % 25 == 0:
+                    length = rng.randrange(20000, 200000)
+                else:
+                    length = rng.randrange(1, 500)
+                lines.append(f"{name}\t{start}\t{start + length}\tfeature{i}")
+        return lines
+
+    def check_queries(self, filename, lines, intervals, **kwargs):
+        """Compare region queries with a search through all the lines."""
+        rng = random.Random(1)
+        regions = [("chr1", 0, None), ("chrX", 0, 100), ("chr2", 500, 501)]
+        for i in range(100):
+            start = rng.randrange(0, 700000)
+            end = start + rng.choice((1, 10, 1000, 50000))
+            regions.append((rng.choice(("chr1", "chr2", "chrM")), start, end))
+        for csi in (False, True):
+            tabix.build_index(filename, csi=csi, **kwargs)
+            extension = ".csi" if csi else ".tbi"
+            with tabix.TabixReader(filename, filename + extension) as reader:
+                self.assertEqual(reader.contigs, ["chr2", "chr1", "chrM"])
+                for name, start, end in regions:
+                    expected = [
+                        line
+                        for line, (n, s, e) in zip(lines, intervals)
+                        if n == name and s < (end or 1 << 40) and e > start
+                    ]
+                    with self.subTest(csi=csi, region=(name, start, end)):
+                        self.assertEqual(list(reader.query(name, start, end)), expected)
+
+    def test_bed(self):
+        """Query a BED file (zero-based half-open coordinates)."""
+        lines = self.random_bed()
+        filename = self.write_bgzf("example.bed.gz", lines)
+        intervals = [(None, 0, 0)] * 2
+        for line in lines[2:]:
+            name, start, end = line.split("\t")[:3]
+            intervals.append((name, int(start), int(end)))
+        self.check_queries(filename, lines, intervals)
+
+    def test_gff(self):
+        """Query a GFF file (one-based inclusive coordinates)."""
+        lines = ["##gff-version 3"]
+        intervals = [(None, 0, 0)]
+        for line in self.random_bed()[2:]:
+            name, start, end, feature = line.split("\t")
+            lines.append(f"{name}\t.\tgene\t{int(start) + 1}\t{end}\t.\t+\t.\t")
+            intervals.append((name, int(start), int(end)))
+        filename = self.write_bgzf("example.gff.gz", lines)
+        self.check_queries(filename, lines, intervals)
+
+    def test_vcf(self):
+        """Query a VCF file, using the REF length or END in INFO."""
+        lines = [
+            "##fileformat=VCFv4.2",
+            "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO",
+        ]
+        intervals = [(None, 0, 0)] * 2
+        for line in self.random_bed()[2:]:
+            name, start, end, feature = line.split("\t")
+            start = int(start)
+            if int(end) - start > 1000:
+                info = f"SVTYPE=DEL;END={end}"
+                ref = "A"
+                intervals.append((name, start, int(end)))
+            else:
+                info = "."
+                ref = "ACGT"[: int(end) % 4 + 1]
+                intervals.append((name, start, start + len(ref)))
+            lines.append(f"{name}\t{start + 1}\t{feature}\t{ref}\tT\t.\tPASS\t{info}")
+        filename = self.write_bgzf("example.vcf.bgz", lines)
+        self.check_queries(filename, lines, intervals)
+
+    def test_tbi_layout(self):
+        """Check the contents of a small tbi index file."""
+        filename = self.write_bgzf(
+            "small.bed.gz", ["chr1\t10\t20", "chr1\t16380\t16400"]
+        )
+        tabix.build_index(filename)
+        with gzip.open(filename + ".tbi") as handle:
+            data = handle.read()
+        self.assertEqual(data[:4], b"TBI\1")
+        self.assertEqual(
+            struct.unpack_from("<8i", data, 4), (1, 0x10000, 1, 2, 3, 35, 0, 5)
+        )
+        self.assertEqual(data[36:41], b"chr1\0")
+        # First line in the first 16kb bin (4681), second line spans two
+        # 16kb bins so is in their parent (585), plus the statistics bin.
+        # As in htslib, the small bin 4681 is merged into its parent, and
+        # the adjacent chunks are then joined.
+        (n_bin,) = struct.unpack_from("<i", data, 41)
+        self.assertEqual(n_bin, 2)
+        offset = 45
+        bins = []
+        for i in range(n_bin):
+            bin, n_chunk = struct.unpack_from("<Ii", data, offset)
+            chunks = struct.unpack_from("<%iQ" % (2 * n_chunk), data, offset + 8)
+            bins.append((bin, chunks))
+            offset += 8 + 16 * n_chunk
+        line1 = 0
+        with open(filename, "rb") as handle:
+            block_starts = [values[0] for values in bgzf.BgzfBlocks(handle)]
+        # Flushing after the first line put the second line in a new block
+        line2 = bgzf.make_virtual_offset(block_starts[1], 0)
+        end = bgzf.make_virtual_offset(block_starts[2], 0)
+        self.assertEqual(
+            bins,
+            [(585, (line1, end)), (37450, (line1, end, 2, 0))],
+        )
+        # Linear index has two 16kb windows, both starting at the first line
+        # which overlaps the second window
+        self.assertEqual(struct.unpack_from("<i2QQ", data, offset), (2, 0, line2, 0))
+
+    def test_read_write_round_trip(self):
+        """Check reading an index gives the same as building it."""
+        filename = self.write_bgzf("example.bed.gz", self.random_bed())
+        for csi in (False, True):
+            built = tabix.build_index(filename, csi=csi)
+            index = tabix.read_index(filename + (".csi" if csi else ".tbi"))
+            self.assertEqual(repr(index), repr(built))
+            self.assertEqual(index.names, built.names)
+            self.assertEqual(index.depth, 8 if csi else 5)
+            self.assertEqual(index._bins, built._bins)
+            self.assertEqual(index._linear, built._linear)
+            self.assertEqual(
+                index.chunks("chr1", 1000, 2000), built.chunks("chr1", 1000, 2000)
+            )
+
+    def test_custom_columns(self):
+        """Index a file with the columns given explicitly."""
+        lines = ["skip me", "a\tx\t5", "a\ty\t7", "b\tz\t1"]
+        filename = self.write_bgzf("example.txt.gz", lines)
+        tabix.build_index(filename, sequence_column=1, begin_column=3, skip=1)
+        with tabix.TabixReader(filename) as reader:
+            self.assertEqual(list(reader.query("a", 4, 5)), ["a\tx\t5"])
+            self.assertEqual(list(reader.query("a", 5, 7)), ["a\ty\t7"])
+            self.assertEqual(list(reader.query("b")), ["b\tz\t1"])
+
+    def test_errors(self):
+        """Check unsorted files and bad arguments are rejected."""
+        filename = self.write_bgzf("unsorted.bed.gz", ["c\t5\t6", "c\t1\t2"])
+        with self.assertRaises(ValueError):
+            tabix.build_index(filename)
+        filename = self.write_bgzf("split.bed.gz", ["c\t5\t6", "d\t1\t2", "c\t7\t8"])
+        with self.assertRaises(ValueError):
+            tabix.build_index(filename)
+        with self.assertRaises(ValueError):
+            tabix.build_index(filename, preset="fasta")
+        with self.assertRaises(ValueError):
+            tabix.TabixReader(filename)
+        filename = self.write_bgzf("example.txt.gz", ["c\t5\t6"])
+        with self.assertRaises(ValueError):
+            tabix.build_index(filename)
+        filename = self.write_bgzf("long.bed.gz", ["c\t1\t600000000"])
+        with self.assertRaises(ValueError):
+            tabix.build_index(filename)
+        tabix.build_index(filename, csi=True)
+        with tabix.TabixReader(filename) as reader:
+            self.assertEqual(len(list(reader.query("c", 599999999))), 1)
+
+
+class HtslibTests(unittest.TestCase):
+    """Compare with index files made by htslib (tabix -p bed, and with -C)."""
+
+    filename = os.path.join("Tabix", "example.bed.gz")
+
+    def test_same_index(self):
+        """Check building an index gives the same as htslib."""
+        for csi in (False, True):
+            expected = tabix.read_index(self.filename + (".csi" if csi else ".tbi"))
+            index = tabix.build_index(self.filename, csi=csi, index_filename=False)
+            with self.subTest(csi=csi):
+                self.assertEqual(repr(index), repr(expected))
+                self.assertEqual(index.names, expected.names)
+                self.assertEqual(index.depth, expected.depth)
+                self.assertEqual(index._bins, expected._bins)
+                self.assertEqual(index._linear, expected._linear)
+
+    def test_queries(self):
+        """Query using the htslib index files."""
+        with gzip.open(self.filename, "rt") as handle:
+            lines = handle.read().splitlines()[1:]
+        rng = random.Random(2)
+        for extension in (".tbi", ".csi"):
+            with tabix.TabixReader(
+                pathlib.Path(self.filename), self.filename + extension
+            ) as reader:
+                self.assertEqual(reader.contigs, ["chr2", "chr1", "chrM"])
+                for i in range(50):
+                    name = rng.choice(("chr1", "chr2", "chrM"))
+                    start = rng.randrange(0, 700000)
+                    end = start + rng.choice((1, 100, 10000))
+                    expected = []
+                    for line in lines:
+                        n, s, e = line.split("\t")[:3]
+                        if n == name and int(s) < end and int(e) > start:
+                            expected.append(line)
+                    with self.subTest(extension=extension, region=(name, start, end)):
+                        self.assertEqual(list(reader.query(name, start, end)), expected)
+
+    def test_path(self):
+        """Check path-like filenames are accepted."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = pathlib.Path(temp_dir) / "example.bed.gz"
+            with open(self.filename, "rb") as source:
+                filename.write_bytes(source.read())
+            tabix.build_index(filename)
+            self.assertTrue(os.path.isfile(str(filename) + ".tbi"))
+            with tabix.TabixReader(filename) as reader:
+                self.assertEqual(len(list(reader.query("chrM", 0, 1000))), 2)
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner(verbosity=2)
+    unittest.main(testRunner=runner)